@@ -21,7 +21,12 @@ own (mypyc-compiled) source, pyright is a bundled JS CLI, so this script:
  * Runs each commit's bundle N times over a fixed corpus, in randomized
    interleaved order, parsing pyright's own ``Completed in X.XXXsec`` line as the
    per-run metric (in-process analysis time -- excludes node startup jitter).
- * Reports per-commit mean/median plus robust paired deltas vs the baseline.
+ * Also parses the per-phase ``--stats`` timings (tokenize, parse, resolve
+   imports, bind, check, ...) from every run and, for bundles that support
+   ``--tracefile``, the time spent parsing, binding and checking each file.
+ * Reports per-commit mean/median plus robust paired deltas vs the baseline,
+   for the total and for each phase and each of the slowest files, so a
+   regression can be attributed to a phase or a file in one run.
 
 Usage:
 
@@ -36,9 +41,13 @@ Requirements / caveats:
    commits so only the checker changes. Errors in the corpus are ignored.
  * Builds are keyed by the resolved commit SHA, so passing a moving ref like
    HEAD/branch name caches under its current SHA (fine within one run).
+ * The per-file breakdown records a trace in every run, which adds a little
+   overhead to all commits alike. Pass ``--top-files 0`` to disable it. It's
+   skipped automatically if any of the commits predates ``--tracefile``.
 """
 
 import argparse
+import json
 import os
 import random
 import re
@@ -47,7 +56,10 @@ import shutil
 import statistics
 import subprocess
 import sys
+import tempfile
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -57,7 +69,21 @@ DIST_DIR = os.path.join(PYRIGHT_PKG, "dist")
 BUILD_CACHE = os.path.join(SCRIPT_DIR, "perfCompare", "binaries")
 
 COMPLETED_RE = re.compile(r"Completed in ([\d.]+)sec")
-CHECK_RE = re.compile(r"Check:\s+([\d.]+)sec")
+# One line per phase in the "Timing stats" block printed by --stats, e.g.
+# "Resolve Imports:      0.12sec".
+PHASE_RE = re.compile(r"^([A-Z][A-Za-z ]+):\s+([\d.]+)sec", re.MULTILINE)
+# Trace spans (see common/performanceTrace.ts) that cover the work done for one file.
+FILE_SPAN_NAMES = ("parseFile", "bindFile", "checkFile")
+
+
+@dataclass
+class RunResult:
+    wall: float
+    cpu: float
+    # Seconds per --stats phase ("Tokenize", "Check", ...).
+    phases: dict[str, float] = field(default_factory=dict)
+    # Seconds spent parsing, binding and checking each file (empty if not traced).
+    files: dict[str, float] = field(default_factory=dict)
 
 
 def heading(s: str) -> None:
@@ -107,27 +133,96 @@ def build_commit(commit: str, sha: str) -> str:
     return cache_dir
 
 
-def run_once(bundle_dir: str, corpus: str) -> tuple[float, float | None, float]:
-    """Run pyright on corpus once; return (wall_completed_sec, check_sec | None, cpu_sec).
+def supports_trace_file(bundle_dir: str) -> bool:
+    """Whether the bundle has the --tracefile option (added after many commits worth comparing)."""
+    res = subprocess.run(
+        ["node", os.path.join(bundle_dir, "pyright.js"), "--help"],
+        cwd=REPO_ROOT, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+    )
+    return "--tracefile" in res.stdout
+
+
+def parse_phases(output: str) -> dict[str, float]:
+    """The per-phase times from the "Timing stats" block printed by --stats."""
+    start = output.find("Timing stats")
+    if start < 0:
+        return {}
+    return {name.strip(): float(sec) for name, sec in PHASE_RE.findall(output, start)}
+
+
+def parse_file_times(trace_path: str, corpus: str) -> dict[str, float]:
+    """Seconds spent parsing, binding and checking each file, summed from the trace's file spans.
+
+    A file span can contain the spans of other files (e.g. an import that is parsed and bound while
+    the importer is being checked), so each span is charged only its self time: its duration minus
+    that of the file spans directly nested within it on the same thread.
+
+    Files inside the corpus are keyed by their path relative to it, so the keys match across commits.
+    """
+    with open(trace_path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    corpus_dir = os.path.abspath(corpus if os.path.isdir(corpus) else os.path.dirname(corpus))
+
+    spans_by_thread: dict[tuple[int, int], list[dict]] = {}
+    for e in events:
+        if e.get("ph") != "X" or e.get("name") not in FILE_SPAN_NAMES:
+            continue
+        if not (e.get("args") or {}).get("file"):
+            continue
+        spans_by_thread.setdefault((e.get("pid", 0), e.get("tid", 0)), []).append(e)
+
+    files: dict[str, float] = {}
+    for spans in spans_by_thread.values():
+        # Parents start no later than their children and, on a tie, last longer.
+        spans.sort(key=lambda e: (e["ts"], -e["dur"]))
+        self_times = [e["dur"] for e in spans]
+        stack: list[int] = []
+        for i, e in enumerate(spans):
+            while stack and spans[stack[-1]]["ts"] + spans[stack[-1]]["dur"] <= e["ts"]:
+                stack.pop()
+            if stack:
+                self_times[stack[-1]] -= e["dur"]
+            stack.append(i)
+
+        for e, self_time in zip(spans, self_times):
+            path = e["args"]["file"]
+            if os.path.isabs(path) and os.path.commonpath([corpus_dir, path]) == corpus_dir:
+                path = os.path.relpath(path, corpus_dir)
+            files[path] = files.get(path, 0.0) + max(self_time, 0) / 1e6
+    return files
+
+
+def run_once(bundle_dir: str, corpus: str, trace: bool) -> RunResult:
+    """Run pyright on corpus once and collect its timings.
 
     `wall` is pyright's own ``Completed in`` (in-process analysis wall time). `cpu` is the
     user+sys CPU time of the node child, via the RUSAGE_CHILDREN delta around the run --
     much less sensitive to scheduling/background noise. This is accurate because pyright runs
     single-process by default (no ``--threads``), so there are no un-reaped worker processes
-    whose CPU would escape node's accounting.
+    whose CPU would escape node's accounting. If `trace` is set, a trace is recorded to get
+    the time spent on each file.
     """
     cmd = ["node", os.path.join(bundle_dir, "pyright.js"), "--stats", os.path.abspath(corpus)]
-    r0 = resource.getrusage(resource.RUSAGE_CHILDREN)
-    # Ignore exit code: corpora routinely produce type errors.
-    res = subprocess.run(cmd, cwd=REPO_ROOT, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    r1 = resource.getrusage(resource.RUSAGE_CHILDREN)
-    cpu = (r1.ru_utime - r0.ru_utime) + (r1.ru_stime - r0.ru_stime)
-    m = COMPLETED_RE.search(res.stdout)
-    if not m:
-        sys.stderr.write(res.stdout[-2000:] + "\n")
-        raise RuntimeError("Could not parse 'Completed in ...sec' from pyright output")
-    c = CHECK_RE.search(res.stdout)
-    return float(m.group(1)), (float(c.group(1)) if c else None), cpu
+    trace_path = None
+    if trace:
+        fd, trace_path = tempfile.mkstemp(prefix="perfCompare-", suffix=".json")
+        os.close(fd)
+        cmd[-1:-1] = ["--tracefile", trace_path]
+    try:
+        r0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        # Ignore exit code: corpora routinely produce type errors.
+        res = subprocess.run(cmd, cwd=REPO_ROOT, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        r1 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = (r1.ru_utime - r0.ru_utime) + (r1.ru_stime - r0.ru_stime)
+        m = COMPLETED_RE.search(res.stdout)
+        if not m:
+            sys.stderr.write(res.stdout[-2000:] + "\n")
+            raise RuntimeError("Could not parse 'Completed in ...sec' from pyright output")
+        files = parse_file_times(trace_path, corpus) if trace_path else {}
+    finally:
+        if trace_path:
+            os.remove(trace_path)
+    return RunResult(wall=float(m.group(1)), cpu=cpu, phases=parse_phases(res.stdout), files=files)
 
 
 def winsorized_paired_stats(diffs: list[float], *, trim_frac: float = 0.1, conf: float = 0.95) -> dict[str, float]:
@@ -147,6 +242,26 @@ def winsorized_paired_stats(diffs: list[float], *, trim_frac: float = 0.1, conf:
     return {"est": est, "median": median, "ci": z * se, "kept": float(len(kept))}
 
 
+def print_paired_deltas(
+    title: str, keys: list[str], runs: dict[str, list[RunResult]], commits: list[str],
+    value: Callable[[RunResult, str], float],
+) -> None:
+    """Paired deltas vs the baseline (the first commit) for each key, e.g. each phase or file."""
+    baseline = commits[0]
+    heading(title)
+    width = max([len(k) for k in keys] + [10])
+    for key in keys:
+        base_vals = [value(r, key) for r in runs[baseline]]
+        base_center = statistics.median(base_vals)
+        cols = [f"{key:<{width}} {base_center * 1000:9.1f}ms"]
+        for c in commits[1:]:
+            diffs = [value(r, key) - b for r, b in zip(runs[c], base_vals)]
+            st = winsorized_paired_stats(diffs)
+            pct = (st["median"] / base_center * 100) if base_center else 0.0
+            cols.append(f"{c}: {st['median'] * 1000:+7.1f}ms +/-{st['ci'] * 1000:5.1f} ({pct:+6.1f}%)")
+        print(" | ".join(cols))
+
+
 def main() -> None:
     t0 = time.time()
     p = argparse.ArgumentParser(
@@ -167,6 +282,9 @@ def main() -> None:
                         "runs single-process by default (multi-process needs --threads, which this script never "
                         "passes), so this is the default; the flag is accepted to document intent.")
     p.add_argument("--no-build", action="store_true", help="skip building; reuse cached dist bundles under build/perfCompare/binaries/")
+    p.add_argument("--top-files", type=int, default=10,
+                   help="number of slowest files (by median time) to report paired deltas for (default 10, "
+                        "0 to disable). Requires every commit's bundle to support --tracefile.")
     p.add_argument("commit", nargs="+", help="git revisions to compare; the first is the baseline (e.g. main HEAD)")
     args = p.parse_args()
 
@@ -200,12 +318,20 @@ def main() -> None:
             heading(f"Restoring {original}")
             git("checkout", "-q", original)
 
+    trace = args.top_files > 0
+    if trace:
+        unsupported = [c for c in commits if not supports_trace_file(bundles[c])]
+        if unsupported:
+            print(f"note: no per-file breakdown; --tracefile isn't supported by {', '.join(unsupported)}")
+            trace = False
+
     num_runs = args.num_runs + args.warmup_runs
     metric_label = "CPU time (user+sys)" if args.metric == "cpu" else "pyright-reported wall time"
     heading(f"Measuring (corpus: {corpus}, {args.num_runs} runs + {args.warmup_runs} warmup, "
             f"metric: {args.metric}, single-process)")
     # `results` holds the chosen comparison metric; the other values are still printed per run.
     results: dict[str, list[float]] = {c: [] for c in commits}
+    runs: dict[str, list[RunResult]] = {c: [] for c in commits}
     for n in range(num_runs):
         warm = n < args.warmup_runs
         print(f"{'Warmup' if warm else 'Run'} {n + 1 - (0 if warm else args.warmup_runs)}/"
@@ -213,12 +339,14 @@ def main() -> None:
         order = commits[:]
         random.shuffle(order)
         for c in order:
-            wall, check, cpu = run_once(bundles[c], corpus)
-            metric_val = cpu if args.metric == "cpu" else wall
+            run = run_once(bundles[c], corpus, trace)
+            metric_val = run.cpu if args.metric == "cpu" else run.wall
             if not warm:
                 results[c].append(metric_val)
+                runs[c].append(run)
+                check = run.phases.get("Check")
                 check_str = f" check={check:.2f}s" if check is not None else ""
-                print(f"  {c}: cpu={cpu:.3f}s wall={wall:.3f}s{check_str}")
+                print(f"  {c}: cpu={run.cpu:.3f}s wall={run.wall:.3f}s{check_str}")
 
     baseline = commits[0]
     heading(f"Results ({metric_label})")
@@ -247,6 +375,22 @@ def main() -> None:
         pct = (st["median"] / base_center * 100) if base_center else 0.0
         print(f"{c:<22} median {st['median'] * 1000:+7.1f}ms  +/-{st['ci'] * 1000:4.1f}  ({pct:+.2f}%)")
 
+    # Phases are listed in the order pyright prints them. The phase times are rounded to 10ms
+    # by pyright, so only differences well above that are meaningful.
+    phases = list(dict.fromkeys(name for c in commits for r in runs[c] for name in r.phases))
+    if len(commits) > 1 and phases:
+        print_paired_deltas(f"Per-phase paired deltas vs {baseline} (baseline median, then median +/- 95% CI)",
+                            phases, runs, commits, lambda r, k: r.phases.get(k, 0.0))
+
+    if len(commits) > 1 and trace:
+        # Rank by the slowest median of any commit so a file that only got slow in a later
+        # commit is still reported.
+        all_files = {f for c in commits for r in runs[c] for f in r.files}
+        slowest = {f: max(statistics.median(r.files.get(f, 0.0) for r in runs[c]) for c in commits) for f in all_files}
+        top = sorted(slowest, key=lambda f: slowest[f], reverse=True)[: args.top_files]
+        print_paired_deltas(f"Slowest {len(top)} files (parse+bind+check), paired deltas vs {baseline}",
+                            top, runs, commits, lambda r, k: r.files.get(k, 0.0))
+
     t = int(time.time() - t0)
     print(f"\nTotal wall time: {t // 60}m {t % 60}s")
 
@@ -12,6 +12,7 @@ import { OperationCanceledException, throwIfCancellationRequested } from '../com
 import { ConfigOptions } from '../common/configOptions';
 import { ConsoleInterface } from '../common/console';
 import * as debug from '../common/debug';
+import { performanceTrace } from '../common/performanceTrace';
 import { Duration } from '../common/timing';
 import { MaxAnalysisTime, Program } from './program';
 import { FileDiagnostics } from '../common/diagnosticSink';
@@ -78,6 +79,10 @@ export function analyzeProgram(
                 reason: 'analysis',
             });
         }
+
+        if (!moreToAnalyze) {
+            writePerformanceTrace(program, configOptions, console);
+        }
     } catch (e: any) {
         if (OperationCanceledException.is(e)) {
             return false;
@@ -100,3 +105,17 @@ export function analyzeProgram(
 
     return moreToAnalyze;
 }
+
+// Writes the performance trace recorded so far if one was requested.
+function writePerformanceTrace(program: Program, configOptions: ConfigOptions, console: ConsoleInterface) {
+    if (!configOptions.performanceTraceFile || !performanceTrace.isEnabled) {
+        return;
+    }
+
+    try {
+        const fs = program.serviceProvider.fs();
+        fs.writeFileSync(configOptions.performanceTraceFile, performanceTrace.serialize(), 'utf8');
+    } catch (e: any) {
+        console.error(`Failed to write performance trace: ${debug.getErrorString(e)}`);
+    }
+}
@@ -0,0 +1,145 @@
+/*
+ * analysisCache.ts
+ *
+ * A persistent on-disk cache of per-file diagnostics. Each entry is keyed by
+ * the file's URI and stores a fingerprint of the file's contents, the contents
+ * of everything it (transitively) imports and the configuration that was used
+ * to check it. If the fingerprint computed on a later run matches, the stored
+ * diagnostics can be reused and the file doesn't need to be bound or checked.
+ */
+
+import { ConfigOptions, ExecutionEnvironment } from '../common/configOptions';
+import { ConsoleInterface } from '../common/console';
+import { sha256Hex } from '../common/crypto';
+import { Diagnostic } from '../common/diagnostic';
+import { FileSystem } from '../common/fileSystem';
+import { PythonVersion } from '../common/pythonVersion';
+import { Uri } from '../common/uri/uri';
+import version from '../version.json';
+
+// Bump this whenever the format of the cache entries changes.
+const _cacheFormatVersion = 1;
+
+interface AnalysisCacheEntry {
+    formatVersion: number;
+    fingerprint: string;
+    diagnostics: ReturnType<Diagnostic['toJsonObj']>[];
+}
+
+export class AnalysisCache {
+    private _isAvailable: boolean;
+    private _didCreateCacheDir = false;
+    private readonly _configKeys = new Map<ExecutionEnvironment, string>();
+
+    constructor(
+        private readonly _fs: FileSystem,
+        readonly cacheDir: Uri,
+        private readonly _configOptions: ConfigOptions,
+        private readonly _console: ConsoleInterface
+    ) {
+        // The fingerprints rely on a cryptographic hash so collisions don't
+        // result in stale diagnostics. If that's not available, disable the cache.
+        this._isAvailable = sha256Hex('') !== undefined;
+        if (!this._isAvailable) {
+            this._console.warn(`Analysis cache is not supported on this platform and will be ignored`);
+        }
+    }
+
+    get isAvailable() {
+        return this._isAvailable;
+    }
+
+    // Computes the fingerprint for a file given the content digests of the file
+    // itself and every file in its dependency closure.
+    computeFingerprint(fileUri: Uri, dependencyDigests: string[]): string | undefined {
+        if (!this._isAvailable) {
+            return undefined;
+        }
+
+        const execEnv = this._configOptions.findExecEnvironment(fileUri);
+        return sha256Hex([this._getConfigKey(execEnv), fileUri.key, ...dependencyDigests.sort()].join('\n'));
+    }
+
+    // Returns the cached diagnostics for the file if the stored fingerprint
+    // matches, otherwise undefined.
+    get(fileUri: Uri, fingerprint: string): Diagnostic[] | undefined {
+        if (!this._isAvailable) {
+            return undefined;
+        }
+
+        const entryUri = this._getEntryUri(fileUri);
+        let entry: AnalysisCacheEntry;
+        try {
+            if (!this._fs.existsSync(entryUri)) {
+                return undefined;
+            }
+
+            entry = JSON.parse(this._fs.readFileSync(entryUri, 'utf8'));
+        } catch {
+            // Treat unreadable or corrupt entries as a cache miss. They'll
+            // be overwritten once the file has been checked.
+            return undefined;
+        }
+
+        if (entry.formatVersion !== _cacheFormatVersion || entry.fingerprint !== fingerprint) {
+            return undefined;
+        }
+
+        try {
+            return entry.diagnostics.map((diag) => Diagnostic.fromJsonObj(diag));
+        } catch {
+            return undefined;
+        }
+    }
+
+    set(fileUri: Uri, fingerprint: string, diagnostics: readonly Diagnostic[]) {
+        if (!this._isAvailable) {
+            return;
+        }
+
+        const entry: AnalysisCacheEntry = {
+            formatVersion: _cacheFormatVersion,
+            fingerprint,
+            diagnostics: diagnostics.map((diag) => diag.toJsonObj()),
+        };
+
+        try {
+            if (!this._didCreateCacheDir) {
+                if (!this._fs.existsSync(this.cacheDir)) {
+                    this._fs.mkdirSync(this.cacheDir, { recursive: true });
+                }
+                this._didCreateCacheDir = true;
+            }
+
+            this._fs.writeFileSync(this._getEntryUri(fileUri), JSON.stringify(entry), 'utf8');
+        } catch (e: any) {
+            this._console.error(`Failed to write analysis cache entry for ${fileUri}: ${e?.message ?? e}`);
+        }
+    }
+
+    private _getEntryUri(fileUri: Uri) {
+        return this.cacheDir.combinePaths(`${sha256Hex(fileUri.key)}.json`);
+    }
+
+    // Returns a string that captures all configuration that can affect the
+    // diagnostics produced for files in the given execution environment.
+    private _getConfigKey(execEnv: ExecutionEnvironment) {
+        let configKey = this._configKeys.get(execEnv);
+        if (configKey === undefined) {
+            configKey = JSON.stringify({
+                version,
+                formatVersion: _cacheFormatVersion,
+                pythonVersion: PythonVersion.toString(execEnv.pythonVersion),
+                pythonPlatform: execEnv.pythonPlatform,
+                diagnosticRuleSet: execEnv.diagnosticRuleSet,
+                ignore: this._configOptions.ignore.map((spec) => spec.regExp.source),
+                strict: this._configOptions.strict.map((spec) => spec.regExp.source),
+                defineConstant: [...this._configOptions.defineConstant.entries()],
+                taskListTokens: this._configOptions.taskListTokens,
+            });
+            this._configKeys.set(execEnv, configKey);
+        }
+
+        return configKey;
+    }
+}
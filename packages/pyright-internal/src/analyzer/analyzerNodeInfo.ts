@@ -74,8 +74,16 @@ export interface AnalyzerNodeInfo {
 
     // List of __all__ symbols in the module.
     dunderAllInfo?: DunderAllInfo | undefined;
+
+    // Callbacks that bind the function bodies whose binding was deferred
+    // until the info of this (function or class) node is needed.
+    deferredBindings?: DeferredBinding[];
 }
 
+// Binds a deferred function body. Returns false if it can't be bound yet
+// because the binder is busy.
+export type DeferredBinding = () => boolean;
+
 export type ScopedNode = ModuleNode | ClassNode | FunctionNode | LambdaNode | ComprehensionNode;
 
 // Cleans out all fields that are added by the analyzer phases
@@ -117,6 +125,10 @@ export function cleanNodeAnalysisInfo(node: ParseNode) {
     if (info?.dunderAllInfo) {
         info.dunderAllInfo = undefined;
     }
+
+    if (info?.deferredBindings) {
+        info.deferredBindings = undefined;
+    }
 }
 
 export function getImportInfo(node: ParseNode): ImportResult | undefined {
@@ -130,17 +142,23 @@ export function setImportInfo(node: ParseNode, importInfo: ImportResult) {
 }
 
 export function getScope(node: ParseNode): Scope | undefined {
-    const info = getAnalyzerInfo(node);
+    const info = getAnalyzerInfoAfterBinding(node);
     return info?.scope;
 }
 
+// Returns the scope of the node without binding any function bodies whose
+// binding was deferred, e.g. when collecting memory usage statistics.
+export function getScopeIfBound(node: ParseNode): Scope | undefined {
+    return getAnalyzerInfo(node)?.scope;
+}
+
 export function setScope(node: ParseNode, scope: Scope) {
     const info = getAnalyzerInfoForWrite(node);
     info.scope = scope;
 }
 
 export function getDeclaration(node: ParseNode): Declaration | undefined {
-    const info = getAnalyzerInfo(node);
+    const info = getAnalyzerInfoAfterBinding(node);
     return info?.declaration;
 }
 
@@ -160,7 +178,7 @@ export function setFlowNode(node: ParseNode, flowNode: FlowNode) {
 }
 
 export function getAfterFlowNode(node: ParseNode): FlowNode | undefined {
-    const info = getAnalyzerInfo(node);
+    const info = getAnalyzerInfoAfterBinding(node);
     return info?.afterFlowNode;
 }
 
@@ -183,7 +201,7 @@ export function setFileInfo(node: ModuleNode, fileInfo: AnalyzerFileInfo) {
 }
 
 export function getCodeFlowExpressions(node: ExecutionScopeNode): Set<string> | undefined {
-    const info = getAnalyzerInfo(node);
+    const info = getAnalyzerInfoAfterBinding(node);
     return info?.codeFlowExpressions;
 }
 
@@ -193,7 +211,7 @@ export function setCodeFlowExpressions(node: ExecutionScopeNode, expressions: Se
 }
 
 export function getCodeFlowComplexity(node: ExecutionScopeNode) {
-    const info = getAnalyzerInfo(node);
+    const info = getAnalyzerInfoAfterBinding(node);
     return info?.codeFlowComplexity ?? 0;
 }
 
@@ -222,6 +240,14 @@ export function setDunderAllInfo(node: ModuleNode, names: DunderAllInfo | undefi
     info.dunderAllInfo = names;
 }
 
+export function addDeferredBinding(node: FunctionNode | ClassNode, binding: DeferredBinding) {
+    const info = getAnalyzerInfoForWrite(node);
+    if (!info.deferredBindings) {
+        info.deferredBindings = [];
+    }
+    info.deferredBindings.push(binding);
+}
+
 export function isCodeUnreachable(node: ParseNode): boolean {
     let curNode: ParseNode | undefined = node;
 
@@ -242,6 +268,17 @@ function getAnalyzerInfo(node: ParseNode): AnalyzerNodeInfo | undefined {
     return node.a as AnalyzerNodeInfo | undefined;
 }
 
+// Returns the analyzer info of a node after binding any function bodies
+// whose binding was deferred until it's needed.
+function getAnalyzerInfoAfterBinding(node: ParseNode): AnalyzerNodeInfo | undefined {
+    const info = node.a as AnalyzerNodeInfo | undefined;
+    if (info?.deferredBindings) {
+        const deferredBindings = info.deferredBindings.filter((binding) => !binding());
+        info.deferredBindings = deferredBindings.length > 0 ? deferredBindings : undefined;
+    }
+    return info;
+}
+
 function getAnalyzerInfoForWrite(node: ParseNode): AnalyzerNodeInfo {
     let info = node.a as AnalyzerNodeInfo | undefined;
     if (!info) {
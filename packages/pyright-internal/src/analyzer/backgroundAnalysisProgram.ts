@@ -13,6 +13,7 @@ import { IBackgroundAnalysis, RefreshOptions } from '../backgroundAnalysisBase';
 import { ConfigOptions, ExecutionEnvironment } from '../common/configOptions';
 import { Diagnostic } from '../common/diagnostic';
 import { FileDiagnostics } from '../common/diagnosticSink';
+import { performanceTrace } from '../common/performanceTrace';
 import { ServiceProvider } from '../common/serviceProvider';
 import '../common/serviceProviderExtensions';
 import { Range } from '../common/textRange';
@@ -48,6 +49,7 @@ export class BackgroundAnalysisProgram {
         private readonly _disableChecker?: boolean,
         program?: Program
     ) {
+        this._startPerformanceTraceIfNeeded();
         this._program =
             program ??
             new Program(
@@ -92,6 +94,7 @@ export class BackgroundAnalysisProgram {
     setConfigOptions(configOptions: ConfigOptions) {
         this._configOptions = configOptions;
         this._backgroundAnalysis?.setConfigOptions(configOptions);
+        this._startPerformanceTraceIfNeeded();
         this._program.setConfigOptions(configOptions);
     }
 
@@ -109,6 +112,11 @@ export class BackgroundAnalysisProgram {
         this._reportDiagnosticsForRemovedFiles(diagnostics);
     }
 
+    addTrackedFiles(fileUris: Uri[]) {
+        this._backgroundAnalysis?.addTrackedFiles(fileUris);
+        this._program.addTrackedFiles(fileUris);
+    }
+
     setAllowedThirdPartyImports(importNames: string[]) {
         this._backgroundAnalysis?.setAllowedThirdPartyImports(importNames);
         this._program.setAllowedThirdPartyImports(importNames);
@@ -291,6 +299,14 @@ export class BackgroundAnalysisProgram {
         return this._program.exitEditMode();
     }
 
+    // The performance trace is recorded by whichever thread runs the analysis.
+    // It must be started before the program creates its type evaluator.
+    private _startPerformanceTraceIfNeeded() {
+        if (!this._backgroundAnalysis && this._configOptions.performanceTraceFile) {
+            performanceTrace.start('analysis');
+        }
+    }
+
     private _ensurePartialStubPackages(execEnv: ExecutionEnvironment) {
         this._backgroundAnalysis?.ensurePartialStubPackages(execEnv.root?.toString());
         return this._importResolver.ensurePartialStubPackages(execEnv);
@@ -150,6 +150,11 @@ interface DeferredBindingTask {
     callback: () => void;
 }
 
+interface DeferredMethodBinding {
+    tasks: DeferredBindingTask[];
+    binding: AnalyzerNodeInfo.DeferredBinding;
+}
+
 interface FinalInfo {
     isFinal: boolean;
     finalTypeNode: ExpressionNode | undefined;
@@ -356,10 +361,19 @@ export class Binder extends ParseTreeWalker {
     // the current function.
     private _codeFlowComplexity = 0;
 
+    // Is the binder currently walking the parse tree? Function bodies whose
+    // binding was deferred until they're needed aren't bound while it is.
+    private _isBindingInProgress = false;
+
+    // Methods of the classes being bound whose binding was deferred until
+    // they're needed.
+    private _deferredMethodBindings = new Map<ClassNode, DeferredMethodBinding>();
+
     constructor(
         fileInfo: AnalyzerFileInfo,
         private _moduleSymbolOnly = false,
-        private readonly _cellChainIndex?: CellChainIndexProvider
+        private readonly _cellChainIndex?: CellChainIndexProvider,
+        private readonly _bindFunctionBodiesOnDemand = false
     ) {
         super();
 
@@ -367,6 +381,15 @@ export class Binder extends ParseTreeWalker {
     }
 
     bindModule(node: ModuleNode): void {
+        this._isBindingInProgress = true;
+        try {
+            this._bindModule(node);
+        } finally {
+            this._isBindingInProgress = false;
+        }
+    }
+
+    private _bindModule(node: ModuleNode) {
         // We'll assume that if there is no builtins scope provided, we must be
         // binding the builtins module itself.
         const isBuiltInModule = this._fileInfo.builtinsScope === undefined;
@@ -628,6 +651,7 @@ export class Binder extends ParseTreeWalker {
                 if (!this._moduleSymbolOnly) {
                     // Analyze the suite.
                     this.walk(node.d.suite);
+                    this._deferredMethodBindings.delete(node);
                 }
 
                 // `__qualname__` is exposed via the metaclass (`type`) rather than as a
@@ -739,7 +763,7 @@ export class Binder extends ParseTreeWalker {
                     this._addImplicitSymbolToCurrentScope('__class__', node, '__class__');
                 }
 
-                this._deferBinding(() => {
+                this._deferFunctionBodyBinding(node, () => {
                     // Create a start node for the function.
                     this._currentFlowNode = this._createStartFlowNode();
                     this._codeFlowComplexity = 0;
@@ -4777,6 +4801,70 @@ export class Binder extends ParseTreeWalker {
         });
     }
 
+    // Defers the binding of a function's body. If function bodies are bound
+    // on demand (which is the case for library files, most of whose functions
+    // are never evaluated), the body is bound when the analysis info of the
+    // function node is first needed. The symbol table of a class depends on
+    // the bodies of its methods, which can declare members ("self.x = 1"), so
+    // all of them are bound (in order) when the info of the class node or of
+    // any of the methods is needed.
+    private _deferFunctionBodyBinding(node: FunctionNode, callback: () => void) {
+        if (
+            !this._bindFunctionBodiesOnDemand ||
+            this._moduleSymbolOnly ||
+            new OuterScopeBindingFinder().checkContainsOuterScopeBinding(node.d.suite)
+        ) {
+            this._deferBinding(callback);
+            return;
+        }
+
+        const task: DeferredBindingTask = {
+            scope: this._currentScope,
+            codeFlowExpressions: this._currentScopeCodeFlowExpressions!,
+            callback,
+        };
+
+        const classNode = ParseTreeUtils.getEnclosingClass(node, /* stopAtFunction */ true);
+        if (!classNode) {
+            AnalyzerNodeInfo.addDeferredBinding(node, this._createDeferredBinding([task]));
+            return;
+        }
+
+        let methodBinding = this._deferredMethodBindings.get(classNode);
+        if (!methodBinding) {
+            const tasks: DeferredBindingTask[] = [];
+            methodBinding = { tasks, binding: this._createDeferredBinding(tasks) };
+            this._deferredMethodBindings.set(classNode, methodBinding);
+            AnalyzerNodeInfo.addDeferredBinding(classNode, methodBinding.binding);
+        }
+
+        methodBinding.tasks.push(task);
+        AnalyzerNodeInfo.addDeferredBinding(node, methodBinding.binding);
+    }
+
+    private _createDeferredBinding(tasks: DeferredBindingTask[]): AnalyzerNodeInfo.DeferredBinding {
+        let isBound = false;
+
+        return () => {
+            if (!isBound) {
+                if (this._isBindingInProgress) {
+                    return false;
+                }
+
+                isBound = true;
+                this._isBindingInProgress = true;
+                try {
+                    this._deferredBindingTasks.push(...tasks);
+                    this._bindDeferred();
+                } finally {
+                    this._isBindingInProgress = false;
+                }
+            }
+
+            return true;
+        };
+    }
+
     private _bindDeferred() {
         while (this._deferredBindingTasks.length > 0) {
             const nextItem = this._deferredBindingTasks.shift()!;
@@ -4905,6 +4993,31 @@ export class YieldFinder extends ParseTreeWalker {
     }
 }
 
+// Determines whether a subtree contains "global" or "nonlocal" statements,
+// which bind names in the scopes that contain the subtree.
+export class OuterScopeBindingFinder extends ParseTreeWalker {
+    private _containsOuterScopeBinding = false;
+
+    checkContainsOuterScopeBinding(node: ParseNode) {
+        this.walk(node);
+        return this._containsOuterScopeBinding;
+    }
+
+    override visitNode(node: ParseNode) {
+        return this._containsOuterScopeBinding ? [] : super.visitNode(node);
+    }
+
+    override visitGlobal(node: GlobalNode): boolean {
+        this._containsOuterScopeBinding = true;
+        return false;
+    }
+
+    override visitNonlocal(node: NonlocalNode): boolean {
+        this._containsOuterScopeBinding = true;
+        return false;
+    }
+}
+
 export class ReturnFinder extends ParseTreeWalker {
     private _containsReturn = false;
 
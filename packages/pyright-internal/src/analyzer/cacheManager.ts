@@ -12,6 +12,7 @@ import type { HeapInfo } from 'v8';
 import { ConsoleInterface } from '../common/console';
 import { fail } from '../common/debug';
 import { getHeapStatistics, getSystemMemoryInfo } from '../common/memUtils';
+import { timingStats } from '../common/timing';
 import { MessageSourceSink } from '../common/workersHost';
 
 export interface CacheOwner {
@@ -21,6 +22,21 @@ export interface CacheOwner {
 
     // Empties the cache, typically in response to a low-memory condition.
     emptyCache(): void;
+
+    // Returns the number of entries and approximate size of each of the
+    // owner's caches, for diagnosing high memory usage.
+    getCacheStats?(): CacheOwnerStats;
+}
+
+export interface CacheStats {
+    name: string;
+    entryCount: number;
+    approximateBytes: number;
+}
+
+export interface CacheOwnerStats {
+    name: string;
+    caches: CacheStats[];
 }
 
 export class CacheManager {
@@ -29,6 +45,7 @@ export class CacheManager {
     private _sharedUsageBuffer: SharedArrayBuffer | undefined;
     private _sharedUsagePosition = 0;
     private _lastHeapStats = Date.now();
+    private _emptyCacheCount = 0;
 
     constructor(private readonly _maxWorkers: number = 0) {
         // Empty
@@ -103,6 +120,26 @@ export class CacheManager {
         return totalUsage;
     }
 
+    // Stats that the caller already computed for some of the owners can be
+    // passed in so they aren't computed again.
+    getCacheStats(knownStats?: Map<CacheOwner, CacheOwnerStats>): CacheOwnerStats[] {
+        const stats: CacheOwnerStats[] = [];
+
+        this._cacheOwners.forEach((p) => {
+            const ownerStats = knownStats?.get(p) ?? p.getCacheStats?.();
+            if (ownerStats) {
+                stats.push(ownerStats);
+            }
+        });
+
+        return stats;
+    }
+
+    // The number of times the caches have been emptied.
+    get emptyCacheCount() {
+        return this._emptyCacheCount;
+    }
+
     emptyCache(console?: ConsoleInterface) {
         if (console) {
             const heapStats = getHeapStatistics();
@@ -110,12 +147,16 @@ export class CacheManager {
             console.info(
                 `Emptying type cache to avoid heap overflow. Used ${this._convertToMB(
                     heapStats.used_heap_size
-                )} out of ${this._convertToMB(heapStats.heap_size_limit)}.`
+                )} out of ${this._convertToMB(heapStats.heap_size_limit)}. ` +
+                    `Previously emptied ${this.emptyCacheCount} times.`
             );
         }
 
-        this._cacheOwners.forEach((p) => {
-            p.emptyCache();
+        this._emptyCacheCount++;
+        timingStats.emptyCacheTime.timeOperation(() => {
+            this._cacheOwners.forEach((p) => {
+                p.emptyCache();
+            });
         });
     }
 
@@ -14,6 +14,7 @@
 import { ConsoleInterface } from '../common/console';
 import { assert, fail } from '../common/debug';
 import { convertOffsetToPosition } from '../common/positionUtils';
+import { cacheStats } from '../common/timing';
 import { ArgCategory, ExpressionNode, ParseNode, ParseNodeType } from '../parser/parseNodes';
 import { getFileInfo, getImportInfo } from './analyzerNodeInfo';
 import {
@@ -474,12 +475,18 @@ export function getCodeFlowEngine(
                     const cachedEntry = getCacheEntry(curFlowNode);
                     if (cachedEntry) {
                         if (!cachedEntry.isIncomplete) {
+                            if (cacheStats.isEnabled) {
+                                cacheStats.codeFlowTypeCache.hitCount++;
+                            }
                             return cachedEntry;
                         }
 
                         // If the cached entry is incomplete, we can use it only if nothing
                         // has changed that may cause the previously-reported incomplete type to change.
                         if (cachedEntry.generationCount === flowIncompleteGeneration) {
+                            if (cacheStats.isEnabled) {
+                                cacheStats.codeFlowTypeCache.hitCount++;
+                            }
                             return FlowNodeTypeResult.create(
                                 cleanIncompleteUnknownForCacheEntry(cachedEntry),
                                 /* isIncomplete */ true
@@ -487,6 +494,10 @@ export function getCodeFlowEngine(
                         }
                     }
 
+                    if (cacheStats.isEnabled) {
+                        cacheStats.codeFlowTypeCache.missCount++;
+                    }
+
                     // Check for recursion.
                     if (flowNodeTypeCache.pendingNodes.has(curFlowNode.id)) {
                         return FlowNodeTypeResult.create(
@@ -0,0 +1,178 @@
+/*
+ * fileScheduler.ts
+ *
+ * Distributes files across the worker processes used for multi-threaded
+ * analysis. Files that are likely to share dependencies are grouped into
+ * clusters so the same worker (and therefore the same type cache) handles
+ * them, clusters are balanced across workers by estimated cost, and idle
+ * workers steal work from the most heavily loaded worker.
+ */
+
+export interface ScheduledFile<T> {
+    // Unique key for the file.
+    key: string;
+
+    // The item handed back to the caller when the file is scheduled.
+    item: T;
+
+    // Estimated relative cost of checking the file (e.g. its size in bytes
+    // or its check time from a previous run).
+    cost: number;
+
+    // Files with the same cluster key are assumed to share most of their
+    // dependencies, e.g. because they're in the same package.
+    clusterKey: string;
+
+    // Keys of other scheduled files this file imports, if known. Files that
+    // import each other are merged into the same cluster.
+    dependencies?: readonly string[];
+}
+
+interface Cluster<T> {
+    files: ScheduledFile<T>[];
+    cost: number;
+}
+
+interface WorkerQueue<T> {
+    files: ScheduledFile<T>[];
+    remainingCost: number;
+}
+
+export class FileScheduler<T> {
+    private readonly _queues: WorkerQueue<T>[] = [];
+    private _stealCount = 0;
+
+    constructor(files: readonly ScheduledFile<T>[], workerCount: number, maxClusterFraction = 0.25) {
+        for (let i = 0; i < workerCount; i++) {
+            this._queues.push({ files: [], remainingCost: 0 });
+        }
+
+        // Don't let any one cluster grow so large that it can't be balanced.
+        const totalCost = files.reduce((total, file) => total + file.cost, 0);
+        const maxClusterCost = Math.max((totalCost / workerCount) * maxClusterFraction, 1);
+        const clusters = this._buildClusters(files, maxClusterCost);
+
+        // Assign the most expensive clusters first, each to the worker with the least
+        // work so far (the "longest processing time" heuristic).
+        clusters.sort((a, b) => b.cost - a.cost);
+        for (const cluster of clusters) {
+            let target = this._queues[0];
+            for (const queue of this._queues) {
+                if (queue.remainingCost < target.remainingCost) {
+                    target = queue;
+                }
+            }
+
+            target.files.push(...cluster.files);
+            target.remainingCost += cluster.cost;
+        }
+    }
+
+    // The number of times a worker had to take work from another worker's queue.
+    get stealCount() {
+        return this._stealCount;
+    }
+
+    get remainingFileCount() {
+        return this._queues.reduce((total, queue) => total + queue.files.length, 0);
+    }
+
+    // Returns the next file for the given worker, or undefined if there's no work left.
+    next(workerIndex: number): T | undefined {
+        const ownQueue = this._queues[workerIndex];
+        const file = ownQueue.files.shift();
+        if (file) {
+            ownQueue.remainingCost -= file.cost;
+            return file.item;
+        }
+
+        // Steal from the end of the queue with the most remaining work. The end
+        // of a queue is the part its owner is least likely to have warmed up.
+        let victim: WorkerQueue<T> | undefined;
+        for (const queue of this._queues) {
+            if (queue.files.length > 0 && (!victim || queue.remainingCost > victim.remainingCost)) {
+                victim = queue;
+            }
+        }
+
+        const stolen = victim?.files.pop();
+        if (!victim || !stolen) {
+            return undefined;
+        }
+
+        victim.remainingCost -= stolen.cost;
+        this._stealCount++;
+        return stolen.item;
+    }
+
+    private _buildClusters(files: readonly ScheduledFile<T>[], maxClusterCost: number): Cluster<T>[] {
+        // Union-find over the cluster keys, merging clusters whose files import each other.
+        const parents = new Map<string, string>();
+        const costs = new Map<string, number>();
+        const fileClusterKeys = new Map<string, string>();
+
+        const find = (key: string): string => {
+            let root = key;
+            while (parents.get(root) !== root) {
+                root = parents.get(root)!;
+            }
+
+            // Compress the path so later lookups are fast.
+            while (key !== root) {
+                const parent = parents.get(key)!;
+                parents.set(key, root);
+                key = parent;
+            }
+
+            return root;
+        };
+
+        for (const file of files) {
+            fileClusterKeys.set(file.key, file.clusterKey);
+            if (!parents.has(file.clusterKey)) {
+                parents.set(file.clusterKey, file.clusterKey);
+                costs.set(file.clusterKey, 0);
+            }
+            costs.set(file.clusterKey, costs.get(file.clusterKey)! + file.cost);
+        }
+
+        for (const file of files) {
+            for (const dependency of file.dependencies ?? []) {
+                const dependencyClusterKey = fileClusterKeys.get(dependency);
+                if (dependencyClusterKey === undefined) {
+                    continue;
+                }
+
+                const root1 = find(file.clusterKey);
+                const root2 = find(dependencyClusterKey);
+                if (root1 === root2) {
+                    continue;
+                }
+
+                const mergedCost = costs.get(root1)! + costs.get(root2)!;
+                if (mergedCost > maxClusterCost) {
+                    continue;
+                }
+
+                parents.set(root2, root1);
+                costs.set(root1, mergedCost);
+            }
+        }
+
+        // Group the files by cluster, preserving their original relative order.
+        const clusters = new Map<string, Cluster<T>>();
+        for (const file of files) {
+            const root = find(file.clusterKey);
+            let cluster = clusters.get(root);
+            if (!cluster) {
+                cluster = { files: [], cost: 0 };
+                clusters.set(root, cluster);
+            }
+
+            cluster.files.push(file);
+            cluster.cost += file.cost;
+        }
+
+        return [...clusters.values()];
+    }
+}
@@ -21,11 +21,13 @@ import { equateStringsCaseInsensitive } from '../common/stringUtils';
 import { Uri } from '../common/uri/uri';
 import { getFileSystemEntriesFromDirEntries } from '../common/uri/uriUtils';
 import { Tokenizer } from '../parser/tokenizer';
+import { CacheStats } from './cacheManager';
 import { ImportLogger } from './importLogger';
 import { ImplicitImport, ImportResult, ImportType } from './importResult';
 import { createImportResolverFileSystem } from './importResolverFileSystem';
 import { getDirectoryLeadingDotsPointsTo } from './importStatementUtils';
 import type { ImportResolverFileSystem, TypeshedInfoProvider } from './importResolverTypes';
+import { ApproximateSize } from './memoryStats';
 import { ImportPath, ParentDirectoryCache } from './parentDirectoryCache';
 import { PyTypedInfo, getPyTypedInfoForPyTypedFile } from './pyTypedUtils';
 import { createDefaultTypeshedInfoProvider } from './typeshedInfoProvider';
@@ -149,6 +151,33 @@ export class ImportResolver {
         this.partialStubs?.clearPartialStubs();
     }
 
+    // Returns the number of entries and approximate size of the caches
+    // of import resolution results.
+    getCacheStats(): CacheStats[] {
+        let importResultCount = 0;
+        this._cachedImportResults.forEach((map) => {
+            importResultCount += map.size;
+        });
+
+        let moduleNameResultCount = 0;
+        this._cachedModuleNameResults.forEach((map) => {
+            moduleNameResultCount += map.size;
+        });
+
+        return [
+            {
+                name: 'import results',
+                entryCount: importResultCount,
+                approximateBytes: importResultCount * ApproximateSize.ImportResult,
+            },
+            {
+                name: 'module names',
+                entryCount: moduleNameResultCount,
+                approximateBytes: moduleNameResultCount * ApproximateSize.ModuleNameResult,
+            },
+        ];
+    }
+
     // Resolves the import and returns the path if it exists, otherwise
     // returns undefined.
     resolveImport(
@@ -0,0 +1,150 @@
+/*
+ * memoryStats.ts
+ *
+ * Approximate statistics about the memory retained by the analyzer's caches
+ * and by the parse and binding results of each source file. The byte counts
+ * are estimates based on typical object sizes. They're meant for finding the
+ * caches and files that are responsible for high memory usage rather than
+ * for exact accounting.
+ */
+
+import { TextRangeCollection } from '../common/textRangeCollection';
+import { Uri } from '../common/uri/uri';
+import { CompactTokenCollection } from '../parser/compactTokenCollection';
+import { isExpressionNode, ParseNode } from '../parser/parseNodes';
+import { ParserOutput } from '../parser/parser';
+import { Token } from '../parser/tokenizerTypes';
+import { getScopeIfBound } from './analyzerNodeInfo';
+import { CacheOwnerStats } from './cacheManager';
+import { ParseTreeWalker } from './parseTreeWalker';
+import { TypeEvaluator } from './typeEvaluatorTypes';
+
+// Approximate number of bytes retained by each item of the given kind,
+// including the objects it references that aren't counted separately.
+export const enum ApproximateSize {
+    Character = 2,
+    Line = 40,
+    Token = 64,
+    CompactToken = 16,
+    ParseNode = 160,
+    Symbol = 120,
+    TypeCacheEntry = 80,
+    ImportResult = 400,
+    ModuleNameResult = 200,
+
+    // Parse and binding results per character of source text. This is a rough
+    // average that is used where walking the parse tree would be too costly.
+    ParsedCharacter = 50,
+}
+
+export interface SourceFileMemoryStats {
+    uri: Uri;
+    textLength: number;
+
+    // Undefined if the tokens aren't retained. They're recreated on demand.
+    tokenCount: number | undefined;
+    parseNodeCount: number;
+    symbolCount: number;
+    typeCacheEntryCount: number;
+    approximateBytes: number;
+}
+
+export interface ProgramMemoryStats {
+    caches: CacheOwnerStats[];
+    parsedFileCount: number;
+
+    // The files that retain the most memory, heaviest first.
+    heaviestFiles: SourceFileMemoryStats[];
+}
+
+export function getSourceFileMemoryStats(
+    uri: Uri,
+    text: string,
+    parserOutput: ParserOutput,
+    tokens: TextRangeCollection<Token> | undefined,
+    evaluator: TypeEvaluator | undefined
+): SourceFileMemoryStats {
+    const walker = new MemoryStatsWalker(evaluator);
+    walker.walk(parserOutput.parseTree);
+
+    const textLength = text.length;
+    const tokenCount = tokens?.count;
+    const bytesPerToken =
+        tokens instanceof CompactTokenCollection ? ApproximateSize.CompactToken : ApproximateSize.Token;
+
+    return {
+        uri,
+        textLength,
+        tokenCount,
+        parseNodeCount: walker.parseNodeCount,
+        symbolCount: walker.symbolCount,
+        typeCacheEntryCount: walker.typeCacheEntryCount,
+        approximateBytes:
+            textLength * ApproximateSize.Character +
+            parserOutput.lines.count * ApproximateSize.Line +
+            (tokenCount ?? 0) * bytesPerToken +
+            walker.parseNodeCount * ApproximateSize.ParseNode +
+            walker.symbolCount * ApproximateSize.Symbol +
+            walker.typeCacheEntryCount * ApproximateSize.TypeCacheEntry,
+    };
+}
+
+export function formatMemoryStats(stats: ProgramMemoryStats): string[] {
+    const output: string[] = [];
+
+    output.push('Cache memory usage (approximate)');
+    stats.caches.forEach((owner) => {
+        output.push(`  ${owner.name}`);
+        owner.caches.forEach((cache) => {
+            output.push(`    ${cache.name}: ${cache.entryCount} entries, ${_formatBytes(cache.approximateBytes)}`);
+        });
+    });
+
+    output.push(`Heaviest files (approximate, ${stats.parsedFileCount} parsed files)`);
+    stats.heaviestFiles.forEach((file) => {
+        const tokens = file.tokenCount === undefined ? 'tokens not retained' : `${file.tokenCount} tokens`;
+        output.push(
+            `  ${_formatBytes(file.approximateBytes)}: ${file.uri.toUserVisibleString()} ` +
+                `(${file.textLength} characters, ${tokens}, ` +
+                `${file.parseNodeCount} parse nodes, ${file.symbolCount} symbols, ` +
+                `${file.typeCacheEntryCount} type cache entries)`
+        );
+    });
+
+    return output;
+}
+
+function _formatBytes(bytes: number) {
+    if (bytes >= 1024 * 1024) {
+        return `${(bytes / (1024 * 1024)).toFixed(1)}MB`;
+    }
+
+    return `${Math.round(bytes / 1024)}KB`;
+}
+
+class MemoryStatsWalker extends ParseTreeWalker {
+    parseNodeCount = 0;
+    symbolCount = 0;
+    typeCacheEntryCount = 0;
+
+    constructor(private readonly _evaluator: TypeEvaluator | undefined) {
+        super();
+    }
+
+    override visitNode(node: ParseNode) {
+        this.parseNodeCount++;
+
+        // Don't bind function bodies whose binding was deferred just to count
+        // their symbols.
+        const scope = getScopeIfBound(node);
+        if (scope) {
+            this.symbolCount += scope.symbolTable.size;
+        }
+
+        if (this._evaluator && isExpressionNode(node) && this._evaluator.getCachedType(node)) {
+            this.typeCacheEntryCount++;
+        }
+
+        return super.visitNode(node);
+    }
+}
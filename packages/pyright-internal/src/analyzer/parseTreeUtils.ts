@@ -25,12 +25,14 @@ import {
     ExecutionScopeNode,
     ExpressionNode,
     FunctionNode,
+    GlobalNode,
     ImportFromNode,
     IndexNode,
     LambdaNode,
     MemberAccessNode,
     ModuleNode,
     NameNode,
+    NonlocalNode,
     ParamCategory,
     ParameterNode,
     ParseNode,
@@ -42,6 +44,8 @@ import {
     SuiteNode,
     TypeAnnotationNode,
     TypeParameterScopeNode,
+    YieldFromNode,
+    YieldNode,
     isExpressionNode,
 } from '../parser/parseNodes';
 import { OperatorTypeNameMap, ParseNodeTypeNameMap } from '../parser/parseNodeUtils';
@@ -1271,6 +1275,156 @@ export function containsAwaitNode(node: ParseNode): boolean {
     return foundAwait;
 }
 
+// Returns the body of the innermost function that contains the specified
+// range and whose body is isolated (see isFunctionBodyIsolated). The range
+// can extend to the end of the body but must start after its colon.
+export function getIsolatedFunctionBody(node: ModuleNode, start: number, end: number): SuiteNode | undefined {
+    let curNode = findNodeByOffset(node, start);
+
+    while (curNode) {
+        if (curNode.nodeType === ParseNodeType.Function) {
+            const suite = curNode.d.suite;
+            if (suite.start < start && end <= TextRange.getEnd(suite) && isFunctionBodyIsolated(curNode)) {
+                return suite;
+            }
+        }
+
+        curNode = curNode.parent;
+    }
+
+    return undefined;
+}
+
+// Determines whether the body of a function can be changed without affecting
+// the types and symbols that are visible outside of the function. This requires
+// a declared return type, a body that is clearly implemented (empty bodies and
+// bodies that just raise an exception are treated as unimplemented in protocols
+// and abstract classes) and no statements that declare symbols in other scopes.
+export function isFunctionBodyIsolated(node: FunctionNode): boolean {
+    if (!node.d.returnAnnotation && !node.d.funcAnnotationComment) {
+        return false;
+    }
+
+    const statements = node.d.suite.d.statements;
+    if (statements.every((statement) => statement.nodeType === ParseNodeType.StatementList)) {
+        const substatements = statements.flatMap((statement) =>
+            statement.nodeType === ParseNodeType.StatementList ? statement.d.statements : []
+        );
+
+        if (!substatements.some((substatement) => substatement.nodeType === ParseNodeType.Return)) {
+            if (
+                substatements.some((substatement) => substatement.nodeType === ParseNodeType.Raise) ||
+                isSuiteEmpty(node.d.suite)
+            ) {
+                return false;
+            }
+        }
+    }
+
+    let isIsolated = true;
+
+    class IsolatedBodyWalker extends ParseTreeWalker {
+        override visitGlobal(node: GlobalNode) {
+            isIsolated = false;
+            return false;
+        }
+
+        override visitNonlocal(node: NonlocalNode) {
+            isIsolated = false;
+            return false;
+        }
+
+        override visitMemberAccess(node: MemberAccessNode) {
+            // Assignments to members of "self" or "cls" declare class and instance variables.
+            if (isWriteAccess(node.d.member)) {
+                isIsolated = false;
+                return false;
+            }
+
+            return true;
+        }
+
+        // A yield statement changes an async function from a coroutine
+        // to an async generator.
+        override visitYield(yieldNode: YieldNode) {
+            if (node.d.isAsync) {
+                isIsolated = false;
+            }
+            return true;
+        }
+
+        override visitYieldFrom(yieldNode: YieldFromNode) {
+            if (node.d.isAsync) {
+                isIsolated = false;
+            }
+            return true;
+        }
+    }
+
+    const walker = new IsolatedBodyWalker();
+    walker.walk(node.d.suite);
+    return isIsolated;
+}
+
+// Returns a textual summary of the parts of a module that can affect the files
+// that import it. Whitespace, comments and the bodies of isolated functions (see
+// isFunctionBodyIsolated) are omitted, so edits that are confined to those leave
+// the summary unchanged. Type comments and pyright directives (other than "ignore")
+// are kept because they can change the inferred types of declarations.
+export function getModuleInterfaceText(
+    parseFileResults: Pick<ParseFileResults, 'parserOutput' | 'tokenizerOutput' | 'text'>
+): string {
+    const excludedRanges: TextRange[] = [];
+
+    class IsolatedBodyCollector extends ParseTreeWalker {
+        override visitFunction(node: FunctionNode) {
+            if (isFunctionBodyIsolated(node)) {
+                excludedRanges.push(node.d.suite);
+                return false;
+            }
+
+            return true;
+        }
+    }
+
+    // The walker visits the functions in source order, so the ranges are sorted.
+    const collector = new IsolatedBodyCollector();
+    collector.walk(parseFileResults.parserOutput.parseTree);
+
+    const text = parseFileResults.text;
+    const tokens = parseFileResults.tokenizerOutput.tokens;
+    const parts: string[] = [];
+    let rangeIndex = 0;
+
+    for (let i = 0; i < tokens.count; i++) {
+        const token = tokens.getItemAt(i);
+
+        // Type comments are kept even within isolated bodies because a function
+        // signature comment is attached to the first token of the body.
+        token.comments?.forEach((comment) => {
+            if (/^\s*(type:|pyright:(?!\s*ignore))/.test(comment.value)) {
+                parts.push(`#${comment.value}`);
+            }
+        });
+
+        while (rangeIndex < excludedRanges.length && TextRange.getEnd(excludedRanges[rangeIndex]) <= token.start) {
+            rangeIndex++;
+        }
+
+        if (rangeIndex < excludedRanges.length && excludedRanges[rangeIndex].start <= token.start) {
+            continue;
+        }
+
+        if (token.type === TokenType.NewLine || token.type === TokenType.Indent || token.type === TokenType.Dedent) {
+            parts.push(`${token.type}`);
+        } else {
+            parts.push(`${token.type}:${text.substr(token.start, token.length)}`);
+        }
+    }
+
+    return parts.join('\n');
+}
+
 // Determines whether two expressions match. Names are compared by value only
 // unless an optional compareName function is provided. In that case, the
 // compareName function is called to determine whether the two names match.
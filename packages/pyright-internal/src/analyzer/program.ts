@@ -31,13 +31,15 @@ import { Duration, timingStats } from '../common/timing';
 import { Uri } from '../common/uri/uri';
 import { ParseFileResults, ParserOutput } from '../parser/parser';
 import { RequiringAnalysisCount } from './analysis';
+import { AnalysisCache } from './analysisCache';
 import { AbsoluteModuleDescriptor, ImportLookupResult, LookupImportOptions } from './analyzerFileInfo';
 import { CellChainIndex, CellChainIndexProvider } from './cellChainIndex';
 import * as AnalyzerNodeInfo from './analyzerNodeInfo';
-import { CacheManager } from './cacheManager';
+import { CacheManager, CacheOwner, CacheOwnerStats } from './cacheManager';
 import { CircularDependency } from './circularDependency';
 import { ImportResolver } from './importResolver';
 import { ImportResult, ImportType } from './importResult';
+import { ApproximateSize, formatMemoryStats, ProgramMemoryStats, SourceFileMemoryStats } from './memoryStats';
 import { getDocString } from './parseTreeUtils';
 import { ISourceFileFactory } from './programTypes';
 import { Scope } from './scope';
@@ -55,6 +57,25 @@ import { BaselineHandler, BaselineMode } from '../baseline';
 
 const _maxImportDepth = 256;
 
+// When the cache is emptied because memory is running low, the parse and bind
+// information for this fraction of the most recently used files is retained
+// so they don't all need to be re-parsed and re-bound.
+const _retainedFileFractionOnEmptyCache = 0.5;
+
+// When the parse and bind information of the files exceeds the configured
+// memory budget, the least recently used files are discarded until what's
+// retained fits in this fraction of the budget. The margin avoids discarding
+// files again as soon as a few more files are parsed.
+const _retainedBudgetFractionOnEviction = 0.75;
+
+// Number of files that are checked between checks of the memory budget. A
+// check iterates over the parsed files, so it isn't done for every file.
+const _filesCheckedPerMemoryBudgetCheck = 8;
+
+// Number of most recently changed files whose dependents are checked ahead of
+// the other files in the program.
+const _maxRecentlyChangedFiles = 64;
+
 // Helper function to check if a diagnostic should be filtered due to disableTaggedHints.
 // Tagged hints include unreachable code, unused code, and deprecated symbols.
 function isTaggedHintDiagnostic(diag: Diagnostic): boolean {
@@ -74,6 +95,21 @@ export interface MaxAnalysisTime {
     noOpenFilesTimeInMs: number;
 }
 
+interface PendingFileChange {
+    // The expected range of the function body if the edits were confined to it.
+    bodyRange: TextRange | undefined;
+    fileContentsVersion: number;
+
+    // The file's interface fingerprint and line count from before the change.
+    interfaceFingerprint: string | undefined;
+    lineCount: number | undefined;
+}
+
+interface PendingAnalysisCacheEntry {
+    fileInfo: SourceFileInfo;
+    fingerprint: string;
+}
+
 interface UpdateImportInfo {
     path: Uri;
     isTypeshedFile: boolean;
@@ -154,6 +190,26 @@ export class Program {
     private _editModeTracker = new EditModeTracker();
     private _sourceFileFactory: ISourceFileFactory;
     private _baselineHandler: BaselineHandler;
+    private _analysisCache: AnalysisCache | undefined;
+
+    // Changed files whose edits might not affect the files that depend on them,
+    // either because the edits were confined to the body of an isolated function
+    // or because the file's interface fingerprint may be unchanged. Dependent files
+    // aren't marked dirty unless the file's next parse shows that they need to be.
+    private _pendingFileChanges = new Map<string, PendingFileChange>();
+
+    // Files that have been parsed or bound, ordered from least to most recently used.
+    private _fileAccessOrder = new Map<string, SourceFileInfo>();
+
+    // Files whose contents have changed, ordered from least to most recently changed.
+    private _recentlyChangedFiles = new Map<string, SourceFileInfo>();
+
+    // Files that were checked (rather than restored from the analysis cache)
+    // and whose results should be written to the cache once analysis completes.
+    private _pendingAnalysisCacheEntries = new Map<string, PendingAnalysisCacheEntry>();
+
+    private _filesCheckedSinceMemoryBudgetCheck = 0;
+    private _isMemoryBudgetTooSmallReported = false;
 
     constructor(
         initialImportResolver: ImportResolver,
@@ -170,6 +226,7 @@ export class Program {
 
         this._sourceFileFactory = serviceProvider.sourceFileFactory();
         this._baselineHandler = new BaselineHandler(this.fileSystem, this._configOptions, this._console);
+        this._analysisCache = this._createAnalysisCache();
 
         this._cacheManager = serviceProvider.tryGet(ServiceKeys.cacheManager) ?? new CacheManager();
         this._cacheManager.registerCacheOwner(this);
@@ -286,6 +343,8 @@ export class Program {
         this._configOptions = configOptions;
         this._importResolver.setConfigOptions(configOptions);
         this._baselineHandler.configOptions = configOptions;
+        this._analysisCache = this._createAnalysisCache();
+        this._pendingAnalysisCacheEntries.clear();
 
         // Create a new evaluator with the updated config options.
         this._createNewEvaluator();
@@ -545,8 +604,7 @@ export class Program {
             // This won't matter much for OpenFileOnly users, but it will matter for
             // people who use diagnosticMode Workspace.
             if (sourceFileInfo.sourceFile.didContentsChangeOnDisk()) {
-                sourceFileInfo.sourceFile.markDirty();
-                this._markFileDirtyRecursive(sourceFileInfo, new Set<string>());
+                this._markFileContentsChanged(sourceFileInfo, new Set<string>());
             }
         }
 
@@ -555,26 +613,25 @@ export class Program {
 
     markAllFilesDirty(evenIfContentsAreSame: boolean) {
         const markDirtySet = new Set<string>();
+        let contentsChanged = false;
 
         this._sourceFileList.forEach((sourceFileInfo) => {
             if (evenIfContentsAreSame) {
                 sourceFileInfo.sourceFile.markDirty();
             } else if (sourceFileInfo.sourceFile.didContentsChangeOnDisk()) {
-                sourceFileInfo.sourceFile.markDirty();
-
-                // Mark any files that depend on this file as dirty
-                // also. This will retrigger analysis of these other files.
-                this._markFileDirtyRecursive(sourceFileInfo, markDirtySet);
+                this._markFileContentsChanged(sourceFileInfo, markDirtySet);
+                contentsChanged = true;
             }
         });
 
-        if (markDirtySet.size > 0) {
+        if (contentsChanged) {
             this._createNewEvaluator();
         }
     }
 
     markFilesDirty(fileUris: Uri[], evenIfContentsAreSame: boolean) {
         const markDirtySet = new Set<string>();
+        let contentsChanged = false;
         fileUris.forEach((fileUri) => {
             const sourceFileInfo = this.getSourceFileInfo(fileUri);
             if (sourceFileInfo) {
@@ -594,16 +651,13 @@ export class Program {
                     evenIfContentsAreSame ||
                     (!sourceFileInfo.isOpenByClient && sourceFileInfo.sourceFile.didContentsChangeOnDisk())
                 ) {
-                    sourceFileInfo.sourceFile.markDirty();
-
-                    // Mark any files that depend on this file as dirty
-                    // also. This will retrigger analysis of these other files.
-                    this._markFileDirtyRecursive(sourceFileInfo, markDirtySet);
+                    this._markFileContentsChanged(sourceFileInfo, markDirtySet);
+                    contentsChanged = true;
                 }
             }
         });
 
-        if (markDirtySet.size > 0) {
+        if (contentsChanged) {
             this._createNewEvaluator();
         }
     }
@@ -751,8 +805,13 @@ export class Program {
     analyze(maxTime?: MaxAnalysisTime, token: CancellationToken = CancellationToken.None): boolean {
         return this._runEvaluatorWithCancellationToken(token, () => {
             this._baselineHandler.invalidateCache();
+            this._resolvePendingFileChanges();
             const elapsedTime = new Duration();
 
+            // A file that's marked dirty while it's being checked (e.g. because a file it
+            // imports was parsed again) needs another pass to be checked again.
+            let isRecheckNeeded = false;
+
             const openFiles = this._sourceFileList.filter(
                 (sf) => sf.isOpenByClient && sf.sourceFile.isCheckingRequired()
             );
@@ -763,6 +822,9 @@ export class Program {
                 // Check the open files.
                 for (const sourceFileInfo of openFiles) {
                     if (this._checkTypes(sourceFileInfo)) {
+                        isRecheckNeeded ||= sourceFileInfo.sourceFile.isCheckingRequired();
+                        this._enforceMemoryBudget();
+
                         if (elapsedTime.getDurationInMilliseconds() > effectiveMaxTime) {
                             return true;
                         }
@@ -781,12 +843,11 @@ export class Program {
                 const effectiveMaxTime = maxTime ? maxTime.noOpenFilesTimeInMs : Number.MAX_VALUE;
 
                 // Now do type parsing and analysis of the remaining.
-                for (const sourceFileInfo of this._sourceFileList) {
-                    if (!isUserCode(sourceFileInfo)) {
-                        continue;
-                    }
-
+                for (const sourceFileInfo of this._getFilesToCheckInPriorityOrder()) {
                     if (this._checkTypes(sourceFileInfo)) {
+                        isRecheckNeeded ||= sourceFileInfo.sourceFile.isCheckingRequired();
+                        this._enforceMemoryBudget();
+
                         if (elapsedTime.getDurationInMilliseconds() > effectiveMaxTime) {
                             return true;
                         }
@@ -794,14 +855,52 @@ export class Program {
                 }
             }
 
-            return false;
+            this._flushAnalysisCache();
+            return isRecheckNeeded;
         });
     }
 
+    // Returns the user files in the order in which they should be checked: the files
+    // that changed most recently and the files that depend on them come first since
+    // their diagnostics are the most likely to have changed, followed by the files
+    // that are imported by or import the open files, followed by the rest.
+    private *_getFilesToCheckInPriorityOrder(): Iterable<SourceFileInfo> {
+        const prioritizedFiles = new Set<SourceFileInfo>();
+        const addPrioritizedFile = (sourceFileInfo: SourceFileInfo) => {
+            if (isUserCode(sourceFileInfo) && sourceFileInfo.sourceFile.isCheckingRequired()) {
+                prioritizedFiles.add(sourceFileInfo);
+            }
+        };
+
+        for (const sourceFileInfo of [...this._recentlyChangedFiles.values()].reverse()) {
+            addPrioritizedFile(sourceFileInfo);
+            sourceFileInfo.importedBy.forEach(addPrioritizedFile);
+        }
+
+        for (const sourceFileInfo of this._sourceFileList) {
+            if (sourceFileInfo.isOpenByClient) {
+                sourceFileInfo.imports.forEach(addPrioritizedFile);
+                sourceFileInfo.importedBy.forEach(addPrioritizedFile);
+            }
+        }
+
+        yield* prioritizedFiles;
+
+        for (const sourceFileInfo of this._sourceFileList) {
+            if (isUserCode(sourceFileInfo) && !prioritizedFiles.has(sourceFileInfo)) {
+                yield sourceFileInfo;
+            }
+        }
+    }
+
     // Performs parsing and analysis of a single file in the program. If the file is not part of
     // the program returns false to indicate analysis was not performed.
     analyzeFile(fileUri: Uri, token: CancellationToken = CancellationToken.None): boolean {
         return this._runEvaluatorWithCancellationToken(token, () => {
+            // Make sure the files that depend on edited files are marked dirty before
+            // they're checked rather than while they're being checked.
+            this._resolvePendingFileChanges();
+
             const sourceFileInfo = this.getSourceFileInfo(fileUri);
             if (sourceFileInfo && this._checkTypes(sourceFileInfo, { skipFileNeededCheck: true })) {
                 return true;
@@ -897,6 +996,27 @@ export class Program {
         });
     }
 
+    // Returns approximate statistics about the memory retained by the caches
+    // and the files with the heaviest parse and binding results.
+    getMemoryStats(maxFileCount: number): ProgramMemoryStats {
+        // Walk the parse trees once and reuse the results for this program's cache stats.
+        const fileStats = this._getFileMemoryStats(this._evaluator);
+        const ownStats = new Map<CacheOwner, CacheOwnerStats>([[this, this._getCacheStats(fileStats)]]);
+
+        return {
+            caches: this._cacheManager.getCacheStats(ownStats),
+            parsedFileCount: fileStats.length,
+            heaviestFiles: fileStats.sort((a, b) => b.approximateBytes - a.approximateBytes).slice(0, maxFileCount),
+        };
+    }
+
+    printMemoryStats(maxFileCount: number) {
+        this._console.info('');
+        formatMemoryStats(this.getMemoryStats(maxFileCount)).forEach((line) => {
+            this._console.info(line);
+        });
+    }
+
     // Prints import dependency information for each of the files in
     // the program, skipping any typeshed files.
     printDependencies(projectRootDir: Uri, verbose: boolean) {
@@ -1156,11 +1276,15 @@ export class Program {
         return Math.max(entryCountRatio, fileCountRatio);
     }
 
-    // Discards any cached information associated with this program.
+    getCacheStats(): CacheOwnerStats {
+        return this._getCacheStats(this._getFileMemoryStats(/* evaluator */ undefined));
+    }
+
+    // Discards the cached type information associated with this program along
+    // with the parse results of files that haven't been used recently.
     emptyCache() {
         this._createNewEvaluator();
-        this._discardCachedParseResults();
-        this._parsedFileCount = 0;
+        this._parsedFileCount = this._discardColdParseResults();
 
         this.serviceProvider.tryGet(ServiceKeys.stateMutationListeners)?.forEach((l) => l.onClearCache?.());
     }
@@ -1190,6 +1314,45 @@ export class Program {
         // Empty
     }
 
+    private _getCacheStats(fileStats: SourceFileMemoryStats[]): CacheOwnerStats {
+        // Type cache entries are counted separately, so don't count them per file.
+        const typeCacheEntryCount = this._evaluator!.getTypeCacheEntryCount();
+
+        return {
+            name: `program ${this._id}`,
+            caches: [
+                {
+                    name: 'parse results',
+                    entryCount: fileStats.length,
+                    approximateBytes: fileStats.reduce(
+                        (total, stats) =>
+                            total + stats.approximateBytes - stats.typeCacheEntryCount * ApproximateSize.TypeCacheEntry,
+                        0
+                    ),
+                },
+                {
+                    name: 'type cache',
+                    entryCount: typeCacheEntryCount,
+                    approximateBytes: typeCacheEntryCount * ApproximateSize.TypeCacheEntry,
+                },
+                ...this._importResolver.getCacheStats(),
+            ],
+        };
+    }
+
+    private _getFileMemoryStats(evaluator: TypeEvaluator | undefined) {
+        const fileStats: SourceFileMemoryStats[] = [];
+
+        this._sourceFileList.forEach((fileInfo) => {
+            const stats = fileInfo.sourceFile.getMemoryStats(evaluator);
+            if (stats) {
+                fileStats.push(stats);
+            }
+        });
+
+        return fileStats;
+    }
+
     private _isNonUserTypeshedFile = (sourceFile: SourceFile) =>
         sourceFile.isTypingStubFile() || sourceFile.isTypeshedStubFile() || sourceFile.isBuiltInStubFile();
 
@@ -1231,12 +1394,155 @@ export class Program {
         }
     }
 
-    // Discards all cached parse results and file contents to free up memory.
-    // It does not discard cached index results or diagnostics for files.
-    private _discardCachedParseResults() {
+    // Evicts the parse and bind information of the least recently used files
+    // that aren't open if its approximate size exceeds the memory budget set
+    // in the config options. Like emptyCache, this discards the evaluator's
+    // cached types, because they refer to the evicted files' parse trees.
+    private _enforceMemoryBudget() {
+        const memoryBudgetMB = this._configOptions.memoryBudgetMB;
+        if (!memoryBudgetMB) {
+            return;
+        }
+
+        if (++this._filesCheckedSinceMemoryBudgetCheck < _filesCheckedPerMemoryBudgetCheck) {
+            return;
+        }
+        this._filesCheckedSinceMemoryBudgetCheck = 0;
+
+        const budgetInBytes = memoryBudgetMB * 1024 * 1024;
+        let usedBytes = (this._evaluator?.getTypeCacheEntryCount() ?? 0) * ApproximateSize.TypeCacheEntry;
+        this._fileAccessOrder.forEach((fileInfo) => {
+            usedBytes += fileInfo.sourceFile.getApproximateParseResultsSize();
+        });
+
+        if (usedBytes <= budgetInBytes) {
+            return;
+        }
+
+        // The open files (and the files their scopes refer to) are never discarded. If they
+        // alone don't fit in the target, discarding the other files and the type cache
+        // wouldn't bring the usage below it, and it would only happen again and again.
+        const targetBytes = budgetInBytes * _retainedBudgetFractionOnEviction;
+        const openFilesBytes = this._retainOpenFiles(new Set<SourceFileInfo>());
+        if (openFilesBytes > targetBytes) {
+            if (!this._isMemoryBudgetTooSmallReported) {
+                this._isMemoryBudgetTooSmallReported = true;
+                this._console.warn(
+                    `The memory budget of ${memoryBudgetMB}MB is too small for the open files, which use ` +
+                        `approximately ${Math.round(openFilesBytes / (1024 * 1024))}MB. It isn't enforced ` +
+                        `while they use more than ${Math.round(_retainedBudgetFractionOnEviction * 100)}% of it.`
+                );
+            }
+            return;
+        }
+
+        if (this._configOptions.verboseOutput) {
+            this._console.info(
+                `Approximate memory usage of ${Math.round(usedBytes / (1024 * 1024))}MB ` +
+                    `exceeds the memory budget of ${memoryBudgetMB}MB`
+            );
+        }
+
+        // The files are evicted in a single batch, after which the type cache is
+        // discarded once, rather than for each evicted file.
+        this._parsedFileCount = this._discardColdParseResults(targetBytes);
+        this._createNewEvaluator();
+
+        this.serviceProvider.tryGet(ServiceKeys.stateMutationListeners)?.forEach((l) => l.onClearCache?.());
+    }
+
+    // Adds the file to retainedFiles, along with the files its scopes refer to, and
+    // returns the approximate size of the parse results of the files that were added.
+    private _retainFile(fileInfo: SourceFileInfo | undefined, retainedFiles: Set<SourceFileInfo>) {
+        let retainedBytes = 0;
+
+        // The scopes of a bound file refer to the scopes of its builtins
+        // and chained files, so those need to be retained too.
+        while (fileInfo && !retainedFiles.has(fileInfo)) {
+            retainedFiles.add(fileInfo);
+            retainedBytes += fileInfo.sourceFile.getApproximateParseResultsSize();
+            fileInfo = this._getImplicitImports(fileInfo);
+        }
+
+        return retainedBytes;
+    }
+
+    // Adds the open files to retainedFiles (see _retainFile) and returns the
+    // approximate size of the parse results of the files that were added.
+    private _retainOpenFiles(retainedFiles: Set<SourceFileInfo>) {
+        let retainedBytes = 0;
+        this._sourceFileList.forEach((fileInfo) => {
+            if (fileInfo.isOpenByClient) {
+                retainedBytes += this._retainFile(fileInfo, retainedFiles);
+            }
+        });
+
+        return retainedBytes;
+    }
+
+    // Discards cached parse results and file contents to free up memory, except
+    // for open files and the most recently used files. If maxRetainedBytes is
+    // specified, the most recently used files are retained while their approximate
+    // size fits in it. Otherwise, a fixed fraction of them is retained. It does not
+    // discard cached index results or diagnostics for files. Returns the number of
+    // files whose parse results were retained.
+    private _discardColdParseResults(maxRetainedBytes?: number) {
+        const retainedFiles = new Set<SourceFileInfo>();
+        let retainedBytes = this._retainOpenFiles(retainedFiles);
+        const retainFile = (fileInfo: SourceFileInfo) => {
+            retainedBytes += this._retainFile(fileInfo, retainedFiles);
+        };
+
+        const filesByAccess = [...this._fileAccessOrder.values()];
+        if (maxRetainedBytes === undefined) {
+            const retainedCount = Math.floor(filesByAccess.length * _retainedFileFractionOnEmptyCache);
+            filesByAccess.slice(filesByAccess.length - retainedCount).forEach((fileInfo) => retainFile(fileInfo));
+        } else {
+            for (let i = filesByAccess.length - 1; i >= 0; i--) {
+                const fileInfo = filesByAccess[i];
+                if (retainedFiles.has(fileInfo)) {
+                    continue;
+                }
+
+                if (retainedBytes + fileInfo.sourceFile.getApproximateParseResultsSize() > maxRetainedBytes) {
+                    break;
+                }
+
+                retainFile(fileInfo);
+            }
+        }
+
+        let discardedCount = 0;
         for (const sourceFileInfo of this._sourceFileList) {
+            if (retainedFiles.has(sourceFileInfo) || sourceFileInfo.sourceFile.isParseRequired()) {
+                continue;
+            }
+
             sourceFileInfo.sourceFile.dropParseAndBindInfo();
+            if (sourceFileInfo.sourceFile.isParseRequired()) {
+                this._fileAccessOrder.delete(sourceFileInfo.uri.key);
+                discardedCount++;
+            }
         }
+
+        const parsedFileCount = this._sourceFileList.filter(
+            (fileInfo) => !fileInfo.sourceFile.isParseRequired()
+        ).length;
+
+        if (this._configOptions.verboseOutput) {
+            this._console.info(
+                `Discarded parse results for ${discardedCount} files, retained ${parsedFileCount} recently used files`
+            );
+        }
+
+        return parsedFileCount;
+    }
+
+    // Records that a file was used so the least recently used files can be
+    // discarded first when memory is running low.
+    private _markFileUsed(fileInfo: SourceFileInfo) {
+        this._fileAccessOrder.delete(fileInfo.uri.key);
+        this._fileAccessOrder.set(fileInfo.uri.key, fileInfo);
     }
 
     // Wrapper function that should be used when invoking this._evaluator
@@ -1732,6 +2038,9 @@ export class Program {
 
     private _removeSourceFileFromListAndMap(fileUri: Uri, indexToRemove: number) {
         this._sourceFileMap.delete(fileUri.key);
+        this._fileAccessOrder.delete(fileUri.key);
+        this._recentlyChangedFiles.delete(fileUri.key);
+        this._pendingFileChanges.delete(fileUri.key);
         this._sourceFileList.splice(indexToRemove, 1);
     }
 
@@ -1850,7 +2159,13 @@ export class Program {
     }
 
     private _parseFile(fileToParse: SourceFileInfo, content?: string, skipFileNeededCheck?: boolean) {
-        if (!this._isFileNeeded(fileToParse, skipFileNeededCheck) || !fileToParse.sourceFile.isParseRequired()) {
+        if (!this._isFileNeeded(fileToParse, skipFileNeededCheck)) {
+            return;
+        }
+
+        this._markFileUsed(fileToParse);
+
+        if (!fileToParse.sourceFile.isParseRequired()) {
             return;
         }
 
@@ -1863,6 +2178,34 @@ export class Program {
             this._updateSourceFileImports(fileToParse, this._configOptions);
         }
 
+        const pendingChange = this._pendingFileChanges.get(fileToParse.uri.key);
+        if (pendingChange) {
+            this._pendingFileChanges.delete(fileToParse.uri.key);
+
+            // If the edits turned out to affect more than a function body and
+            // changed the file's interface, the files that depend on this one
+            // need to be checked again.
+            const sourceFile = fileToParse.sourceFile;
+            const isBodyEdit =
+                !!pendingChange.bodyRange &&
+                pendingChange.fileContentsVersion === sourceFile.getFileContentsVersion() &&
+                sourceFile.isIsolatedFunctionBody(pendingChange.bodyRange);
+
+            // If lines were added or removed, the declarations that follow the edit
+            // have moved, and the diagnostics of the dependent files can refer to them.
+            const isLineCountChanged =
+                pendingChange.lineCount === undefined || pendingChange.lineCount !== sourceFile.getParsedLineCount();
+
+            if (
+                isLineCountChanged ||
+                (!isBodyEdit &&
+                    (!pendingChange.interfaceFingerprint ||
+                        pendingChange.interfaceFingerprint !== sourceFile.getInterfaceFingerprint()))
+            ) {
+                this._markFileDirtyRecursive(fileToParse, new Set<string>());
+            }
+        }
+
         if (fileToParse.sourceFile.isFileDeleted()) {
             fileToParse.isTracked = false;
 
@@ -1876,6 +2219,59 @@ export class Program {
         }
     }
 
+    // Marks a file whose contents have changed as dirty. Files that depend on it
+    // are marked dirty too unless the change might not be visible to them. In that
+    // case, the decision is deferred until the file is parsed again (see _parseFile).
+    private _markFileContentsChanged(sourceFileInfo: SourceFileInfo, markDirtySet: Set<string>) {
+        const fileUri = sourceFileInfo.uri;
+        const sourceFile = sourceFileInfo.sourceFile;
+
+        // These need to be computed from the parse results that precede the change.
+        const bodyRange = sourceFileInfo.isOpenByClient ? sourceFile.getIsolatedFunctionBodyEdit() : undefined;
+        const interfaceFingerprint = sourceFile.getInterfaceFingerprint();
+        const lineCount = sourceFile.getParsedLineCount();
+
+        sourceFile.markDirty();
+
+        this._recentlyChangedFiles.delete(fileUri.key);
+        this._recentlyChangedFiles.set(fileUri.key, sourceFileInfo);
+        if (this._recentlyChangedFiles.size > _maxRecentlyChangedFiles) {
+            this._recentlyChangedFiles.delete(this._recentlyChangedFiles.keys().next().value!);
+        }
+
+        // Files that are chained to this one refer to its module scope directly,
+        // so they always need to be rebound.
+        const isChainedFile =
+            !!sourceFileInfo.chainedSourceFile ||
+            sourceFileInfo.importedBy.some((dep) => dep.chainedSourceFile === sourceFileInfo);
+
+        if ((bodyRange || interfaceFingerprint) && !isChainedFile && !markDirtySet.has(fileUri.key)) {
+            this._pendingFileChanges.set(fileUri.key, {
+                bodyRange,
+                fileContentsVersion: sourceFile.getFileContentsVersion(),
+                interfaceFingerprint,
+                lineCount,
+            });
+        } else {
+            this._pendingFileChanges.delete(fileUri.key);
+
+            // Mark any files that depend on this file as dirty
+            // also. This will retrigger analysis of these other files.
+            this._markFileDirtyRecursive(sourceFileInfo, markDirtySet);
+        }
+    }
+
+    // Parses the files with pending changes so that the files that depend
+    // on them are marked dirty (if necessary) before they're checked.
+    private _resolvePendingFileChanges() {
+        for (const fileKey of [...this._pendingFileChanges.keys()]) {
+            const sourceFileInfo = this._sourceFileMap.get(fileKey);
+            if (sourceFileInfo) {
+                this._parseFile(sourceFileInfo);
+            }
+        }
+    }
+
     private _getImplicitImports(file: SourceFileInfo) {
         // If file is builtins.pyi, then chainedSourceFile might not exist or be incorrect.
         if (file.builtinsImport === file) {
@@ -1935,10 +2331,16 @@ export class Program {
         skipFileNeededCheck = false,
         isImplicitImport = false
     ): boolean {
-        if (!this._isFileNeeded(fileToBind, skipFileNeededCheck) || !fileToBind.sourceFile.isBindingRequired()) {
+        if (!this._isFileNeeded(fileToBind, skipFileNeededCheck)) {
             return !fileToBind.sourceFile.isBindingRequired();
         }
 
+        this._markFileUsed(fileToBind);
+
+        if (!fileToBind.sourceFile.isBindingRequired()) {
+            return true;
+        }
+
         this._parseFile(fileToBind, content, skipFileNeededCheck);
 
         // Create a function to get the scope info.
@@ -2141,6 +2543,27 @@ export class Program {
                 return false;
             }
 
+            // If a previous run already produced results for this exact file and
+            // dependency closure, reuse them rather than binding and checking it.
+            const cacheFingerprint = this._getAnalysisCacheFingerprint(fileToCheck);
+            if (cacheFingerprint !== undefined) {
+                const cachedDiagnostics = this._analysisCache!.get(fileToCheck.uri, cacheFingerprint);
+                if (cachedDiagnostics) {
+                    logState.add(`restored from analysis cache`);
+                    fileToCheck.sourceFile.restoreCachedDiagnostics(this._configOptions, cachedDiagnostics);
+
+                    // The cycles are already part of the restored diagnostics, but they
+                    // also need to be reported in the other files that are part of them.
+                    this._detectImportCycles(fileToCheck);
+                    return true;
+                }
+
+                this._pendingAnalysisCacheEntries.set(fileToCheck.uri.key, {
+                    fileInfo: fileToCheck,
+                    fingerprint: cacheFingerprint,
+                });
+            }
+
             // Bind the file if necessary even if we're not going to run the checker.
             // disableChecker means disable semantic errors, not syntax errors. We need to bind again
             // in order to generate syntax errors.
@@ -2175,38 +2598,42 @@ export class Program {
                 }
             }
 
-            // Detect import cycles that involve the file.
-            if (this._configOptions.diagnosticRuleSet.reportImportCycles !== 'none') {
-                // Don't detect import cycles when doing type stub generation. Some
-                // third-party modules are pretty convoluted.
-                // Or if the file is the notebook cell. notebook cell can't have cycles.
-                if (!this._allowedThirdPartyImports && fileToCheck.ipythonMode !== IPythonMode.CellDocs) {
-                    // We need to force all of the files to be parsed and build
-                    // a closure map for the files.
-                    const closureMap = new Map<string, SourceFileInfo>();
-                    this._getImportsRecursive(fileToCheck, closureMap, 0);
-
-                    closureMap.forEach((file) => {
-                        timingStats.cycleDetectionTime.timeOperation(() => {
-                            const filesVisitedMap = new Map<string, SourceFileInfo>();
-
-                            if (!this._detectAndReportImportCycles(file, filesVisitedMap)) {
-                                // If no cycles were found in any of the files we visited,
-                                // set a flag to indicates that we don't need to visit them again
-                                // on subsequent cycle checks.
-                                filesVisitedMap.forEach((sourceFileInfo) => {
-                                    sourceFileInfo.sourceFile.setNoCircularDependencyConfirmed();
-                                });
-                            }
-                        });
-                    });
-                }
-            }
+            this._detectImportCycles(fileToCheck);
 
             return true;
         });
     }
 
+    // Detects import cycles that involve the file and reports them in the files that are part of them.
+    private _detectImportCycles(fileToCheck: SourceFileInfo) {
+        if (this._configOptions.diagnosticRuleSet.reportImportCycles !== 'none') {
+            // Don't detect import cycles when doing type stub generation. Some
+            // third-party modules are pretty convoluted.
+            // Or if the file is the notebook cell. notebook cell can't have cycles.
+            if (!this._allowedThirdPartyImports && fileToCheck.ipythonMode !== IPythonMode.CellDocs) {
+                // We need to force all of the files to be parsed and build
+                // a closure map for the files.
+                const closureMap = new Map<string, SourceFileInfo>();
+                this._getImportsRecursive(fileToCheck, closureMap, 0);
+
+                closureMap.forEach((file) => {
+                    timingStats.cycleDetectionTime.timeOperation(() => {
+                        const filesVisitedMap = new Map<string, SourceFileInfo>();
+
+                        if (!this._detectAndReportImportCycles(file, filesVisitedMap)) {
+                            // If no cycles were found in any of the files we visited,
+                            // set a flag to indicates that we don't need to visit them again
+                            // on subsequent cycle checks.
+                            filesVisitedMap.forEach((sourceFileInfo) => {
+                                sourceFileInfo.sourceFile.setNoCircularDependencyConfirmed();
+                            });
+                        }
+                    });
+                });
+            }
+        }
+    }
+
     private _checkDependentFiles(fileToCheck: SourceFileInfo, chainedByList: SourceFileInfo[] | undefined) {
         if (fileToCheck.ipythonMode !== IPythonMode.CellDocs) {
             return undefined;
@@ -2307,6 +2734,87 @@ export class Program {
         }
     }
 
+    private _createAnalysisCache() {
+        const cacheDir = this._configOptions.analysisCacheDir;
+        if (!cacheDir) {
+            return undefined;
+        }
+
+        const cache = new AnalysisCache(this.fileSystem, cacheDir, this._configOptions, this._console);
+        return cache.isAvailable ? cache : undefined;
+    }
+
+    // Computes the analysis cache fingerprint for the file, or returns undefined if
+    // the file's results shouldn't be cached. This parses (but doesn't bind) every
+    // file in the dependency closure so that changes to any of them are detected.
+    private _getAnalysisCacheFingerprint(fileInfo: SourceFileInfo): string | undefined {
+        if (
+            !this._analysisCache ||
+            this._disableChecker ||
+            this._preCheckCallback ||
+            !isUserCode(fileInfo) ||
+            fileInfo.ipythonMode === IPythonMode.CellDocs
+        ) {
+            return undefined;
+        }
+
+        const closure = new Map<string, SourceFileInfo>();
+        const filesToVisit = [fileInfo];
+
+        while (filesToVisit.length > 0) {
+            const file = filesToVisit.pop()!;
+            if (closure.has(file.uri.key)) {
+                continue;
+            }
+
+            closure.set(file.uri.key, file);
+            this._parseFile(file, /* content */ undefined, /* skipFileNeededCheck */ true);
+
+            filesToVisit.push(...file.imports);
+            if (file.builtinsImport) {
+                filesToVisit.push(file.builtinsImport);
+            }
+            if (file.chainedSourceFile) {
+                filesToVisit.push(file.chainedSourceFile);
+            }
+        }
+
+        return timingStats.analysisCacheTime.timeOperation(() => {
+            const digests: string[] = [];
+            for (const file of closure.values()) {
+                const digest = file.sourceFile.getContentDigest();
+                if (digest === undefined) {
+                    return undefined;
+                }
+
+                digests.push(`${file.uri.key}:${digest}`);
+            }
+
+            return this._analysisCache!.computeFingerprint(fileInfo.uri, digests);
+        });
+    }
+
+    // Writes the results of all files checked since the last flush to the analysis cache.
+    private _flushAnalysisCache() {
+        if (!this._analysisCache) {
+            return;
+        }
+
+        for (const { fileInfo, fingerprint } of this._pendingAnalysisCacheEntries.values()) {
+            const sourceFile = fileInfo.sourceFile;
+
+            // Skip files that have been invalidated since they were checked or whose
+            // check didn't complete successfully.
+            if (sourceFile.isCheckingRequired() || sourceFile.getCheckTime() === undefined) {
+                continue;
+            }
+
+            this._analysisCache.set(fileInfo.uri, fingerprint, sourceFile.getUnbaselinedDiagnostics());
+        }
+
+        this._pendingAnalysisCacheEntries.clear();
+    }
+
     private _detectAndReportImportCycles(
         sourceFileInfo: SourceFileInfo,
         filesVisited: Map<string, SourceFileInfo>,
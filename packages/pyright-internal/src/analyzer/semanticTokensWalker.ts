@@ -30,6 +30,8 @@ import {
     MemberAccessNode,
     NameNode,
     ParameterNode,
+    ParseNode,
+    ParseNodeArray,
     ParseNodeType,
     TypeAliasNode,
 } from '../parser/parseNodes';
@@ -39,6 +41,7 @@ import { Declaration, DeclarationType, isFunctionDeclaration, isVariableDeclarat
 import { getScopeForNode } from './scopeUtils';
 import { ScopeType } from './scope';
 import { assertNever } from '../common/debug';
+import { TextRange } from '../common/textRange';
 import { getDeclaration } from './analyzerNodeInfo';
 import { isDeclInEnumClass } from './enums';
 import { getEnclosingClass, isWriteAccess } from './parseTreeUtils';
@@ -69,9 +72,18 @@ export class SemanticTokensWalker extends ParseTreeWalker {
     builtinModules = new Set<string>(['builtins', '__builtins__']);
     items: SemanticTokenItem[] = [];
 
-    constructor(private readonly _evaluator: TypeEvaluator) {
+    // If a range is specified, only the nodes that overlap it are visited.
+    constructor(private readonly _evaluator: TypeEvaluator, private readonly _range?: TextRange) {
         super();
     }
+
+    override visitNode(node: ParseNode): ParseNodeArray {
+        if (this._range && !TextRange.overlapsRange(this._range, node)) {
+            return [];
+        }
+        return super.visitNode(node);
+    }
+
     override visitClass(node: ClassNode): boolean {
         const decls = this._getNameNodeDeclarations(node.d.name);
         const modifiers: TokenModifiers[] = [SemanticTokenModifiers.declaration];
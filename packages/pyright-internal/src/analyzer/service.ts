@@ -147,6 +147,7 @@ export class AnalyzerService {
     private _lastUserInteractionTime = 0;
     private _backgroundAnalysisCancellationSource: AbstractCancellationTokenSource | undefined;
     private _sourceEnumerator: SourceEnumerator | undefined;
+    private _hasNewlyEnumeratedFiles = false;
 
     private _disposed = false;
     private _pendingLibraryChanges: RefreshOptions = { changesOnly: true };
@@ -439,6 +440,8 @@ export class AnalyzerService {
 
         const checkedFileCount = this._program.getUserFileCount();
         this._console.info('Total files checked: ' + checkedFileCount.toString());
+
+        this._program.printMemoryStats(/* maxFileCount */ 10);
     }
 
     printDetailedAnalysisTimes() {
@@ -543,6 +546,13 @@ export class AnalyzerService {
         this.scheduleReanalysis(/* requireTrackedFileUpdate */ false);
     }
 
+    // Schedules analysis of the files that still need it without discarding
+    // the results of previous passes, so an interrupted analysis picks up
+    // where it stopped.
+    resumeAnalysis() {
+        this.scheduleReanalysis(/* requireTrackedFileUpdate */ false);
+    }
+
     invalidateAndForceReanalysis(reason: InvalidatedReason, refreshOptions?: RefreshOptions) {
         if (this.options.onInvalidated) {
             this.options.onInvalidated(reason);
@@ -579,6 +589,12 @@ export class AnalyzerService {
             );
 
             if (!enumResults.isComplete) {
+                // Start tracking the files that have been found so far, so they
+                // can be checked while the enumeration continues.
+                if (enumResults.newMatches.length > 0) {
+                    this._backgroundAnalysisProgram.addTrackedFiles(enumResults.newMatches);
+                    this._hasNewlyEnumeratedFiles = true;
+                }
                 return false;
             }
 
@@ -599,6 +615,7 @@ export class AnalyzerService {
 
             // Source file enumeration is complete. Proceed with analysis.
             this._sourceEnumerator = undefined;
+            this._hasNewlyEnumeratedFiles = false;
 
             if (this.options.onSourceEnumerationComplete) {
                 try {
@@ -657,6 +674,12 @@ export class AnalyzerService {
 
         this._backgroundAnalysisCancellationSource?.cancel();
 
+        this._scheduleAnalysisTimer();
+    }
+
+    // Schedules the timer that runs the next source enumeration and analysis pass.
+    // Unlike scheduleReanalysis, this doesn't cancel the analysis in progress.
+    private _scheduleAnalysisTimer() {
         // Remove any existing analysis timer.
         this._clearReanalysisTimer();
 
@@ -690,7 +713,22 @@ export class AnalyzerService {
             // and other environments where the user is not blocked on the operation.
             const maxSourceEnumeratorTime = this.options.maxAnalysisTime?.noOpenFilesTimeInMs ?? 0;
             if (!this.enumerateSourceFiles(maxSourceEnumeratorTime)) {
-                this.scheduleReanalysis(/* requireTrackedFileUpdate */ false);
+                // If files were found by this pass, analyze them while the enumeration
+                // continues. Otherwise, let the analysis that's in progress (if any)
+                // continue uninterrupted.
+                if (!this._hasNewlyEnumeratedFiles) {
+                    this._scheduleAnalysisTimer();
+                    return;
+                }
+
+                this._hasNewlyEnumeratedFiles = false;
+                this._backgroundAnalysisCancellationSource?.cancel();
+                this._backgroundAnalysisCancellationSource = this.cancellationProvider.createCancellationTokenSource();
+                this.runAnalysis(this._backgroundAnalysisCancellationSource.token);
+
+                if (!this._analyzeTimer) {
+                    this._scheduleAnalysisTimer();
+                }
                 return;
             }
 
@@ -1137,6 +1175,15 @@ export class AnalyzerService {
                 configOptions.baselineFile = projectRoot.resolvePaths(languageServerOptions.baselineFile);
             }
         }
+        if (languageServerOptions.analysisCacheDir) {
+            configOptions.analysisCacheDir = projectRoot.resolvePaths(languageServerOptions.analysisCacheDir);
+        }
+        if (languageServerOptions.traceFile) {
+            configOptions.performanceTraceFile = projectRoot.resolvePaths(languageServerOptions.traceFile);
+        }
+        if (languageServerOptions.memoryBudgetMB) {
+            configOptions.memoryBudgetMB = languageServerOptions.memoryBudgetMB;
+        }
     }
 
     private _applyCommandLineOverrides(
@@ -15,6 +15,10 @@ import { website } from '../constants';
 
 export interface SourceEnumerateResult {
     matches: Map<string, Uri>;
+
+    // The matches that were found by this call to enumerate, so the caller
+    // can start checking them before the enumeration is complete.
+    newMatches: Uri[];
     autoExcludedDirs: Uri[];
     isComplete: boolean;
 }
@@ -32,6 +36,7 @@ export class SourceEnumerator {
     private _includesToExplore: FileSpec[];
     private _dirsToExplore: DirToExplore[] = [];
     private _matches = new Map<string, Uri>();
+    private _newMatches: Uri[] = [];
     private _autoExcludeDirs: Uri[] = [];
     private _isComplete = false;
     private _numFilesVisited = 0;
@@ -63,6 +68,7 @@ export class SourceEnumerator {
     // time limit and returns all matching files.
     enumerate(timeLimitInMs: number): SourceEnumerateResult {
         const startTime = Date.now();
+        this._newMatches = [];
 
         while (!this._isComplete) {
             if (this._doNext()) {
@@ -108,6 +114,7 @@ export class SourceEnumerator {
 
         return {
             matches: this._matches,
+            newMatches: this._newMatches,
             autoExcludedDirs: this._autoExcludeDirs,
             isComplete: this._isComplete,
         };
@@ -163,19 +170,17 @@ export class SourceEnumerator {
         }
         this._seenDirs.add(realDirPath.key);
 
-        if (this._autoExcludeVenv) {
-            if (envMarkers.some((f) => this._fs.existsSync(dir.uri.resolvePaths(...f)))) {
-                this._autoExcludeDirs.push(dir.uri);
-                this._console.info(`Auto-excluding ${dir.uri.toUserVisibleString()}`);
-                return;
-            }
-        }
-
         const { files, directories, symlinkedDirectories } = getFileSystemEntriesWithSymlinkedDirectories(
             this._fs,
             dir.uri
         );
 
+        if (this._autoExcludeVenv && this._isEnvironmentDir(dir.uri, files, directories)) {
+            this._autoExcludeDirs.push(dir.uri);
+            this._console.info(`Auto-excluding ${dir.uri.toUserVisibleString()}`);
+            return;
+        }
+
         for (const symlinkedDir of symlinkedDirectories) {
             this._recordSymlinkedDirectoryRoot(symlinkedDir);
         }
@@ -183,7 +188,7 @@ export class SourceEnumerator {
         for (const file of files) {
             if (FileSpec.matchIncludeFileSpec(dir.includeRegExp, this._excludes, file)) {
                 this._numFilesVisited++;
-                this._matches.set(file.key, file);
+                this._addMatch(file);
             }
         }
 
@@ -200,6 +205,28 @@ export class SourceEnumerator {
         }
     }
 
+    // Determines whether the directory is a Python environment. The markers are
+    // looked up in the directory's entries rather than probed individually, which
+    // saves several file system calls per directory on slow (e.g. network) drives.
+    private _isEnvironmentDir(dirUri: Uri, files: Uri[], directories: Uri[]) {
+        const entryKeys = new Set<string>();
+        files.forEach((file) => entryKeys.add(file.key));
+        directories.forEach((subDir) => entryKeys.add(subDir.key));
+
+        return envMarkers.some(
+            ([entryName, ...rest]) =>
+                entryKeys.has(dirUri.combinePaths(entryName).key) &&
+                (rest.length === 0 || this._fs.existsSync(dirUri.resolvePaths(entryName, ...rest)))
+        );
+    }
+
+    private _addMatch(file: Uri) {
+        if (!this._matches.has(file.key)) {
+            this._newMatches.push(file);
+        }
+        this._matches.set(file.key, file);
+    }
+
     private _exploreInclude(includeSpec: FileSpec) {
         if (FileSpec.isInPath(includeSpec.wildcardRoot, this._excludes)) {
             return;
@@ -218,7 +245,7 @@ export class SourceEnumerator {
 
         const stat = tryStat(this._fs, includeSpec.wildcardRoot);
         if (stat?.isFile()) {
-            this._matches.set(includeSpec.wildcardRoot.key, includeSpec.wildcardRoot);
+            this._addMatch(includeSpec.wildcardRoot);
         } else if (stat?.isDirectory()) {
             this._dirsToExplore.push({
                 uri: includeSpec.wildcardRoot,
@@ -19,6 +19,7 @@ import {
     unreachableDiagnosticRules,
 } from '../common/configOptions';
 import { ConsoleInterface, StandardConsole } from '../common/console';
+import { sha256Hex } from '../common/crypto';
 import { assert } from '../common/debug';
 import { Diagnostic, DiagnosticCategory, TaskListToken, convertLevelToCategory } from '../common/diagnostic';
 import { DiagnosticRule } from '../common/diagnosticRules';
@@ -26,6 +27,7 @@ import { DiagnosticSink, TextRangeDiagnosticSink } from '../common/diagnosticSin
 import { FileSystem } from '../common/fileSystem';
 import { LogTracker, getPathForLogging } from '../common/logTracker';
 import { stripFileExtension } from '../common/pathUtils';
+import { performanceTrace, TraceArgs } from '../common/performanceTrace';
 import { convertOffsetsToRange, convertTextRangeToRange } from '../common/positionUtils';
 import { ServiceKeys } from '../common/serviceKeys';
 import { ServiceProvider } from '../common/serviceProvider';
@@ -35,11 +37,20 @@ import { Range, TextRange, getEmptyRange } from '../common/textRange';
 import { TextRangeCollection } from '../common/textRangeCollection';
 import { Duration, timingStats } from '../common/timing';
 import { Uri } from '../common/uri/uri';
+import { FileSpec } from '../common/uri/uriUtils';
 import { LocMessage } from '../localization/localize';
-import { ModuleNode } from '../parser/parseNodes';
-import { ModuleImport, ParseFileResults, ParseOptions, Parser, ParserOutput } from '../parser/parser';
+import { ModuleNode, ParseNodeType } from '../parser/parseNodes';
+import {
+    IncrementalParseInfo,
+    ModuleImport,
+    ParseFileResults,
+    ParseOptions,
+    Parser,
+    ParserOutput,
+    PreviousParseResults,
+} from '../parser/parser';
 import { IgnoreComment, IgnoreCommentRule, Tokenizer, TokenizerOutput } from '../parser/tokenizer';
-import { Token } from '../parser/tokenizerTypes';
+import { FStringMiddleToken, IdentifierToken, StringToken, Token, TokenType } from '../parser/tokenizerTypes';
 import { AnalyzerFileInfo, ImportLookup } from './analyzerFileInfo';
 import * as AnalyzerNodeInfo from './analyzerNodeInfo';
 import { Binder } from './binder';
@@ -49,7 +60,9 @@ import { CircularDependency } from './circularDependency';
 import * as CommentUtils from './commentUtils';
 import { ImportResolver } from './importResolver';
 import { ImportResult } from './importResult';
+import { ApproximateSize, getSourceFileMemoryStats, SourceFileMemoryStats } from './memoryStats';
 import { ParseTreeCleanerWalker } from './parseTreeCleaner';
+import * as ParseTreeUtils from './parseTreeUtils';
 import { Scope } from './scope';
 import { SymbolTable } from './symbol';
 import { TestWalker } from './testWalker';
@@ -64,6 +77,9 @@ const _maxImportCyclesPerFile = 4;
 // https://github.com/microsoft/vscode/blob/1e750a7514f365585d8dab1a7a82e0938481ea2f/src/vs/editor/common/model/textModel.ts#L194
 export const maxSourceFileSize = 50 * 1024 * 1024;
 
+// Matches identifier-like words within string literals and comments.
+const _wordRegEx = /[\p{L}\p{Nl}_][\p{L}\p{Nl}\p{Mn}\p{Mc}\p{Nd}\p{Pc}]*/gu;
+
 interface ResolveImportResult {
     imports: ImportResult[];
     builtinsImportResult?: ImportResult | undefined;
@@ -167,6 +183,7 @@ class WriteableData {
     parsedFileContents: string | undefined;
     tokenizerLines: TextRangeCollection<TextRange> | undefined;
     tokenizerOutput: TokenizerOutput | undefined;
+    incrementalParseInfo: IncrementalParseInfo | undefined;
     lineCount: number | undefined;
 
     moduleSymbolTable: SymbolTable | undefined;
@@ -191,6 +208,28 @@ class WriteableData {
     accumulatedDiagnostics: Diagnostic[] = [];
     diagnosticsWithoutFileIgnore: Diagnostic[] = [];
 
+    // The accumulated diagnostics before they were matched against the
+    // baseline file. This is what gets stored in the analysis cache.
+    unbaselinedDiagnostics: Diagnostic[] = [];
+
+    // Diagnostics that were restored from the analysis cache in place of a
+    // checking pass. They remain valid until the file is reparsed or needs
+    // to be checked again, even if the file is bound in the meantime.
+    restoredDiagnostics: Diagnostic[] | undefined;
+
+    // Lazily-computed digest of parsedFileContents.
+    contentDigest: string | undefined;
+
+    // Lazily-computed digest of the parts of parsedFileContents that can affect
+    // other files. It's kept when the file is marked dirty by an edit so it can
+    // be compared with the digest of the new contents.
+    interfaceFingerprint: string | undefined;
+
+    // Lazily-computed newline-delimited (and newline-terminated) list of the names
+    // that appear in parsedFileContents (see containsIdentifier). Unlike the parse
+    // results, this is kept when memory is low because it's small.
+    identifierText: string | undefined;
+
     // Circular dependencies that have been reported in this file.
     circularDependencies: CircularDependency[] = [];
     noCircularDependencyConfirmed = false;
@@ -201,6 +240,9 @@ class WriteableData {
     // Do we need to perform a binding step?
     isBindingNeeded = true;
 
+    // Were the function bodies bound on demand (see Binder) in the last binding step?
+    isBoundOnDemand = false;
+
     // Do we have valid diagnostic results from a checking pass?
     isCheckingNeeded = true;
 
@@ -455,6 +497,180 @@ export class SourceFile {
         return this._writableData.diagnosticsWithoutFileIgnore;
     }
 
+    // Returns the diagnostics before they were matched against the baseline file.
+    getUnbaselinedDiagnostics(): Diagnostic[] {
+        return this._writableData.unbaselinedDiagnostics;
+    }
+
+    // Returns a digest of the contents that were last parsed, or undefined
+    // if the file needs to be parsed first.
+    getContentDigest(): string | undefined {
+        if (this.isParseRequired() || this._writableData.parsedFileContents === undefined) {
+            return undefined;
+        }
+
+        if (this._writableData.contentDigest === undefined) {
+            this._writableData.contentDigest = sha256Hex(this._writableData.parsedFileContents);
+        }
+
+        return this._writableData.contentDigest;
+    }
+
+    // Returns the number of lines in the most recently parsed contents. Like the
+    // parse results, it remains available after the file is marked dirty.
+    getParsedLineCount(): number | undefined {
+        return this._writableData.tokenizerLines?.length;
+    }
+
+    // Returns a digest of the parts of the most recently parsed contents that can
+    // affect the files that import this one (see getModuleInterfaceText). It's
+    // computed on first use, which can be after the file is marked dirty because
+    // the parse results are kept until the file is parsed again. It's undefined for
+    // notebook cells and library files, whose importers are always invalidated when
+    // they change.
+    getInterfaceFingerprint(): string | undefined {
+        const parserOutput = this._writableData.parserOutput;
+        const text = this._writableData.parsedFileContents;
+
+        // Library files rarely change, so don't spend the time on their fingerprint.
+        if (
+            this._writableData.interfaceFingerprint === undefined &&
+            parserOutput &&
+            text !== undefined &&
+            !this._isThirdPartyImport &&
+            !this._isTypeshedStubFile &&
+            this._ipythonMode === IPythonMode.None
+        ) {
+            // The tokenizer output isn't cached for closed files. It isn't cached here
+            // either because the file may have been marked dirty (see _tokenizeContents).
+            const tokenizerOutput = this._writableData.tokenizerOutput ?? new Tokenizer().tokenize(text);
+            this._writableData.interfaceFingerprint = sha256Hex(
+                ParseTreeUtils.getModuleInterfaceText({ parserOutput, tokenizerOutput, text })
+            );
+        }
+
+        return this._writableData.interfaceFingerprint;
+    }
+
+    // Determines whether any of the names appear in the most recently parsed contents,
+    // either as an identifier or keyword, as a word within a string literal or comment
+    // or as an entire line of a string literal. Returns undefined if this isn't known,
+    // e.g. because the file has changed since it was parsed.
+    containsIdentifier(names: readonly string[]): boolean | undefined {
+        // Library files are rarely searched for references, so don't spend
+        // the time and memory on indexing their names.
+        if (
+            this._writableData.identifierText === undefined &&
+            !this._isThirdPartyImport &&
+            !this._isTypeshedStubFile
+        ) {
+            const parseFileResults = this.getParseResults();
+            if (parseFileResults) {
+                this._writableData.identifierText = _buildIdentifierText(
+                    parseFileResults.text,
+                    parseFileResults.tokenizerOutput.tokens
+                );
+            }
+        }
+
+        const identifierText = this._writableData.identifierText;
+        if (identifierText === undefined) {
+            return undefined;
+        }
+
+        return names.some((name) => identifierText.indexOf(`\n${name}\n`) >= 0);
+    }
+
+    // If the client-provided contents of the file have changed since it was last
+    // parsed and all of the changes fall within the body of a single isolated
+    // function (see isFunctionBodyIsolated), returns the range of that body in
+    // the new contents. Otherwise returns undefined.
+    getIsolatedFunctionBodyEdit(): TextRange | undefined {
+        const parserOutput = this._writableData.parserOutput;
+        const oldContents = this._writableData.parsedFileContents;
+        const newContents = this._writableData.clientDocumentContents;
+        if (
+            this._ipythonMode !== IPythonMode.None ||
+            !parserOutput ||
+            oldContents === undefined ||
+            newContents === undefined
+        ) {
+            return undefined;
+        }
+
+        // Find the range of text that changed.
+        const maxLength = Math.min(oldContents.length, newContents.length);
+        let prefixLength = 0;
+        while (
+            prefixLength < maxLength &&
+            oldContents.charCodeAt(prefixLength) === newContents.charCodeAt(prefixLength)
+        ) {
+            prefixLength++;
+        }
+
+        if (prefixLength === oldContents.length && prefixLength === newContents.length) {
+            return undefined;
+        }
+
+        let suffixLength = 0;
+        while (
+            suffixLength < maxLength - prefixLength &&
+            oldContents.charCodeAt(oldContents.length - suffixLength - 1) ===
+                newContents.charCodeAt(newContents.length - suffixLength - 1)
+        ) {
+            suffixLength++;
+        }
+
+        const body = ParseTreeUtils.getIsolatedFunctionBody(
+            parserOutput.parseTree,
+            prefixLength,
+            oldContents.length - suffixLength
+        );
+        if (!body) {
+            return undefined;
+        }
+
+        return { start: body.start, length: body.length + newContents.length - oldContents.length };
+    }
+
+    // Determines whether the most recently parsed contents contain an isolated
+    // function whose body spans exactly the specified range.
+    isIsolatedFunctionBody(range: TextRange): boolean {
+        const parserOutput = this._writableData.parserOutput;
+        if (this.isParseRequired() || !parserOutput) {
+            return false;
+        }
+
+        let curNode = ParseTreeUtils.findNodeByOffset(parserOutput.parseTree, range.start);
+        while (curNode) {
+            if (curNode.nodeType === ParseNodeType.Function && curNode.d.suite.start === range.start) {
+                return curNode.d.suite.length === range.length && ParseTreeUtils.isFunctionBodyIsolated(curNode);
+            }
+
+            curNode = curNode.parent;
+        }
+
+        return false;
+    }
+
+    // Replaces the results of the checker with diagnostics that were produced by
+    // a previous run (see AnalysisCache). The file is treated as checked, but it
+    // isn't bound, so the binder will run if something else needs its symbols.
+    restoreCachedDiagnostics(configOptions: ConfigOptions, diagnostics: Diagnostic[]) {
+        assert(!this.isParseRequired(), 'Cached diagnostics restored before parsing');
+
+        this._writableData.isCheckingNeeded = false;
+        this._writableData.checkTime = undefined;
+        this._writableData.restoredDiagnostics = diagnostics;
+
+        // The cached diagnostics already include any import cycles because
+        // those are determined by the dependency closure.
+        this._writableData.circularDependencies = [];
+
+        this._writableData.diagnosticVersion++;
+        this._finalizeDiagnostics(configOptions, diagnostics);
+    }
+
     getImports(): ImportResult[] {
         return this._writableData.imports || [];
     }
@@ -471,6 +687,32 @@ export class SourceFile {
         return this._writableData.checkTime;
     }
 
+    // Returns approximate statistics about the memory retained by the file's
+    // parse and binding results, or undefined if the file isn't parsed.
+    getMemoryStats(evaluator: TypeEvaluator | undefined): SourceFileMemoryStats | undefined {
+        if (this.isParseRequired() || !this._writableData.parserOutput) {
+            return undefined;
+        }
+
+        return getSourceFileMemoryStats(
+            this._uri,
+            this._writableData.parsedFileContents ?? '',
+            this._writableData.parserOutput,
+            this._writableData.tokenizerOutput?.tokens,
+            evaluator
+        );
+    }
+
+    // Returns a cheap estimate of the number of bytes retained by the file's
+    // parse and binding results, or 0 if the file isn't parsed.
+    getApproximateParseResultsSize(): number {
+        if (this.isParseRequired() || !this._writableData.parsedFileContents) {
+            return 0;
+        }
+
+        return this._writableData.parsedFileContents.length * ApproximateSize.ParsedCharacter;
+    }
+
     restore(): string | undefined {
         // If we had an edit, return our text.
         if (this._preEditData) {
@@ -541,10 +783,17 @@ export class SourceFile {
         this._writableData.parserOutput = undefined;
         this._writableData.tokenizerLines = undefined;
         this._writableData.tokenizerOutput = undefined;
+        this._writableData.incrementalParseInfo = undefined;
         this._writableData.parsedFileContents = undefined;
         this._writableData.moduleSymbolTable = undefined;
+        this._writableData.contentDigest = undefined;
         this._writableData.isBindingNeeded = true;
         this._writableData.imports = [];
+
+        // The interface fingerprint and identifier text are kept (if they were
+        // computed) because the contents haven't changed. This lets the program
+        // determine whether the files that depend on this one are affected if it
+        // changes before it's parsed again.
     }
 
     markDirty(): void {
@@ -552,9 +801,11 @@ export class SourceFile {
         this._writableData.semanticVersion++;
         this._writableData.noCircularDependencyConfirmed = false;
         this._writableData.isCheckingNeeded = true;
+        this._writableData.restoredDiagnostics = undefined;
         this._writableData.isBindingNeeded = true;
         this._writableData.moduleSymbolTable = undefined;
         this._writableData.lineCount = undefined;
+        this._writableData.identifierText = undefined;
 
         this._fireFileDirtyEvent();
     }
@@ -563,6 +814,7 @@ export class SourceFile {
         // Keep the parse info, but reset the analysis to the beginning.
         this._writableData.semanticVersion++;
         this._writableData.isCheckingNeeded = true;
+        this._writableData.restoredDiagnostics = undefined;
         this._writableData.noCircularDependencyConfirmed = false;
 
         // If the file contains a wildcard import or __all__ symbols,
@@ -647,6 +899,7 @@ export class SourceFile {
             // Since the file is no longer open, dump the tokenizer output
             // so it doesn't consume memory.
             this._writableData.tokenizerOutput = undefined;
+            this._writableData.incrementalParseInfo = undefined;
         } else {
             this._writableData.clientDocumentVersion = version;
             this._writableData.clientDocumentContents = contents;
@@ -659,6 +912,10 @@ export class SourceFile {
                 contentsHash !== this._writableData.lastFileContentHash
             ) {
                 this.markDirty();
+            } else if (this._writableData.isBoundOnDemand) {
+                // Open files are bound in full because they're checked, and the
+                // checker expects the diagnostics of every function body.
+                this.markReanalysisRequired(/* forceRebinding */ true);
             }
 
             this._writableData.lastFileContentLength = contents.length;
@@ -750,7 +1007,8 @@ export class SourceFile {
             }
         }
 
-        if (updatedDependencyList) {
+        // Diagnostics restored from the analysis cache already report the cycle.
+        if (updatedDependencyList && !this._writableData.restoredDiagnostics) {
             this._recomputeDiagnostics(configOptions);
         }
     }
@@ -771,176 +1029,187 @@ export class SourceFile {
     // (or at least cancel) prior to calling again. It returns true if a parse
     // was required and false if the parse information was up to date already.
     parse(configOptions: ConfigOptions, importResolver: ImportResolver, content?: string): boolean {
-        return this._logTracker.log(`parsing: ${this._getPathForLogging(this._uri)}`, (logState) => {
-            // If the file is already parsed, we can skip.
-            if (!this.isParseRequired()) {
-                logState.suppress();
-                return false;
-            }
+        return performanceTrace.span('parseFile', 'file', this._getTraceArgs, () => {
+            return this._logTracker.log(`parsing: ${this._getPathForLogging(this._uri)}`, (logState) => {
+                // If the file is already parsed, we can skip.
+                if (!this.isParseRequired()) {
+                    logState.suppress();
+                    return false;
+                }
 
-            const diagSink = this.createDiagnosticSink();
-            let fileContents = this.getOpenFileContents();
-            if (fileContents === undefined) {
-                try {
-                    const startTime = timingStats.readFileTime.totalTime;
-                    timingStats.readFileTime.timeOperation(() => {
-                        // Read the file's contents.
-                        fileContents = content ?? this.getFileContent();
-                        if (fileContents === undefined) {
-                            throw new Error("Can't get file content");
-                        }
+                const diagSink = this.createDiagnosticSink();
+                let fileContents = this.getOpenFileContents();
+                if (fileContents === undefined) {
+                    try {
+                        const startTime = timingStats.readFileTime.totalTime;
+                        timingStats.readFileTime.timeOperation(() => {
+                            // Read the file's contents.
+                            fileContents = content ?? this.getFileContent();
+                            if (fileContents === undefined) {
+                                throw new Error("Can't get file content");
+                            }
 
-                        // Remember the length and hash for comparison purposes.
-                        this._writableData.lastFileContentLength = fileContents.length;
-                        this._writableData.lastFileContentHash = StringUtils.hashString(fileContents);
-                    });
-                    logState.add(`fs read ${timingStats.readFileTime.totalTime - startTime}ms`);
-                } catch (error) {
-                    diagSink.addError(`Source file could not be read`, getEmptyRange());
-                    fileContents = '';
+                            // Remember the length and hash for comparison purposes.
+                            this._writableData.lastFileContentLength = fileContents.length;
+                            this._writableData.lastFileContentHash = StringUtils.hashString(fileContents);
+                        });
+                        logState.add(`fs read ${timingStats.readFileTime.totalTime - startTime}ms`);
+                    } catch (error) {
+                        diagSink.addError(`Source file could not be read`, getEmptyRange());
+                        fileContents = '';
 
-                    if (!this.fileSystem.existsSync(this._uri)) {
-                        this._writableData.isFileDeleted = true;
+                        if (!this.fileSystem.existsSync(this._uri)) {
+                            this._writableData.isFileDeleted = true;
+                        }
                     }
                 }
-            }
 
-            try {
-                // Parse the token stream, building the abstract syntax tree.
-                const parseFileResults = this._parseFile(
-                    configOptions,
-                    this._uri,
-                    fileContents!,
-                    this.getIPythonMode() !== IPythonMode.None,
-                    diagSink
-                );
+                try {
+                    // Parse the token stream, building the abstract syntax tree.
+                    const parseFileResults = this._parseFile(
+                        configOptions,
+                        this._uri,
+                        fileContents!,
+                        this.getIPythonMode() !== IPythonMode.None,
+                        diagSink,
+                        this._getPreviousParseResults()
+                    );
 
-                assert(parseFileResults !== undefined && parseFileResults.tokenizerOutput !== undefined);
-                this._writableData.parserOutput = parseFileResults.parserOutput;
-                this._writableData.tokenizerLines = parseFileResults.tokenizerOutput.lines;
-                this._writableData.parsedFileContents = fileContents;
-                this._writableData.typeIgnoreLines = parseFileResults.tokenizerOutput.typeIgnoreLines;
-                this._writableData.typeIgnoreAll = parseFileResults.tokenizerOutput.typeIgnoreAll;
-                this._writableData.pyrightIgnoreLines = parseFileResults.tokenizerOutput.pyrightIgnoreLines;
-                this._writableData.lineCount = parseFileResults.tokenizerOutput.lines.length;
-
-                // Cache the tokenizer output only if this file is open.
-                if (this._writableData.clientDocumentContents !== undefined) {
-                    this._writableData.tokenizerOutput = parseFileResults.tokenizerOutput;
-                }
+                    assert(parseFileResults !== undefined && parseFileResults.tokenizerOutput !== undefined);
+                    this._writableData.parserOutput = parseFileResults.parserOutput;
+                    this._writableData.tokenizerLines = parseFileResults.tokenizerOutput.lines;
+                    this._writableData.parsedFileContents = fileContents;
+                    this._writableData.contentDigest = undefined;
+                    this._writableData.typeIgnoreLines = parseFileResults.tokenizerOutput.typeIgnoreLines;
+                    this._writableData.typeIgnoreAll = parseFileResults.tokenizerOutput.typeIgnoreAll;
+                    this._writableData.pyrightIgnoreLines = parseFileResults.tokenizerOutput.pyrightIgnoreLines;
+                    this._writableData.lineCount = parseFileResults.tokenizerOutput.lines.length;
+
+                    this._writableData.identifierText = undefined;
+                    this._writableData.interfaceFingerprint = undefined;
+
+                    // Cache the tokenizer output only if this file is open.
+                    if (this._writableData.clientDocumentContents !== undefined) {
+                        this._writableData.tokenizerOutput = parseFileResults.tokenizerOutput;
+                        this._writableData.incrementalParseInfo = parseFileResults.incrementalParseInfo;
+                    }
 
-                // Resolve imports.
-                const execEnvironment = configOptions.findExecEnvironment(this._uri);
-                timingStats.resolveImportsTime.timeOperation(() => {
-                    const importResult = this._resolveImports(
-                        importResolver,
-                        parseFileResults.parserOutput.importedModules,
-                        execEnvironment
-                    );
+                    // Resolve imports.
+                    const execEnvironment = configOptions.findExecEnvironment(this._uri);
+                    timingStats.resolveImportsTime.timeOperation(() => {
+                        const importResult = this._resolveImports(
+                            importResolver,
+                            parseFileResults.parserOutput.importedModules,
+                            execEnvironment
+                        );
 
-                    this._writableData.imports = importResult.imports;
-                    this._writableData.builtinsImport = importResult.builtinsImportResult;
+                        this._writableData.imports = importResult.imports;
+                        this._writableData.builtinsImport = importResult.builtinsImportResult;
 
-                    this._writableData.parseDiagnostics = diagSink.fetchAndClear();
+                        this._writableData.parseDiagnostics = diagSink.fetchAndClear();
 
-                    this._writableData.taskListDiagnostics = [];
-                    this._addTaskListDiagnostics(
-                        configOptions.taskListTokens,
-                        parseFileResults,
-                        this._writableData.taskListDiagnostics
-                    );
-                });
+                        this._writableData.taskListDiagnostics = [];
+                        this._addTaskListDiagnostics(
+                            configOptions.taskListTokens,
+                            parseFileResults,
+                            this._writableData.taskListDiagnostics
+                        );
+                    });
 
-                // Is this file in a "strict" path?
-                const useStrict =
-                    configOptions.strict.find((strictFileSpec) => this._uri.matchesRegex(strictFileSpec.regExp)) !==
-                    undefined;
-
-                const commentDiags: CommentUtils.CommentDiagnostic[] = [];
-                this._diagnosticRuleSet = CommentUtils.getFileLevelDirectives(
-                    parseFileResults.tokenizerOutput.tokens,
-                    parseFileResults.tokenizerOutput.lines,
-                    execEnvironment.diagnosticRuleSet,
-                    useStrict,
-                    commentDiags
-                );
+                    // Is this file in a "strict" path?
+                    const useStrict = FileSpec.isInPath(this._uri, configOptions.strict);
+
+                    const commentDiags: CommentUtils.CommentDiagnostic[] = [];
+                    this._diagnosticRuleSet = CommentUtils.getFileLevelDirectives(
+                        parseFileResults.tokenizerOutput.tokens,
+                        parseFileResults.tokenizerOutput.lines,
+                        execEnvironment.diagnosticRuleSet,
+                        useStrict,
+                        commentDiags
+                    );
 
-                this._writableData.commentDiagnostics = [];
+                    this._writableData.commentDiagnostics = [];
 
-                commentDiags.forEach((commentDiag) => {
-                    this._writableData.commentDiagnostics.push(
-                        new Diagnostic(
-                            DiagnosticCategory.Error,
-                            commentDiag.message,
-                            convertTextRangeToRange(commentDiag.range, parseFileResults.tokenizerOutput.lines)
-                        )
+                    commentDiags.forEach((commentDiag) => {
+                        this._writableData.commentDiagnostics.push(
+                            new Diagnostic(
+                                DiagnosticCategory.Error,
+                                commentDiag.message,
+                                convertTextRangeToRange(commentDiag.range, parseFileResults.tokenizerOutput.lines)
+                            )
+                        );
+                    });
+                } catch (e: any) {
+                    const message: string =
+                        (e.stack ? e.stack.toString() : undefined) ||
+                        (typeof e.message === 'string' ? e.message : undefined) ||
+                        JSON.stringify(e);
+                    this._console.error(
+                        LocMessage.internalParseError().format({
+                            file: this.getUri().toUserVisibleString(),
+                            message,
+                        })
                     );
-                });
-            } catch (e: any) {
-                const message: string =
-                    (e.stack ? e.stack.toString() : undefined) ||
-                    (typeof e.message === 'string' ? e.message : undefined) ||
-                    JSON.stringify(e);
-                this._console.error(
-                    LocMessage.internalParseError().format({
-                        file: this.getUri().toUserVisibleString(),
-                        message,
-                    })
-                );
 
-                // Create dummy parse results.
-                this._writableData.parsedFileContents = '';
-                this._writableData.tokenizerLines = new TextRangeCollection<TextRange>([]);
-
-                this._writableData.parserOutput = {
-                    parseTree: ModuleNode.create({ start: 0, length: 0 }),
-                    importedModules: [],
-                    futureImports: new Set<string>(),
-                    containsWildcardImport: false,
-                    typingSymbolAliases: new Map<string, string>(),
-                    hasTypeAnnotations: false,
-                    lines: this._writableData.tokenizerLines,
-                };
-
-                this._writableData.tokenizerOutput = {
-                    tokens: new TextRangeCollection<Token>([]),
-                    lines: this._writableData.tokenizerLines,
-                    typeIgnoreAll: undefined,
-                    typeIgnoreLines: new Map<number, IgnoreComment>(),
-                    pyrightIgnoreLines: new Map<number, IgnoreComment>(),
-                    predominantEndOfLineSequence: '\n',
-                    hasPredominantTabSequence: false,
-                    predominantTabSequence: '    ',
-                    predominantSingleQuoteCharacter: "'",
-                };
-
-                this._writableData.imports = undefined;
-                this._writableData.builtinsImport = undefined;
+                    // Create dummy parse results.
+                    this._writableData.parsedFileContents = '';
+                    this._writableData.contentDigest = undefined;
+                    this._writableData.interfaceFingerprint = undefined;
+                    this._writableData.identifierText = undefined;
+                    this._writableData.tokenizerLines = new TextRangeCollection<TextRange>([]);
+
+                    this._writableData.parserOutput = {
+                        parseTree: ModuleNode.create({ start: 0, length: 0 }),
+                        importedModules: [],
+                        futureImports: new Set<string>(),
+                        containsWildcardImport: false,
+                        typingSymbolAliases: new Map<string, string>(),
+                        hasTypeAnnotations: false,
+                        lines: this._writableData.tokenizerLines,
+                    };
+
+                    this._writableData.incrementalParseInfo = undefined;
+                    this._writableData.tokenizerOutput = {
+                        tokens: new TextRangeCollection<Token>([]),
+                        lines: this._writableData.tokenizerLines,
+                        typeIgnoreAll: undefined,
+                        typeIgnoreLines: new Map<number, IgnoreComment>(),
+                        pyrightIgnoreLines: new Map<number, IgnoreComment>(),
+                        predominantEndOfLineSequence: '\n',
+                        hasPredominantTabSequence: false,
+                        predominantTabSequence: '    ',
+                        predominantSingleQuoteCharacter: "'",
+                    };
+
+                    this._writableData.imports = undefined;
+                    this._writableData.builtinsImport = undefined;
 
-                const diagSink = this.createDiagnosticSink();
-                diagSink.addError(
-                    LocMessage.internalParseError().format({
-                        file: this.getUri().toUserVisibleString(),
-                        message,
-                    }),
-                    getEmptyRange()
-                );
-                this._writableData.parseDiagnostics = diagSink.fetchAndClear();
-                this._writableData.taskListDiagnostics = diagSink.fetchAndClear();
+                    const diagSink = this.createDiagnosticSink();
+                    diagSink.addError(
+                        LocMessage.internalParseError().format({
+                            file: this.getUri().toUserVisibleString(),
+                            message,
+                        }),
+                        getEmptyRange()
+                    );
+                    this._writableData.parseDiagnostics = diagSink.fetchAndClear();
+                    this._writableData.taskListDiagnostics = diagSink.fetchAndClear();
 
-                // Do not rethrow the exception, swallow it here. Callers are not
-                // prepared to handle an exception.
-            }
+                    // Do not rethrow the exception, swallow it here. Callers are not
+                    // prepared to handle an exception.
+                }
 
-            this._writableData.analyzedFileContentsVersion = this._writableData.fileContentsVersion;
-            this._writableData.isBindingNeeded = true;
-            this._writableData.isCheckingNeeded = true;
-            this._writableData.parseTreeNeedsCleaning = false;
-            this._writableData.hitMaxImportDepth = undefined;
+                this._writableData.analyzedFileContentsVersion = this._writableData.fileContentsVersion;
+                this._writableData.isBindingNeeded = true;
+                this._writableData.isCheckingNeeded = true;
+                this._writableData.restoredDiagnostics = undefined;
+                this._writableData.parseTreeNeedsCleaning = false;
+                this._writableData.hitMaxImportDepth = undefined;
 
-            this._recomputeDiagnostics(configOptions);
+                this._recomputeDiagnostics(configOptions);
 
-            return true;
+                return true;
+            });
         });
     }
 
@@ -956,64 +1225,85 @@ export class SourceFile {
         assert(!this._writableData.isBindingInProgress, 'Bind called while binding in progress');
         assert(this._writableData.parserOutput !== undefined, 'Parse results not available');
 
-        return this._logTracker.log(`binding: ${this._getPathForLogging(this._uri)}`, () => {
-            try {
-                // Perform name binding.
-                timingStats.bindTime.timeOperation(() => {
-                    this._cleanParseTreeIfRequired();
-
-                    const fileInfo = this._buildFileInfo(configOptions, importLookup, builtinsScope, futureImports);
-                    AnalyzerNodeInfo.setFileInfo(this._writableData.parserOutput!.parseTree, fileInfo);
-
-                    const binder = new Binder(fileInfo, configOptions.indexGenerationMode, cellChainIndex);
-                    this._writableData.isBindingInProgress = true;
-                    binder.bindModule(this._writableData.parserOutput!.parseTree);
-
-                    // If we're in "test mode" (used for unit testing), run an additional
-                    // "test walker" over the parse tree to validate its internal consistency.
-                    if (configOptions.internalTestMode) {
-                        const testWalker = new TestWalker();
-                        testWalker.walk(this._writableData.parserOutput!.parseTree);
-                    }
+        return performanceTrace.span('bindFile', 'file', this._getTraceArgs, () => {
+            return this._logTracker.log(`binding: ${this._getPathForLogging(this._uri)}`, () => {
+                try {
+                    // Perform name binding.
+                    timingStats.bindTime.timeOperation(() => {
+                        this._cleanParseTreeIfRequired();
+
+                        const fileInfo = this._buildFileInfo(configOptions, importLookup, builtinsScope, futureImports);
+                        AnalyzerNodeInfo.setFileInfo(this._writableData.parserOutput!.parseTree, fileInfo);
+
+                        // Most of the functions in a library file are never evaluated, so
+                        // their bodies are bound only when they're needed. Open files are
+                        // bound in full because they're likely to be checked.
+                        const bindFunctionBodiesOnDemand =
+                            this._isThirdPartyImport &&
+                            !this._isStubFile &&
+                            this._writableData.clientDocumentContents === undefined;
+
+                        const binder = new Binder(
+                            fileInfo,
+                            configOptions.indexGenerationMode,
+                            cellChainIndex,
+                            bindFunctionBodiesOnDemand
+                        );
+                        this._writableData.isBindingInProgress = true;
+                        this._writableData.isBoundOnDemand = bindFunctionBodiesOnDemand;
+                        binder.bindModule(this._writableData.parserOutput!.parseTree);
+
+                        // If we're in "test mode" (used for unit testing), run an additional
+                        // "test walker" over the parse tree to validate its internal consistency.
+                        if (configOptions.internalTestMode) {
+                            const testWalker = new TestWalker();
+                            testWalker.walk(this._writableData.parserOutput!.parseTree);
+                        }
 
-                    this._writableData.bindDiagnostics = fileInfo.diagnosticSink.fetchAndClear();
-                    const moduleScope = AnalyzerNodeInfo.getScope(this._writableData.parserOutput!.parseTree);
-                    assert(moduleScope !== undefined, 'Module scope not returned by binder');
-                    this._writableData.moduleSymbolTable = moduleScope!.symbolTable;
-                });
-            } catch (e: any) {
-                const message: string =
-                    (e.stack ? e.stack.toString() : undefined) ||
-                    (typeof e.message === 'string' ? e.message : undefined) ||
-                    JSON.stringify(e);
-                this._console.error(
-                    LocMessage.internalBindError().format({
-                        file: this.getUri().toUserVisibleString(),
-                        message,
-                    })
-                );
+                        this._writableData.bindDiagnostics = fileInfo.diagnosticSink.fetchAndClear();
+                        const moduleScope = AnalyzerNodeInfo.getScope(this._writableData.parserOutput!.parseTree);
+                        assert(moduleScope !== undefined, 'Module scope not returned by binder');
+                        this._writableData.moduleSymbolTable = moduleScope!.symbolTable;
+                    });
+                } catch (e: any) {
+                    const message: string =
+                        (e.stack ? e.stack.toString() : undefined) ||
+                        (typeof e.message === 'string' ? e.message : undefined) ||
+                        JSON.stringify(e);
+                    this._console.error(
+                        LocMessage.internalBindError().format({
+                            file: this.getUri().toUserVisibleString(),
+                            message,
+                        })
+                    );
 
-                const diagSink = this.createDiagnosticSink();
-                diagSink.addError(
-                    LocMessage.internalBindError().format({
-                        file: this.getUri().toUserVisibleString(),
-                        message,
-                    }),
-                    getEmptyRange()
-                );
-                this._writableData.bindDiagnostics = diagSink.fetchAndClear();
+                    const diagSink = this.createDiagnosticSink();
+                    diagSink.addError(
+                        LocMessage.internalBindError().format({
+                            file: this.getUri().toUserVisibleString(),
+                            message,
+                        }),
+                        getEmptyRange()
+                    );
+                    this._writableData.bindDiagnostics = diagSink.fetchAndClear();
 
-                // Do not rethrow the exception, swallow it here. Callers are not
-                // prepared to handle an exception.
-            } finally {
-                this._writableData.isBindingInProgress = false;
-            }
+                    // Do not rethrow the exception, swallow it here. Callers are not
+                    // prepared to handle an exception.
+                } finally {
+                    this._writableData.isBindingInProgress = false;
+                }
 
-            // Prepare for the next stage of the analysis.
-            this._writableData.isCheckingNeeded = true;
-            this._writableData.isBindingNeeded = false;
+                this._writableData.isBindingNeeded = false;
 
-            this._recomputeDiagnostics(configOptions);
+                // Binding the file doesn't invalidate the diagnostics restored from
+                // the analysis cache because they were produced from the same contents.
+                if (!this._writableData.restoredDiagnostics) {
+                    // Prepare for the next stage of the analysis.
+                    this._writableData.isCheckingNeeded = true;
+
+                    this._recomputeDiagnostics(configOptions);
+                }
+            });
         });
     }
 
@@ -1031,63 +1321,70 @@ export class SourceFile {
         assert(this.isCheckingRequired(), 'Check called unnecessarily');
         assert(this._writableData.parserOutput !== undefined, 'Parse results not available');
 
-        return this._logTracker.log(`checking: ${this._getPathForLogging(this._uri)}`, () => {
-            try {
-                timingStats.typeCheckerTime.timeOperation(() => {
-                    const checkDuration = new Duration();
-                    const checker = new Checker(
-                        importResolver,
-                        evaluator,
-                        this._writableData.parserOutput!,
-                        dependentFiles
-                    );
-                    this._writableData.isCheckingInProgress = true;
-                    checker.check();
-                    this._writableData.isCheckingNeeded = false;
-
-                    const fileInfo = AnalyzerNodeInfo.getFileInfo(this._writableData.parserOutput!.parseTree)!;
-                    this._writableData.checkerDiagnostics = fileInfo.diagnosticSink.fetchAndClear();
-                    this._writableData.checkTime = checkDuration.getDurationInMilliseconds();
-                });
-            } catch (e: any) {
-                const isCancellation = OperationCanceledException.is(e);
-                if (!isCancellation) {
-                    const message: string =
-                        (e.stack ? e.stack.toString() : undefined) ||
-                        (typeof e.message === 'string' ? e.message : undefined) ||
-                        JSON.stringify(e);
-                    this._console.error(
-                        LocMessage.internalTypeCheckingError().format({
-                            file: this.getUri().toUserVisibleString(),
-                            message,
-                        })
-                    );
-                    const diagSink = this.createDiagnosticSink();
-                    diagSink.addError(
-                        LocMessage.internalTypeCheckingError().format({
-                            file: this.getUri().toUserVisibleString(),
-                            message,
-                        }),
-                        getEmptyRange()
-                    );
+        return performanceTrace.span('checkFile', 'file', this._getTraceArgs, () => {
+            return this._logTracker.log(`checking: ${this._getPathForLogging(this._uri)}`, () => {
+                try {
+                    timingStats.typeCheckerTime.timeOperation(() => {
+                        const checkDuration = new Duration();
+                        const checker = new Checker(
+                            importResolver,
+                            evaluator,
+                            this._writableData.parserOutput!,
+                            dependentFiles
+                        );
+                        const semanticVersion = this._writableData.semanticVersion;
+                        this._writableData.isCheckingInProgress = true;
+                        this._writableData.restoredDiagnostics = undefined;
+                        checker.check();
+
+                        // The file needs to be checked again if it was marked dirty while it
+                        // was being checked, e.g. because a file it imports was parsed again.
+                        this._writableData.isCheckingNeeded = this._writableData.semanticVersion !== semanticVersion;
+
+                        const fileInfo = AnalyzerNodeInfo.getFileInfo(this._writableData.parserOutput!.parseTree)!;
+                        this._writableData.checkerDiagnostics = fileInfo.diagnosticSink.fetchAndClear();
+                        this._writableData.checkTime = checkDuration.getDurationInMilliseconds();
+                    });
+                } catch (e: any) {
+                    const isCancellation = OperationCanceledException.is(e);
+                    if (!isCancellation) {
+                        const message: string =
+                            (e.stack ? e.stack.toString() : undefined) ||
+                            (typeof e.message === 'string' ? e.message : undefined) ||
+                            JSON.stringify(e);
+                        this._console.error(
+                            LocMessage.internalTypeCheckingError().format({
+                                file: this.getUri().toUserVisibleString(),
+                                message,
+                            })
+                        );
+                        const diagSink = this.createDiagnosticSink();
+                        diagSink.addError(
+                            LocMessage.internalTypeCheckingError().format({
+                                file: this.getUri().toUserVisibleString(),
+                                message,
+                            }),
+                            getEmptyRange()
+                        );
 
-                    this._writableData.checkerDiagnostics = diagSink.fetchAndClear();
+                        this._writableData.checkerDiagnostics = diagSink.fetchAndClear();
 
-                    // Mark the file as complete so we don't get into an infinite loop.
-                    this._writableData.isCheckingNeeded = false;
-                }
+                        // Mark the file as complete so we don't get into an infinite loop.
+                        this._writableData.isCheckingNeeded = false;
+                    }
 
-                throw e;
-            } finally {
-                this._writableData.isCheckingInProgress = false;
+                    throw e;
+                } finally {
+                    this._writableData.isCheckingInProgress = false;
 
-                // Clear any circular dependencies associated with this file.
-                // These will be detected by the program module and associated
-                // with the source file right before it is finalized.
-                this._writableData.circularDependencies = [];
+                    // Clear any circular dependencies associated with this file.
+                    // These will be detected by the program module and associated
+                    // with the source file right before it is finalized.
+                    this._writableData.circularDependencies = [];
 
-                this._recomputeDiagnostics(configOptions);
-            }
+                    this._recomputeDiagnostics(configOptions);
+                }
+            });
         });
     }
 
@@ -1144,14 +1441,6 @@ export class SourceFile {
     private _recomputeDiagnostics(configOptions: ConfigOptions) {
         this._writableData.diagnosticVersion++;
 
-        let includeWarningsAndErrors = true;
-
-        // If a file was imported as a third-party file, don't report
-        // any errors for it. The user can't fix them anyway.
-        if (this._isThirdPartyImport) {
-            includeWarningsAndErrors = false;
-        }
-
         let diagList: Diagnostic[] = [];
         appendArray(diagList, this._writableData.parseDiagnostics);
         appendArray(diagList, this._writableData.commentDiagnostics);
@@ -1395,6 +1684,22 @@ export class SourceFile {
         // Now add in the "unnecessary type ignore" diagnostics.
         diagList = diagList.concat(unnecessaryTypeIgnoreDiags);
 
+        this._finalizeDiagnostics(configOptions, diagList);
+    }
+
+    // Applies the baseline file and the file-level filters to the accumulated
+    // diagnostics and stores the results.
+    private _finalizeDiagnostics(configOptions: ConfigOptions, diagList: Diagnostic[]) {
+        let includeWarningsAndErrors = true;
+
+        // If a file was imported as a third-party file, don't report
+        // any errors for it. The user can't fix them anyway.
+        if (this._isThirdPartyImport) {
+            includeWarningsAndErrors = false;
+        }
+
+        this._writableData.unbaselinedDiagnostics = diagList;
+
         diagList = this._baselineHandler.sortDiagnosticsAndMatchBaseline(this._uri, this.getCellIndex(), diagList);
 
         // If we're not returning any diagnostics, filter out all of
@@ -1410,7 +1715,7 @@ export class SourceFile {
         this._writableData.diagnosticsWithoutFileIgnore = diagList;
 
         // If the file is in the ignore list, clear the diagnostic list.
-        if (configOptions.ignore.find((ignoreFileSpec) => this._uri.matchesRegex(ignoreFileSpec.regExp))) {
+        if (FileSpec.isInPath(this._uri, configOptions.ignore)) {
             diagList = [];
         }
 
@@ -1639,16 +1944,40 @@ export class SourceFile {
         };
     }
 
+    // Passed to performanceTrace.span as a function so the arguments are
+    // computed only when a trace is being recorded.
+    private _getTraceArgs = (): TraceArgs => {
+        return { file: this._uri.toUserVisibleString() };
+    };
+
     private _getPathForLogging(fileUri: Uri) {
         return getPathForLogging(this.fileSystem, fileUri);
     }
 
+    // Returns the results of the previous parse if they can be used to reparse
+    // the file incrementally. They're retained only while the file is open
+    // because that's when it's edited repeatedly.
+    private _getPreviousParseResults(): PreviousParseResults | undefined {
+        const { parserOutput, tokenizerOutput, parsedFileContents, incrementalParseInfo } = this._writableData;
+        if (!parserOutput || !tokenizerOutput || parsedFileContents === undefined || !incrementalParseInfo) {
+            return undefined;
+        }
+
+        // The statements that are reused keep the analysis information that
+        // was attached to them when the file was last bound.
+        const cleanerWalker = new ParseTreeCleanerWalker(parserOutput.parseTree);
+        cleanerWalker.clean();
+
+        return { text: parsedFileContents, parserOutput, tokenizerOutput, incrementalParseInfo };
+    }
+
     private _parseFile(
         configOptions: ConfigOptions,
         fileUri: Uri,
         fileContents: string,
         useNotebookMode: boolean,
-        diagSink: DiagnosticSink
+        diagSink: DiagnosticSink,
+        previousParse: PreviousParseResults | undefined
     ): ParseFileResults {
         // Use the configuration options to determine the environment zin which
         // this source file will be executed.
@@ -1661,10 +1990,11 @@ export class SourceFile {
         }
         parseOptions.pythonVersion = execEnvironment.pythonVersion;
         parseOptions.skipFunctionAndClassBody = configOptions.indexGenerationMode ?? false;
+        parseOptions.enableIncrementalParse = this._writableData.clientDocumentContents !== undefined;
 
         // Parse the token stream, building the abstract syntax tree.
         const parser = new Parser();
-        return parser.parseSourceFile(fileContents, parseOptions, diagSink);
+        return parser.parseSourceFile(fileContents, parseOptions, diagSink, previousParse);
     }
 
     private _tokenizeContents(fileContents: string, contentHash: number): TokenizerOutput {
@@ -1701,3 +2031,48 @@ export class SourceFile {
         });
     }
 }
+
+function _buildIdentifierText(fileContents: string, tokens: TextRangeCollection<Token>): string {
+    const names = new Set<string>();
+
+    const addWords = (value: string) => {
+        _wordRegEx.lastIndex = 0;
+        let match = _wordRegEx.exec(value);
+        while (match) {
+            names.add(match[0]);
+            match = _wordRegEx.exec(value);
+        }
+    };
+
+    for (let i = 0; i < tokens.count; i++) {
+        const token = tokens.getItemAt(i);
+        token.comments?.forEach((comment) => addWords(comment.value));
+
+        switch (token.type) {
+            case TokenType.Identifier:
+                names.add((token as IdentifierToken).value);
+                break;
+
+            case TokenType.Keyword:
+                // Soft keywords (like "match" and "type") can also be names.
+                names.add(fileContents.substr(token.start, token.length));
+                break;
+
+            case TokenType.String: {
+                // Some references (e.g. TypedDict keys) are entire string literals.
+                const value = (token as StringToken).escapedValue;
+                addWords(value);
+                value.split(/\r\n|\r|\n/).forEach((line) => names.add(line));
+                break;
+            }
+
+            case TokenType.FStringMiddle:
+                addWords((token as FStringMiddleToken).escapedValue);
+                break;
+        }
+    }
+
+    // Joining the names creates a single compact string that doesn't
+    // keep the (potentially much larger) file contents alive.
+    return `\n${[...names].join('\n')}\n`;
+}
@@ -119,6 +119,14 @@ export class SourceFileInfo implements extensibility.SourceFileInfo {
         return this.sourceFile.getSemanticVersion();
     }
 
+    get contentsVersion() {
+        return this.sourceFile.getFileContentsVersion();
+    }
+
+    containsIdentifier(names: readonly string[]) {
+        return this.sourceFile.containsIdentifier(names);
+    }
+
     set diagnosticsVersion(value: number | undefined) {
         this._cachePreEditState();
         this._writableData.diagnosticsVersion = value;
@@ -36,6 +36,7 @@ import {
     pythonVersion3_9,
 } from '../common/pythonVersion';
 import { TextRange } from '../common/textRange';
+import { cacheStats } from '../common/timing';
 import { Uri } from '../common/uri/uri';
 import { LocAddendum, LocMessage, ParameterizedString } from '../localization/localize';
 import {
@@ -1243,10 +1244,17 @@ export function createTypeEvaluator(
                     );
                 }
 
+                if (cacheStats.isEnabled) {
+                    cacheStats.typeCache.hitCount++;
+                }
                 return cacheEntry.typeResult;
             }
         }
 
+        if (cacheStats.isEnabled) {
+            cacheStats.typeCache.missCount++;
+        }
+
         // Is it cached in the speculative type cache?
         const specCacheEntry = useTypeFormCache
             ? undefined
@@ -1264,10 +1272,17 @@ export function createTypeEvaluator(
                     );
                 }
 
+                if (cacheStats.isEnabled) {
+                    cacheStats.speculativeTypeCache.hitCount++;
+                }
                 return specCacheEntry.typeResult;
             }
         }
 
+        if (!useTypeFormCache && cacheStats.isEnabled) {
+            cacheStats.speculativeTypeCache.missCount++;
+        }
+
         if (printExpressionTypes) {
             console.log(
                 `${getPrintExpressionTypesSpaces()}${ParseTreeUtils.printExpression(node)} (${getLineNum(node)}): Pre`
@@ -11,11 +11,20 @@
 import { LogLevel } from '../common/console';
 import { isDebugMode } from '../common/core';
 import { LogTracker } from '../common/logTracker';
+import { performanceTrace, TraceArgs } from '../common/performanceTrace';
+import { convertOffsetToPosition } from '../common/positionUtils';
 import { timingStats } from '../common/timing';
+import { Uri } from '../common/uri/uri';
+import { ParseNode } from '../parser/parseNodes';
 import { ImportLookup } from './analyzerFileInfo';
+import { getFileInfoFromNode } from './parseTreeUtils';
 import { TracePrinter } from './tracePrinter';
 import { createTypeEvaluator, EvaluatorOptions } from './typeEvaluator';
 
+// Evaluator calls that take less time than this aren't recorded in the
+// performance trace. There are far too many of them to be useful.
+const minTracedEvaluatorCallDurationInMs = 1;
+
 // We don't want to track calls from the type evaluator itself, but only entry points.
 export function createTypeEvaluatorWithTracker(
     importLookup: ImportLookup,
@@ -46,6 +55,21 @@ export function createTypeEvaluatorWithTracker(
                     /* logParsingPerf */ true
                 );
             };
+        } else if (performanceTrace.isEnabled) {
+            return (...args: Parameters<T>): ReturnType<T> => {
+                // Record only the calls made from outside the evaluator.
+                if (timingStats.typeEvaluationTime.isTiming) {
+                    return timingStats.typeEvaluationTime.timeOperation(func, ...args);
+                }
+
+                return performanceTrace.span(
+                    func.name,
+                    'evaluator',
+                    () => getTraceArgs(args[0]),
+                    () => timingStats.typeEvaluationTime.timeOperation(func, ...args),
+                    minTracedEvaluatorCallDurationInMs
+                );
+            };
         } else if (!isDebugMode()) {
             return timingStats.typeEvaluationTime.timeOperation.bind(timingStats.typeEvaluationTime, func);
         } else {
@@ -69,3 +93,28 @@ export function createTypeEvaluatorWithTracker(
 
     return evaluator;
 }
+
+// Describes the location of the node (or the file) passed to an evaluator
+// call so the call can be found in the trace.
+function getTraceArgs(arg: unknown): TraceArgs {
+    if (Uri.is(arg)) {
+        return { file: arg.toUserVisibleString() };
+    }
+
+    const node = arg as ParseNode | undefined;
+    if (!node || typeof node.nodeType !== 'number' || typeof node.start !== 'number') {
+        return {};
+    }
+
+    const fileInfo = getFileInfoFromNode(node);
+    if (!fileInfo) {
+        return {};
+    }
+
+    const position = convertOffsetToPosition(node.start, fileInfo.lines);
+    return {
+        file: fileInfo.fileUri.toUserVisibleString(),
+        line: position.line + 1,
+        column: position.character + 1,
+    };
+}
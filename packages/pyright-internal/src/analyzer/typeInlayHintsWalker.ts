@@ -25,7 +25,7 @@ import {
     FunctionNode,
     ParamCategory,
     ParseNode,
-    ParseNodeBase,
+    ParseNodeArray,
     ParseNodeType,
     TypeAnnotationNode,
 } from '../parser/parseNodes';
@@ -41,6 +41,12 @@ export type TypeInlayHintsItemType = {
     value: string;
     imports?: ImportTrackerResults;
 };
+
+// The inlay hints that were computed for each node of a file. It can be shared
+// by walkers of the same parse tree, evaluator and settings so the nodes that
+// were already visited aren't evaluated again.
+export type TypeInlayHintsCache = WeakMap<ParseNode, TypeInlayHintsItemType[]>;
+
 // Don't generate inlay hints for arguments to builtin types and functions
 const ignoredBuiltinTypes = new Set(
     [
@@ -99,7 +105,8 @@ export class TypeInlayHintsWalker extends ParseTreeWalker {
         private readonly _program: ProgramView,
         private _settings: InlayHintSettings,
         private _fileUri: Uri,
-        range?: Range
+        range?: Range,
+        private readonly _cache?: TypeInlayHintsCache
     ) {
         super();
         this.parseResults = this._program.getParseResults(_fileUri);
@@ -111,6 +118,14 @@ export class TypeInlayHintsWalker extends ParseTreeWalker {
         }
     }
 
+    override visitNode(node: ParseNode): ParseNodeArray {
+        // Skip the subtrees that are outside the range.
+        if (!this._checkInRange(node)) {
+            return [];
+        }
+        return super.visitNode(node);
+    }
+
     override visitClass(node: ClassNode): boolean {
         const evaluator = this._program.evaluator;
         if (evaluator) {
@@ -132,12 +147,53 @@ export class TypeInlayHintsWalker extends ParseTreeWalker {
     }
 
     override visitAssignment(node: AssignmentNode): boolean {
+        if (this._settings.variableTypes) {
+            this._addItemsForNode(node, () => this._generateHintsForAssignmentNode(node));
+        }
+        return super.visitAssignment(node);
+    }
+
+    override visitCall(node: CallNode): boolean {
+        this._addItemsForNode(node, () => this._generateHintsForCallNode(node));
+        return super.visitCall(node);
+    }
+
+    override visitFunction(node: FunctionNode): boolean {
+        if (this._settings.functionReturnTypes) {
+            this._addItemsForNode(node, () => this._generateHintsForFunctionNode(node));
+        }
+        return super.visitFunction(node);
+    }
+
+    override visitTypeAnnotation(node: TypeAnnotationNode): boolean {
+        if (this._settings.genericTypes) {
+            this._addItemsForNode(node, () => this._generateHintsForTypeAnnotationNode(node));
+        }
+        return super.visitTypeAnnotation(node);
+    }
+
+    private _checkInRange = (node: ParseNode) =>
+        !this._range || TextRange.overlapsRange(this._range, TextRange.create(node.start, node.length));
+
+    // Adds the items that the callback generates for the node, or the
+    // items that were cached for it by a previous walk.
+    private _addItemsForNode(node: ParseNode, generateItems: () => void) {
+        const cachedItems = this._cache?.get(node);
+        if (cachedItems) {
+            this.featureItems.push(...cachedItems);
+            return;
+        }
+
+        const startIndex = this.featureItems.length;
+        generateItems();
+        this._cache?.set(node, this.featureItems.slice(startIndex));
+    }
+
+    private _generateHintsForAssignmentNode(node: AssignmentNode) {
         const leftExpr = node.d.leftExpr;
         const isNameNode = leftExpr.nodeType === ParseNodeType.Name;
         const isMemberAccessNode = leftExpr.nodeType === ParseNodeType.MemberAccess;
         if (
-            this._settings.variableTypes &&
-            this._checkInRange(node) &&
             // only put the inlay hint if the assigmment is on a name or member access expression but not tuple expressions.
             // we whitelist name and member access instead of blaclisting tuple expressions in case there are also other
             // node types that can be assigned to that i'm forgetting about
@@ -163,7 +219,7 @@ export class TypeInlayHintsWalker extends ParseTreeWalker {
                 if (isMemberAccessNode) {
                     const declarations = this._program.evaluator?.getDeclInfoForNameNode(leftExpr.d.member)?.decls;
                     if (!declarations?.find((declaration) => declaration.node === leftExpr.d.member)) {
-                        return super.visitAssignment(node);
+                        return;
                     }
                 }
                 let importTracker: ImportTracker;
@@ -190,66 +246,49 @@ export class TypeInlayHintsWalker extends ParseTreeWalker {
                 });
             }
         }
-        return super.visitAssignment(node);
-    }
-
-    override visitCall(node: CallNode): boolean {
-        if (this._checkInRange(node)) {
-            this._generateHintsForCallNode(node);
-        }
-        return super.visitCall(node);
     }
 
-    override visitFunction(node: FunctionNode): boolean {
-        if (this._settings.functionReturnTypes && this._checkInRange(node)) {
-            const evaluator = this._program.evaluator;
-            const functionType = evaluator?.getTypeOfFunction(node)?.functionType;
-            if (functionType !== undefined && !functionType.shared.declaredReturnType) {
-                const inferredReturnType = evaluator?.getInferredReturnType(functionType);
-                if (inferredReturnType) {
-                    const { imports, value } = this._printType(node, inferredReturnType);
-                    this.featureItems.push({
-                        inlayHintType: 'functionReturn',
-                        position: node.d.suite.start,
-                        value: `-> ${value}`,
-                        imports: imports.result,
-                    });
-                }
+    private _generateHintsForFunctionNode(node: FunctionNode) {
+        const evaluator = this._program.evaluator;
+        const functionType = evaluator?.getTypeOfFunction(node)?.functionType;
+        if (functionType !== undefined && !functionType.shared.declaredReturnType) {
+            const inferredReturnType = evaluator?.getInferredReturnType(functionType);
+            if (inferredReturnType) {
+                const { imports, value } = this._printType(node, inferredReturnType);
+                this.featureItems.push({
+                    inlayHintType: 'functionReturn',
+                    position: node.d.suite.start,
+                    value: `-> ${value}`,
+                    imports: imports.result,
+                });
             }
         }
-
-        return super.visitFunction(node);
     }
 
-    override visitTypeAnnotation(node: TypeAnnotationNode): boolean {
-        if (this._settings.genericTypes && this._checkInRange(node)) {
-            const evaluator = this._program.evaluator;
-            if (evaluator) {
-                const annotationType = evaluator.getType(node.d.annotation);
-                if (
-                    annotationType &&
-                    isInstantiableClass(annotationType) &&
-                    (ClassType.isBuiltIn(annotationType, 'Final') || ClassType.isBuiltIn(annotationType, 'ClassVar'))
-                ) {
-                    const valueType = evaluator.getType(node.d.valueExpr);
-                    if (valueType) {
-                        const { value, imports } = this._printType(node, valueType);
-                        this.featureItems.push({
-                            inlayHintType: 'generic',
-                            position: this._endOfNode(node),
-                            value: `[${value}]`,
-                            imports: imports.result,
-                        });
-                    }
-                }
+    private _generateHintsForTypeAnnotationNode(node: TypeAnnotationNode) {
+        const evaluator = this._program.evaluator;
+        if (!evaluator) {
+            return;
+        }
+        const annotationType = evaluator.getType(node.d.annotation);
+        if (
+            annotationType &&
+            isInstantiableClass(annotationType) &&
+            (ClassType.isBuiltIn(annotationType, 'Final') || ClassType.isBuiltIn(annotationType, 'ClassVar'))
+        ) {
+            const valueType = evaluator.getType(node.d.valueExpr);
+            if (valueType) {
+                const { value, imports } = this._printType(node, valueType);
+                this.featureItems.push({
+                    inlayHintType: 'generic',
+                    position: this._endOfNode(node),
+                    value: `[${value}]`,
+                    imports: imports.result,
+                });
             }
         }
-        return super.visitTypeAnnotation(node);
     }
 
-    private _checkInRange = (node: ParseNodeBase<ParseNodeType>) =>
-        !this._range || TextRange.overlapsRange(this._range, TextRange.create(node.start, node.length));
-
     private _generateHintsForCallNode(node: CallNode) {
         const evaluator = this._program.evaluator;
         if (!evaluator) {
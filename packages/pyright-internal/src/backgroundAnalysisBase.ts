@@ -41,6 +41,7 @@ import { FileDiagnostics } from './common/diagnosticSink';
 import { disposeCancellationToken, getCancellationTokenFromId } from './common/fileBasedCancellationUtils';
 import { Host, HostKind } from './common/host';
 import { LogTracker } from './common/logTracker';
+import { performanceTrace } from './common/performanceTrace';
 import { ServiceProvider } from './common/serviceProvider';
 import { Range } from './common/textRange';
 import { createMessageChannel, MessagePort, threadId, MessageChannel, Worker } from './common/workersHost';
@@ -56,6 +57,7 @@ export interface IBackgroundAnalysis extends Disposable {
     setImportResolver(importResolver: ImportResolver): void;
     setConfigOptions(configOptions: ConfigOptions): void;
     setTrackedFiles(fileUris: Uri[]): void;
+    addTrackedFiles(fileUris: Uri[]): void;
     setAllowedThirdPartyImports(importNames: string[]): void;
     ensurePartialStubPackages(executionRoot: string | undefined): void;
     setFileOpened(fileUri: Uri, version: number | null, contents: string, options: OpenFileOptions): void;
@@ -156,6 +158,10 @@ export class BackgroundAnalysisBase implements IBackgroundAnalysis {
         this.enqueueRequest({ requestType: 'setTrackedFiles', data: serialize(fileUris) });
     }
 
+    addTrackedFiles(fileUris: Uri[]) {
+        this.enqueueRequest({ requestType: 'addTrackedFiles', data: serialize(fileUris) });
+    }
+
     setAllowedThirdPartyImports(importNames: string[]) {
         this.enqueueRequest({ requestType: 'setAllowedThirdPartyImports', data: serialize(importNames) });
     }
@@ -585,6 +591,11 @@ export abstract class BackgroundAnalysisRunnerBase extends BackgroundThreadBase
                 break;
             }
 
+            case 'addTrackedFiles': {
+                this.handleAddTrackedFiles(deserialize(msg.data));
+                break;
+            }
+
             case 'setAllowedThirdPartyImports': {
                 this.handleSetAllowedThirdPartyImports(deserialize(msg.data));
                 break;
@@ -757,6 +768,11 @@ export abstract class BackgroundAnalysisRunnerBase extends BackgroundThreadBase
     protected handleSetConfigOptions(configOptions: ConfigOptions) {
         this._configOptions = configOptions;
 
+        // Start the trace before the program creates its type evaluator.
+        if (configOptions.performanceTraceFile) {
+            performanceTrace.start('background analysis');
+        }
+
         this.importResolver = this.createImportResolver(
             this.getServiceProvider(),
             this._configOptions,
@@ -771,6 +787,10 @@ export abstract class BackgroundAnalysisRunnerBase extends BackgroundThreadBase
         this._reportDiagnostics(diagnostics, this.program.getFilesToAnalyzeCount(), 0);
     }
 
+    protected handleAddTrackedFiles(fileUris: Uri[]) {
+        this.program.addTrackedFiles(fileUris);
+    }
+
     protected handleSetAllowedThirdPartyImports(importNames: string[]) {
         this.program.setAllowedThirdPartyImports(importNames);
     }
@@ -962,6 +982,7 @@ export type BackgroundRequestKind =
     | 'resumeAnalysis'
     | 'setConfigOptions'
     | 'setTrackedFiles'
+    | 'addTrackedFiles'
     | 'setAllowedThirdPartyImports'
     | 'ensurePartialStubPackages'
     | 'setFileOpened'
@@ -12,6 +12,7 @@ import { LanguageServerInterface } from '../common/languageServerInterface';
 import { Commands } from './commands';
 import { CreateTypeStubCommand } from './createTypeStub';
 import { DumpFileDebugInfoCommand } from './dumpFileDebugInfoCommand';
+import { DumpMemoryStatsCommand } from './dumpMemoryStatsCommand';
 import { QuickActionCommand } from './quickActionCommand';
 import { RestartServerCommand } from './restartServer';
 import { WriteBaselineCommand } from './writeBaseline';
@@ -25,6 +26,7 @@ export class CommandController implements ServerCommand {
     private _restartServer: RestartServerCommand;
     private _quickAction: QuickActionCommand;
     private _dumpFileDebugInfo: DumpFileDebugInfoCommand;
+    private _dumpMemoryStats: DumpMemoryStatsCommand;
     private _writeBaseline: WriteBaselineCommand;
 
     constructor(ls: LanguageServerInterface) {
@@ -32,6 +34,7 @@ export class CommandController implements ServerCommand {
         this._restartServer = new RestartServerCommand(ls);
         this._quickAction = new QuickActionCommand(ls);
         this._dumpFileDebugInfo = new DumpFileDebugInfoCommand(ls);
+        this._dumpMemoryStats = new DumpMemoryStatsCommand(ls);
         this._writeBaseline = new WriteBaselineCommand(ls);
     }
 
@@ -53,6 +56,10 @@ export class CommandController implements ServerCommand {
                 return this._dumpFileDebugInfo.execute(cmdParams, token);
             }
 
+            case Commands.dumpMemoryStats: {
+                return this._dumpMemoryStats.execute(cmdParams, token);
+            }
+
             case Commands.writeBaseline: {
                 return this._writeBaseline.execute();
             }
@@ -18,6 +18,7 @@ export const enum Commands {
     dumpTypes = 'basedpyright.dumpTypes',
     dumpCachedTypes = 'basedpyright.dumpCachedTypes',
     dumpCodeFlowGraph = 'basedpyright.dumpCodeFlowGraph',
+    dumpMemoryStats = 'basedpyright.dumpMemoryStats',
     import = 'basedpyright.import',
     writeBaseline = 'basedpyright.writeBaseline',
 }
@@ -0,0 +1,49 @@
+/*
+ * dumpMemoryStatsCommand.ts
+ *
+ * Implements the 'dump memory stats' command, which logs the approximate
+ * memory retained by each cache and by the heaviest files of the programs
+ * on the main thread.
+ */
+
+import { CancellationToken, ExecuteCommandParams } from 'vscode-languageserver';
+
+import { formatMemoryStats, ProgramMemoryStats } from '../analyzer/memoryStats';
+import { throwIfCancellationRequested } from '../common/cancellationUtils';
+import { LanguageServerInterface } from '../common/languageServerInterface';
+import { ServerCommand } from './commandController';
+
+const defaultMaxFileCount = 20;
+
+export class DumpMemoryStatsCommand implements ServerCommand {
+    constructor(private _ls: LanguageServerInterface) {}
+
+    async execute(params: ExecuteCommandParams, token: CancellationToken): Promise<any> {
+        const maxFileCount = (params.arguments?.[0] as number | undefined) ?? defaultMaxFileCount;
+        const workspaces = await this._ls.getWorkspaces();
+        throwIfCancellationRequested(token);
+
+        // The programs of all workspaces share the cache manager, so each
+        // program's stats include the caches of all of them.
+        let stats: ProgramMemoryStats = { caches: [], parsedFileCount: 0, heaviestFiles: [] };
+        workspaces.forEach((workspace) => {
+            const programStats = workspace.service.backgroundAnalysisProgram.program.getMemoryStats(maxFileCount);
+
+            stats = {
+                caches: programStats.caches,
+                parsedFileCount: stats.parsedFileCount + programStats.parsedFileCount,
+                heaviestFiles: [...stats.heaviestFiles, ...programStats.heaviestFiles]
+                    .sort((a, b) => b.approximateBytes - a.approximateBytes)
+                    .slice(0, maxFileCount),
+            };
+        });
+
+        // Print all of the output in one message so the trace log is smaller.
+        this._ls.console.info(['* Memory usage', ...formatMemoryStats(stats)].join('\n'));
+
+        return {
+            ...stats,
+            heaviestFiles: stats.heaviestFiles.map((file) => ({ ...file, uri: file.uri.toString() })),
+        };
+    }
+}
@@ -159,6 +159,15 @@ export class CommandLineLanguageServerOptions {
 
     //Path to baseline file.
     baselineFile?: string | undefined;
+
+    // Directory used to persist analysis results between runs.
+    analysisCacheDir?: string | undefined;
+
+    // File to which a performance trace is written after each analysis pass.
+    traceFile?: string | undefined;
+
+    // Approximate memory budget (in megabytes) for the parse and bind state of files.
+    memoryBudgetMB?: number | undefined;
 }
 
 // Some options can be specified from a source other than the pyright config file.
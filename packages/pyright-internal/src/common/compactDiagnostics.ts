@@ -0,0 +1,180 @@
+/*
+ * compactDiagnostics.ts
+ *
+ * A compact encoding for lists of file diagnostics that are sent between
+ * processes. Strings and URIs are stored once in lookup tables, and the
+ * numeric fields of each diagnostic are packed into a single Int32Array.
+ * When sent over an IPC channel that uses "advanced" serialization, the
+ * numeric data is transferred as a binary buffer rather than as JSON.
+ */
+
+import { Diagnostic, DiagnosticCategory, TaskListPriority } from './diagnostic';
+import { FileDiagnostics } from './diagnosticSink';
+import { Uri } from './uri/uri';
+
+export interface CompactFileDiagnostics {
+    // Unique strings (messages, rules, priorities and reasons).
+    strings: string[];
+
+    // Serialized form of each unique URI.
+    uris: any[];
+
+    // Rarely-used diagnostic fields (actions and data) that don't
+    // fit in the numeric encoding.
+    extras: { actions: any; data: any }[];
+
+    // Packed numeric fields. See the encode function for the layout.
+    values: Int32Array;
+}
+
+const _noValue = -1;
+
+export function encodeFileDiagnostics(fileDiagnostics: readonly FileDiagnostics[]): CompactFileDiagnostics {
+    const strings: string[] = [];
+    const stringIndices = new Map<string, number>();
+    const uris: any[] = [];
+    const uriIndices = new Map<string, number>();
+    const extras: { actions: any; data: any }[] = [];
+    const values: number[] = [];
+
+    const addString = (value: string | undefined) => {
+        if (value === undefined) {
+            return _noValue;
+        }
+
+        let index = stringIndices.get(value);
+        if (index === undefined) {
+            index = strings.length;
+            strings.push(value);
+            stringIndices.set(value, index);
+        }
+        return index;
+    };
+
+    const addUri = (uri: Uri) => {
+        let index = uriIndices.get(uri.key);
+        if (index === undefined) {
+            index = uris.length;
+            uris.push(uri.toJsonObj());
+            uriIndices.set(uri.key, index);
+        }
+        return index;
+    };
+
+    const addRange = (diag: { range: Diagnostic['range'] }) => {
+        values.push(diag.range.start.line, diag.range.start.character, diag.range.end.line, diag.range.end.character);
+    };
+
+    // Layout per file:
+    //   uri, cell, version, reason, diagnostic count
+    // followed by, for each diagnostic:
+    //   category, message, start line, start char, end line, end char,
+    //   priority, baselined, rule, extras, related info count
+    // followed by, for each related info entry:
+    //   message, uri, start line, start char, end line, end char, priority
+    values.push(fileDiagnostics.length);
+    for (const fileDiag of fileDiagnostics) {
+        values.push(
+            addUri(fileDiag.fileUri),
+            fileDiag.cell ?? _noValue,
+            fileDiag.version ?? _noValue,
+            addString(fileDiag.reason),
+            fileDiag.diagnostics.length
+        );
+
+        for (const diag of fileDiag.diagnostics) {
+            values.push(diag.category, addString(diag.message));
+            addRange(diag);
+
+            let extrasIndex = _noValue;
+            const actions = diag.getActions();
+            const data = diag.getData();
+            if (actions !== undefined || (data !== null && data !== undefined)) {
+                extrasIndex = extras.length;
+                extras.push({ actions, data });
+            }
+
+            const relatedInfo = diag.getRelatedInfo();
+            values.push(
+                addString(diag.priority),
+                diag.baselined ? 1 : 0,
+                addString(diag.getRule()),
+                extrasIndex,
+                relatedInfo.length
+            );
+
+            for (const info of relatedInfo) {
+                values.push(addString(info.message), addUri(info.uri));
+                addRange(info);
+                values.push(addString(info.priority));
+            }
+        }
+    }
+
+    return { strings, uris, extras, values: Int32Array.from(values) };
+}
+
+export function decodeFileDiagnostics(encoded: CompactFileDiagnostics): FileDiagnostics[] {
+    const { strings, extras, values } = encoded;
+    const uris = encoded.uris.map((uri) => Uri.fromJsonObj(uri));
+    let offset = 0;
+
+    const next = () => values[offset++];
+    const nextOptional = () => {
+        const value = next();
+        return value === _noValue ? undefined : value;
+    };
+    const nextRange = () => ({
+        start: { line: next(), character: next() },
+        end: { line: next(), character: next() },
+    });
+
+    const fileDiagnostics: FileDiagnostics[] = [];
+    const fileCount = next();
+    for (let fileIndex = 0; fileIndex < fileCount; fileIndex++) {
+        const fileUri = uris[next()];
+        const cell = nextOptional();
+        const version = nextOptional();
+        const reason = strings[next()] as FileDiagnostics['reason'];
+        const diagnosticCount = next();
+
+        const diagnostics: Diagnostic[] = [];
+        for (let diagIndex = 0; diagIndex < diagnosticCount; diagIndex++) {
+            const category = next() as DiagnosticCategory;
+            const message = strings[next()];
+            const range = nextRange();
+            const priority = strings[next()] as TaskListPriority;
+            const baselined = next() === 1;
+            const ruleIndex = next();
+            const extrasIndex = next();
+            const relatedInfoCount = next();
+
+            const diag = new Diagnostic(category, message, range, priority, baselined);
+            if (ruleIndex !== _noValue) {
+                diag.setRule(strings[ruleIndex]);
+            }
+
+            if (extrasIndex !== _noValue) {
+                const { actions, data } = extras[extrasIndex];
+                for (const action of actions ?? []) {
+                    diag.addAction(action);
+                }
+                diag.setData(data ?? null);
+            }
+
+            for (let infoIndex = 0; infoIndex < relatedInfoCount; infoIndex++) {
+                const infoMessage = strings[next()];
+                const infoUri = uris[next()];
+                const infoRange = nextRange();
+                const infoPriority = strings[next()] as TaskListPriority;
+                diag.addRelatedInfo(infoMessage, infoUri, infoRange, infoPriority);
+            }
+
+            diagnostics.push(diag);
+        }
+
+        fileDiagnostics.push({ fileUri, cell, version, diagnostics, reason });
+    }
+
+    return fileDiagnostics;
+}
@@ -1424,6 +1424,23 @@ export class ConfigOptions {
     // Filter out any hint diagnostics with tags?
     disableTaggedHints = false;
 
+    // Directory in which to persist per-file analysis results between runs.
+    // This property is for internal use and not exposed externally as a
+    // config setting. It is set via the "--cachedir" command-line option.
+    analysisCacheDir?: Uri | undefined;
+
+    // File to which a performance trace is written after each analysis
+    // pass. This property is for internal use and not exposed externally
+    // as a config setting. It is set via a language server setting.
+    performanceTraceFile?: Uri | undefined;
+
+    // Approximate amount of memory (in megabytes) that the parse and bind
+    // state of the program's files may use before that of the least recently
+    // used closed files is evicted. This property is for internal use and not
+    // exposed externally as a config setting. It is set via a language server
+    // setting.
+    memoryBudgetMB?: number | undefined;
+
     //---------------------------------------------------------------
     // Diagnostics Rule Set
 
@@ -69,3 +69,14 @@ export function randomBytesHex(size: number): string {
 
     fail('crypto library not found');
 }
+
+// Returns the hex-encoded SHA-256 digest of the given string, or undefined
+// if no synchronous implementation is available on this platform. Callers
+// that use the digest for caching should simply disable the cache in that case.
+export function sha256Hex(data: string): string | undefined {
+    if (nodeCrypto) {
+        return nodeCrypto.createHash('sha256').update(data).digest('hex');
+    }
+
+    return undefined;
+}
@@ -60,6 +60,9 @@ export interface SourceFileInfo {
     readonly hasTypeAnnotations: boolean;
     readonly diagnosticsVersion: number | undefined;
     readonly semanticVersion: number;
+    // Changes whenever the contents of the file change. Program views that
+    // don't track it leave it undefined.
+    readonly contentsVersion?: number | undefined;
     readonly clientVersion: number | undefined;
 
     readonly chainedSourceFile?: SourceFileInfo | undefined;
@@ -79,6 +82,10 @@ export interface SourceFileInfo {
     readonly importedBy: readonly SourceFileInfo[];
     readonly shadows: readonly SourceFileInfo[];
     readonly shadowedBy: readonly SourceFileInfo[];
+
+    // See SourceFile.containsIdentifier. Implementations that don't index their
+    // names can omit it, which is treated the same as returning undefined.
+    containsIdentifier?(names: readonly string[]): boolean | undefined;
 }
 
 // Readonly wrapper around a Program. Makes sure it doesn't mutate the program.
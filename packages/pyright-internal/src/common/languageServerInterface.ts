@@ -30,6 +30,8 @@ export interface ServerSettings {
     useLibraryCodeForTypes?: boolean | undefined;
     baselineFile?: Uri | undefined;
     baselineMode?: ServerBaselineMode | undefined;
+    traceFile?: Uri | undefined;
+    memoryBudgetMB?: number | undefined;
     configFilePath?: Uri | undefined;
     disableLanguageServices?: boolean | undefined;
     disableTaggedHints?: boolean | undefined;
@@ -0,0 +1,151 @@
+/*
+ * performanceTrace.ts
+ *
+ * Records nested spans for the phases of an analysis run (tokenizing,
+ * parsing, binding and checking each file, resolving imports and calling
+ * into the type evaluator) and exports them in the Chrome trace event
+ * format, which can be opened in Perfetto, chrome://tracing or speedscope.
+ */
+
+export type TraceArgs = { [name: string]: string | number | boolean | undefined };
+
+// A "complete" (ph: 'X') or "metadata" (ph: 'M') event in the Chrome trace
+// event format. Times are in microseconds.
+export interface TraceEvent {
+    name: string;
+    cat?: string;
+    ph: 'X' | 'M';
+    ts?: number;
+    dur?: number;
+    pid: number;
+    tid: number;
+    args?: TraceArgs;
+}
+
+// Events taken from one process to be added to the trace of another.
+export interface TraceEventBatch {
+    events: TraceEvent[];
+    droppedEventCount: number;
+}
+
+// Stop recording once this many events have been recorded so a long-running
+// session can't exhaust the memory of the process.
+const maxEventCount = 1000000;
+
+export class PerformanceTrace {
+    private _events: TraceEvent[] | undefined;
+    private _eventCount = 0;
+    private _droppedEventCount = 0;
+    private _takenDroppedEventCount = 0;
+
+    get isEnabled() {
+        return this._events !== undefined;
+    }
+
+    get droppedEventCount() {
+        return this._droppedEventCount;
+    }
+
+    // Starts recording events. The process name is shown as the title of
+    // the process's track in the trace viewer.
+    start(processName: string) {
+        if (this._events) {
+            return;
+        }
+
+        this._events = [];
+        this._addEvent({
+            name: 'process_name',
+            ph: 'M',
+            pid: process.pid,
+            tid: 0,
+            args: { name: processName },
+        });
+    }
+
+    // Runs the callback and records a span for it if tracing is enabled.
+    // The arguments can be given as a function so they're computed only if
+    // the span is recorded. Spans shorter than the minimum duration are
+    // omitted.
+    span<T>(
+        name: string,
+        category: string,
+        args: TraceArgs | (() => TraceArgs) | undefined,
+        callback: () => T,
+        minDurationInMs = 0
+    ): T {
+        if (!this._events) {
+            return callback();
+        }
+
+        const startTime = performance.now();
+        try {
+            return callback();
+        } finally {
+            const duration = performance.now() - startTime;
+            if (duration >= minDurationInMs) {
+                this._addEvent({
+                    name,
+                    cat: category,
+                    ph: 'X',
+                    ts: Math.round((performance.timeOrigin + startTime) * 1000),
+                    dur: Math.round(duration * 1000),
+                    pid: process.pid,
+                    tid: 0,
+                    args: typeof args === 'function' ? args() : args,
+                });
+            }
+        }
+    }
+
+    // Adds events recorded by another process (e.g. a worker used for
+    // multi-threaded analysis).
+    addEvents(batch: TraceEventBatch) {
+        if (!this._events) {
+            return;
+        }
+
+        for (const event of batch.events) {
+            this._addEvent(event);
+        }
+
+        this._droppedEventCount += batch.droppedEventCount;
+    }
+
+    // Returns the events recorded (or dropped) since the last call and
+    // forgets them. Recording continues.
+    takeEvents(): TraceEventBatch {
+        const batch: TraceEventBatch = {
+            events: this._events ?? [],
+            droppedEventCount: this._droppedEventCount - this._takenDroppedEventCount,
+        };
+
+        if (this._events) {
+            this._events = [];
+        }
+
+        this._takenDroppedEventCount = this._droppedEventCount;
+        return batch;
+    }
+
+    // Returns the events recorded so far in the Chrome trace JSON format.
+    serialize(): string {
+        return JSON.stringify({
+            traceEvents: this._events ?? [],
+            displayTimeUnit: 'ms',
+            otherData: { droppedEventCount: this._droppedEventCount },
+        });
+    }
+
+    private _addEvent(event: TraceEvent) {
+        if (this._eventCount >= maxEventCount) {
+            this._droppedEventCount++;
+            return;
+        }
+
+        this._eventCount++;
+        this._events!.push(event);
+    }
+}
+
+export const performanceTrace = new PerformanceTrace();
@@ -17,9 +17,7 @@ export function isPatternInSymbol(typedValue: string, symbolName: string): boole
     const symbolLower = symbolName.toLocaleLowerCase();
     const typedLength = typedLower.length;
     const symbolLength = symbolLower.length;
-    /** how many times we're allowed to skip a section of characters in symbolName
-    to find the next character in typedValue */
-    const skipLimit = Math.floor(typedLength / 4) + 1;
+    const skipLimit = getPatternSkipLimit(typedLower);
     let countSkips = 0;
     let inSkip = false;
     let typedPos = 0;
@@ -43,6 +41,13 @@ export function isPatternInSymbol(typedValue: string, symbolName: string): boole
     return typedPos === typedLength;
 }
 
+// Returns how many times isPatternInSymbol is allowed to skip a section of
+// characters in the symbol name to find the next typed character. A name that
+// matches a typed string also matches its prefixes that have the same limit.
+export function getPatternSkipLimit(typedValue: string): number {
+    return Math.floor(typedValue.length / 4) + 1;
+}
+
 // This is a simple, non-cryptographic hash function for text.
 export function hashString(contents: string) {
     let hash = 0;
@@ -9,6 +9,7 @@
  */
 
 import { ConsoleInterface } from './console';
+import { performanceTrace } from './performanceTrace';
 
 export class Duration {
     private _startTime: number;
@@ -32,6 +33,10 @@ export class TimingStat {
     callCount = 0;
     isTiming = false;
 
+    // If a trace name is provided, each (non-reentrant) operation is also
+    // recorded as a span when a performance trace is being recorded.
+    constructor(readonly traceName?: string) {}
+
     timeOperation<T extends (...args: any[]) => any>(callback: T, ...args: any[]): ReturnType<T> {
         this.callCount++;
 
@@ -41,11 +46,17 @@ export class TimingStat {
         } else {
             this.isTiming = true;
             const duration = new Duration();
-            const result = callback(...args);
-            this.totalTime += duration.getDurationInMilliseconds();
-            this.isTiming = false;
 
-            return result;
+            // Reset the state even if the operation is cancelled. Otherwise all
+            // later operations would be treated as reentrant.
+            try {
+                return this.traceName && performanceTrace.isEnabled
+                    ? performanceTrace.span(this.traceName, 'analysis', undefined, () => callback(...args))
+                    : callback(...args);
+            } finally {
+                this.totalTime += duration.getDurationInMilliseconds();
+                this.isTiming = false;
+            }
         }
     }
 
@@ -70,15 +81,20 @@ export class TimingStat {
 
 export class TimingStats {
     totalDuration = new Duration();
-    findFilesTime = new TimingStat();
-    readFileTime = new TimingStat();
-    tokenizeFileTime = new TimingStat();
-    parseFileTime = new TimingStat();
-    resolveImportsTime = new TimingStat();
-    cycleDetectionTime = new TimingStat();
+    findFilesTime = new TimingStat('findFiles');
+    readFileTime = new TimingStat('readFile');
+    tokenizeFileTime = new TimingStat('tokenize');
+    parseFileTime = new TimingStat('parse');
+    resolveImportsTime = new TimingStat('resolveImports');
+    cycleDetectionTime = new TimingStat('detectCycles');
+
+    // Binding and checking are traced per file by the source file, and type
+    // evaluation is traced by the evaluator's entry points.
     bindTime = new TimingStat();
     typeCheckerTime = new TimingStat();
     typeEvaluationTime = new TimingStat();
+    analysisCacheTime = new TimingStat('analysisCache');
+    emptyCacheTime = new TimingStat('emptyCache');
 
     printSummary(console: ConsoleInterface) {
         console.info(`Completed in ${this.totalDuration.getDurationInSeconds()}sec`);
@@ -95,6 +111,10 @@ export class TimingStats {
         console.info('Bind:                 ' + this.bindTime.printTime());
         console.info('Check:                ' + this.typeCheckerTime.printTime());
         console.info('Detect Cycles:        ' + this.cycleDetectionTime.printTime());
+        console.info('Analysis Cache:       ' + this.analysisCacheTime.printTime());
+        console.info(
+            'Empty Cache:          ' + this.emptyCacheTime.printTime() + ` (${this.emptyCacheTime.callCount} times)`
+        );
     }
 
     getTotalDuration() {
@@ -103,3 +123,34 @@ export class TimingStats {
 }
 
 export const timingStats = new TimingStats();
+
+// Counts the lookups in one of the analyzer's caches.
+export class CacheStat {
+    hitCount = 0;
+    missCount = 0;
+
+    getHitRate() {
+        const lookupCount = this.hitCount + this.missCount;
+        return lookupCount > 0 ? this.hitCount / lookupCount : 0;
+    }
+}
+
+export class CacheStats {
+    // Lookups are counted only while this is set (e.g. by a benchmark) so the
+    // cache lookups, which are on the evaluator's hottest paths, don't pay for
+    // the counting otherwise.
+    isEnabled = false;
+
+    // Lookups of expression types in the type evaluator's cache.
+    typeCache = new CacheStat();
+
+    // Lookups in the cache of types evaluated speculatively (e.g. while
+    // evaluating the arguments of an overloaded call). These happen only
+    // after a lookup in the type cache misses.
+    speculativeTypeCache = new CacheStat();
+
+    // Lookups of the narrowed type of a reference at a code flow node.
+    codeFlowTypeCache = new CacheStat();
+}
+
+export const cacheStats = new CacheStats();
@@ -45,7 +45,11 @@ export namespace FileSpec {
         return candidate && !!candidate.wildcardRoot && !!candidate.regExp;
     }
     export function isInPath(uri: Uri, paths: FileSpec[]) {
-        return !!paths.find((p) => uri.matchesRegex(p.regExp));
+        if (paths.length <= 1) {
+            return paths.length === 1 && uri.matchesRegex(paths[0].regExp);
+        }
+
+        return _getCombinedRegExps(paths).some((regExp) => uri.matchesRegex(regExp));
     }
 
     export function matchesIncludeFileRegex(uri: Uri, isFile = true) {
@@ -61,6 +65,43 @@ export namespace FileSpec {
 
         return false;
     }
+
+    // Returns regular expressions that match the union of the file specs: one per
+    // set of regular expression flags, with an alternative for each file spec.
+    // Config options can have many (e.g. exclude) file specs, and testing a path
+    // against one regular expression is much faster than testing it against each
+    // file spec's regular expression in turn.
+    function _getCombinedRegExps(paths: FileSpec[]): RegExp[] {
+        // File spec lists are sometimes modified in place, so make sure the
+        // cached regular expressions were created for the current file specs.
+        const cached = _combinedRegExpCache.get(paths);
+        if (
+            cached &&
+            cached.fileSpecs.length === paths.length &&
+            cached.fileSpecs.every((fileSpec, index) => fileSpec === paths[index])
+        ) {
+            return cached.regExps;
+        }
+
+        const sourcesByFlags = new Map<string, string[]>();
+        for (const fileSpec of paths) {
+            const flags = fileSpec.regExp.flags;
+            let sources = sourcesByFlags.get(flags);
+            if (!sources) {
+                sources = [];
+                sourcesByFlags.set(flags, sources);
+            }
+            sources.push(`(?:${fileSpec.regExp.source})`);
+        }
+
+        const regExps = Array.from(sourcesByFlags.entries()).map(
+            ([flags, sources]) => new RegExp(sources.join('|'), flags)
+        );
+        _combinedRegExpCache.set(paths, { fileSpecs: paths.slice(), regExps });
+        return regExps;
+    }
+
+    const _combinedRegExpCache = new WeakMap<FileSpec[], { fileSpecs: FileSpec[]; regExps: RegExp[] }>();
 }
 
 export interface FileSystemEntries {
@@ -23,7 +23,6 @@ import {
     CompletionItem,
     CompletionList,
     CompletionParams,
-    CompletionTriggerKind,
     ConfigurationItem,
     Connection,
     Declaration,
@@ -57,6 +56,7 @@ import {
     Location,
     MarkupKind,
     PrepareRenameParams,
+    PreviousResultId,
     PublishDiagnosticsParams,
     ReferenceParams,
     RemoteWindow,
@@ -73,6 +73,7 @@ import {
     WorkspaceDiagnosticParams,
     WorkspaceDiagnosticReport,
     WorkspaceDiagnosticReportPartialResult,
+    WorkspaceDocumentDiagnosticReport,
     WorkspaceEdit,
     WorkspaceFoldersChangeEvent,
     WorkspaceSymbol,
@@ -86,7 +87,9 @@ import {
     DocumentOnTypeFormattingParams,
     InlayHint,
     InlayHintParams,
+    SemanticTokensDeltaParams,
     SemanticTokensParams,
+    SemanticTokensRangeParams,
     TextEdit,
     WillSaveTextDocumentParams,
 } from 'vscode-languageserver-protocol';
@@ -135,8 +138,13 @@ import { Uri } from './common/uri/uri';
 import { hasWorkspaceEditChanges } from './common/workspaceEditUtils';
 import { AnalyzerServiceExecutor } from './languageService/analyzerServiceExecutor';
 import { CallHierarchyProvider } from './languageService/callHierarchyProvider';
-import { InlayHintsProvider } from './languageService/inlayHintsProvider';
-import { CompletionItemData, CompletionMap, CompletionProvider } from './languageService/completionProvider';
+import { InlayHintsCache, InlayHintsProvider } from './languageService/inlayHintsProvider';
+import {
+    CompletionCache,
+    CompletionItemData,
+    CompletionMap,
+    CompletionProvider,
+} from './languageService/completionProvider';
 import { DefinitionFilter, DefinitionProvider, TypeDefinitionProvider } from './languageService/definitionProvider';
 import { DocumentHighlightProvider } from './languageService/documentHighlightProvider';
 import { CollectionResult } from './languageService/documentSymbolCollector';
@@ -162,7 +170,11 @@ import {
 } from './workspaceFactory';
 import { PullDiagnosticsDynamicFeature } from './languageService/pullDiagnosticsDynamicFeature';
 import { website } from './constants';
-import { SemanticTokensProvider, SemanticTokensProviderLegend } from './languageService/semanticTokensProvider';
+import {
+    SemanticTokensCache,
+    SemanticTokensProvider,
+    SemanticTokensProviderLegend,
+} from './languageService/semanticTokensProvider';
 import { RenameUsageFinder } from './analyzer/renameUsageFinder';
 import { AutoImporter, buildModuleSymbolsMap } from './languageService/autoImporter';
 import { zip } from 'lodash';
@@ -175,6 +187,9 @@ import toSpliced from '@core-js/pure/es/array/to-spliced';
 
 const UncomputedDiagnosticsVersion = -1;
 
+// The maximum number of files reported in a single partial result of a workspace diagnostics request.
+const MaxWorkspaceDiagnosticsChunkSize = 100;
+
 export function wrapProgressReporter(reporter: WorkDoneProgressReporter): ProgressReporter {
     let isDisplayingProgress = false;
     return {
@@ -211,13 +226,18 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
     private _progressReporter: ProgressReporter;
     private _progressReportCounter = 0;
 
-    private _lastTriggerKind: CompletionTriggerKind | undefined = CompletionTriggerKind.Invoked;
-
     private _initialized = false;
     private _workspaceFoldersChangedDisposable: Disposable | undefined;
     private _workspaceDiagnosticsReporter: ResultProgressReporter<WorkspaceDiagnosticReportPartialResult> | undefined;
     private _workspaceDiagnosticsProgressReporter: ProgressReporter | undefined;
     private _workspaceDiagnosticsResolve: ((value: WorkspaceDiagnosticReport) => void) | undefined;
+    private _pendingWorkspaceDiagnostics: WorkspaceDocumentDiagnosticReport[] = [];
+
+    // The result id last sent to a workspace diagnostics request for each file, keyed like
+    // documentsWithDiagnostics. The prefix keeps the ids of different server instances apart.
+    private readonly _workspaceDiagnosticsResultIds = new Map<string, { uri: string; resultId: string }>();
+    private readonly _workspaceDiagnosticsResultIdPrefix = Date.now().toString(36);
+    private _workspaceDiagnosticsResultIdCounter = 0;
     protected isDisposed = false;
 
     protected client: ClientCapabilities = {
@@ -252,6 +272,9 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
     protected readonly workspaceFactory: IWorkspaceFactory;
     protected readonly openFileMap = new Map<string, TextDocument>();
     private readonly _openCells = new Map<string, readonly TextDocument[]>();
+    private readonly _semanticTokensCache = new SemanticTokensCache();
+    private readonly _inlayHintsCache = new InlayHintsCache();
+    private readonly _completionCache = new CompletionCache();
     protected readonly fs: FileSystem;
     protected readonly caseSensitiveDetector: CaseSensitivityDetector;
 
@@ -319,6 +342,10 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
         this.workspaceFactory.clear();
         this.openFileMap.clear();
         this._openCells.clear();
+        this._semanticTokensCache.clear();
+        this._inlayHintsCache.clear();
+        this._completionCache.clear();
+        this._workspaceDiagnosticsResultIds.clear();
         this.dynamicFeatures.unregister();
         this._workspaceFoldersChangedDisposable?.dispose();
     }
@@ -638,6 +665,8 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
 
         const semanticTokens = this.connection.languages.semanticTokens;
         semanticTokens.on(async (params, token) => this.onSemanticTokens(params, token));
+        semanticTokens.onRange(async (params, token) => this.onSemanticTokensRange(params, token));
+        semanticTokens.onDelta(async (params, token) => this.onSemanticTokensDelta(params, token));
 
         this.connection.onDidOpenTextDocument(async (params) => this.onDidOpenTextDocument(params));
         this.connection.onDidChangeTextDocument(async (params) => this.onDidChangeTextDocument(params));
@@ -785,7 +814,8 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
                 inlayHintProvider: true,
                 semanticTokensProvider: {
                     legend: SemanticTokensProviderLegend,
-                    full: true,
+                    full: { delta: true },
+                    range: true,
                 },
                 workspace: {
                     fileOperations: { willRename: { filters: [{ pattern: { glob: '**/*' } }] } },
@@ -1105,26 +1135,6 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
         }, token);
     }
 
-    protected setCompletionIncomplete(params: CompletionParams, completions: CompletionList | null) {
-        // We set completion incomplete for the first invocation and next consecutive call,
-        // but after that we mark it as completed so the client doesn't repeatedly call back.
-        // We mark the first one as incomplete because completion could be invoked without
-        // any meaningful character provided, such as an explicit completion invocation (ctrl+space)
-        // or a period. That might cause us to not include some items (e.g., auto-imports).
-        // The next consecutive call provides some characters to help us to pick
-        // better completion items. After that, we are not going to introduce new items,
-        // so we can let the client to do the filtering and caching.
-        const completionIncomplete =
-            this._lastTriggerKind !== CompletionTriggerKind.TriggerForIncompleteCompletions ||
-            params.context?.triggerKind !== CompletionTriggerKind.TriggerForIncompleteCompletions;
-
-        this._lastTriggerKind = params.context?.triggerKind;
-
-        if (completions) {
-            completions.isIncomplete = completionIncomplete;
-        }
-    }
-
     protected async onCompletion(params: CompletionParams, token: CancellationToken): Promise<CompletionList | null> {
         const uri = this.convertLspUriStringToUri(params.textDocument.uri);
         const workspace = await this.getWorkspaceForFile(uri);
@@ -1132,8 +1142,8 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
             return null;
         }
 
-        return await workspace.service.run(async (program) => {
-            const completions = await new CompletionProvider(
+        return workspace.service.run((program) => {
+            return new CompletionProvider(
                 program,
                 uri,
                 params.position,
@@ -1147,11 +1157,9 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
                     useTypingExtensions: workspace.useTypingExtensions,
                 },
                 token,
-                false
+                false,
+                this._completionCache
             ).getCompletions();
-
-            this.setCompletionIncomplete(params, completions);
-            return completions;
         }, token);
     }
 
@@ -1238,32 +1246,42 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
             return null;
         }
         return workspace.service.run((program) => {
-            const currentFile = program.getSourceFileInfo(uri);
-            const moduleSymbolMap = buildModuleSymbolsMap(
-                program,
-                program.getSourceFileInfoList().filter((s) => s !== currentFile),
-                token
-            );
+            const createAutoImporter = () => {
+                const parseFileResults = program.getParseResults(uri);
+                if (!parseFileResults) {
+                    return undefined;
+                }
 
-            const parseFileResults = program.getParseResults(uri);
-            const autoImporter = parseFileResults
-                ? new AutoImporter(
-                      program,
-                      program.configOptions.findExecEnvironment(uri),
-                      parseFileResults,
-                      params.range.start,
-                      new CompletionMap(),
-                      moduleSymbolMap,
-                      {}
-                  )
-                : undefined;
-            return new InlayHintsProvider(program, uri, autoImporter, params.range, {
-                callArgumentNames: workspace.inlayHints?.callArgumentNames ?? true,
-                callArgumentNamesMatching: workspace.inlayHints?.callArgumentNamesMatching ?? false,
-                functionReturnTypes: workspace.inlayHints?.functionReturnTypes ?? true,
-                variableTypes: workspace.inlayHints?.variableTypes ?? true,
-                genericTypes: workspace.inlayHints?.genericTypes ?? false,
-            }).onInlayHints();
+                const currentFile = program.getSourceFileInfo(uri);
+                const moduleSymbolMap = buildModuleSymbolsMap(
+                    program,
+                    program.getSourceFileInfoList().filter((s) => s !== currentFile),
+                    token
+                );
+                return new AutoImporter(
+                    program,
+                    program.configOptions.findExecEnvironment(uri),
+                    parseFileResults,
+                    params.range.start,
+                    new CompletionMap(),
+                    moduleSymbolMap,
+                    {}
+                );
+            };
+            return new InlayHintsProvider(
+                program,
+                uri,
+                createAutoImporter,
+                params.range,
+                {
+                    callArgumentNames: workspace.inlayHints?.callArgumentNames ?? true,
+                    callArgumentNamesMatching: workspace.inlayHints?.callArgumentNamesMatching ?? false,
+                    functionReturnTypes: workspace.inlayHints?.functionReturnTypes ?? true,
+                    variableTypes: workspace.inlayHints?.variableTypes ?? true,
+                    genericTypes: workspace.inlayHints?.genericTypes ?? false,
+                },
+                this._inlayHintsCache
+            ).onInlayHints();
         }, token);
     }
 
@@ -1274,7 +1292,31 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
             return null;
         }
         return workspace.service.run((program) => {
-            return new SemanticTokensProvider(program, uri, token).onSemanticTokens();
+            return new SemanticTokensProvider(program, uri, token, this._semanticTokensCache).onSemanticTokens();
+        }, token);
+    }
+
+    protected async onSemanticTokensRange(params: SemanticTokensRangeParams, token: CancellationToken) {
+        const uri = this.convertLspUriStringToUri(params.textDocument.uri);
+        const workspace = await this.getWorkspaceForFile(uri);
+        if (workspace.disableLanguageServices) {
+            return null;
+        }
+        return workspace.service.run((program) => {
+            return new SemanticTokensProvider(program, uri, token).onSemanticTokensRange(params.range);
+        }, token);
+    }
+
+    protected async onSemanticTokensDelta(params: SemanticTokensDeltaParams, token: CancellationToken) {
+        const uri = this.convertLspUriStringToUri(params.textDocument.uri);
+        const workspace = await this.getWorkspaceForFile(uri);
+        if (workspace.disableLanguageServices) {
+            return null;
+        }
+        return workspace.service.run((program) => {
+            return new SemanticTokensProvider(program, uri, token, this._semanticTokensCache).onSemanticTokensDelta(
+                params.previousResultId
+            );
         }, token);
     }
 
@@ -1534,6 +1576,9 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
         // Stop tracking the document as open before any async work so that a request handled
         // immediately after this close (e.g. a pull-diagnostics re-pull) observes the file as closed.
         this.openFileMap.delete(uri.key);
+        this._semanticTokensCache.delete(uri);
+        this._inlayHintsCache.delete(uri);
+        this._completionCache.delete(uri);
 
         // Send this close to all the workspaces that might contain this file.
         const workspaces = await this.getContainingWorkspacesForFile(uri);
@@ -1552,6 +1597,9 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
         await Promise.all(
             params.cellTextDocuments.map(async (textDocument) => {
                 const cellUri = this.convertLspUriStringToUri(textDocument.uri);
+                this._semanticTokensCache.delete(cellUri);
+                this._inlayHintsCache.delete(cellUri);
+                this._completionCache.delete(cellUri);
                 // Send this close to all the workspaces that might contain this file.
                 const workspaces = await this.getContainingWorkspacesForFile(cellUri);
                 workspaces.forEach((w) => w.service.setFileClosed(cellUri));
@@ -1622,13 +1670,13 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
                         : diagnosticsVersionAfter.toString();
                 result.items = lspDiagnostics;
                 if (sourceFile) {
-                    this.documentsWithDiagnostics[uri.toString()] = {
+                    this._setDocumentDiagnostics(uri.toString(), {
                         reason: 'analysis',
                         fileUri: uri,
                         cell: sourceFile.getCellIndex(),
                         diagnostics: serverDiagnostics,
                         version: diagnosticsVersion,
-                    };
+                    });
                 }
             } else {
                 (result as any).kind = 'unchanged';
@@ -1652,24 +1700,49 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
         // Resolve any pending workspace diagnostics. We only allow one at a time.
         this._workspaceDiagnosticsResolve?.({ items: [] });
         this._workspaceDiagnosticsResolve = undefined;
+        this._pendingWorkspaceDiagnostics = [];
 
-        // Save the progress reporters and force a refresh of analysis.
+        // Save the progress reporters.
         this._workspaceDiagnosticsProgressReporter = !isNullProgressReporter(workDoneProgress)
             ? wrapProgressReporter(workDoneProgress)
             : undefined;
         this._workspaceDiagnosticsReporter = resultReporter;
-        this.workspaceFactory.getNonDefaultWorkspaces().forEach((workspace) => {
-            workspace.service.invalidateAndScheduleReanalysis(InvalidatedReason.Reanalyzed);
-        });
 
-        return new Promise<WorkspaceDiagnosticReport>((resolve, reject) => {
+        const result = new Promise<WorkspaceDiagnosticReport>((resolve, reject) => {
             // We never resolve as this should be a continually occurring process. Scheduling analysis
             // should cause a new workspace diagnostic to be generated.
+            let cancellationDisposable: Disposable | undefined;
+            const resolveRequest = (report: WorkspaceDiagnosticReport) => {
+                cancellationDisposable?.dispose();
+                resolve(report);
+            };
 
             // Save the resolve callback to be used during shutdown so that tests don't crash
             // on the unresolved promise for the workspace diagnostics.
-            this._workspaceDiagnosticsResolve = resolve;
+            this._workspaceDiagnosticsResolve = resolveRequest;
+
+            // If the client cancels the request, stop reporting to it. Analysis carries on, and
+            // its results are reported when the client asks again.
+            cancellationDisposable = token.onCancellationRequested(() => {
+                if (this._workspaceDiagnosticsResolve === resolveRequest) {
+                    this._workspaceDiagnosticsResolve = undefined;
+                    this._pendingWorkspaceDiagnostics = [];
+                    resolveRequest({ items: [] });
+                }
+            });
+        });
+
+        if (resultReporter) {
+            await this._reportKnownWorkspaceDiagnostics(resultReporter, params.previousResultIds, token);
+        }
+
+        // Resume analysis rather than invalidating it so files that were already checked (for
+        // example, before an earlier request was cancelled) aren't checked again.
+        this.workspaceFactory.getNonDefaultWorkspaces().forEach((workspace) => {
+            workspace.service.resumeAnalysis();
         });
+
+        return result;
     }
 
     protected onDidChangeWatchedFiles(params: DidChangeWatchedFilesParams) {
@@ -1908,13 +1981,12 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
 
     protected async onAnalysisCompletedHandler(fs: FileSystem, results: AnalysisResults): Promise<void> {
         // Send the computed diagnostics to the client.
-        results.diagnostics.forEach((fileDiag) => {
-            if (!this.canNavigateToFile(fileDiag.fileUri, fs)) {
-                return;
-            }
-
-            this.sendDiagnostics(fs, { ...fileDiag, reason: results.reason });
-        });
+        await Promise.all(
+            results.diagnostics
+                .filter((fileDiag) => this.canNavigateToFile(fileDiag.fileUri, fs))
+                .map((fileDiag) => this.sendDiagnostics(fs, { ...fileDiag, reason: results.reason }))
+        );
+        this._flushWorkspaceDiagnostics();
 
         // if any baselined diagnostics disappeared, update the baseline for the effected files
         if (
@@ -1993,21 +2065,30 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
     protected onWorkspaceRemoved(workspace: Workspace) {
         const otherWorkspaces = this.workspaceFactory.items().filter((w) => w !== workspace);
 
+        const sent: Promise<void>[] = [];
         for (const fileWithDiagnostics of Object.values(this.documentsWithDiagnostics)) {
             if (workspace.service.isTracked(fileWithDiagnostics.fileUri)) {
                 // Do not clean up diagnostics for files tracked by multiple workspaces
                 if (otherWorkspaces.some((w) => w.service.isTracked(fileWithDiagnostics.fileUri))) {
                     continue;
                 }
-                this.sendDiagnostics(this.fs, {
-                    fileUri: fileWithDiagnostics.fileUri,
-                    cell: fileWithDiagnostics.cell,
-                    diagnostics: fileWithDiagnostics.diagnostics,
-                    version: undefined,
-                    reason: 'tracking',
-                });
+                sent.push(
+                    this.sendDiagnostics(this.fs, {
+                        fileUri: fileWithDiagnostics.fileUri,
+                        cell: fileWithDiagnostics.cell,
+                        diagnostics: fileWithDiagnostics.diagnostics,
+                        version: undefined,
+                        reason: 'tracking',
+                    })
+                );
             }
         }
+
+        Promise.all(sent)
+            .then(() => this._flushWorkspaceDiagnostics())
+            .catch((e: any) => {
+                this.console.error(`Failed to clear diagnostics for removed workspace: ${e?.message ?? e}`);
+            });
     }
 
     protected createAnalyzerServiceForWorkspace(
@@ -2081,27 +2162,102 @@ export abstract class LanguageServerBase implements LanguageServerInterface, Dis
         fileWithDiagnostics: FileDiagnostics & { reason: 'analysis' | 'tracking' }
     ) {
         const key = fileWithDiagnostics.fileUri.toString();
-        this.documentsWithDiagnostics[key] = fileWithDiagnostics;
+        this._setDocumentDiagnostics(key, fileWithDiagnostics);
         const convertedDiagnostics = await this.convertDiagnostics(fs, fileWithDiagnostics);
-        // If we're waiting for a pending workspace diagnostic, send a partial result.
+        // If we're waiting for a pending workspace diagnostic, queue a partial result. The queued results
+        // are sent in chunks once the analysis pass that produced them completes. If the request was
+        // cancelled, the diagnostics are reported when the client asks again.
         if (this._workspaceDiagnosticsReporter) {
-            // Skip storing previous result ids, just send new results every time.
-            this._workspaceDiagnosticsReporter.report({
-                items: [
-                    {
-                        ...convertedDiagnostics,
-                        kind: 'full',
-                        version: convertedDiagnostics.version || null,
-                        items: convertedDiagnostics.diagnostics,
-                    },
-                ],
-            });
+            if (this._workspaceDiagnosticsResolve && this.documentsWithDiagnostics[key] === fileWithDiagnostics) {
+                this._queueWorkspaceDiagnostics(this._createFullWorkspaceDiagnosticReport(key, convertedDiagnostics));
+            }
         } else {
             // Otherwise send a publish diagnostic notification.
             this.connection.sendDiagnostics(convertedDiagnostics);
         }
     }
 
+    // Reports the diagnostics that were already computed when a workspace diagnostics request
+    // arrives, so the client doesn't have to wait for the files to be checked again. Files whose
+    // diagnostics the client already has (per the result ids it sent) are reported as unchanged.
+    private async _reportKnownWorkspaceDiagnostics(
+        reporter: ResultProgressReporter<WorkspaceDiagnosticReportPartialResult>,
+        previousResultIds: PreviousResultId[],
+        token: CancellationToken
+    ) {
+        const previousResultIdMap = new Map(previousResultIds.map((previous) => [previous.uri, previous.value]));
+
+        for (const [key, fileWithDiagnostics] of Object.entries(this.documentsWithDiagnostics)) {
+            if (token.isCancellationRequested || this._workspaceDiagnosticsReporter !== reporter) {
+                return;
+            }
+
+            if (!this.canNavigateToFile(fileWithDiagnostics.fileUri, this.fs)) {
+                continue;
+            }
+
+            const reported = this._workspaceDiagnosticsResultIds.get(key);
+            if (reported && previousResultIdMap.get(reported.uri) === reported.resultId) {
+                this._queueWorkspaceDiagnostics({
+                    kind: 'unchanged',
+                    uri: reported.uri,
+                    resultId: reported.resultId,
+                    version: fileWithDiagnostics.version ?? null,
+                });
+                continue;
+            }
+
+            const convertedDiagnostics = await this.convertDiagnostics(this.fs, fileWithDiagnostics);
+
+            // Newer diagnostics for the file may have been sent while these were being converted.
+            if (this.documentsWithDiagnostics[key] === fileWithDiagnostics) {
+                this._queueWorkspaceDiagnostics(this._createFullWorkspaceDiagnosticReport(key, convertedDiagnostics));
+            }
+        }
+
+        this._flushWorkspaceDiagnostics();
+    }
+
+    private _setDocumentDiagnostics(key: string, fileWithDiagnostics: FileDiagnostics) {
+        this.documentsWithDiagnostics[key] = fileWithDiagnostics;
+
+        // The result id that the client has for the file no longer matches the diagnostics.
+        // A new one is assigned when they're sent to a workspace diagnostics request.
+        this._workspaceDiagnosticsResultIds.delete(key);
+    }
+
+    private _createFullWorkspaceDiagnosticReport(
+        key: string,
+        convertedDiagnostics: PublishDiagnosticsParams
+    ): WorkspaceDocumentDiagnosticReport {
+        const resultId = `${this._workspaceDiagnosticsResultIdPrefix}-${++this._workspaceDiagnosticsResultIdCounter}`;
+        this._workspaceDiagnosticsResultIds.set(key, { uri: convertedDiagnostics.uri, resultId });
+
+        return {
+            ...convertedDiagnostics,
+            kind: 'full',
+            resultId,
+            version: convertedDiagnostics.version || null,
+            items: convertedDiagnostics.diagnostics,
+        };
+    }
+
+    private _queueWorkspaceDiagnostics(report: WorkspaceDocumentDiagnosticReport) {
+        this._pendingWorkspaceDiagnostics.push(report);
+        if (this._pendingWorkspaceDiagnostics.length >= MaxWorkspaceDiagnosticsChunkSize) {
+            this._flushWorkspaceDiagnostics();
+        }
+    }
+
+    private _flushWorkspaceDiagnostics() {
+        if (this._pendingWorkspaceDiagnostics.length === 0 || !this._workspaceDiagnosticsReporter) {
+            return;
+        }
+
+        this._workspaceDiagnosticsReporter.report({ items: this._pendingWorkspaceDiagnostics });
+        this._pendingWorkspaceDiagnostics = [];
+    }
+
     protected addDynamicFeature(feature: DynamicFeature<unknown>) {
         this.dynamicFeatures.add(feature);
     }
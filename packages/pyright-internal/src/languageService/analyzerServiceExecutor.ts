@@ -146,6 +146,14 @@ export function getEffectiveCommandLineOptions(
         commandLineOptions.configSettings.baselineFile = serverSettings.baselineFile.getFilePath();
     }
 
+    if (serverSettings.traceFile) {
+        commandLineOptions.languageServerSettings.traceFile = serverSettings.traceFile.getFilePath();
+    }
+
+    if (serverSettings.memoryBudgetMB) {
+        commandLineOptions.languageServerSettings.memoryBudgetMB = serverSettings.memoryBudgetMB;
+    }
+
     if (serverSettings.configFilePath) {
         commandLineOptions.configFilePath = serverSettings.configFilePath.getFilePath();
     }
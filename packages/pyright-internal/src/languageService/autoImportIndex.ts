@@ -0,0 +1,272 @@
+/*
+ * autoImportIndex.ts
+ *
+ * A persistent index of the names of the symbols that each file of a program
+ * offers for auto-import. It lets the auto-importer skip the modules that have
+ * no symbol matching the name being completed without walking (or, for user
+ * files that aren't bound yet, binding) them. A file's names are recomputed
+ * only when the file changes, and the names of files that aren't open are
+ * saved to the analysis cache directory (if one is configured) so they can be
+ * reused after a restart.
+ */
+
+import { sha256Hex } from '../common/crypto';
+import { ProgramView, SourceFileInfo } from '../common/extensibility';
+import { PythonVersion } from '../common/pythonVersion';
+import '../common/serviceProviderExtensions';
+import { Uri } from '../common/uri/uri';
+import version from '../version.json';
+
+// Bump this whenever the format of the saved index changes.
+const _indexFormatVersion = 2;
+
+// The index is saved while completions are computed, so it's saved at most
+// this often. Changes made since the last save are lost if the process exits
+// before the next one, which only means they're indexed again.
+const _minSaveIntervalInMs = 30 * 1000;
+
+interface IndexedFile {
+    names: readonly string[];
+
+    // The source file info and contents version that the names are known to
+    // be up to date with. This is undefined for names loaded from disk until
+    // they have been validated.
+    fileInfo: SourceFileInfo | undefined;
+    contentsVersion: number | undefined;
+
+    // The modification time and size of the file when the names were
+    // computed, or undefined if they were computed from unsaved contents.
+    diskStamp: string | undefined;
+}
+
+interface SavedIndex {
+    formatVersion: number;
+    version: string;
+    configKey: string;
+    files: { [fileKey: string]: { diskStamp: string; names: readonly string[] } };
+}
+
+const _indexes = new WeakMap<ProgramView, AutoImportIndex>();
+
+export class AutoImportIndex {
+    private readonly _files = new Map<string, IndexedFile>();
+    private _configKey: string | undefined;
+    private _isSaveNeeded = false;
+    private _lastSaveTime: number | undefined;
+
+    private constructor(private readonly _program: ProgramView) {}
+
+    static get(program: ProgramView) {
+        let index = _indexes.get(program);
+        if (!index) {
+            index = new AutoImportIndex(program);
+            _indexes.set(program, index);
+        }
+
+        index._validateConfig();
+        return index;
+    }
+
+    // Returns the names of the symbols that the file offers for auto-import,
+    // or undefined if they aren't known for the current contents of the file.
+    getSymbolNames(fileInfo: SourceFileInfo): readonly string[] | undefined {
+        const indexedFile = this._files.get(fileInfo.uri.key);
+        if (!indexedFile) {
+            return undefined;
+        }
+
+        if (indexedFile.fileInfo) {
+            return _isSameVersion(indexedFile, fileInfo) ? indexedFile.names : undefined;
+        }
+
+        // The names were loaded from disk. They can be used if the file is
+        // unchanged since they were saved.
+        if (
+            fileInfo.contentsVersion === undefined ||
+            fileInfo.isOpenByClient ||
+            indexedFile.diskStamp !== this._getDiskStamp(fileInfo.uri)
+        ) {
+            return undefined;
+        }
+
+        indexedFile.fileInfo = fileInfo;
+        indexedFile.contentsVersion = fileInfo.contentsVersion;
+        return indexedFile.names;
+    }
+
+    setSymbolNames(fileInfo: SourceFileInfo, names: readonly string[]) {
+        const diskStamp = fileInfo.isOpenByClient ? undefined : this._getDiskStamp(fileInfo.uri);
+
+        const previous = this._files.get(fileInfo.uri.key);
+        this._files.set(fileInfo.uri.key, {
+            names,
+            fileInfo,
+            contentsVersion: fileInfo.contentsVersion,
+            diskStamp,
+        });
+        this._isSaveNeeded ||= diskStamp !== undefined || previous?.diskStamp !== undefined;
+    }
+
+    deleteSymbolNames(fileInfo: SourceFileInfo) {
+        const indexedFile = this._files.get(fileInfo.uri.key);
+        if (indexedFile) {
+            this._files.delete(fileInfo.uri.key);
+            this._isSaveNeeded ||= indexedFile.diskStamp !== undefined;
+        }
+    }
+
+    // Drops the names for files other than the specified ones (e.g. files
+    // that were deleted) and saves the index if it changed and it hasn't
+    // been saved recently.
+    update(fileKeys: ReadonlySet<string>) {
+        for (const [fileKey, indexedFile] of this._files) {
+            if (!fileKeys.has(fileKey)) {
+                this._files.delete(fileKey);
+                this._isSaveNeeded ||= indexedFile.diskStamp !== undefined;
+            }
+        }
+
+        this._save();
+    }
+
+    // The symbols that a file declares can depend on the execution
+    // environment (e.g. names defined under a "sys.version_info" check), so
+    // the index is discarded if it changes.
+    private _validateConfig() {
+        const configKey = _getConfigKey(this._program);
+        if (this._configKey === configKey) {
+            return;
+        }
+
+        const isFirstUse = this._configKey === undefined;
+        this._configKey = configKey;
+        this._isSaveNeeded ||= this._files.size > 0;
+        this._files.clear();
+
+        if (isFirstUse) {
+            this._load();
+        }
+    }
+
+    private _getDiskStamp(uri: Uri): string | undefined {
+        try {
+            const stats = this._program.fileSystem.statSync(uri);
+            return `${stats.mtimeMs}:${stats.size}`;
+        } catch {
+            return undefined;
+        }
+    }
+
+    private _getSavedIndexUri(): Uri | undefined {
+        const cacheDir = this._program.configOptions.analysisCacheDir;
+        if (!cacheDir) {
+            return undefined;
+        }
+
+        const rootHash = sha256Hex(this._program.rootPath.key);
+        return rootHash ? cacheDir.combinePaths(`autoImports-${rootHash}.json`) : undefined;
+    }
+
+    private _load() {
+        const indexUri = this._getSavedIndexUri();
+        if (!indexUri) {
+            return;
+        }
+
+        const fs = this._program.serviceProvider.fs();
+        let savedIndex: SavedIndex;
+        try {
+            if (!fs.existsSync(indexUri)) {
+                return;
+            }
+
+            savedIndex = JSON.parse(fs.readFileSync(indexUri, 'utf8'));
+        } catch {
+            // Treat an unreadable or corrupt index as empty. It'll be
+            // overwritten after the next completion.
+            return;
+        }
+
+        if (
+            savedIndex.formatVersion !== _indexFormatVersion ||
+            savedIndex.version !== version ||
+            savedIndex.configKey !== this._configKey
+        ) {
+            return;
+        }
+
+        for (const [fileKey, savedFile] of Object.entries(savedIndex.files)) {
+            this._files.set(fileKey, {
+                names: savedFile.names,
+                fileInfo: undefined,
+                contentsVersion: undefined,
+                diskStamp: savedFile.diskStamp,
+            });
+        }
+    }
+
+    private _save() {
+        if (
+            !this._isSaveNeeded ||
+            (this._lastSaveTime !== undefined && Date.now() - this._lastSaveTime < _minSaveIntervalInMs)
+        ) {
+            return;
+        }
+
+        const indexUri = this._getSavedIndexUri();
+        if (!indexUri) {
+            return;
+        }
+
+        this._isSaveNeeded = false;
+        this._lastSaveTime = Date.now();
+
+        const savedIndex: SavedIndex = {
+            formatVersion: _indexFormatVersion,
+            version,
+            configKey: this._configKey!,
+            files: {},
+        };
+        for (const [fileKey, indexedFile] of this._files) {
+            if (indexedFile.diskStamp !== undefined) {
+                savedIndex.files[fileKey] = { diskStamp: indexedFile.diskStamp, names: indexedFile.names };
+            }
+        }
+
+        const fs = this._program.serviceProvider.fs();
+        try {
+            if (!fs.existsSync(indexUri.getDirectory())) {
+                fs.mkdirSync(indexUri.getDirectory(), { recursive: true });
+            }
+
+            fs.writeFileSync(indexUri, JSON.stringify(savedIndex), 'utf8');
+        } catch (e: any) {
+            this._program.console.error(`Failed to write auto-import index: ${e?.message ?? e}`);
+        }
+    }
+}
+
+// Returns a key that identifies the settings that affect which symbols
+// the binder declares in a file.
+function _getConfigKey(program: ProgramView) {
+    const configOptions = program.configOptions;
+    const executionEnvironments = [...configOptions.executionEnvironments, configOptions.getDefaultExecEnvironment()];
+    return JSON.stringify({
+        executionEnvironments: executionEnvironments.map((env) => [
+            env.root?.key,
+            PythonVersion.toString(env.pythonVersion),
+            env.pythonPlatform,
+        ]),
+        defineConstant: [...configOptions.defineConstant],
+    });
+}
+
+// Determines whether the indexed names were computed for the current contents of
+// the file. That's never known if the program doesn't track the contents version.
+function _isSameVersion(indexedFile: IndexedFile, fileInfo: SourceFileInfo) {
+    return (
+        indexedFile.fileInfo === fileInfo &&
+        fileInfo.contentsVersion !== undefined &&
+        indexedFile.contentsVersion === fileInfo.contentsVersion
+    );
+}
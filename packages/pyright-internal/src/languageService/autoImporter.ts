@@ -8,6 +8,7 @@
 
 import { CancellationToken, CompletionItem, CompletionItemKind, SymbolKind } from 'vscode-languageserver';
 
+import { getDunderAllInfo } from '../analyzer/analyzerNodeInfo';
 import { DeclarationType } from '../analyzer/declaration';
 import { ImportResolver, ModuleNameAndType } from '../analyzer/importResolver';
 import { ImportType } from '../analyzer/importResult';
@@ -37,6 +38,7 @@ import { Position } from '../common/textRange';
 import { Uri } from '../common/uri/uri';
 import { ImportFromAsNode, ParseNodeType } from '../parser/parseNodes';
 import { ParseFileResults } from '../parser/parser';
+import { AutoImportIndex } from './autoImportIndex';
 import { CompletionItemData, CompletionMap } from './completionProvider';
 import { IndexAliasData } from './symbolIndexer';
 import { fromLSPAny } from '../common/lspUtils';
@@ -56,6 +58,11 @@ export interface AutoImportSymbol {
 
 export interface ModuleSymbolTable {
     readonly uri: Uri;
+
+    // The names of the symbols that getSymbols returns, if they're known
+    // without computing the symbols. Modules with no matching name are skipped.
+    readonly symbolNames?: readonly string[];
+
     getSymbols(): Generator<AutoImportSymbol>;
 }
 
@@ -147,6 +154,7 @@ export function buildModuleSymbolsMap(
     options: ModuleSymbolMapOptions = {}
 ): ModuleSymbolMap {
     const moduleSymbolMap = new Map<string, ModuleSymbolTable>();
+    const index = AutoImportIndex.get(program);
 
     files.forEach((file) => {
         // Binding unbound files (see getModuleSymbolTableForAutoImport) can be expensive
@@ -160,11 +168,6 @@ export function buildModuleSymbolsMap(
         }
 
         const uri = file.uri;
-        const symbolTable = getModuleSymbolTableForAutoImport(program, file, options);
-        if (!symbolTable) {
-            return;
-        }
-
         const fileName = stripFileExtension(uri.fileName);
 
         // Don't offer imports from files that are named with private
@@ -173,60 +176,105 @@ export function buildModuleSymbolsMap(
             return;
         }
 
-        moduleSymbolMap.set(uri.key, {
-            uri,
-            *getSymbols() {
-                for (const [name, symbol] of symbolTable) {
-                    if (!isVisibleExternally(symbol)) {
-                        continue;
-                    }
-
-                    const declarations = symbol.getDeclarations();
-                    if (!declarations || declarations.length === 0) {
-                        continue;
+        // If the names of the file's symbols are indexed, defer getting its symbol
+        // table (which may require binding the file) until the auto-importer finds
+        // that one of the names matches.
+        const symbolNames = index.getSymbolNames(file);
+        if (symbolNames && (program.getModuleSymbolTable(uri) || (options.bindUnboundUserCode && isUserCode(file)))) {
+            moduleSymbolMap.set(uri.key, {
+                uri,
+                symbolNames,
+                *getSymbols() {
+                    const symbolTable = getModuleSymbolTableForAutoImport(program, file, options);
+                    if (symbolTable) {
+                        yield* getAutoImportSymbols(file, symbolTable);
                     }
+                },
+            });
+            return;
+        }
 
-                    const declaration = declarations[0];
-                    if (!declaration) {
-                        continue;
-                    }
+        const symbolTable = getModuleSymbolTableForAutoImport(program, file, options);
+        if (!symbolTable) {
+            return;
+        }
 
-                    if (
-                        // We don't include import aliases in auto import for workspace files...
-                        declaration.type === DeclarationType.Alias &&
-                        isUserCode(file) &&
-                        // ... unless they're in '__all__'...
-                        !symbol.isInDunderAll() &&
-                        // ... or unless they're an 'explicit re-export' (alias with the same name, see #772)
-                        !(
-                            declaration.node.nodeType === ParseNodeType.ImportFromAs &&
-                            declaration.node.d.alias?.d.value === name
-                        )
-                    ) {
-                        continue;
-                    }
+        const autoImportSymbols = [...getAutoImportSymbols(file, symbolTable)];
+        if (hasSelfContainedSymbols(program, file)) {
+            index.setSymbolNames(file, autoImportSymbols.map((autoSymbol) => autoSymbol.name));
+        } else {
+            index.deleteSymbolNames(file);
+        }
 
-                    const variableKind =
-                        declaration.type === DeclarationType.Variable && !declaration.isConstant && !declaration.isFinal
-                            ? SymbolKind.Variable
-                            : undefined;
-
-                    yield {
-                        name,
-                        symbol,
-                        kind: variableKind,
-                        library: !isUserCode(file),
-                        inDunderAll: symbol.isInDunderAll(),
-                    };
-                }
+        moduleSymbolMap.set(uri.key, {
+            uri,
+            *getSymbols() {
+                yield* autoImportSymbols;
             },
         });
-        return;
     });
 
+    index.update(new Set(program.getSourceFileInfoList().map((file) => file.uri.key)));
     return moduleSymbolMap;
 }
 
+// Determines whether the symbols that a (bound) file exports depend only on
+// its own contents. A wildcard import or an "__all__" can bring in names from
+// other modules, which can change without the file changing, so their names
+// aren't indexed. This matches the files that are rebound when a dependency
+// changes (see SourceFile.markReanalysisRequired).
+function hasSelfContainedSymbols(program: ProgramView, file: SourceFileInfo) {
+    const parserOutput = program.getParserOutput(file.uri);
+    return (
+        !!parserOutput &&
+        !parserOutput.containsWildcardImport &&
+        getDunderAllInfo(parserOutput.parseTree) === undefined
+    );
+}
+
+function* getAutoImportSymbols(file: SourceFileInfo, symbolTable: SymbolTable): Generator<AutoImportSymbol> {
+    for (const [name, symbol] of symbolTable) {
+        if (!isVisibleExternally(symbol)) {
+            continue;
+        }
+
+        const declarations = symbol.getDeclarations();
+        if (!declarations || declarations.length === 0) {
+            continue;
+        }
+
+        const declaration = declarations[0];
+        if (!declaration) {
+            continue;
+        }
+
+        if (
+            // We don't include import aliases in auto import for workspace files...
+            declaration.type === DeclarationType.Alias &&
+            isUserCode(file) &&
+            // ... unless they're in '__all__'...
+            !symbol.isInDunderAll() &&
+            // ... or unless they're an 'explicit re-export' (alias with the same name, see #772)
+            !(declaration.node.nodeType === ParseNodeType.ImportFromAs && declaration.node.d.alias?.d.value === name)
+        ) {
+            continue;
+        }
+
+        const variableKind =
+            declaration.type === DeclarationType.Variable && !declaration.isConstant && !declaration.isFinal
+                ? SymbolKind.Variable
+                : undefined;
+
+        yield {
+            name,
+            symbol,
+            kind: variableKind,
+            library: !isUserCode(file),
+            inDunderAll: symbol.isInDunderAll(),
+        };
+    }
+}
+
 export class AutoImporter {
     private readonly _importStatements: ImportStatements;
 
@@ -484,7 +532,10 @@ export class AutoImporter {
         }
 
         const dotCount = StringUtils.getCharacterCount(importSource, '.');
-        for (const autoSymbol of topLevelSymbols.getSymbols()) {
+        const hasSimilarSymbol =
+            !topLevelSymbols.symbolNames ||
+            topLevelSymbols.symbolNames.some((name) => this._isSimilar(word, name, similarityLimit));
+        for (const autoSymbol of hasSimilarSymbol ? topLevelSymbols.getSymbols() : []) {
             if (!this.shouldIncludeVariable(autoSymbol, fileProperties.isStub)) {
                 continue;
             }
@@ -376,6 +376,121 @@ const similarityLimit = 0.25;
 // We'll remember this many completions in the MRU list.
 const maxRecentCompletions = 128;
 
+// The identifier that is being completed and the text of the file around it.
+interface CompletionWord {
+    // The part of the identifier before the position.
+    text: string;
+
+    textBeforeWord: string;
+    textAfterPosition: string;
+
+    // Whether the word is the start of an identifier token. Only completions for
+    // such words are reused when the identifier is extended.
+    isIdentifier: boolean;
+}
+
+interface CompletionCacheEntry {
+    word: string;
+    textBeforeWord: string;
+    textAfterPosition: string;
+    position: Position;
+    options: string;
+
+    // The program the completions were computed for. It's kept in a weak set so
+    // the entry doesn't keep it alive after it's replaced.
+    program: WeakSet<ProgramView>;
+    otherFilesStamp: string;
+
+    items: CompletionItem[];
+}
+
+// The completions most recently computed for an identifier in each open file.
+// While the user keeps typing the identifier, they're filtered by the longer word
+// instead of being computed again. A name can only match the longer word if it
+// matches the shorter one (as long as the matcher allows the same number of
+// skips), and the completions don't otherwise depend on the word. They're reused
+// only if the rest of the file and the other files of the program are unchanged.
+export class CompletionCache {
+    private readonly _entries = new Map<string, CompletionCacheEntry>();
+
+    get(
+        fileUri: Uri,
+        program: ProgramView,
+        word: CompletionWord,
+        options: CompletionOptions
+    ): CompletionCacheEntry | undefined {
+        const entry = this._entries.get(fileUri.key);
+        if (
+            !entry ||
+            !word.isIdentifier ||
+            !entry.program.has(program) ||
+            entry.options !== JSON.stringify(options) ||
+            entry.textBeforeWord !== word.textBeforeWord ||
+            entry.textAfterPosition !== word.textAfterPosition ||
+            !word.text.startsWith(entry.word) ||
+            StringUtils.getPatternSkipLimit(word.text) !== StringUtils.getPatternSkipLimit(entry.word) ||
+            entry.otherFilesStamp !== _getOtherFilesStamp(program, fileUri)
+        ) {
+            return undefined;
+        }
+
+        return entry;
+    }
+
+    set(
+        fileUri: Uri,
+        program: ProgramView,
+        word: CompletionWord,
+        position: Position,
+        options: CompletionOptions,
+        items: CompletionItem[]
+    ) {
+        const otherFilesStamp = _getOtherFilesStamp(program, fileUri);
+        if (otherFilesStamp === undefined) {
+            this._entries.delete(fileUri.key);
+            return;
+        }
+
+        this._entries.set(fileUri.key, {
+            word: word.text,
+            textBeforeWord: word.textBeforeWord,
+            textAfterPosition: word.textAfterPosition,
+            position,
+            options: JSON.stringify(options),
+            program: new WeakSet([program]),
+            otherFilesStamp,
+            items,
+        });
+    }
+
+    delete(fileUri: Uri) {
+        this._entries.delete(fileUri.key);
+    }
+
+    clear() {
+        this._entries.clear();
+    }
+}
+
+// Returns a value that changes whenever a file other than the specified one
+// is added to, removed from or changed in the program, or undefined if the
+// program doesn't track the versions of the contents of its files.
+function _getOtherFilesStamp(program: ProgramView, fileUri: Uri): string | undefined {
+    const fileInfos = program.getSourceFileInfoList();
+    let contentsVersions = 0;
+    for (const fileInfo of fileInfos) {
+        if (fileInfo.uri.key !== fileUri.key) {
+            if (fileInfo.contentsVersion === undefined) {
+                return undefined;
+            }
+
+            contentsVersions += fileInfo.contentsVersion;
+        }
+    }
+
+    return `${fileInfos.length}:${contentsVersions}`;
+}
+
 export class CompletionProvider {
     private static _mostRecentCompletions: RecentCompletionInfo[] = [];
 
@@ -397,7 +512,8 @@ export class CompletionProvider {
         protected readonly position: Position,
         protected readonly options: CompletionOptions,
         protected readonly cancellationToken: CancellationToken,
-        private readonly _codeActions: boolean
+        private readonly _codeActions: boolean,
+        private readonly _cache?: CompletionCache
     ) {
         this.execEnv = this.configOptions.findExecEnvironment(this.fileUri);
 
@@ -414,9 +530,31 @@ export class CompletionProvider {
             return null;
         }
 
-        this.program.loadStdlibModules(this.fileUri);
-        const completionMap = this._getCompletions();
-        const completionList = CompletionList.create(completionMap?.toArray());
+        const word = this._getCompletionWord();
+        const cacheEntry =
+            word && !this.itemToResolve ? this._cache?.get(this.fileUri, this.program, word, this.options) : undefined;
+
+        let items: CompletionItem[] | undefined;
+        if (word && cacheEntry) {
+            items = this._getCachedCompletions(cacheEntry, word.text);
+        } else {
+            this.program.loadStdlibModules(this.fileUri);
+            items = this._getCompletions()?.toArray();
+
+            if (word?.isIdentifier && items && !this.itemToResolve && !this.options.triggerCharacter) {
+                this._cache?.set(this.fileUri, this.program, word, this.position, this.options, items);
+            }
+        }
+
+        const completionList = CompletionList.create(items);
+
+        // The list is always incomplete so the client asks again as the user types.
+        // Auto-import candidates are only offered once there's a word to filter them
+        // by, and the matcher allows more skips as the word gets longer, so a longer
+        // word can match names the client filtered out. Asking again is cheap while
+        // the cached completions can be reused.
+        completionList.isIncomplete = true;
+
         if (this.options.completionItemDataDefault) {
             hoistCompletionItemDataDefault(completionList, this.fileUri, this.position);
         }
@@ -1440,6 +1578,74 @@ export class CompletionProvider {
         return boundType?.type ?? originalType;
     }
 
+    private _getCompletionWord(): CompletionWord | undefined {
+        const offset = convertPositionToOffset(this.position, this.parseResults.tokenizerOutput.lines);
+        if (offset === undefined) {
+            return undefined;
+        }
+
+        const lineTextRange = this.parseResults.tokenizerOutput.lines.getItemAt(this.position.line);
+        const textOnLine = this._fileContents.substr(lineTextRange.start, lineTextRange.length);
+        const priorText = textOnLine.substr(0, this.position.character);
+        const priorWordIndex = priorText.search(/[\p{L}\p{N}\p{Pc}\p{Mn}\p{Mc}]+$/u);
+        const priorWord = priorWordIndex >= 0 ? priorText.substr(priorWordIndex) : '';
+
+        const wordStart = offset - priorWord.length;
+        const tokens = this.parseResults.tokenizerOutput.tokens;
+        const tokenIndex = tokens.getItemContaining(wordStart);
+        const token = tokenIndex >= 0 ? tokens.getItemAt(tokenIndex) : undefined;
+
+        return {
+            text: priorWord,
+            textBeforeWord: this._fileContents.slice(0, wordStart),
+            textAfterPosition: this._fileContents.slice(offset),
+            isIdentifier:
+                priorWord.length > 0 &&
+                token?.type === TokenType.Identifier &&
+                token.start === wordStart &&
+                TextRange.getEnd(token) >= offset,
+        };
+    }
+
+    // Adjusts the completions that were computed for a prefix of the word to the
+    // current position and drops the ones that don't match the word.
+    private _getCachedCompletions(cacheEntry: CompletionCacheEntry, word: string): CompletionItem[] {
+        const previousPosition = cacheEntry.position;
+        const shiftPosition = (position: Position): Position =>
+            position.line === previousPosition.line && position.character >= previousPosition.character
+                ? { line: position.line, character: position.character + word.length - cacheEntry.word.length }
+                : position;
+        const shiftEdit = (edit: TextEdit): TextEdit =>
+            TextEdit.replace(
+                { start: shiftPosition(edit.range.start), end: shiftPosition(edit.range.end) },
+                edit.newText
+            );
+
+        const items: CompletionItem[] = [];
+        for (const cachedItem of cacheEntry.items) {
+            if (!StringUtils.isPatternInSymbol(word, cachedItem.filterText ?? cachedItem.label)) {
+                continue;
+            }
+
+            const item = { ...cachedItem };
+            if (item.textEdit && TextEdit.is(item.textEdit)) {
+                item.textEdit = shiftEdit(item.textEdit);
+            }
+
+            if (item.additionalTextEdits) {
+                item.additionalTextEdits = item.additionalTextEdits.map(shiftEdit);
+            }
+
+            if (item.data && !this.options.completionItemDataDefault) {
+                item.data = toLSPAny({ ...this.getCompletionItemData(item), position: this.position });
+            }
+
+            items.push(item);
+        }
+
+        return items;
+    }
+
     private _getCompletions(): CompletionMap | undefined {
         const offset = convertPositionToOffset(this.position, this.parseResults.tokenizerOutput.lines);
         if (offset === undefined) {
@@ -2,25 +2,99 @@ import { InlayHint, InlayHintKind } from 'vscode-languageserver-protocol';
 import { ProgramView } from '../common/extensibility';
 import { convertOffsetToPosition } from '../common/positionUtils';
 
-import { TypeInlayHintsWalker } from '../analyzer/typeInlayHintsWalker';
+import { TypeInlayHintsCache, TypeInlayHintsItemType, TypeInlayHintsWalker } from '../analyzer/typeInlayHintsWalker';
 import { Range, TextEdit } from 'vscode-languageserver-types';
 import { InlayHintSettings } from '../workspaceFactory';
 import { AutoImporter } from './autoImporter';
 import { ImportGroup } from '../analyzer/importStatementUtils';
+import { TypeEvaluator } from '../analyzer/typeEvaluatorTypes';
 import { Uri } from '../common/uri/uri';
 import { convertToTextEdits } from '../common/workspaceEditUtils';
+import { ParseFileResults } from '../parser/parser';
+import { ModuleNode } from '../parser/parseNodes';
+
+interface InlayHintsCacheEntry {
+    // The parse tree, evaluator and settings the hints were computed with. They're
+    // kept in weak sets so the entry doesn't keep them alive after they're replaced.
+    parseTree: WeakSet<ModuleNode>;
+    evaluator: WeakSet<TypeEvaluator>;
+    settings: string;
+
+    items: TypeInlayHintsCache;
+    hints: WeakMap<TypeInlayHintsItemType, InlayHint>;
+}
+
+// The inlay hints computed for each open file. Requests for other ranges of a file
+// reuse them until the file changes or the evaluator is replaced (which happens when
+// any file changes), so scrolling back to a range doesn't evaluate its nodes again.
+export class InlayHintsCache {
+    private readonly _entries = new Map<string, InlayHintsCacheEntry>();
+
+    getEntry(
+        fileUri: Uri,
+        parseTree: ModuleNode,
+        evaluator: TypeEvaluator,
+        inlayHintSettings: InlayHintSettings
+    ): InlayHintsCacheEntry {
+        const settings = JSON.stringify(inlayHintSettings);
+        let entry = this._entries.get(fileUri.key);
+        if (
+            !entry ||
+            !entry.parseTree.has(parseTree) ||
+            !entry.evaluator.has(evaluator) ||
+            entry.settings !== settings
+        ) {
+            entry = {
+                parseTree: new WeakSet([parseTree]),
+                evaluator: new WeakSet([evaluator]),
+                settings,
+                items: new WeakMap(),
+                hints: new WeakMap(),
+            };
+            this._entries.set(fileUri.key, entry);
+        }
+
+        return entry;
+    }
+
+    delete(fileUri: Uri) {
+        this._entries.delete(fileUri.key);
+    }
+
+    clear() {
+        this._entries.clear();
+    }
+}
 
 export class InlayHintsProvider {
     private readonly _walker: TypeInlayHintsWalker;
+    private readonly _cacheEntry: InlayHintsCacheEntry | undefined;
+    private _autoImporter: AutoImporter | undefined;
+    private _isAutoImporterCreated = false;
 
+    // The auto importer is only created if a hint needs an import that
+    // isn't cached, because creating it requires the symbols of all modules.
     constructor(
         private _program: ProgramView,
         private _fileUri: Uri,
-        private _autoImporter: AutoImporter | undefined,
+        private _createAutoImporter: () => AutoImporter | undefined,
         range: Range,
-        inlayHintSettings: InlayHintSettings
+        inlayHintSettings: InlayHintSettings,
+        cache?: InlayHintsCache
     ) {
-        this._walker = new TypeInlayHintsWalker(this._program, inlayHintSettings, _fileUri, range);
+        const parseTree = this._program.getParseResults(_fileUri)?.parserOutput.parseTree;
+        const evaluator = this._program.evaluator;
+        this._cacheEntry =
+            cache && parseTree && evaluator
+                ? cache.getEntry(_fileUri, parseTree, evaluator, inlayHintSettings)
+                : undefined;
+        this._walker = new TypeInlayHintsWalker(
+            this._program,
+            inlayHintSettings,
+            _fileUri,
+            range,
+            this._cacheEntry?.items
+        );
     }
 
     async onInlayHints(): Promise<InlayHint[] | null> {
@@ -31,30 +105,46 @@ export class InlayHintsProvider {
         this._walker.walk(parseResults.parserOutput.parseTree);
 
         return this._walker.featureItems.map((item) => {
-            const position = convertOffsetToPosition(item.position, parseResults.tokenizerOutput.lines);
-            const paddingLeft = item.inlayHintType === 'functionReturn';
-            const textEdits: TextEdit[] = [
-                { newText: `${paddingLeft ? ' ' : ''}${item.value}`, range: { start: position, end: position } },
-            ];
-            if (item.imports) {
-                for (const module of item.imports.imports) {
-                    textEdits.push(...this._createTextEditsForImport(module, new Set()));
-                }
-                for (const [module, names] of item.imports.importFroms) {
-                    textEdits.push(...this._createTextEditsForImport(module, names));
-                }
+            const cachedHint = this._cacheEntry?.hints.get(item);
+            if (cachedHint) {
+                return cachedHint;
             }
-            return {
-                label: item.value,
-                position,
-                paddingLeft,
-                kind: item.inlayHintType === 'parameter' ? InlayHintKind.Parameter : InlayHintKind.Type,
-                textEdits,
-            };
+
+            const hint = this._createInlayHint(item, parseResults);
+            this._cacheEntry?.hints.set(item, hint);
+            return hint;
         });
     }
 
+    private _createInlayHint(item: TypeInlayHintsItemType, parseResults: ParseFileResults): InlayHint {
+        const position = convertOffsetToPosition(item.position, parseResults.tokenizerOutput.lines);
+        const paddingLeft = item.inlayHintType === 'functionReturn';
+        const textEdits: TextEdit[] = [
+            { newText: `${paddingLeft ? ' ' : ''}${item.value}`, range: { start: position, end: position } },
+        ];
+        if (item.imports) {
+            for (const module of item.imports.imports) {
+                textEdits.push(...this._createTextEditsForImport(module, new Set()));
+            }
+            for (const [module, names] of item.imports.importFroms) {
+                textEdits.push(...this._createTextEditsForImport(module, names));
+            }
+        }
+        return {
+            label: item.value,
+            position,
+            paddingLeft,
+            kind: item.inlayHintType === 'parameter' ? InlayHintKind.Parameter : InlayHintKind.Type,
+            textEdits,
+        };
+    }
+
     private _createTextEditsForImport = (module: string, names: ReadonlySet<string>) => {
+        if (!this._isAutoImporterCreated) {
+            this._autoImporter = this._createAutoImporter();
+            this._isAutoImporterCreated = true;
+        }
+
         const result = this._autoImporter?.getTextEditsForMultipleAutoImport(
             Array.from(names).map((name) => ({ name })),
             { name: module },
@@ -492,12 +492,11 @@ export class ReferencesProvider {
                 lastWalkedSeedVersion?.set(fileKey, seedVersion);
 
                 // See if the reference symbol's string is located somewhere within the file.
-                // If not, we can skip additional processing for the file.
-                const fileContents = curSourceFileInfo.contents;
+                // If not, we can skip additional processing for the file. Use the file's index
+                // of names if it's up to date so the file's contents don't need to be loaded.
                 if (
                     !checkConstructorUsagesForClass &&
-                    fileContents &&
-                    !referencesResult.symbolNames.some((s) => fileContents.indexOf(s) >= 0)
+                    !this._mayContainSymbolNames(curSourceFileInfo, referencesResult.symbolNames)
                 ) {
                     // No possible match at this seed version; re-examine only after the seed (and thus the
                     // symbol-name set) grows past the watermark recorded above.
@@ -554,6 +553,16 @@ export class ReferencesProvider {
         }
     }
 
+    private _mayContainSymbolNames(sourceFileInfo: SourceFileInfo, symbolNames: readonly string[]) {
+        const containsIdentifier = sourceFileInfo.containsIdentifier?.(symbolNames);
+        if (containsIdentifier !== undefined) {
+            return containsIdentifier;
+        }
+
+        const fileContents = sourceFileInfo.contents;
+        return !fileContents || symbolNames.some((s) => fileContents.indexOf(s) >= 0);
+    }
+
     static getDeclarationForNode(
         program: ProgramView,
         fileUri: Uri,
@@ -1,16 +1,22 @@
 import {
     CancellationToken,
+    Range,
     SemanticTokenModifiers,
     SemanticTokenTypes,
     SemanticTokens,
     SemanticTokensBuilder,
+    SemanticTokensDelta,
+    SemanticTokensEdit,
 } from 'vscode-languageserver';
 import { throwIfCancellationRequested } from '../common/cancellationUtils';
 import { ProgramView } from '../common/extensibility';
-import { convertOffsetsToRange } from '../common/positionUtils';
+import { convertOffsetsToRange, convertRangeToTextRange } from '../common/positionUtils';
+import { TextRange } from '../common/textRange';
 import { Uri } from '../common/uri/uri';
+import { ModuleNode } from '../parser/parseNodes';
 import { ParseFileResults } from '../parser/parser';
 import { SemanticTokensWalker } from '../analyzer/semanticTokensWalker';
+import { TypeEvaluator } from '../analyzer/typeEvaluatorTypes';
 
 export enum CustomSemanticTokenTypes {
     selfParameter = 'selfParameter',
@@ -86,20 +92,142 @@ function encodeTokenModifiers(modifiers: string[]): number {
     return data;
 }
 
+// Computes the edits that turn the previous token data into the current one.
+// Tokens are encoded relative to the previous token, so the data that follows
+// an edit is usually unchanged, and a single edit covers the changed part.
+function computeEdits(previous: number[], current: number[]): SemanticTokensEdit[] {
+    let start = 0;
+    while (start < previous.length && start < current.length && previous[start] === current[start]) {
+        start++;
+    }
+
+    if (start === previous.length && start === current.length) {
+        return [];
+    }
+
+    let endOffset = 0;
+    while (
+        endOffset < previous.length - start &&
+        endOffset < current.length - start &&
+        previous[previous.length - 1 - endOffset] === current[current.length - 1 - endOffset]
+    ) {
+        endOffset++;
+    }
+
+    return [
+        {
+            start,
+            deleteCount: previous.length - start - endOffset,
+            data: current.slice(start, current.length - endOffset),
+        },
+    ];
+}
+
+interface SemanticTokensCacheEntry {
+    resultId: string;
+    data: number[];
+
+    // The parse tree and the evaluator the data was computed with. The data is
+    // still valid if neither has changed. They're kept in weak sets so the entry
+    // doesn't keep them alive after they're replaced.
+    parseTree: WeakSet<ModuleNode>;
+    evaluator: WeakSet<TypeEvaluator>;
+}
+
+// The most recent full semantic tokens of each open file. They're used to compute
+// the edits for delta requests, and are returned again if the file hasn't changed.
+export class SemanticTokensCache {
+    private readonly _entries = new Map<string, SemanticTokensCacheEntry>();
+    private _nextResultId = 1;
+
+    get(fileUri: Uri): SemanticTokensCacheEntry | undefined {
+        return this._entries.get(fileUri.key);
+    }
+
+    set(fileUri: Uri, data: number[], parseTree: ModuleNode, evaluator: TypeEvaluator): SemanticTokensCacheEntry {
+        const entry: SemanticTokensCacheEntry = {
+            resultId: `${this._nextResultId++}`,
+            data,
+            parseTree: new WeakSet([parseTree]),
+            evaluator: new WeakSet([evaluator]),
+        };
+
+        this._entries.set(fileUri.key, entry);
+        return entry;
+    }
+
+    delete(fileUri: Uri) {
+        this._entries.delete(fileUri.key);
+    }
+
+    clear() {
+        this._entries.clear();
+    }
+}
+
 export class SemanticTokensProvider {
     private readonly _parseResults: ParseFileResults | undefined;
 
-    constructor(private _program: ProgramView, private _fileUri: Uri, private _token: CancellationToken) {
+    constructor(
+        private _program: ProgramView,
+        private _fileUri: Uri,
+        private _token: CancellationToken,
+        private _cache?: SemanticTokensCache
+    ) {
         this._parseResults = this._program.getParseResults(this._fileUri);
     }
 
     onSemanticTokens(): SemanticTokens {
+        const entry = this._getCacheEntry();
+        if (!entry) {
+            return this._getSemanticTokens();
+        }
+
+        return { resultId: entry.resultId, data: entry.data };
+    }
+
+    onSemanticTokensRange(range: Range): SemanticTokens {
+        if (!this._parseResults) {
+            return new SemanticTokensBuilder().build();
+        }
+
+        return this._getSemanticTokens(convertRangeToTextRange(range, this._parseResults.tokenizerOutput.lines));
+    }
+
+    onSemanticTokensDelta(previousResultId: string): SemanticTokens | SemanticTokensDelta {
+        const previous = this._cache?.get(this._fileUri);
+        const entry = this._getCacheEntry();
+        if (!entry || !previous || previous.resultId !== previousResultId) {
+            return entry ? { resultId: entry.resultId, data: entry.data } : this._getSemanticTokens();
+        }
+
+        return { resultId: entry.resultId, edits: computeEdits(previous.data, entry.data) };
+    }
+
+    // Returns the cached tokens of the file, computing them first if they're
+    // missing or out of date. Returns undefined if there's no cache.
+    private _getCacheEntry(): SemanticTokensCacheEntry | undefined {
+        if (!this._cache || !this._parseResults) {
+            return undefined;
+        }
+
+        const parseTree = this._parseResults.parserOutput.parseTree;
+        const evaluator = this._program.evaluator!;
+        const entry = this._cache.get(this._fileUri);
+        if (entry && entry.parseTree.has(parseTree) && entry.evaluator.has(evaluator)) {
+            return entry;
+        }
+
+        return this._cache.set(this._fileUri, this._getSemanticTokens().data, parseTree, evaluator);
+    }
+
+    private _getSemanticTokens(range?: TextRange): SemanticTokens {
         const builder = new SemanticTokensBuilder();
         if (!this._parseResults) {
             return builder.build();
         }
 
-        const walker = new SemanticTokensWalker(this._program.evaluator!);
+        const walker = new SemanticTokensWalker(this._program.evaluator!, range);
         walker.walk(this._parseResults.parserOutput.parseTree);
 
         throwIfCancellationRequested(this._token);
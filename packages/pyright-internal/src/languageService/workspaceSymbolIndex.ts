@@ -0,0 +1,317 @@
+/*
+ * workspaceSymbolIndex.ts
+ *
+ * A persistent index of the symbols declared in the user files of a program,
+ * used to answer workspace symbol queries. A file's symbols are recomputed
+ * only when the file changes, and the symbols of files that aren't open are
+ * saved to the analysis cache directory (if one is configured) so they can be
+ * reused after a restart. Each name is stored with a mask of the characters it
+ * contains so most names that can't match a query are rejected without
+ * running the fuzzy matcher.
+ */
+
+import { CancellationToken, SymbolKind } from 'vscode-languageserver';
+
+import { getFileInfo } from '../analyzer/analyzerNodeInfo';
+import { sha256Hex } from '../common/crypto';
+import { ProgramView, SourceFileInfo } from '../common/extensibility';
+import '../common/serviceProviderExtensions';
+import { isPatternInSymbol } from '../common/stringUtils';
+import { Range } from '../common/textRange';
+import { Uri } from '../common/uri/uri';
+import version from '../version.json';
+import { IndexSymbolData, SymbolIndexer } from './symbolIndexer';
+
+// Bump this whenever the format of the saved index changes.
+const _indexFormatVersion = 1;
+
+export interface WorkspaceSymbolIndexEntry {
+    name: string;
+    kind: SymbolKind;
+    selectionRange: Range;
+    containerName: string | undefined;
+}
+
+interface IndexedFile {
+    entries: WorkspaceSymbolIndexEntry[];
+    masks: Int32Array;
+
+    // The source file info and contents version that the entries are known to
+    // be up to date with. This is undefined for entries loaded from disk until
+    // they have been validated.
+    fileInfo: SourceFileInfo | undefined;
+    contentsVersion: number | undefined;
+
+    // The modification time and size of the file when the entries were
+    // computed, or undefined if they were computed from unsaved contents.
+    diskStamp: string | undefined;
+}
+
+interface SavedIndex {
+    formatVersion: number;
+    version: string;
+    files: { [fileKey: string]: { diskStamp: string; entries: WorkspaceSymbolIndexEntry[] } };
+}
+
+const _indexes = new WeakMap<ProgramView, WorkspaceSymbolIndex>();
+
+export class WorkspaceSymbolIndex {
+    private readonly _files = new Map<string, IndexedFile>();
+    private _isLoaded = false;
+    private _isSaveNeeded = false;
+
+    private constructor(private readonly _program: ProgramView) {}
+
+    static get(program: ProgramView) {
+        let index = _indexes.get(program);
+        if (!index) {
+            index = new WorkspaceSymbolIndex(program);
+            _indexes.set(program, index);
+        }
+
+        return index;
+    }
+
+    // Determines whether the entries for the file are up to date, meaning
+    // that it won't need to be parsed to answer a query.
+    isUpToDate(fileInfo: SourceFileInfo): boolean {
+        this._load();
+
+        const indexedFile = this._files.get(fileInfo.uri.key);
+        if (!indexedFile) {
+            return false;
+        }
+
+        if (indexedFile.fileInfo) {
+            return _isSameVersion(indexedFile, fileInfo);
+        }
+
+        // The entry was loaded from disk. It can be used if the file is
+        // unchanged since the entry was saved.
+        if (
+            fileInfo.contentsVersion === undefined ||
+            fileInfo.isOpenByClient ||
+            indexedFile.diskStamp !== this._getDiskStamp(fileInfo.uri)
+        ) {
+            return false;
+        }
+
+        indexedFile.fileInfo = fileInfo;
+        indexedFile.contentsVersion = fileInfo.contentsVersion;
+        return true;
+    }
+
+    // Returns the symbols declared in the file whose names match the query,
+    // indexing the file first if it has changed.
+    findSymbols(fileInfo: SourceFileInfo, query: string, token: CancellationToken): WorkspaceSymbolIndexEntry[] {
+        const indexedFile = this.isUpToDate(fileInfo)
+            ? this._files.get(fileInfo.uri.key)!
+            : this._indexFile(fileInfo, token);
+
+        const queryMask = _getCharacterMask(query);
+        const matches: WorkspaceSymbolIndexEntry[] = [];
+        for (let i = 0; i < indexedFile.entries.length; i++) {
+            if ((indexedFile.masks[i] & queryMask) !== queryMask) {
+                continue;
+            }
+
+            const entry = indexedFile.entries[i];
+            if (isPatternInSymbol(query, entry.name)) {
+                matches.push(entry);
+            }
+        }
+
+        return matches;
+    }
+
+    // Drops the entries for files other than the specified ones (e.g. files
+    // that were deleted) and saves the index if it changed.
+    update(fileKeys: ReadonlySet<string>) {
+        for (const [fileKey, indexedFile] of this._files) {
+            if (!fileKeys.has(fileKey)) {
+                this._files.delete(fileKey);
+                this._isSaveNeeded ||= indexedFile.diskStamp !== undefined;
+            }
+        }
+
+        this._save();
+    }
+
+    private _indexFile(fileInfo: SourceFileInfo, token: CancellationToken): IndexedFile {
+        const diskStamp = fileInfo.isOpenByClient ? undefined : this._getDiskStamp(fileInfo.uri);
+
+        const entries: WorkspaceSymbolIndexEntry[] = [];
+        const parseResults = this._program.getParseResults(fileInfo.uri);
+        const analyzerFileInfo = parseResults ? getFileInfo(parseResults.parserOutput.parseTree) : undefined;
+        if (parseResults && analyzerFileInfo) {
+            const indexSymbolData = SymbolIndexer.indexSymbols(
+                analyzerFileInfo,
+                parseResults,
+                { includeAliases: false },
+                token
+            );
+            _appendEntriesRecursive(indexSymbolData, /* containerName */ undefined, entries);
+        }
+
+        const indexedFile: IndexedFile = {
+            entries,
+            masks: Int32Array.from(entries, (entry) => _getCharacterMask(entry.name)),
+            fileInfo,
+            contentsVersion: fileInfo.contentsVersion,
+            diskStamp,
+        };
+
+        const previous = this._files.get(fileInfo.uri.key);
+        this._files.set(fileInfo.uri.key, indexedFile);
+        this._isSaveNeeded ||= diskStamp !== undefined || previous?.diskStamp !== undefined;
+
+        return indexedFile;
+    }
+
+    private _getDiskStamp(uri: Uri): string | undefined {
+        try {
+            const stats = this._program.fileSystem.statSync(uri);
+            return `${stats.mtimeMs}:${stats.size}`;
+        } catch {
+            return undefined;
+        }
+    }
+
+    private _getSavedIndexUri(): Uri | undefined {
+        const cacheDir = this._program.configOptions.analysisCacheDir;
+        const rootHash = sha256Hex(this._program.rootPath.key);
+        if (!cacheDir || !rootHash) {
+            return undefined;
+        }
+
+        return cacheDir.combinePaths(`workspaceSymbols-${rootHash}.json`);
+    }
+
+    private _load() {
+        if (this._isLoaded) {
+            return;
+        }
+
+        this._isLoaded = true;
+
+        const indexUri = this._getSavedIndexUri();
+        if (!indexUri) {
+            return;
+        }
+
+        const fs = this._program.serviceProvider.fs();
+        let savedIndex: SavedIndex;
+        try {
+            if (!fs.existsSync(indexUri)) {
+                return;
+            }
+
+            savedIndex = JSON.parse(fs.readFileSync(indexUri, 'utf8'));
+        } catch {
+            // Treat an unreadable or corrupt index as empty. It'll be
+            // overwritten after the next query.
+            return;
+        }
+
+        if (savedIndex.formatVersion !== _indexFormatVersion || savedIndex.version !== version) {
+            return;
+        }
+
+        for (const [fileKey, savedFile] of Object.entries(savedIndex.files)) {
+            this._files.set(fileKey, {
+                entries: savedFile.entries,
+                masks: Int32Array.from(savedFile.entries, (entry) => _getCharacterMask(entry.name)),
+                fileInfo: undefined,
+                contentsVersion: undefined,
+                diskStamp: savedFile.diskStamp,
+            });
+        }
+    }
+
+    private _save() {
+        const indexUri = this._getSavedIndexUri();
+        if (!this._isSaveNeeded || !indexUri) {
+            return;
+        }
+
+        this._isSaveNeeded = false;
+
+        const savedIndex: SavedIndex = { formatVersion: _indexFormatVersion, version, files: {} };
+        for (const [fileKey, indexedFile] of this._files) {
+            if (indexedFile.diskStamp !== undefined) {
+                savedIndex.files[fileKey] = { diskStamp: indexedFile.diskStamp, entries: indexedFile.entries };
+            }
+        }
+
+        const fs = this._program.serviceProvider.fs();
+        try {
+            if (!fs.existsSync(indexUri.getDirectory())) {
+                fs.mkdirSync(indexUri.getDirectory(), { recursive: true });
+            }
+
+            fs.writeFileSync(indexUri, JSON.stringify(savedIndex), 'utf8');
+        } catch (e: any) {
+            this._program.console.error(`Failed to write workspace symbol index: ${e?.message ?? e}`);
+        }
+    }
+}
+
+function _appendEntriesRecursive(
+    indexSymbolData: IndexSymbolData[] | undefined,
+    containerName: string | undefined,
+    entries: WorkspaceSymbolIndexEntry[]
+) {
+    if (!indexSymbolData) {
+        return;
+    }
+
+    for (const symbolData of indexSymbolData) {
+        if (symbolData.alias) {
+            continue;
+        }
+
+        entries.push({
+            name: symbolData.name,
+            kind: symbolData.kind,
+            selectionRange: symbolData.selectionRange!,
+            containerName,
+        });
+
+        _appendEntriesRecursive(
+            symbolData.children,
+            containerName ? `${containerName}.${symbolData.name}` : symbolData.name,
+            entries
+        );
+    }
+}
+
+// Returns a mask with a bit set for each ASCII letter, digit (all digits share
+// a bit) and underscore in the lower-cased name. A name can only match a query
+// (see isPatternInSymbol) if its mask includes all of the query's bits.
+function _getCharacterMask(name: string) {
+    const lowerName = name.toLocaleLowerCase();
+    let mask = 0;
+
+    for (let i = 0; i < lowerName.length; i++) {
+        const charCode = lowerName.charCodeAt(i);
+        if (charCode >= 97 && charCode <= 122) {
+            mask |= 1 << (charCode - 97);
+        } else if (charCode >= 48 && charCode <= 57) {
+            mask |= 1 << 26;
+        } else if (charCode === 95) {
+            mask |= 1 << 27;
+        }
+    }
+
+    return mask;
+}
+
+// Determines whether the indexed entries were computed for the current contents of
+// the file. That's never known if the program doesn't track the contents version.
+function _isSameVersion(indexedFile: IndexedFile, fileInfo: SourceFileInfo) {
+    return (
+        indexedFile.fileInfo === fileInfo &&
+        fileInfo.contentsVersion !== undefined &&
+        indexedFile.contentsVersion === fileInfo.contentsVersion
+    );
+}
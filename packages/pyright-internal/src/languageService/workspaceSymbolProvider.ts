@@ -7,15 +7,13 @@
  */
 
 import { CancellationToken, Location, ResultProgressReporter, SymbolInformation } from 'vscode-languageserver';
-import { getFileInfo } from '../analyzer/analyzerNodeInfo';
 import { isUserCode } from '../analyzer/sourceFileInfoUtils';
 import { throwIfCancellationRequested } from '../common/cancellationUtils';
 import { appendArray } from '../common/collectionUtils';
 import { ProgramView } from '../common/extensibility';
-import * as StringUtils from '../common/stringUtils';
 import { Uri } from '../common/uri/uri';
 import { Workspace } from '../workspaceFactory';
-import { IndexSymbolData, SymbolIndexer } from './symbolIndexer';
+import { WorkspaceSymbolIndex } from './workspaceSymbolIndex';
 import { LanguageServerInterface } from '../common/languageServerInterface';
 
 type WorkspaceSymbolCallback = (symbols: SymbolInformation[]) => void;
@@ -60,72 +58,32 @@ export class WorkspaceSymbolProvider {
     protected getSymbolsForDocument(program: ProgramView, fileUri: Uri): SymbolInformation[] {
         const symbolList: SymbolInformation[] = [];
 
-        const parseResults = program.getParseResults(fileUri);
-        if (!parseResults) {
+        const sourceFileInfo = program.getSourceFileInfo(fileUri);
+        if (!sourceFileInfo) {
             return symbolList;
         }
 
-        const fileInfo = getFileInfo(parseResults.parserOutput.parseTree);
-        if (!fileInfo) {
-            return symbolList;
-        }
-
-        const indexSymbolData = SymbolIndexer.indexSymbols(
-            fileInfo,
-            parseResults,
-            { includeAliases: false },
-            this._token
-        );
-        this.appendWorkspaceSymbolsRecursive(indexSymbolData, program, fileUri, '', symbolList);
-
-        return symbolList;
-    }
-
-    protected appendWorkspaceSymbolsRecursive(
-        indexSymbolData: IndexSymbolData[] | undefined,
-        program: ProgramView,
-        fileUri: Uri,
-        container: string,
-        symbolList: SymbolInformation[]
-    ) {
+        const entries = WorkspaceSymbolIndex.get(program).findSymbols(sourceFileInfo, this._query, this._token);
         throwIfCancellationRequested(this._token);
 
-        if (!indexSymbolData) {
-            return;
-        }
+        const lspUri = entries.length > 0 ? this._ls.convertUriToLspUriString(program.fileSystem, fileUri) : '';
+        for (const entry of entries) {
+            const location: Location = { uri: lspUri, range: entry.selectionRange };
 
-        for (const symbolData of indexSymbolData) {
-            if (symbolData.alias) {
-                continue;
-            }
+            const symbolInfo: SymbolInformation = {
+                name: entry.name,
+                kind: entry.kind,
+                location,
+            };
 
-            if (StringUtils.isPatternInSymbol(this._query, symbolData.name)) {
-                const location: Location = {
-                    uri: this._ls.convertUriToLspUriString(program.fileSystem, fileUri),
-                    range: symbolData.selectionRange!,
-                };
-
-                const symbolInfo: SymbolInformation = {
-                    name: symbolData.name,
-                    kind: symbolData.kind,
-                    location,
-                };
-
-                if (container.length) {
-                    symbolInfo.containerName = container;
-                }
-
-                symbolList.push(symbolInfo);
+            if (entry.containerName) {
+                symbolInfo.containerName = entry.containerName;
             }
 
-            this.appendWorkspaceSymbolsRecursive(
-                symbolData.children,
-                program,
-                fileUri,
-                this._getContainerName(container, symbolData.name),
-                symbolList
-            );
+            symbolList.push(symbolInfo);
         }
+
+        return symbolList;
     }
 
     private _reportSymbolsForProgram(program: ProgramView) {
@@ -135,28 +93,30 @@ export class WorkspaceSymbolProvider {
             return;
         }
 
+        const index = WorkspaceSymbolIndex.get(program);
+        const fileKeys = new Set<string>();
+
         // "Workspace symbols" searches symbols only from user code.
         for (const sourceFileInfo of program.getSourceFileInfoList()) {
             if (!isUserCode(sourceFileInfo)) {
                 continue;
             }
 
+            fileKeys.add(sourceFileInfo.uri.key);
+            const needsIndexing = !index.isUpToDate(sourceFileInfo);
+
             const symbolList = this.getSymbolsForDocument(program, sourceFileInfo.uri);
             if (symbolList.length > 0) {
                 this._reporter(symbolList);
             }
 
-            // This operation can consume significant memory, so check
+            // Indexing a file can consume significant memory, so check
             // for situations where we need to discard the type cache.
-            program.handleMemoryHighUsage();
-        }
-    }
-
-    private _getContainerName(container: string, name: string) {
-        if (container.length > 0) {
-            return `${container}.${name}`;
+            if (needsIndexing) {
+                program.handleMemoryHighUsage();
+            }
         }
 
-        return name;
+        index.update(fileKeys);
     }
 }
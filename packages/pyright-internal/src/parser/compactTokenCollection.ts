@@ -0,0 +1,201 @@
+/*
+ * compactTokenCollection.ts
+ *
+ * A token collection that stores the tokens in parallel typed arrays rather
+ * than as one object per token. The tokenizer uses it for large files, whose
+ * tokens would otherwise account for a large number of long-lived objects
+ * (they're kept for as long as the file's parse results are).
+ *
+ * Tokens that have no data besides their type and range (punctuation,
+ * keywords, operators and new lines) are stored only in the arrays, and an
+ * object is created for them when they're accessed. The other tokens are
+ * kept as objects in a side table. Most of them (names, strings and numbers)
+ * are referenced by the parse tree anyway.
+ */
+
+import { fail } from '../common/debug';
+import { TextRangeCollection } from '../common/textRangeCollection';
+import { Comment, KeywordToken, NewLineToken, OperatorToken, Token, TokenType } from './tokenizerTypes';
+
+// Number of recently accessed tokens that are cached so a token that is
+// accessed repeatedly within a short span (e.g. while the parser looks ahead)
+// is created only once. This must be a power of two.
+const _cachedTokenCount = 64;
+
+export class CompactTokenCollection extends TextRangeCollection<Token> {
+    private readonly _types: Uint8Array;
+    private readonly _starts: Int32Array;
+    private readonly _lengths: Int32Array;
+
+    // The keyword, operator or new line type of a token stored in the arrays,
+    // or the index in _objects of a token stored as an object.
+    private readonly _data: Int32Array;
+    private readonly _objects: Token[] = [];
+    private readonly _comments = new Map<number, Comment[]>();
+
+    private readonly _cachedIndices = new Int32Array(_cachedTokenCount).fill(-1);
+    private readonly _cachedTokens: (Token | undefined)[] = new Array(_cachedTokenCount);
+
+    constructor(tokens: Token[]) {
+        super([]);
+
+        const count = tokens.length;
+        this._types = new Uint8Array(count);
+        this._starts = new Int32Array(count);
+        this._lengths = new Int32Array(count);
+        this._data = new Int32Array(count);
+
+        for (let i = 0; i < count; i++) {
+            const token = tokens[i];
+            this._types[i] = token.type;
+            this._starts[i] = token.start;
+            this._lengths[i] = token.length;
+
+            switch (token.type) {
+                case TokenType.Keyword:
+                    this._data[i] = (token as KeywordToken).keywordType;
+                    break;
+
+                case TokenType.Operator:
+                    this._data[i] = (token as OperatorToken).operatorType;
+                    break;
+
+                case TokenType.NewLine:
+                    this._data[i] = (token as NewLineToken).newLineType;
+                    break;
+
+                default:
+                    if (_isStoredAsObject(token.type)) {
+                        this._data[i] = this._objects.length;
+                        this._objects.push(token);
+                        continue;
+                    }
+                    break;
+            }
+
+            if (token.comments) {
+                this._comments.set(i, token.comments);
+            }
+        }
+    }
+
+    override get start(): number {
+        return this._starts.length > 0 ? this._starts[0] : 0;
+    }
+
+    override get end(): number {
+        const lastIndex = this._starts.length - 1;
+        return lastIndex >= 0 ? this._starts[lastIndex] + this._lengths[lastIndex] : 0;
+    }
+
+    override get count(): number {
+        return this._starts.length;
+    }
+
+    override getItemAt(index: number): Token {
+        if (index < 0 || index >= this._starts.length) {
+            fail('index is out of range');
+        }
+
+        if (_isStoredAsObject(this._types[index])) {
+            return this._objects[this._data[index]];
+        }
+
+        const slot = index & (_cachedTokenCount - 1);
+        if (this._cachedIndices[slot] === index) {
+            return this._cachedTokens[slot]!;
+        }
+
+        const token = this._createToken(index);
+        this._cachedIndices[slot] = index;
+        this._cachedTokens[slot] = token;
+        return token;
+    }
+
+    // Returns the nearest item prior to the position.
+    // The position may not be contained within the item.
+    override getItemAtPosition(position: number): number {
+        const starts = this._starts;
+        if (starts.length === 0 || position < this.start || position > this.end) {
+            return -1;
+        }
+
+        let min = 0;
+        let max = starts.length - 1;
+
+        while (min < max) {
+            const mid = min + ((max - min) >> 1);
+            const start = starts[mid];
+
+            // Is the position past the start of this item but before
+            // the start of the next item? If so, we found our item.
+            if (position >= start) {
+                if (mid >= starts.length - 1 || position < starts[mid + 1]) {
+                    return mid;
+                }
+            }
+
+            if (position < start) {
+                max = mid - 1;
+            } else {
+                min = mid + 1;
+            }
+        }
+        return min;
+    }
+
+    override getItemContaining(position: number): number {
+        let index = this.getItemAtPosition(position);
+
+        // Tokens don't overlap, so only the last non-empty token that starts
+        // at or before the position can contain it.
+        while (index >= 0 && this._lengths[index] === 0) {
+            index--;
+        }
+
+        if (index < 0 || position < this._starts[index] || position >= this._starts[index] + this._lengths[index]) {
+            return -1;
+        }
+
+        return index;
+    }
+
+    private _createToken(index: number): Token {
+        const start = this._starts[index];
+        const length = this._lengths[index];
+        const comments = this._comments.get(index);
+
+        switch (this._types[index]) {
+            case TokenType.Keyword:
+                return KeywordToken.create(start, length, this._data[index], comments);
+
+            case TokenType.Operator:
+                return OperatorToken.create(start, length, this._data[index], comments);
+
+            case TokenType.NewLine:
+                return NewLineToken.create(start, length, this._data[index], comments);
+
+            default:
+                return Token.create(this._types[index], start, length, comments);
+        }
+    }
+}
+
+// Determines whether tokens of the type carry data that isn't stored in the
+// arrays.
+function _isStoredAsObject(type: TokenType) {
+    switch (type) {
+        case TokenType.Indent:
+        case TokenType.Dedent:
+        case TokenType.String:
+        case TokenType.Number:
+        case TokenType.Identifier:
+        case TokenType.FStringStart:
+        case TokenType.FStringMiddle:
+        case TokenType.FStringEnd:
+            return true;
+
+        default:
+            return false;
+    }
+}
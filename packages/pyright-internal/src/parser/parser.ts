@@ -131,6 +131,7 @@ import {
     extendRange,
     getNextNodeId,
 } from './parseNodes';
+import { isLineBreak } from './characters';
 import * as StringTokenUtils from './stringTokenUtils';
 import { Tokenizer, TokenizerOutput } from './tokenizer';
 import {
@@ -173,6 +174,10 @@ export class ParseOptions {
     useNotebookMode: boolean;
     reportErrorsForParsedStringContents: boolean;
 
+    // Retain the information needed to reparse the file incrementally
+    // after it's edited (see IncrementalParseInfo).
+    enableIncrementalParse: boolean;
+
     constructor() {
         this.isStubFile = false;
         this.pythonVersion = latestStablePythonVersion;
@@ -180,6 +185,7 @@ export class ParseOptions {
         this.skipFunctionAndClassBody = false;
         this.useNotebookMode = false;
         this.reportErrorsForParsedStringContents = false;
+        this.enableIncrementalParse = false;
     }
 }
 
@@ -198,6 +204,39 @@ export interface ParseFileResults {
     contentHash: number;
     parserOutput: ParserOutput;
     tokenizerOutput: TokenizerOutput;
+    incrementalParseInfo?: IncrementalParseInfo;
+}
+
+// Information about the top-level statements of a parsed file that allows
+// the file to be reparsed incrementally after it's edited.
+export interface IncrementalParseInfo {
+    parseOptions: ParseOptions;
+
+    // Syntax errors reported while parsing each top-level statement,
+    // keyed by the node ID of the statement.
+    statementDiagnostics: Map<number, Diagnostic[]>;
+
+    // Node IDs of the top-level statements that contain type annotations.
+    statementsWithTypeAnnotations: Set<number>;
+
+    // Node IDs of the top-level statements whose parse started with a token
+    // that precedes the statement (e.g. an unexpected indent).
+    statementsWithLeadingTokens: Set<number>;
+
+    // Node IDs of the top-level statements after which the parser's state
+    // didn't return to that of the module level (e.g. after a syntax error).
+    statementsWithNestedState: Set<number>;
+
+    // Were some tokens skipped rather than parsed as part of a statement?
+    hasSkippedTokens: boolean;
+}
+
+// The results of the previous parse of a file that's being reparsed.
+export interface PreviousParseResults {
+    text: string;
+    parserOutput: ParserOutput;
+    tokenizerOutput: TokenizerOutput;
+    incrementalParseInfo: IncrementalParseInfo;
 }
 
 export interface ParseExpressionTextResults<T extends ParseNode> {
@@ -227,6 +266,25 @@ export const enum ParseTextMode {
     FunctionAnnotation,
 }
 
+// State of an incremental reparse, which reuses the top-level statements
+// of the previous parse that precede and follow the edited text.
+interface IncrementalReparse {
+    previous: PreviousParseResults;
+
+    // Offset by which the text that follows the edit has moved.
+    delta: number;
+
+    // Index of the next previous statement that may be reused once the
+    // parser reaches its start.
+    nextStatementIndex: number;
+
+    // Number of previous imports that precede the reparsed text.
+    prefixImportCount: number;
+
+    // Number of imports that were recorded when reparsing started.
+    importCount: number;
+}
+
 // Limit the max child node depth to prevent stack overflows.
 const maxChildNodeDepth = 256;
 
@@ -255,8 +313,18 @@ export class Parser {
     private _typingSymbolAliases: Map<string, string> = new Map<string, string>();
     private _maxChildDepthMap = new Map<number, number>();
     private _hasTypeAnnotations = false;
+    private _incrementalParseInfo: IncrementalParseInfo | undefined;
+    private _statementDiagnostics: Diagnostic[] | undefined;
 
-    parseSourceFile(fileContents: string, parseOptions: ParseOptions, diagSink: DiagnosticSink): ParseFileResults {
+    // Parses the file. If the results of a previous parse of the file are
+    // provided, the top-level statements that precede and follow the edited
+    // text are reused rather than parsed again where possible.
+    parseSourceFile(
+        fileContents: string,
+        parseOptions: ParseOptions,
+        diagSink: DiagnosticSink,
+        previousParse?: PreviousParseResults
+    ): ParseFileResults {
         this._hasTypeAnnotations = false;
         timingStats.tokenizeFileTime.timeOperation(() => {
             this._startNewParse(fileContents, 0, fileContents.length, parseOptions, diagSink);
@@ -264,9 +332,31 @@ export class Parser {
 
         const moduleNode = ModuleNode.create({ start: 0, length: fileContents.length });
 
+        if (parseOptions.enableIncrementalParse) {
+            this._incrementalParseInfo = {
+                parseOptions,
+                statementDiagnostics: new Map<number, Diagnostic[]>(),
+                statementsWithTypeAnnotations: new Set<number>(),
+                statementsWithLeadingTokens: new Set<number>(),
+                statementsWithNestedState: new Set<number>(),
+                hasSkippedTokens: false,
+            };
+        }
+
         timingStats.parseFileTime.timeOperation(() => {
+            const reparse = previousParse ? this._startIncrementalReparse(moduleNode, previousParse) : undefined;
+
             while (!this._atEof()) {
+                if (reparse && this._reuseStatementsAfterEdit(moduleNode, reparse)) {
+                    break;
+                }
+
                 if (!this._consumeTokenIfType(TokenType.NewLine)) {
+                    const startToken = this._peekToken();
+                    const hadTypeAnnotations = this._hasTypeAnnotations;
+                    this._hasTypeAnnotations = false;
+                    this._statementDiagnostics = this._incrementalParseInfo ? [] : undefined;
+
                     // Handle a common error case and try to recover.
                     const nextToken = this._peekToken();
                     if (nextToken.type === TokenType.Indent) {
@@ -283,10 +373,38 @@ export class Parser {
                     if (!statement) {
                         // Perform basic error recovery to get to the next line.
                         this._consumeTokensUntilType([TokenType.NewLine]);
+
+                        if (this._incrementalParseInfo) {
+                            this._incrementalParseInfo.hasSkippedTokens = true;
+                        }
                     } else {
                         statement.parent = moduleNode;
                         moduleNode.d.statements.push(statement);
+
+                        if (this._incrementalParseInfo) {
+                            if (this._statementDiagnostics!.length > 0) {
+                                this._incrementalParseInfo.statementDiagnostics.set(
+                                    statement.id,
+                                    this._statementDiagnostics!
+                                );
+                            }
+
+                            if (this._hasTypeAnnotations) {
+                                this._incrementalParseInfo.statementsWithTypeAnnotations.add(statement.id);
+                            }
+
+                            if (startToken.start !== statement.start || startToken.length === 0) {
+                                this._incrementalParseInfo.statementsWithLeadingTokens.add(statement.id);
+                            }
+
+                            if (!this._isAtModuleLevel()) {
+                                this._incrementalParseInfo.statementsWithNestedState.add(statement.id);
+                            }
+                        }
                     }
+
+                    this._statementDiagnostics = undefined;
+                    this._hasTypeAnnotations = this._hasTypeAnnotations || hadTypeAnnotations;
                 }
             }
         });
@@ -305,6 +423,7 @@ export class Parser {
                 lines: this._tokenizerOutput!.lines,
             },
             tokenizerOutput: this._tokenizerOutput!,
+            incrementalParseInfo: this._incrementalParseInfo,
         };
     }
 
@@ -414,6 +533,252 @@ export class Parser {
         this._tokenIndex = 0;
     }
 
+    // Prepares to reparse the file incrementally after an edit. The top-level
+    // statements of the previous parse that precede the edited text are reused,
+    // and parsing resumes one statement before the first one the edit may have
+    // changed because the parser looks ahead at the start of the following
+    // statement (e.g. for an "else" clause). Returns undefined if the previous
+    // parse can't be reused.
+    private _startIncrementalReparse(
+        moduleNode: ModuleNode,
+        previous: PreviousParseResults
+    ): IncrementalReparse | undefined {
+        const previousInfo = previous.incrementalParseInfo;
+        if (previousInfo.hasSkippedTokens || !_areParseOptionsEqual(previousInfo.parseOptions, this._parseOptions)) {
+            return undefined;
+        }
+
+        // Find the range of text that changed.
+        const oldText = previous.text;
+        const newText = this._fileContents!;
+        const maxLength = Math.min(oldText.length, newText.length);
+        let prefixLength = 0;
+        while (prefixLength < maxLength && oldText.charCodeAt(prefixLength) === newText.charCodeAt(prefixLength)) {
+            prefixLength++;
+        }
+
+        let suffixLength = 0;
+        while (
+            suffixLength < maxLength - prefixLength &&
+            oldText.charCodeAt(oldText.length - suffixLength - 1) ===
+                newText.charCodeAt(newText.length - suffixLength - 1)
+        ) {
+            suffixLength++;
+        }
+
+        const statements = previous.parserOutput.parseTree.d.statements;
+        let reparseIndex = 0;
+        while (reparseIndex < statements.length && statements[reparseIndex].start <= prefixLength) {
+            reparseIndex++;
+        }
+        reparseIndex -= 2;
+
+        // Parsing can resume only at a statement that starts a line at the
+        // outermost indentation level, where the tokens don't depend on the
+        // preceding text.
+        for (; reparseIndex > 0; reparseIndex--) {
+            const statement = statements[reparseIndex];
+            const tokenIndex = this._tokens!.getItemAtPosition(statement.start);
+            if (
+                !previousInfo.statementsWithLeadingTokens.has(statement.id) &&
+                !previousInfo.statementsWithNestedState.has(statements[reparseIndex - 1].id) &&
+                _isStatementStart(this._tokens!, tokenIndex, statement.start, newText)
+            ) {
+                this._tokenIndex = tokenIndex;
+                break;
+            }
+        }
+
+        reparseIndex = Math.max(reparseIndex, 0);
+        for (let i = 0; i < reparseIndex; i++) {
+            this._reuseStatement(moduleNode, statements[i], previousInfo, /* lineDelta */ 0);
+        }
+
+        // The imports of the reused statements precede the first statement
+        // that's reparsed (in the previous text).
+        const reparseStart = reparseIndex < statements.length ? statements[reparseIndex].start : oldText.length;
+        const previousImports = previous.parserOutput.importedModules;
+        let prefixImportCount = 0;
+        while (
+            prefixImportCount < previousImports.length &&
+            previousImports[prefixImportCount].nameNode.start < reparseStart
+        ) {
+            prefixImportCount++;
+        }
+        this._addReusedImports(previousImports.slice(0, prefixImportCount));
+
+        // Only the statements that lie entirely within the unchanged text
+        // that follows the edit can be reused.
+        let nextStatementIndex = reparseIndex + 1;
+        while (
+            nextStatementIndex < statements.length &&
+            statements[nextStatementIndex].start < oldText.length - suffixLength
+        ) {
+            nextStatementIndex++;
+        }
+
+        return {
+            previous,
+            delta: newText.length - oldText.length,
+            nextStatementIndex,
+            prefixImportCount,
+            importCount: this._importedModules.length,
+        };
+    }
+
+    // Called before each top-level statement is parsed during an incremental
+    // reparse. If the parser has reached the start of one of the previous
+    // statements that follow the edited text and the tokenizer and parser
+    // are in the same state there as they were in the previous parse, that
+    // statement and the ones after it are reused. Returns true if they were.
+    private _reuseStatementsAfterEdit(moduleNode: ModuleNode, reparse: IncrementalReparse): boolean {
+        const previous = reparse.previous;
+        const statements = previous.parserOutput.parseTree.d.statements;
+        const nextToken = this._peekToken();
+        while (
+            reparse.nextStatementIndex < statements.length &&
+            statements[reparse.nextStatementIndex].start + reparse.delta < nextToken.start
+        ) {
+            reparse.nextStatementIndex++;
+        }
+
+        if (
+            reparse.nextStatementIndex >= statements.length ||
+            statements[reparse.nextStatementIndex].start + reparse.delta !== nextToken.start ||
+            !_isStatementStart(this._tokens!, this._tokenIndex, nextToken.start, this._fileContents!)
+        ) {
+            return false;
+        }
+
+        const statement = statements[reparse.nextStatementIndex];
+        const oldTokens = previous.tokenizerOutput.tokens;
+        const oldTokenIndex = oldTokens.getItemAtPosition(statement.start);
+        if (
+            previous.incrementalParseInfo.statementsWithLeadingTokens.has(statement.id) ||
+            previous.incrementalParseInfo.statementsWithNestedState.has(statements[reparse.nextStatementIndex - 1].id) ||
+            !this._isAtModuleLevel() ||
+            !_isStatementStart(oldTokens, oldTokenIndex, statement.start, previous.text) ||
+            oldTokens.count - oldTokenIndex !== this._tokenCount - this._tokenIndex
+        ) {
+            return false;
+        }
+
+        // Imports affect the way type annotations are parsed, so the
+        // statements can't be reused if the edit changed any.
+        const previousImports = previous.parserOutput.importedModules;
+        let importCount = reparse.prefixImportCount;
+        while (importCount < previousImports.length && previousImports[importCount].nameNode.start < statement.start) {
+            importCount++;
+        }
+
+        const reparsedImports = this._importedModules.slice(reparse.importCount);
+        const replacedImports = previousImports.slice(reparse.prefixImportCount, importCount);
+        if (
+            reparsedImports.length !== replacedImports.length ||
+            reparsedImports.some(
+                (moduleImport, index) =>
+                    !_isSameImport(moduleImport, this._fileContents!, replacedImports[index], previous.text)
+            )
+        ) {
+            return false;
+        }
+
+        const lineDelta =
+            this._tokenizerOutput!.lines.getItemAtPosition(nextToken.start) -
+            previous.parserOutput.lines.getItemAtPosition(statement.start);
+        const mover = new ParseNodeMover(statement.start, reparse.delta, nextToken);
+
+        for (let i = reparse.nextStatementIndex; i < statements.length; i++) {
+            mover.moveNode(statements[i]);
+            this._reuseStatement(moduleNode, statements[i], previous.incrementalParseInfo, lineDelta);
+        }
+
+        this._addReusedImports(previousImports.slice(importCount));
+
+        // Skip to the end-of-stream token.
+        this._tokenIndex = this._tokenCount - 1;
+        return true;
+    }
+
+    private _reuseStatement(
+        moduleNode: ModuleNode,
+        statement: StatementNode,
+        previousInfo: IncrementalParseInfo,
+        lineDelta: number
+    ) {
+        statement.parent = moduleNode;
+        moduleNode.d.statements.push(statement);
+
+        let diagnostics = previousInfo.statementDiagnostics.get(statement.id);
+        if (diagnostics) {
+            if (lineDelta !== 0) {
+                diagnostics = diagnostics.map((diag) =>
+                    diag.copy({
+                        range: {
+                            start: { line: diag.range.start.line + lineDelta, character: diag.range.start.character },
+                            end: { line: diag.range.end.line + lineDelta, character: diag.range.end.character },
+                        },
+                    })
+                );
+            }
+
+            diagnostics.forEach((diag) => {
+                this._diagSink.addDiagnostic(diag);
+            });
+            this._incrementalParseInfo?.statementDiagnostics.set(statement.id, diagnostics);
+        }
+
+        if (previousInfo.statementsWithTypeAnnotations.has(statement.id)) {
+            this._hasTypeAnnotations = true;
+            this._incrementalParseInfo?.statementsWithTypeAnnotations.add(statement.id);
+        }
+
+        if (previousInfo.statementsWithLeadingTokens.has(statement.id)) {
+            this._incrementalParseInfo?.statementsWithLeadingTokens.add(statement.id);
+        }
+
+        if (previousInfo.statementsWithNestedState.has(statement.id)) {
+            this._incrementalParseInfo?.statementsWithNestedState.add(statement.id);
+        }
+    }
+
+    // Determines whether the parser's state is that of the module level,
+    // outside of any statement.
+    private _isAtModuleLevel() {
+        return (
+            !this._areErrorsSuppressed &&
+            !this._isInLoop &&
+            !this._isInFunction &&
+            !this._isInExceptionGroup &&
+            !this._isParsingTypeAnnotation &&
+            !this._isParsingIndexTrailer &&
+            !this._isParsingQuotedText &&
+            !this._isInFinallyBlock &&
+            !this._isInFinallyLoop &&
+            this._assignmentExpressionsAllowed
+        );
+    }
+
+    // Records the imports of statements that were reused from a previous parse.
+    private _addReusedImports(imports: ModuleImport[]) {
+        let prevNameNode: ModuleNameNode | undefined;
+
+        imports.forEach((moduleImport) => {
+            // A module with a multi-part name is imported once for each part.
+            if (moduleImport.nameNode === prevNameNode) {
+                return;
+            }
+            prevNameNode = moduleImport.nameNode;
+
+            const importNode = moduleImport.nameNode.parent;
+            if (importNode?.nodeType === ParseNodeType.ImportFrom) {
+                this._addImportFrom(importNode);
+            } else if (importNode?.nodeType === ParseNodeType.ImportAs) {
+                this._addImportAs(importNode);
+            }
+        });
+    }
+
     // stmt: simple_stmt | compound_stmt
     // compound_stmt: if_stmt | while_stmt | for_stmt | try_stmt | with_stmt
     //   | funcdef | classdef | decorated | async_stmt
@@ -2664,13 +3029,6 @@ export class Parser {
         const modName = this._parseDottedModuleName(/* allowJustDots */ true);
         const importFromNode = ImportFromNode.create(fromToken, modName);
 
-        // Handle imports from __future__ specially because they can
-        // change the way we interpret the rest of the file.
-        const isFutureImport =
-            modName.d.leadingDots === 0 &&
-            modName.d.nameParts.length === 1 &&
-            modName.d.nameParts[0].d.value === '__future__';
-
         const possibleInputToken = this._peekToken();
         if (!this._consumeTokenIfKeyword(KeywordType.Import)) {
             this._addSyntaxError(LocMessage.expectedImport(), this._peekToken());
@@ -2686,7 +3044,6 @@ export class Parser {
                 extendRange(importFromNode, possibleStarToken);
                 importFromNode.d.isWildcardImport = true;
                 importFromNode.d.wildcardToken = possibleStarToken;
-                this._containsWildcardImport = true;
             } else {
                 const openParenToken = this._peekToken();
                 const inParen = this._consumeTokenIfType(TokenType.OpenParenthesis);
@@ -2717,11 +3074,6 @@ export class Parser {
                     importFromAsNode.parent = importFromNode;
                     extendRange(importFromNode, importFromAsNode);
 
-                    if (isFutureImport) {
-                        // Add the future import by name.
-                        this._futureImports.add(importName.value);
-                    }
-
                     const nextToken = this._peekToken();
                     if (!this._consumeTokenIfType(TokenType.Comma)) {
                         break;
@@ -2748,36 +3100,7 @@ export class Parser {
             }
         }
 
-        this._importedModules.push({
-            nameNode: importFromNode.d.module,
-            leadingDots: importFromNode.d.module.d.leadingDots,
-            nameParts: importFromNode.d.module.d.nameParts.map((p) => p.d.value),
-            importedSymbols: new Set<string>(importFromNode.d.imports.map((imp) => imp.d.name.d.value)),
-        });
-
-        let isTypingImport = false;
-        if (importFromNode.d.module.d.nameParts.length === 1) {
-            const firstNamePartValue = importFromNode.d.module.d.nameParts[0].d.value;
-            if (firstNamePartValue === 'typing' || firstNamePartValue === 'typing_extensions') {
-                isTypingImport = true;
-            }
-        }
-
-        if (isTypingImport) {
-            const typingSymbolsOfInterest = ['Literal', 'TypeAlias', 'Annotated'];
-
-            if (importFromNode.d.isWildcardImport) {
-                typingSymbolsOfInterest.forEach((s) => {
-                    this._typingSymbolAliases.set(s, s);
-                });
-            } else {
-                importFromNode.d.imports.forEach((imp) => {
-                    if (typingSymbolsOfInterest.some((s) => s === imp.d.name.d.value)) {
-                        this._typingSymbolAliases.set(imp.d.alias?.d.value || imp.d.name.d.value, imp.d.name.d.value);
-                    }
-                });
-            }
-        }
+        this._addImportFrom(importFromNode);
 
         return importFromNode;
     }
@@ -2813,38 +3136,7 @@ export class Parser {
             importNode.d.list.push(importAsNode);
             importAsNode.parent = importNode;
 
-            const nameParts = importAsNode.d.module.d.nameParts.map((p) => p.d.value);
-
-            if (
-                importAsNode.d.alias ||
-                importAsNode.d.module.d.leadingDots > 0 ||
-                importAsNode.d.module.d.nameParts.length === 0
-            ) {
-                this._importedModules.push({
-                    nameNode: importAsNode.d.module,
-                    leadingDots: importAsNode.d.module.d.leadingDots,
-                    nameParts,
-                    importedSymbols: undefined,
-                });
-            } else {
-                // Implicitly import all modules in the multi-part name if we
-                // are not assigning the final module to an alias.
-                importAsNode.d.module.d.nameParts.forEach((_, index) => {
-                    this._importedModules.push({
-                        nameNode: importAsNode.d.module,
-                        leadingDots: importAsNode.d.module.d.leadingDots,
-                        nameParts: nameParts.slice(0, index + 1),
-                        importedSymbols: undefined,
-                    });
-                });
-            }
-
-            if (modName.d.nameParts.length === 1) {
-                const firstNamePartValue = modName.d.nameParts[0].d.value;
-                if (firstNamePartValue === 'typing' || firstNamePartValue === 'typing_extensions') {
-                    this._typingImportAliases.push(importAsNode.d.alias?.d.value || firstNamePartValue);
-                }
-            }
+            this._addImportAs(importAsNode);
 
             if (!this._consumeTokenIfType(TokenType.Comma)) {
                 break;
@@ -2858,6 +3150,96 @@ export class Parser {
         return importNode;
     }
 
+    // Records the module imported by a "from X import Y" statement and
+    // its effects on the way the rest of the file is parsed.
+    private _addImportFrom(importFromNode: ImportFromNode) {
+        if (importFromNode.d.isWildcardImport) {
+            this._containsWildcardImport = true;
+        }
+
+        // Handle imports from __future__ specially because they can
+        // change the way we interpret the rest of the file.
+        const modName = importFromNode.d.module;
+        if (
+            modName.d.leadingDots === 0 &&
+            modName.d.nameParts.length === 1 &&
+            modName.d.nameParts[0].d.value === '__future__'
+        ) {
+            importFromNode.d.imports.forEach((imp) => {
+                // Add the future import by name.
+                this._futureImports.add(imp.d.name.d.value);
+            });
+        }
+
+        this._importedModules.push({
+            nameNode: importFromNode.d.module,
+            leadingDots: importFromNode.d.module.d.leadingDots,
+            nameParts: importFromNode.d.module.d.nameParts.map((p) => p.d.value),
+            importedSymbols: new Set<string>(importFromNode.d.imports.map((imp) => imp.d.name.d.value)),
+        });
+
+        let isTypingImport = false;
+        if (importFromNode.d.module.d.nameParts.length === 1) {
+            const firstNamePartValue = importFromNode.d.module.d.nameParts[0].d.value;
+            if (firstNamePartValue === 'typing' || firstNamePartValue === 'typing_extensions') {
+                isTypingImport = true;
+            }
+        }
+
+        if (isTypingImport) {
+            const typingSymbolsOfInterest = ['Literal', 'TypeAlias', 'Annotated'];
+
+            if (importFromNode.d.isWildcardImport) {
+                typingSymbolsOfInterest.forEach((s) => {
+                    this._typingSymbolAliases.set(s, s);
+                });
+            } else {
+                importFromNode.d.imports.forEach((imp) => {
+                    if (typingSymbolsOfInterest.some((s) => s === imp.d.name.d.value)) {
+                        this._typingSymbolAliases.set(imp.d.alias?.d.value || imp.d.name.d.value, imp.d.name.d.value);
+                    }
+                });
+            }
+        }
+    }
+
+    // Records the modules imported by an "import X" statement and its
+    // effects on the way the rest of the file is parsed.
+    private _addImportAs(importAsNode: ImportAsNode) {
+        const nameParts = importAsNode.d.module.d.nameParts.map((p) => p.d.value);
+
+        if (
+            importAsNode.d.alias ||
+            importAsNode.d.module.d.leadingDots > 0 ||
+            importAsNode.d.module.d.nameParts.length === 0
+        ) {
+            this._importedModules.push({
+                nameNode: importAsNode.d.module,
+                leadingDots: importAsNode.d.module.d.leadingDots,
+                nameParts,
+                importedSymbols: undefined,
+            });
+        } else {
+            // Implicitly import all modules in the multi-part name if we
+            // are not assigning the final module to an alias.
+            importAsNode.d.module.d.nameParts.forEach((_, index) => {
+                this._importedModules.push({
+                    nameNode: importAsNode.d.module,
+                    leadingDots: importAsNode.d.module.d.leadingDots,
+                    nameParts: nameParts.slice(0, index + 1),
+                    importedSymbols: undefined,
+                });
+            });
+        }
+
+        if (importAsNode.d.module.d.nameParts.length === 1) {
+            const firstNamePartValue = importAsNode.d.module.d.nameParts[0].d.value;
+            if (firstNamePartValue === 'typing' || firstNamePartValue === 'typing_extensions') {
+                this._typingImportAliases.push(importAsNode.d.alias?.d.value || firstNamePartValue);
+            }
+        }
+    }
+
     // ('.' | '...')* dotted_name | ('.' | '...')+
     // dotted_name: NAME ('.' NAME)*
     private _parseDottedModuleName(allowJustDots = false): ModuleNameNode {
@@ -5464,10 +5846,122 @@ export class Parser {
         assert(range !== undefined);
 
         if (!this._areErrorsSuppressed) {
-            this._diagSink.addError(
+            const diag = this._diagSink.addError(
                 message,
                 convertOffsetsToRange(range.start, range.start + range.length, this._tokenizerOutput!.lines)
             );
+            this._statementDiagnostics?.push(diag);
+        }
+    }
+}
+
+function _areParseOptionsEqual(options1: ParseOptions, options2: ParseOptions) {
+    return (
+        options1.isStubFile === options2.isStubFile &&
+        PythonVersion.isEqualTo(options1.pythonVersion, options2.pythonVersion) &&
+        options1.reportInvalidStringEscapeSequence === options2.reportInvalidStringEscapeSequence &&
+        options1.skipFunctionAndClassBody === options2.skipFunctionAndClassBody &&
+        options1.useNotebookMode === options2.useNotebookMode &&
+        options1.reportErrorsForParsedStringContents === options2.reportErrorsForParsedStringContents
+    );
+}
+
+// Determines whether the token at the specified index is the first token of
+// a statement that starts at the specified offset, at the beginning of a line
+// and at the outermost indentation level. The tokenizer is in the same state
+// (no open parentheses and no indentation) at every such token.
+function _isStatementStart(tokens: TextRangeCollection<Token>, tokenIndex: number, start: number, text: string) {
+    if (tokenIndex < 0 || (start > 0 && !isLineBreak(text.charCodeAt(start - 1)))) {
+        return false;
+    }
+
+    const token = tokens.getItemAt(tokenIndex);
+    if (token.start !== start || token.length === 0 || token.type === TokenType.NewLine) {
+        return false;
+    }
+
+    if (tokenIndex === 0) {
+        return true;
+    }
+
+    const prevTokenType = tokens.getItemAt(tokenIndex - 1).type;
+    return prevTokenType === TokenType.NewLine || prevTokenType === TokenType.Dedent;
+}
+
+// Determines whether two imports come from import statements with the same
+// text, which have the same effect on the parser.
+function _isSameImport(import1: ModuleImport, text1: string, import2: ModuleImport, text2: string) {
+    const node1 = import1.nameNode.parent ?? import1.nameNode;
+    const node2 = import2.nameNode.parent ?? import2.nameNode;
+
+    return (
+        node1.length === node2.length &&
+        text1.substr(node1.start, node1.length) === text2.substr(node2.start, node2.length)
+    );
+}
+
+// Moves the parse nodes that were reused from a previous parse, along with
+// their descendants and tokens, by the specified offset. Because the comments
+// that precede the first statement may have been edited, its first token gets
+// the comments of the corresponding new token.
+class ParseNodeMover {
+    private _movedObjects = new Set<object>();
+
+    constructor(private _start: number, private _delta: number, private _firstToken: Token) {}
+
+    moveNode(node: ParseNode) {
+        if (this._movedObjects.has(node)) {
+            return;
+        }
+        this._movedObjects.add(node);
+
+        this._moveRange(node);
+
+        Object.values(node.d).forEach((value) => {
+            this._moveValue(value);
+        });
+    }
+
+    private _moveValue(value: unknown) {
+        if (Array.isArray(value)) {
+            value.forEach((element) => {
+                this._moveValue(element);
+            });
+            return;
+        }
+
+        if (!value || typeof value !== 'object' || typeof (value as TextRange).start !== 'number') {
+            return;
+        }
+
+        if ('nodeType' in value) {
+            this.moveNode(value as ParseNode);
+            return;
+        }
+
+        // Anything else that has a range is a token (or a comment).
+        if (this._movedObjects.has(value)) {
+            return;
+        }
+        this._movedObjects.add(value);
+
+        const token = value as Token;
+        this._moveRange(token);
+
+        if (token.start === this._firstToken.start && token.type === this._firstToken.type) {
+            if (token.comments !== this._firstToken.comments) {
+                (token as any).comments = this._firstToken.comments;
+            }
+        } else if (token.comments) {
+            this._moveValue(token.comments);
+        }
+    }
+
+    private _moveRange(range: TextRange) {
+        // Ranges that precede the reused text belong to placeholders (e.g.
+        // for a missing name) that don't correspond to any text.
+        if (range.start >= this._start) {
+            (range as any).start = range.start + this._delta;
         }
     }
 }
@@ -24,6 +24,7 @@ import {
     isSurrogateChar,
 } from './characters';
 import { CharacterStream } from './characterStream';
+import { CompactTokenCollection } from './compactTokenCollection';
 import {
     Comment,
     CommentType,
@@ -276,6 +277,11 @@ const _byteOrderMarker = 0xfeff;
 
 const defaultTabSize = 8;
 
+// The tokens of files with at least this many tokens are stored in a
+// CompactTokenCollection, which uses far fewer objects but has to create
+// an object for some of the tokens each time they're accessed.
+const _minCompactTokenCount = 8192;
+
 // Fast-reject table: only these ASCII chars can begin a string literal
 // (quote chars or valid string prefix chars f/r/b/u/t and their uppercase).
 // Checking this table first avoids calling _getStringPrefixLength() for the
@@ -808,7 +814,10 @@ export class Tokenizer {
         }
 
         return {
-            tokens: new TextRangeCollection(this._tokens),
+            tokens:
+                this._tokens.length >= _minCompactTokenCount
+                    ? new CompactTokenCollection(this._tokens)
+                    : new TextRangeCollection(this._tokens),
             lines: new TextRangeCollection(this._lineRanges),
             typeIgnoreLines: this._typeIgnoreLines,
             typeIgnoreAll: this._typeIgnoreAll,
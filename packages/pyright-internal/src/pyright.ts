@@ -10,7 +10,7 @@
 // Add the start timer at the very top of the file, before we import other modules.
 
 /* eslint-disable */
-import { timingStats } from './common/timing';
+import { Duration, timingStats } from './common/timing';
 /* eslint-enable */
 
 import chalk from 'chalk';
@@ -25,7 +25,7 @@ import { PackageTypeVerifier } from './analyzer/packageTypeVerifier';
 import { AnalyzerService } from './analyzer/service';
 import { TypeStubWriter } from './analyzer/typeStubWriter';
 import { maxSourceFileSize } from './analyzer/sourceFile';
-import { SourceFileInfo } from './analyzer/sourceFileInfo';
+import { FileScheduler } from './analyzer/fileScheduler';
 import { initializeDependencies } from './common/asyncInitialization';
 import { ChokidarFileWatcherProvider } from './common/chokidarFileWatcherProvider';
 import { CommandLineOptions as PyrightCommandLineOptions } from './common/commandLineOptions';
@@ -34,8 +34,11 @@ import { fail } from './common/debug';
 import { createDeferred, Deferred } from './common/deferred';
 import { Diagnostic, DiagnosticCategory } from './common/diagnostic';
 import { FileDiagnostics } from './common/diagnosticSink';
+import { decodeFileDiagnostics, encodeFileDiagnostics } from './common/compactDiagnostics';
+import { appendArray } from './common/collectionUtils';
 import { FullAccessHost } from './common/fullAccessHost';
 import { combinePaths, normalizePath } from './common/pathUtils';
+import { performanceTrace, TraceEventBatch } from './common/performanceTrace';
 import { PythonVersion } from './common/pythonVersion';
 import { RealTempFile, createFromRealFileSystem } from './common/realFileSystem';
 import { ServiceKeys } from './common/serviceKeys';
@@ -64,6 +67,29 @@ import { BaselineMode, baselineModes } from './baseline';
 
 type SeverityLevel = 'error' | 'warning' | 'information';
 
+// The maximum number of files sent to a worker process in one message.
+const maxFilesPerWorkerBatch = 32;
+
+// An in-memory file that each worker process analyzes while it waits for its
+// first batch of files.
+const workerWarmUpFileName = '__pyright_worker_warm_up__.py';
+const workerWarmUpFileContents = [
+    'import abc',
+    'import collections.abc',
+    'import dataclasses',
+    'import enum',
+    'import types',
+    'import typing',
+    'import typing_extensions',
+].join('\n');
+
+// Timing information reported by a worker process for each batch of files.
+interface WorkerBatchTime {
+    fileCount: number;
+    analysisTime: number;
+    totalTime: number;
+}
+
 // These values are publicly documented. Do not change them.
 enum ExitStatus {
     NoErrors = 0,
@@ -164,6 +190,7 @@ const cancellationNone = Object.freeze({
 
 async function processArgs(): Promise<ExitStatus> {
     const optionDefinitions: OptionDefinition[] = [
+        { name: 'cachedir', type: String },
         { name: 'createstub', type: String },
         { name: 'dependencies', type: Boolean },
         { name: 'files', type: String, multiple: true, defaultOption: true },
@@ -182,6 +209,7 @@ async function processArgs(): Promise<ExitStatus> {
         { name: 'skipunannotated', type: Boolean },
         { name: 'stats', type: Boolean },
         { name: 'threads', type: parseThreadsArgValue },
+        { name: 'tracefile', type: String },
         { name: 'typeshed-path', type: String },
         { name: 'baselinefile', type: String },
         { name: 'typeshedpath', alias: 't', type: String },
@@ -254,7 +282,16 @@ async function processArgs(): Promise<ExitStatus> {
     }
 
     if (args.verifytypes !== undefined) {
-        const incompatibleArgs = ['watch', 'stats', 'createstub', 'dependencies', 'skipunannotated', 'threads'];
+        const incompatibleArgs = [
+            'watch',
+            'stats',
+            'createstub',
+            'dependencies',
+            'skipunannotated',
+            'threads',
+            'cachedir',
+            'tracefile',
+        ];
         for (const arg of incompatibleArgs) {
             if (args[arg] !== undefined) {
                 console.error(`'verifytypes' option cannot be used with '${arg}' option`);
@@ -264,7 +301,15 @@ async function processArgs(): Promise<ExitStatus> {
     }
 
     if (args.createstub) {
-        const incompatibleArgs = ['watch', 'stats', 'verifytypes', 'dependencies', 'skipunannotated', 'threads'];
+        const incompatibleArgs = [
+            'watch',
+            'stats',
+            'verifytypes',
+            'dependencies',
+            'skipunannotated',
+            'threads',
+            'cachedir',
+        ];
         for (const arg of incompatibleArgs) {
             if (args[arg] !== undefined) {
                 console.error(`'createstub' option cannot be used with '${arg}' option`);
@@ -407,6 +452,10 @@ async function processArgs(): Promise<ExitStatus> {
         options.configSettings.baselineFile = combinePaths(process.cwd(), normalizePath(args['baselinefile']));
     }
 
+    if (args['cachedir']) {
+        options.languageServerSettings.analysisCacheDir = combinePaths(process.cwd(), normalizePath(args['cachedir']));
+    }
+
     if (args.createstub) {
         options.languageServerSettings.typeStubTargetImportName = args.createstub;
     }
@@ -457,6 +506,10 @@ async function processArgs(): Promise<ExitStatus> {
 
     const serviceProvider = createServiceProvider(fileSystem, output, tempFile);
 
+    if (args.tracefile) {
+        performanceTrace.start(toolName);
+    }
+
     // The package type verification uses a different path.
     if (args['verifytypes'] !== undefined) {
         return verifyPackageTypes(
@@ -625,6 +678,7 @@ async function runSingleThreaded(
                 ? 0
                 : outputResults(args, options, results, service, minSeverityLevel, output);
 
+        writeTraceFile(args, output);
         checkForErrors(exitStatus, output);
 
         if (args.createstub) {
@@ -707,113 +761,31 @@ async function runMultiThreaded(
     const startTime = Date.now();
     const exitStatus = createDeferred<ExitStatus>();
 
-    // Specify that only open files should be checked. This will allow us
-    // to control which files are checked by which workers.
-    options.languageServerSettings.checkOnlyOpenFiles = true;
-
-    // This will trigger discovery of files in the project.
-    service.setOptions(options);
-    service.enumerateSourceFiles(0);
-    const program = service.backgroundAnalysisProgram.program;
-
-    // Get the list of "tracked" source files -- those that will be type checked.
-    const sourceFilesToAnalyze = program.getSourceFileInfoList().filter((info) => info.isTracked);
-
-    // Don't create more workers than there are files.
-    const workerCount = Math.min(maxThreadCount, sourceFilesToAnalyze.length);
-
-    // Split the source files into affinity queues, one for each worker. We assume
-    // that files that are next to each other in the directory hierarchy probably
-    // have more common imports, so we want to analyze them with the same worker
-    // if possible to maximize type cache hits.
-    const affinityQueues: SourceFileInfo[][] = new Array<SourceFileInfo[]>(workerCount);
-    const filesPerAffinityQueue = sourceFilesToAnalyze.length / workerCount;
-
-    for (let i = 0; i < sourceFilesToAnalyze.length; i++) {
-        const affinityIndex = Math.floor(i / filesPerAffinityQueue);
-        if (affinityQueues[affinityIndex] === undefined) {
-            affinityQueues[affinityIndex] = [];
-        }
-
-        affinityQueues[affinityIndex].push(sourceFilesToAnalyze[i]);
-    }
-
-    output.info(`Found ${sourceFilesToAnalyze.length} files to analyze`);
-    output.info(`Using ${workerCount} threads`);
-
-    const fileDiagnostics: FileDiagnostics[] = [];
-    let pendingAnalysisCount = 0;
-
     const sendMessageToWorker = (worker: ChildProcess, message: string, data: any) => {
         worker.send(JSON.stringify({ action: message, data: data }));
     };
 
-    const analyzeNextFile = (workerIndex: number) => {
-        const worker = workers[workerIndex];
-        let nextFileToAnalyze: SourceFileInfo | undefined;
-
-        // Determine the next file to analyze for this worker.
-        for (let i = 0; i < affinityQueues.length; i++) {
-            const affinityIndex = (workerIndex + i) % affinityQueues.length;
-            if (affinityQueues[affinityIndex].length > 0) {
-                nextFileToAnalyze = affinityQueues[affinityIndex].shift()!;
-                break;
-            }
-        }
-
-        if (nextFileToAnalyze) {
-            // Tell the worker to analyze the next file.
-            const fileUri = nextFileToAnalyze.uri.toString();
-
-            sendMessageToWorker(worker, 'analyzeFile', fileUri);
-
-            pendingAnalysisCount++;
-        } else {
-            // Kill the worker since there's nothing left to do.
-            workersShutdown.add(worker);
-            worker.kill();
-
-            if (pendingAnalysisCount === 0) {
-                // If there are no more files to analyze and all pending analysis
-                // is complete, report the results and exit.
-                if (!exitStatus.resolved) {
-                    const elapsedTime = (Date.now() - startTime) / 1000;
-                    const errorCount = outputResults(
-                        args,
-                        options,
-                        { diagnostics: fileDiagnostics, filesInProgram: sourceFilesToAnalyze.length, elapsedTime },
-                        service,
-                        minSeverityLevel,
-                        output
-                    );
-                    if (!args.outputjson) {
-                        // Print the total time.
-                        output.info(`Completed in ${elapsedTime}sec`);
-                    }
-
-                    exitStatus.resolve(errorCount > 0 ? ExitStatus.ErrorsReported : ExitStatus.NoErrors);
-                }
-            }
-        }
-    };
-
-    // Launch worker processes.
-    for (let i = 0; i < workerCount; i++) {
+    // Launches a worker process. The message handler refers to state that's
+    // initialized once the files in the project have been enumerated, but
+    // the worker doesn't send any messages until it's given a batch of files.
+    function launchWorker(i: number) {
         const mainModulePath = process.mainModule!.filename;
 
         // Ensure forked processes use the temp folder owned by the main process.
         // This allows for automatic deletion when the main process exits.
-        const worker = fork(mainModulePath, [
-            'worker',
-            i.toString(),
-            service.serviceProvider.get(ServiceKeys.tempFile).tmpdir().getFilePath(),
-        ]);
+        // Use "advanced" serialization so the diagnostics sent back by the worker
+        // are transferred as binary data rather than JSON.
+        const worker = fork(
+            mainModulePath,
+            ['worker', i.toString(), service.serviceProvider.get(ServiceKeys.tempFile).tmpdir().getFilePath()],
+            { serialization: 'advanced' }
+        );
 
         worker.on('message', (message) => {
             let messageObj: any;
 
             try {
-                messageObj = JSON.parse(message as string);
+                messageObj = typeof message === 'string' ? JSON.parse(message) : message;
             } catch {
                 output.error(`Invalid message from worker: ${message}`);
                 exitStatus.resolve(ExitStatus.FatalError);
@@ -836,11 +808,21 @@ async function runMultiThreaded(
                         return;
                     }
 
-                    for (const fileDiag of results.diagnostics) {
-                        fileDiagnostics.push(FileDiagnostics.fromJsonObj(fileDiag));
+                    appendArray(fileDiagnostics, decodeFileDiagnostics(messageObj.data.diagnostics));
+
+                    if (messageObj.data.traceEvents) {
+                        performanceTrace.addEvents(messageObj.data.traceEvents as TraceEventBatch);
+                    }
+
+                    if (args.verbose && !args.outputjson) {
+                        const batchTime = messageObj.data.batchTime as WorkerBatchTime;
+                        output.info(
+                            `Thread ${i} analyzed ${pluralize(batchTime.fileCount, 'file')} in ` +
+                                `${batchTime.totalTime}sec (${batchTime.analysisTime}sec in analysis)`
+                        );
                     }
 
-                    analyzeNextFile(i);
+                    analyzeNextBatch(i);
                     checkForErrors(exitStatus, console);
                     break;
                 }
@@ -867,11 +849,126 @@ async function runMultiThreaded(
             exitStatus.resolve(ExitStatus.FatalError);
         });
 
+        // Start the trace before setting the options so the warm-up is recorded.
+        if (performanceTrace.isEnabled) {
+            sendMessageToWorker(worker, 'startTrace', undefined);
+        }
+
         sendMessageToWorker(worker, 'setOptions', options);
-        workers.push(worker);
+        return worker;
+    }
+
+    // Specify that only open files should be checked. This will allow us
+    // to control which files are checked by which workers.
+    options.languageServerSettings.checkOnlyOpenFiles = true;
 
-        // Tell the worker to analyze the next file.
-        analyzeNextFile(i);
+    // Launch the workers before discovering the files in the project. Each worker
+    // needs to parse and bind the builtins and other commonly-used stdlib stubs
+    // before it can do any useful work, so let it do that while we enumerate.
+    for (let i = 0; i < maxThreadCount; i++) {
+        workers.push(launchWorker(i));
+    }
+
+    // This will trigger discovery of files in the project.
+    service.setOptions(options);
+    service.enumerateSourceFiles(0);
+    const program = service.backgroundAnalysisProgram.program;
+
+    // Get the list of "tracked" source files -- those that will be type checked.
+    const sourceFilesToAnalyze = program.getSourceFileInfoList().filter((info) => info.isTracked);
+
+    // Don't use more workers than there are files.
+    const workerCount = Math.min(maxThreadCount, sourceFilesToAnalyze.length);
+    for (const worker of workers.splice(workerCount)) {
+        workersShutdown.add(worker);
+        worker.kill();
+    }
+
+    // Distribute the files across the workers. Files in the same directory (or that
+    // import each other, if that's already known) probably have more common imports,
+    // so we want to analyze them with the same worker if possible to maximize type
+    // cache hits. The file size is used as a rough estimate of the cost of checking it.
+    const scheduler = new FileScheduler(
+        sourceFilesToAnalyze.map((info) => ({
+            key: info.uri.key,
+            item: info,
+            cost: tryStat(service.fs, info.uri)?.size ?? 0,
+            clusterKey: info.uri.getDirectory().key,
+            dependencies: info.imports.map((importInfo) => importInfo.uri.key),
+        })),
+        workerCount
+    );
+
+    output.info(`Found ${sourceFilesToAnalyze.length} files to analyze`);
+    output.info(`Using ${workerCount} threads`);
+
+    const fileDiagnostics: FileDiagnostics[] = [];
+    let pendingAnalysisCount = 0;
+    let batchCount = 0;
+
+    const analyzeNextBatch = (workerIndex: number) => {
+        const worker = workers[workerIndex];
+
+        // Send files to the worker in batches to amortize the per-message overhead.
+        // The batches shrink as the remaining work shrinks so the workers still
+        // finish at about the same time.
+        const batchSize = Math.max(
+            1,
+            Math.min(maxFilesPerWorkerBatch, Math.floor(scheduler.remainingFileCount / (workerCount * 4)))
+        );
+
+        const fileUris: string[] = [];
+        while (fileUris.length < batchSize) {
+            const nextFileToAnalyze = scheduler.next(workerIndex);
+            if (!nextFileToAnalyze) {
+                break;
+            }
+
+            fileUris.push(nextFileToAnalyze.uri.toString());
+        }
+
+        if (fileUris.length > 0) {
+            // Tell the worker to analyze the next batch of files.
+            sendMessageToWorker(worker, 'analyzeFiles', fileUris);
+
+            pendingAnalysisCount++;
+            batchCount++;
+        } else {
+            // Kill the worker since there's nothing left to do.
+            workersShutdown.add(worker);
+            worker.kill();
+
+            if (pendingAnalysisCount === 0) {
+                // If there are no more files to analyze and all pending analysis
+                // is complete, report the results and exit.
+                if (!exitStatus.resolved) {
+                    const elapsedTime = (Date.now() - startTime) / 1000;
+                    const errorCount = outputResults(
+                        args,
+                        options,
+                        { diagnostics: fileDiagnostics, filesInProgram: sourceFilesToAnalyze.length, elapsedTime },
+                        service,
+                        minSeverityLevel,
+                        output
+                    );
+                    if (!args.outputjson) {
+                        // Print the total time.
+                        output.info(`Completed in ${elapsedTime}sec`);
+                        output.info(`Files moved between threads: ${scheduler.stealCount}`);
+                        output.info(`Batches sent to threads: ${batchCount}`);
+                    }
+
+                    writeTraceFile(args, output);
+
+                    exitStatus.resolve(errorCount > 0 ? ExitStatus.ErrorsReported : ExitStatus.NoErrors);
+                }
+            }
+        }
+    };
+
+    // Tell each worker to analyze its first batch of files.
+    for (let i = 0; i < workerCount; i++) {
+        analyzeNextBatch(i);
     }
 
     return await exitStatus.promise;
@@ -883,10 +980,12 @@ function runWorkerMessageLoop(workerNum: number, tempFolderName: string) {
     let serviceProvider: ServiceProvider | undefined;
     let service: AnalyzerService | undefined;
     let fileSystem: PyrightFileSystem | undefined;
-    let lastOpenFileUri: Uri | undefined;
+    let pendingBatch: { fileUris: Set<string>; duration: Duration } | undefined;
 
+    // Messages to the parent are sent as objects rather than JSON strings so
+    // the packed diagnostics are transferred in binary form.
     const sendMessageToParent = (message: string, data: any) => {
-        process.send?.(JSON.stringify({ action: message, data: data }));
+        process.send?.({ action: message, data: data });
     };
 
     process.on('message', (message) => {
@@ -900,6 +999,11 @@ function runWorkerMessageLoop(workerNum: number, tempFolderName: string) {
         }
 
         switch (messageObj.action) {
+            case 'startTrace': {
+                performanceTrace.start(`worker ${workerNum}`);
+                break;
+            }
+
             case 'setOptions': {
                 const options = new PyrightCommandLineOptions(process.cwd(), false);
 
@@ -928,42 +1032,79 @@ function runWorkerMessageLoop(workerNum: number, tempFolderName: string) {
                 });
 
                 service.setCompletionCallback((results) => {
-                    // We're interested only in diagnostics for the last open file.
+                    // Don't report the results of the warm-up pass. The parent
+                    // isn't waiting for them.
+                    const batch = pendingBatch;
+                    if (!batch && !results.fatalErrorOccurred) {
+                        return;
+                    }
+
+                    // We're interested only in diagnostics for the files in the current batch.
                     const fileDiags = results.diagnostics.filter((fileDiag) =>
-                        fileDiag.fileUri.equals(lastOpenFileUri)
+                        batch?.fileUris.has(fileDiag.fileUri.key)
                     );
 
-                    // Convert JSON-compatible format.
+                    const batchTime: WorkerBatchTime = {
+                        fileCount: batch?.fileUris.size ?? 0,
+                        analysisTime: results.elapsedTime,
+                        totalTime: batch?.duration.getDurationInSeconds() ?? 0,
+                    };
+                    pendingBatch = undefined;
+
+                    // Convert to the compact format used for transport. The trace events
+                    // recorded since the last batch (including the warm-up) are sent
+                    // along with the results.
                     const resultsObj = {
                         ...results,
-                        diagnostics: fileDiags.map((fileDiag) => FileDiagnostics.toJsonObj(fileDiag)),
+                        diagnostics: encodeFileDiagnostics(fileDiags),
+                        batchTime,
+                        traceEvents: performanceTrace.isEnabled ? performanceTrace.takeEvents() : undefined,
                     };
 
                     sendMessageToParent('analysisResults', resultsObj);
                 });
 
                 service.setOptions(options);
+
+                // Warm up the worker while the parent is still looking for files to
+                // analyze by opening an in-memory file that imports the modules
+                // almost every file depends on. This parses and binds the builtins
+                // chain and the stubs for these modules.
+                const warmUpFileUri = service.backgroundAnalysisProgram.configOptions.projectRoot.combinePaths(
+                    workerWarmUpFileName
+                );
+                if (!fileSystem.existsSync(warmUpFileUri)) {
+                    service.setFileOpened(warmUpFileUri, /* version */ 1, workerWarmUpFileContents);
+                }
                 break;
             }
 
-            case 'analyzeFile': {
+            case 'analyzeFiles': {
                 if (serviceProvider && fileSystem && service) {
-                    const uri = Uri.parse(messageObj.data as string, serviceProvider);
-
-                    // Check the file's length before attempting to read its full contents.
-                    const fileStat = fileSystem.statSync(uri);
-                    if (fileStat.size > maxSourceFileSize) {
-                        console.error(
-                            `File length of "${uri}" is ${fileStat.size} ` +
-                                `which exceeds the maximum supported file size of ${maxSourceFileSize}`
-                        );
-                        throw new Error('File larger than max');
+                    const batch = { fileUris: new Set<string>(), duration: new Duration() };
+
+                    // Open all of the files in the batch before analysis starts so
+                    // they're checked in a single analysis pass.
+                    for (const fileUriString of messageObj.data as string[]) {
+                        const uri = Uri.parse(fileUriString, serviceProvider);
+
+                        // Check the file's length before attempting to read its full contents.
+                        const fileStat = fileSystem.statSync(uri);
+                        if (fileStat.size > maxSourceFileSize) {
+                            console.error(
+                                `File length of "${uri}" is ${fileStat.size} ` +
+                                    `which exceeds the maximum supported file size of ${maxSourceFileSize}`
+                            );
+                            throw new Error('File larger than max');
+                        }
+
+                        const fileContents = fileSystem.readFileSync(uri, 'utf8');
+
+                        batch.fileUris.add(uri.key);
+                        service.setFileOpened(uri, /* version */ 1, fileContents);
                     }
 
-                    const fileContents = fileSystem.readFileSync(uri, 'utf8');
-
-                    lastOpenFileUri = uri;
-                    service?.setFileOpened(uri, /* version */ 1, fileContents);
+                    pendingBatch = batch;
                 }
                 break;
             }
@@ -971,6 +1112,19 @@ function runWorkerMessageLoop(workerNum: number, tempFolderName: string) {
     });
 }
 
+// Writes the performance trace recorded so far if one was requested.
+function writeTraceFile(args: CommandLineOptions, output: ConsoleInterface) {
+    if (!args.tracefile) {
+        return;
+    }
+
+    try {
+        writeFileSync(args.tracefile, performanceTrace.serialize());
+    } catch (err) {
+        output.error(`Failed to write trace file '${args.tracefile}': ${err}`);
+    }
+}
+
 function verifyPackageTypes(
     serviceProvider: ServiceProvider,
     packageName: string,
@@ -1253,6 +1407,7 @@ function printUsage() {
             toolName +
             ' [options] files...\n' +
             '  Options:\n' +
+            '  --cachedir <DIRECTORY>             Reuse results for unchanged files from this directory\n' +
             '  --createstub <IMPORT>              Create type stub file(s) for import\n' +
             '  --dependencies                     Emit import dependency information\n' +
             '  -h,--help                          Show this help message\n' +
@@ -1267,9 +1422,10 @@ function printUsage() {
             '  --pythonpath <FILE>                Path to the Python interpreter\n' +
             '  --pythonversion <VERSION>          Analyze for a specific version (3.3, 3.4, etc.)\n' +
             '  --skipunannotated                  Skip analysis of functions with no type annotations\n' +
-            '  --stats                            Print detailed performance stats\n' +
+            '  --stats                            Print detailed performance and memory usage stats\n' +
             '  -t,--typeshedpath <DIRECTORY>      Use typeshed type stubs at this location\n' +
             '  --threads <optional COUNT>         Use separate threads to parallelize type checking \n' +
+            '  --tracefile <FILE>                 Write a performance trace in Chrome trace event format\n' +
             '  -v,--venvpath <DIRECTORY>          Directory that contains virtual environments\n' +
             '  --verbose                          Emit verbose diagnostics\n' +
             '  --verifytypes <PACKAGE>            Verify type completeness of a py.typed package\n' +
@@ -25,7 +25,7 @@ import { serverBaselineModes, ServerBaselineMode } from './baseline';
 import { CommandController } from './commands/commandController';
 import { ConfigOptions, SignatureDisplayType } from './common/configOptions';
 import { ConsoleWithLogLevel, LogLevel, convertLogLevel } from './common/console';
-import { isDefined, isString } from './common/core';
+import { isDefined, isNumber, isString } from './common/core';
 import { resolvePathWithEnvVariables } from './common/envVarUtils';
 import { FileSystem, TempFile } from './common/fileSystem';
 import { Host } from './common/host';
@@ -101,7 +101,12 @@ export abstract class RealLanguageServer extends LanguageServerBase {
                 supportedCodeActions: [CodeActionKind.QuickFix, CodeActionKind.SourceOrganizeImports],
                 // TODO: all the other commands are registered in the vscode extension because they seem to have client side logic
                 // for some reason
-                supportedCommands: [Commands.createTypeStub, Commands.restartServer, Commands.writeBaseline],
+                supportedCommands: [
+                    Commands.createTypeStub,
+                    Commands.restartServer,
+                    Commands.writeBaseline,
+                    Commands.dumpMemoryStats,
+                ],
             },
             connection
         );
@@ -178,6 +183,16 @@ export abstract class RealLanguageServer extends LanguageServerBase {
                     serverSettings.baselineMode = baselineMode as ServerBaselineMode;
                 }
 
+                const traceFile = pythonAnalysisSection.traceFile;
+                if (traceFile && isString(traceFile)) {
+                    serverSettings.traceFile = resolvePathWithEnvVariables(workspace, traceFile, workspaces);
+                }
+
+                const memoryBudgetMB = pythonAnalysisSection.memoryBudgetMB;
+                if (isNumber(memoryBudgetMB) && memoryBudgetMB > 0) {
+                    serverSettings.memoryBudgetMB = memoryBudgetMB;
+                }
+
                 const configFilePath = pythonAnalysisSection.configFilePath;
                 if (configFilePath && isString(configFilePath)) {
                     serverSettings.configFilePath = resolvePathWithEnvVariables(workspace, configFilePath, workspaces);
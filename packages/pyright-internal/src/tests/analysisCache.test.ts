@@ -0,0 +1,109 @@
+/*
+ * analysisCache.test.ts
+ *
+ * Tests for the persistent on-disk analysis cache used by the "--cachedir" CLI option.
+ */
+
+import assert from 'assert';
+
+import { ImportResolver } from '../analyzer/importResolver';
+import { Program } from '../analyzer/program';
+import { ConfigOptions } from '../common/configOptions';
+import { DiagnosticCategory } from '../common/diagnostic';
+import { getDirectoryPath, normalizeSlashes } from '../common/pathUtils';
+import { createServiceProvider } from '../common/serviceProviderExtensions';
+import { UriEx } from '../common/uri/uriUtils';
+import { PyrightFileSystem } from '../pyrightFileSystem';
+import { TestAccessHost } from './harness/testAccessHost';
+import { TestFileSystem } from './harness/vfs/filesystem';
+
+const mainPath = '/main.py';
+const helperPath = '/helper.py';
+
+function createTestFileSystem(files: { path: string; content: string }[]): TestFileSystem {
+    const fs = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+
+    for (const file of files) {
+        const path = normalizeSlashes(file.path);
+        fs.mkdirpSync(getDirectoryPath(path));
+        fs.writeFileSync(UriEx.file(path), file.content);
+    }
+
+    return fs;
+}
+
+function analyzeWithCache(testFS: TestFileSystem, reportedPath = mainPath) {
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    configOptions.analysisCacheDir = UriEx.file('/.cache');
+
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+    program.setTrackedFiles([UriEx.file(helperPath), UriEx.file(mainPath)]);
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    const sourceFile = program.getSourceFile(UriEx.file(reportedPath));
+    assert(sourceFile);
+
+    return {
+        checkTime: sourceFile.getCheckTime(),
+        errors: sourceFile
+            .getDiagnostics(configOptions)
+            .filter((diag) => diag.category === DiagnosticCategory.Error)
+            .map((diag) => diag.message),
+    };
+}
+
+describe('analysis cache', () => {
+    test('unchanged files are restored from the cache', () => {
+        const testFS = createTestFileSystem([
+            { path: helperPath, content: 'def helper() -> int: ...' },
+            { path: mainPath, content: 'from helper import helper\nx: str = helper()' },
+        ]);
+
+        const firstRun = analyzeWithCache(testFS);
+        assert.strictEqual(firstRun.errors.length, 1);
+        assert.notStrictEqual(firstRun.checkTime, undefined);
+        assert(testFS.readdirSync(UriEx.file('/.cache')).length > 0);
+
+        const secondRun = analyzeWithCache(testFS);
+        assert.deepStrictEqual(secondRun.errors, firstRun.errors);
+        assert.strictEqual(secondRun.checkTime, undefined);
+    });
+
+    test('files are re-checked when a dependency changes', () => {
+        const testFS = createTestFileSystem([
+            { path: helperPath, content: 'def helper() -> int: ...' },
+            { path: mainPath, content: 'from helper import helper\nx: str = helper()' },
+        ]);
+
+        assert.strictEqual(analyzeWithCache(testFS).errors.length, 1);
+
+        testFS.writeFileSync(UriEx.file(helperPath), 'def helper() -> str: ...');
+
+        const secondRun = analyzeWithCache(testFS);
+        assert.strictEqual(secondRun.errors.length, 0);
+        assert.notStrictEqual(secondRun.checkTime, undefined);
+    });
+
+    test('restored diagnostics survive when an importer is checked', () => {
+        const testFS = createTestFileSystem([
+            { path: helperPath, content: 'def helper() -> int: ...\ny: int = ""' },
+            { path: mainPath, content: 'from helper import helper\nx: str = helper()' },
+        ]);
+
+        const firstRun = analyzeWithCache(testFS, helperPath);
+        assert.strictEqual(firstRun.errors.length, 1);
+
+        // The helper is restored from the cache, but it's bound again when the
+        // edited importer is checked.
+        testFS.writeFileSync(UriEx.file(mainPath), 'from helper import helper\nx: int = helper()');
+
+        const secondRun = analyzeWithCache(testFS, helperPath);
+        assert.deepStrictEqual(secondRun.errors, firstRun.errors);
+        assert.strictEqual(secondRun.checkTime, undefined);
+    });
+});
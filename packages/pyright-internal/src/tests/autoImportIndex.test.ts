@@ -0,0 +1,125 @@
+/*
+ * autoImportIndex.test.ts
+ *
+ * Unit tests for the persistent index of the names offered for auto-import.
+ */
+
+import assert from 'assert';
+import { CancellationToken } from 'vscode-languageserver';
+
+import { ImportResolver } from '../analyzer/importResolver';
+import { Program } from '../analyzer/program';
+import { ConfigOptions } from '../common/configOptions';
+import { normalizeSlashes } from '../common/pathUtils';
+import { createServiceProvider } from '../common/serviceProviderExtensions';
+import { UriEx } from '../common/uri/uriUtils';
+import { AutoImportIndex } from '../languageService/autoImportIndex';
+import { buildModuleSymbolsMap } from '../languageService/autoImporter';
+import { PyrightFileSystem } from '../pyrightFileSystem';
+import { TestAccessHost } from './harness/testAccessHost';
+import { TestFileSystem } from './harness/vfs/filesystem';
+
+const fileUri = UriEx.file('/src/shapes.py');
+const cacheDir = UriEx.file('/cache');
+
+function createProgram(testFS: TestFileSystem) {
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    configOptions.analysisCacheDir = cacheDir;
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+    program.setTrackedFiles([fileUri]);
+    return program;
+}
+
+function getModuleSymbolTable(program: Program) {
+    const moduleSymbolMap = buildModuleSymbolsMap(program, program.getSourceFileInfoList(), CancellationToken.None, {
+        bindUnboundUserCode: true,
+    });
+    return moduleSymbolMap.get(fileUri.key)!;
+}
+
+// Returns the names declared in the file, leaving out implicit module attributes like "__doc__".
+function getDeclaredNames(names: Iterable<string> | undefined) {
+    return names ? [...names].filter((name) => !name.startsWith('__')) : undefined;
+}
+
+function getSymbolNames(program: Program) {
+    return getDeclaredNames([...getModuleSymbolTable(program).getSymbols()].map((autoSymbol) => autoSymbol.name));
+}
+
+function createFileSystem() {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    testFS.mkdirpSync(fileUri.getDirectory().getFilePath());
+    testFS.writeFileSync(fileUri, 'import os\n\nclass Circle: ...\n\ndef make_circle(): ...\n');
+    return testFS;
+}
+
+test('indexes the names offered for auto-import', () => {
+    const program = createProgram(createFileSystem());
+
+    assert.strictEqual(getModuleSymbolTable(program).symbolNames, undefined);
+    assert.deepStrictEqual(getSymbolNames(program), ['Circle', 'make_circle']);
+    assert.deepStrictEqual(getDeclaredNames(getModuleSymbolTable(program).symbolNames), ['Circle', 'make_circle']);
+    assert.deepStrictEqual(getSymbolNames(program), ['Circle', 'make_circle']);
+
+    program.dispose();
+});
+
+test('reindexes files that changed', () => {
+    const program = createProgram(createFileSystem());
+    const index = AutoImportIndex.get(program);
+
+    getSymbolNames(program);
+    assert(index.getSymbolNames(program.getSourceFileInfo(fileUri)!));
+
+    program.setFileOpened(fileUri, /* version */ 1, 'class Square: ...\n');
+    program.markFilesDirty([fileUri], /* evenIfContentsAreSame */ true);
+    assert(!index.getSymbolNames(program.getSourceFileInfo(fileUri)!));
+
+    assert.deepStrictEqual(getSymbolNames(program), ['Square']);
+    assert.deepStrictEqual(getDeclaredNames(getModuleSymbolTable(program).symbolNames), ['Square']);
+
+    program.dispose();
+});
+
+test('does not index files whose names can come from other modules', () => {
+    const contentsList = [
+        'from os.path import *\n\nclass Circle: ...\n',
+        "__all__ = ['Circle']\n\nclass Circle: ...\n",
+    ];
+    for (const contents of contentsList) {
+        const testFS = createFileSystem();
+        testFS.writeFileSync(fileUri, contents);
+        const program = createProgram(testFS);
+
+        getSymbolNames(program);
+        assert.strictEqual(getModuleSymbolTable(program).symbolNames, undefined);
+        assert(!AutoImportIndex.get(program).getSymbolNames(program.getSourceFileInfo(fileUri)!));
+
+        program.dispose();
+    }
+});
+
+test('reuses the saved index after a restart without binding', () => {
+    const testFS = createFileSystem();
+    const program1 = createProgram(testFS);
+    getSymbolNames(program1);
+    program1.dispose();
+
+    const program2 = createProgram(testFS);
+    const moduleSymbolTable = getModuleSymbolTable(program2);
+    assert.deepStrictEqual(getDeclaredNames(moduleSymbolTable.symbolNames), ['Circle', 'make_circle']);
+    assert(!program2.getSourceFile(fileUri)!.getParseResults());
+
+    const names = [...moduleSymbolTable.getSymbols()].map((autoSymbol) => autoSymbol.name);
+    assert.deepStrictEqual(getDeclaredNames(names), ['Circle', 'make_circle']);
+    assert(program2.getModuleSymbolTable(fileUri));
+    program2.dispose();
+
+    testFS.writeFileSync(fileUri, 'class Square: ...\n');
+    const program3 = createProgram(testFS);
+    assert.strictEqual(getModuleSymbolTable(program3).symbolNames, undefined);
+    assert.deepStrictEqual(getSymbolNames(program3), ['Square']);
+    program3.dispose();
+});
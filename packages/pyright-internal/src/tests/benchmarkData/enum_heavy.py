@@ -0,0 +1,1159 @@
+# enum_heavy.py — large enums
+# Stresses enum class synthesis and literal math: enums with hundreds of
+# members, Flag combinations, members with complex values, exhaustive
+# narrowing over enum literals and iteration over enum classes.
+
+from __future__ import annotations
+
+import enum
+from enum import Enum, Flag, IntEnum, StrEnum, auto
+from typing import Literal, assert_never
+
+
+class Opcode(IntEnum):
+    OP_0 = 0
+    OP_1 = 1
+    OP_2 = 2
+    OP_3 = 3
+    OP_4 = 4
+    OP_5 = 5
+    OP_6 = 6
+    OP_7 = 7
+    OP_8 = 8
+    OP_9 = 9
+    OP_10 = 10
+    OP_11 = 11
+    OP_12 = 12
+    OP_13 = 13
+    OP_14 = 14
+    OP_15 = 15
+    OP_16 = 16
+    OP_17 = 17
+    OP_18 = 18
+    OP_19 = 19
+    OP_20 = 20
+    OP_21 = 21
+    OP_22 = 22
+    OP_23 = 23
+    OP_24 = 24
+    OP_25 = 25
+    OP_26 = 26
+    OP_27 = 27
+    OP_28 = 28
+    OP_29 = 29
+    OP_30 = 30
+    OP_31 = 31
+    OP_32 = 32
+    OP_33 = 33
+    OP_34 = 34
+    OP_35 = 35
+    OP_36 = 36
+    OP_37 = 37
+    OP_38 = 38
+    OP_39 = 39
+    OP_40 = 40
+    OP_41 = 41
+    OP_42 = 42
+    OP_43 = 43
+    OP_44 = 44
+    OP_45 = 45
+    OP_46 = 46
+    OP_47 = 47
+    OP_48 = 48
+    OP_49 = 49
+    OP_50 = 50
+    OP_51 = 51
+    OP_52 = 52
+    OP_53 = 53
+    OP_54 = 54
+    OP_55 = 55
+    OP_56 = 56
+    OP_57 = 57
+    OP_58 = 58
+    OP_59 = 59
+    OP_60 = 60
+    OP_61 = 61
+    OP_62 = 62
+    OP_63 = 63
+    OP_64 = 64
+    OP_65 = 65
+    OP_66 = 66
+    OP_67 = 67
+    OP_68 = 68
+    OP_69 = 69
+    OP_70 = 70
+    OP_71 = 71
+    OP_72 = 72
+    OP_73 = 73
+    OP_74 = 74
+    OP_75 = 75
+    OP_76 = 76
+    OP_77 = 77
+    OP_78 = 78
+    OP_79 = 79
+    OP_80 = 80
+    OP_81 = 81
+    OP_82 = 82
+    OP_83 = 83
+    OP_84 = 84
+    OP_85 = 85
+    OP_86 = 86
+    OP_87 = 87
+    OP_88 = 88
+    OP_89 = 89
+    OP_90 = 90
+    OP_91 = 91
+    OP_92 = 92
+    OP_93 = 93
+    OP_94 = 94
+    OP_95 = 95
+    OP_96 = 96
+    OP_97 = 97
+    OP_98 = 98
+    OP_99 = 99
+    OP_100 = 100
+    OP_101 = 101
+    OP_102 = 102
+    OP_103 = 103
+    OP_104 = 104
+    OP_105 = 105
+    OP_106 = 106
+    OP_107 = 107
+    OP_108 = 108
+    OP_109 = 109
+    OP_110 = 110
+    OP_111 = 111
+    OP_112 = 112
+    OP_113 = 113
+    OP_114 = 114
+    OP_115 = 115
+    OP_116 = 116
+    OP_117 = 117
+    OP_118 = 118
+    OP_119 = 119
+    OP_120 = 120
+    OP_121 = 121
+    OP_122 = 122
+    OP_123 = 123
+    OP_124 = 124
+    OP_125 = 125
+    OP_126 = 126
+    OP_127 = 127
+    OP_128 = 128
+    OP_129 = 129
+    OP_130 = 130
+    OP_131 = 131
+    OP_132 = 132
+    OP_133 = 133
+    OP_134 = 134
+    OP_135 = 135
+    OP_136 = 136
+    OP_137 = 137
+    OP_138 = 138
+    OP_139 = 139
+    OP_140 = 140
+    OP_141 = 141
+    OP_142 = 142
+    OP_143 = 143
+    OP_144 = 144
+    OP_145 = 145
+    OP_146 = 146
+    OP_147 = 147
+    OP_148 = 148
+    OP_149 = 149
+    OP_150 = 150
+    OP_151 = 151
+    OP_152 = 152
+    OP_153 = 153
+    OP_154 = 154
+    OP_155 = 155
+    OP_156 = 156
+    OP_157 = 157
+    OP_158 = 158
+    OP_159 = 159
+    OP_160 = 160
+    OP_161 = 161
+    OP_162 = 162
+    OP_163 = 163
+    OP_164 = 164
+    OP_165 = 165
+    OP_166 = 166
+    OP_167 = 167
+    OP_168 = 168
+    OP_169 = 169
+    OP_170 = 170
+    OP_171 = 171
+    OP_172 = 172
+    OP_173 = 173
+    OP_174 = 174
+    OP_175 = 175
+    OP_176 = 176
+    OP_177 = 177
+    OP_178 = 178
+    OP_179 = 179
+    OP_180 = 180
+    OP_181 = 181
+    OP_182 = 182
+    OP_183 = 183
+    OP_184 = 184
+    OP_185 = 185
+    OP_186 = 186
+    OP_187 = 187
+    OP_188 = 188
+    OP_189 = 189
+    OP_190 = 190
+    OP_191 = 191
+    OP_192 = 192
+    OP_193 = 193
+    OP_194 = 194
+    OP_195 = 195
+    OP_196 = 196
+    OP_197 = 197
+    OP_198 = 198
+    OP_199 = 199
+
+
+class Token(StrEnum):
+    TOKEN_0 = auto()
+    TOKEN_1 = auto()
+    TOKEN_2 = auto()
+    TOKEN_3 = auto()
+    TOKEN_4 = auto()
+    TOKEN_5 = auto()
+    TOKEN_6 = auto()
+    TOKEN_7 = auto()
+    TOKEN_8 = auto()
+    TOKEN_9 = auto()
+    TOKEN_10 = auto()
+    TOKEN_11 = auto()
+    TOKEN_12 = auto()
+    TOKEN_13 = auto()
+    TOKEN_14 = auto()
+    TOKEN_15 = auto()
+    TOKEN_16 = auto()
+    TOKEN_17 = auto()
+    TOKEN_18 = auto()
+    TOKEN_19 = auto()
+    TOKEN_20 = auto()
+    TOKEN_21 = auto()
+    TOKEN_22 = auto()
+    TOKEN_23 = auto()
+    TOKEN_24 = auto()
+    TOKEN_25 = auto()
+    TOKEN_26 = auto()
+    TOKEN_27 = auto()
+    TOKEN_28 = auto()
+    TOKEN_29 = auto()
+    TOKEN_30 = auto()
+    TOKEN_31 = auto()
+    TOKEN_32 = auto()
+    TOKEN_33 = auto()
+    TOKEN_34 = auto()
+    TOKEN_35 = auto()
+    TOKEN_36 = auto()
+    TOKEN_37 = auto()
+    TOKEN_38 = auto()
+    TOKEN_39 = auto()
+    TOKEN_40 = auto()
+    TOKEN_41 = auto()
+    TOKEN_42 = auto()
+    TOKEN_43 = auto()
+    TOKEN_44 = auto()
+    TOKEN_45 = auto()
+    TOKEN_46 = auto()
+    TOKEN_47 = auto()
+    TOKEN_48 = auto()
+    TOKEN_49 = auto()
+    TOKEN_50 = auto()
+    TOKEN_51 = auto()
+    TOKEN_52 = auto()
+    TOKEN_53 = auto()
+    TOKEN_54 = auto()
+    TOKEN_55 = auto()
+    TOKEN_56 = auto()
+    TOKEN_57 = auto()
+    TOKEN_58 = auto()
+    TOKEN_59 = auto()
+    TOKEN_60 = auto()
+    TOKEN_61 = auto()
+    TOKEN_62 = auto()
+    TOKEN_63 = auto()
+    TOKEN_64 = auto()
+    TOKEN_65 = auto()
+    TOKEN_66 = auto()
+    TOKEN_67 = auto()
+    TOKEN_68 = auto()
+    TOKEN_69 = auto()
+    TOKEN_70 = auto()
+    TOKEN_71 = auto()
+    TOKEN_72 = auto()
+    TOKEN_73 = auto()
+    TOKEN_74 = auto()
+    TOKEN_75 = auto()
+    TOKEN_76 = auto()
+    TOKEN_77 = auto()
+    TOKEN_78 = auto()
+    TOKEN_79 = auto()
+    TOKEN_80 = auto()
+    TOKEN_81 = auto()
+    TOKEN_82 = auto()
+    TOKEN_83 = auto()
+    TOKEN_84 = auto()
+    TOKEN_85 = auto()
+    TOKEN_86 = auto()
+    TOKEN_87 = auto()
+    TOKEN_88 = auto()
+    TOKEN_89 = auto()
+    TOKEN_90 = auto()
+    TOKEN_91 = auto()
+    TOKEN_92 = auto()
+    TOKEN_93 = auto()
+    TOKEN_94 = auto()
+    TOKEN_95 = auto()
+    TOKEN_96 = auto()
+    TOKEN_97 = auto()
+    TOKEN_98 = auto()
+    TOKEN_99 = auto()
+    TOKEN_100 = auto()
+    TOKEN_101 = auto()
+    TOKEN_102 = auto()
+    TOKEN_103 = auto()
+    TOKEN_104 = auto()
+    TOKEN_105 = auto()
+    TOKEN_106 = auto()
+    TOKEN_107 = auto()
+    TOKEN_108 = auto()
+    TOKEN_109 = auto()
+    TOKEN_110 = auto()
+    TOKEN_111 = auto()
+    TOKEN_112 = auto()
+    TOKEN_113 = auto()
+    TOKEN_114 = auto()
+    TOKEN_115 = auto()
+    TOKEN_116 = auto()
+    TOKEN_117 = auto()
+    TOKEN_118 = auto()
+    TOKEN_119 = auto()
+    TOKEN_120 = auto()
+    TOKEN_121 = auto()
+    TOKEN_122 = auto()
+    TOKEN_123 = auto()
+    TOKEN_124 = auto()
+    TOKEN_125 = auto()
+    TOKEN_126 = auto()
+    TOKEN_127 = auto()
+    TOKEN_128 = auto()
+    TOKEN_129 = auto()
+    TOKEN_130 = auto()
+    TOKEN_131 = auto()
+    TOKEN_132 = auto()
+    TOKEN_133 = auto()
+    TOKEN_134 = auto()
+    TOKEN_135 = auto()
+    TOKEN_136 = auto()
+    TOKEN_137 = auto()
+    TOKEN_138 = auto()
+    TOKEN_139 = auto()
+    TOKEN_140 = auto()
+    TOKEN_141 = auto()
+    TOKEN_142 = auto()
+    TOKEN_143 = auto()
+    TOKEN_144 = auto()
+    TOKEN_145 = auto()
+    TOKEN_146 = auto()
+    TOKEN_147 = auto()
+    TOKEN_148 = auto()
+    TOKEN_149 = auto()
+    TOKEN_150 = auto()
+    TOKEN_151 = auto()
+    TOKEN_152 = auto()
+    TOKEN_153 = auto()
+    TOKEN_154 = auto()
+    TOKEN_155 = auto()
+    TOKEN_156 = auto()
+    TOKEN_157 = auto()
+    TOKEN_158 = auto()
+    TOKEN_159 = auto()
+    TOKEN_160 = auto()
+    TOKEN_161 = auto()
+    TOKEN_162 = auto()
+    TOKEN_163 = auto()
+    TOKEN_164 = auto()
+    TOKEN_165 = auto()
+    TOKEN_166 = auto()
+    TOKEN_167 = auto()
+    TOKEN_168 = auto()
+    TOKEN_169 = auto()
+    TOKEN_170 = auto()
+    TOKEN_171 = auto()
+    TOKEN_172 = auto()
+    TOKEN_173 = auto()
+    TOKEN_174 = auto()
+    TOKEN_175 = auto()
+    TOKEN_176 = auto()
+    TOKEN_177 = auto()
+    TOKEN_178 = auto()
+    TOKEN_179 = auto()
+    TOKEN_180 = auto()
+    TOKEN_181 = auto()
+    TOKEN_182 = auto()
+    TOKEN_183 = auto()
+    TOKEN_184 = auto()
+    TOKEN_185 = auto()
+    TOKEN_186 = auto()
+    TOKEN_187 = auto()
+    TOKEN_188 = auto()
+    TOKEN_189 = auto()
+    TOKEN_190 = auto()
+    TOKEN_191 = auto()
+    TOKEN_192 = auto()
+    TOKEN_193 = auto()
+    TOKEN_194 = auto()
+    TOKEN_195 = auto()
+    TOKEN_196 = auto()
+    TOKEN_197 = auto()
+    TOKEN_198 = auto()
+    TOKEN_199 = auto()
+
+
+class Permission(Flag):
+    PERM_0 = auto()
+    PERM_1 = auto()
+    PERM_2 = auto()
+    PERM_3 = auto()
+    PERM_4 = auto()
+    PERM_5 = auto()
+    PERM_6 = auto()
+    PERM_7 = auto()
+    PERM_8 = auto()
+    PERM_9 = auto()
+    PERM_10 = auto()
+    PERM_11 = auto()
+    PERM_12 = auto()
+    PERM_13 = auto()
+    PERM_14 = auto()
+    PERM_15 = auto()
+    PERM_16 = auto()
+    PERM_17 = auto()
+    PERM_18 = auto()
+    PERM_19 = auto()
+    PERM_20 = auto()
+    PERM_21 = auto()
+    PERM_22 = auto()
+    PERM_23 = auto()
+    PERM_24 = auto()
+    PERM_25 = auto()
+    PERM_26 = auto()
+    PERM_27 = auto()
+    PERM_28 = auto()
+    PERM_29 = auto()
+    PERM_30 = auto()
+    PERM_31 = auto()
+    READ_ALL = PERM_0 | PERM_4 | PERM_8 | PERM_12 | PERM_16 | PERM_20 | PERM_24 | PERM_28
+    WRITE_ALL = PERM_1 | PERM_5 | PERM_9 | PERM_13 | PERM_17 | PERM_21 | PERM_25 | PERM_29
+
+
+class Planet(Enum):
+    PLANET_0 = (0.0e23, 1.0e6)
+    PLANET_1 = (1.0e23, 2.0e6)
+    PLANET_2 = (2.0e23, 3.0e6)
+    PLANET_3 = (3.0e23, 4.0e6)
+    PLANET_4 = (4.0e23, 5.0e6)
+    PLANET_5 = (5.0e23, 6.0e6)
+    PLANET_6 = (6.0e23, 7.0e6)
+    PLANET_7 = (7.0e23, 8.0e6)
+    PLANET_8 = (8.0e23, 9.0e6)
+    PLANET_9 = (9.0e23, 10.0e6)
+    PLANET_10 = (10.0e23, 11.0e6)
+    PLANET_11 = (11.0e23, 12.0e6)
+    PLANET_12 = (12.0e23, 13.0e6)
+    PLANET_13 = (13.0e23, 14.0e6)
+    PLANET_14 = (14.0e23, 15.0e6)
+    PLANET_15 = (15.0e23, 16.0e6)
+    PLANET_16 = (16.0e23, 17.0e6)
+    PLANET_17 = (17.0e23, 18.0e6)
+    PLANET_18 = (18.0e23, 19.0e6)
+    PLANET_19 = (19.0e23, 20.0e6)
+    PLANET_20 = (20.0e23, 21.0e6)
+    PLANET_21 = (21.0e23, 22.0e6)
+    PLANET_22 = (22.0e23, 23.0e6)
+    PLANET_23 = (23.0e23, 24.0e6)
+    PLANET_24 = (24.0e23, 25.0e6)
+    PLANET_25 = (25.0e23, 26.0e6)
+    PLANET_26 = (26.0e23, 27.0e6)
+    PLANET_27 = (27.0e23, 28.0e6)
+    PLANET_28 = (28.0e23, 29.0e6)
+    PLANET_29 = (29.0e23, 30.0e6)
+    PLANET_30 = (30.0e23, 31.0e6)
+    PLANET_31 = (31.0e23, 32.0e6)
+    PLANET_32 = (32.0e23, 33.0e6)
+    PLANET_33 = (33.0e23, 34.0e6)
+    PLANET_34 = (34.0e23, 35.0e6)
+    PLANET_35 = (35.0e23, 36.0e6)
+    PLANET_36 = (36.0e23, 37.0e6)
+    PLANET_37 = (37.0e23, 38.0e6)
+    PLANET_38 = (38.0e23, 39.0e6)
+    PLANET_39 = (39.0e23, 40.0e6)
+
+    def __init__(self, mass: float, radius: float) -> None:
+        self.mass = mass
+        self.radius = radius
+
+    @property
+    def surface_gravity(self) -> float:
+        return 6.673e-11 * self.mass / (self.radius * self.radius)
+
+
+class Color(Enum):
+    RED = enum.auto()
+    GREEN = enum.auto()
+    BLUE = enum.auto()
+    CYAN = enum.auto()
+    MAGENTA = enum.auto()
+    YELLOW = enum.auto()
+    BLACK = enum.auto()
+    WHITE = enum.auto()
+
+
+def color_name(color: Color) -> str:
+    if color is Color.RED:
+        return "red"
+    elif color is Color.GREEN:
+        return "green"
+    elif color == Color.BLUE:
+        return "blue"
+    elif color in (Color.CYAN, Color.MAGENTA):
+        return "cmy"
+    elif color is Color.YELLOW:
+        return "yellow"
+    elif color is Color.BLACK or color is Color.WHITE:
+        return "mono"
+    else:
+        assert_never(color)
+
+
+
+def execute_0(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_0:
+            return stack[-1] + 0
+        case Opcode.OP_1:
+            return stack[-1] + 1
+        case Opcode.OP_2:
+            return stack[-1] + 2
+        case Opcode.OP_3:
+            return stack[-1] + 3
+        case Opcode.OP_4:
+            return stack[-1] + 4
+        case Opcode.OP_5:
+            return stack[-1] + 5
+        case Opcode.OP_6:
+            return stack[-1] + 6
+        case Opcode.OP_7:
+            return stack[-1] + 7
+        case Opcode.OP_8:
+            return stack[-1] + 8
+        case Opcode.OP_9:
+            return stack[-1] + 9
+        case Opcode.OP_10:
+            return stack[-1] + 10
+        case Opcode.OP_11:
+            return stack[-1] + 11
+        case Opcode.OP_12:
+            return stack[-1] + 12
+        case Opcode.OP_13:
+            return stack[-1] + 13
+        case Opcode.OP_14:
+            return stack[-1] + 14
+        case Opcode.OP_15:
+            return stack[-1] + 15
+        case _:
+            return len(stack)
+
+
+def execute_1(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_16:
+            return stack[-1] + 16
+        case Opcode.OP_17:
+            return stack[-1] + 17
+        case Opcode.OP_18:
+            return stack[-1] + 18
+        case Opcode.OP_19:
+            return stack[-1] + 19
+        case Opcode.OP_20:
+            return stack[-1] + 20
+        case Opcode.OP_21:
+            return stack[-1] + 21
+        case Opcode.OP_22:
+            return stack[-1] + 22
+        case Opcode.OP_23:
+            return stack[-1] + 23
+        case Opcode.OP_24:
+            return stack[-1] + 24
+        case Opcode.OP_25:
+            return stack[-1] + 25
+        case Opcode.OP_26:
+            return stack[-1] + 26
+        case Opcode.OP_27:
+            return stack[-1] + 27
+        case Opcode.OP_28:
+            return stack[-1] + 28
+        case Opcode.OP_29:
+            return stack[-1] + 29
+        case Opcode.OP_30:
+            return stack[-1] + 30
+        case Opcode.OP_31:
+            return stack[-1] + 31
+        case _:
+            return len(stack)
+
+
+def execute_2(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_32:
+            return stack[-1] + 32
+        case Opcode.OP_33:
+            return stack[-1] + 33
+        case Opcode.OP_34:
+            return stack[-1] + 34
+        case Opcode.OP_35:
+            return stack[-1] + 35
+        case Opcode.OP_36:
+            return stack[-1] + 36
+        case Opcode.OP_37:
+            return stack[-1] + 37
+        case Opcode.OP_38:
+            return stack[-1] + 38
+        case Opcode.OP_39:
+            return stack[-1] + 39
+        case Opcode.OP_40:
+            return stack[-1] + 40
+        case Opcode.OP_41:
+            return stack[-1] + 41
+        case Opcode.OP_42:
+            return stack[-1] + 42
+        case Opcode.OP_43:
+            return stack[-1] + 43
+        case Opcode.OP_44:
+            return stack[-1] + 44
+        case Opcode.OP_45:
+            return stack[-1] + 45
+        case Opcode.OP_46:
+            return stack[-1] + 46
+        case Opcode.OP_47:
+            return stack[-1] + 47
+        case _:
+            return len(stack)
+
+
+def execute_3(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_48:
+            return stack[-1] + 48
+        case Opcode.OP_49:
+            return stack[-1] + 49
+        case Opcode.OP_50:
+            return stack[-1] + 50
+        case Opcode.OP_51:
+            return stack[-1] + 51
+        case Opcode.OP_52:
+            return stack[-1] + 52
+        case Opcode.OP_53:
+            return stack[-1] + 53
+        case Opcode.OP_54:
+            return stack[-1] + 54
+        case Opcode.OP_55:
+            return stack[-1] + 55
+        case Opcode.OP_56:
+            return stack[-1] + 56
+        case Opcode.OP_57:
+            return stack[-1] + 57
+        case Opcode.OP_58:
+            return stack[-1] + 58
+        case Opcode.OP_59:
+            return stack[-1] + 59
+        case Opcode.OP_60:
+            return stack[-1] + 60
+        case Opcode.OP_61:
+            return stack[-1] + 61
+        case Opcode.OP_62:
+            return stack[-1] + 62
+        case Opcode.OP_63:
+            return stack[-1] + 63
+        case _:
+            return len(stack)
+
+
+def execute_4(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_64:
+            return stack[-1] + 64
+        case Opcode.OP_65:
+            return stack[-1] + 65
+        case Opcode.OP_66:
+            return stack[-1] + 66
+        case Opcode.OP_67:
+            return stack[-1] + 67
+        case Opcode.OP_68:
+            return stack[-1] + 68
+        case Opcode.OP_69:
+            return stack[-1] + 69
+        case Opcode.OP_70:
+            return stack[-1] + 70
+        case Opcode.OP_71:
+            return stack[-1] + 71
+        case Opcode.OP_72:
+            return stack[-1] + 72
+        case Opcode.OP_73:
+            return stack[-1] + 73
+        case Opcode.OP_74:
+            return stack[-1] + 74
+        case Opcode.OP_75:
+            return stack[-1] + 75
+        case Opcode.OP_76:
+            return stack[-1] + 76
+        case Opcode.OP_77:
+            return stack[-1] + 77
+        case Opcode.OP_78:
+            return stack[-1] + 78
+        case Opcode.OP_79:
+            return stack[-1] + 79
+        case _:
+            return len(stack)
+
+
+def execute_5(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_80:
+            return stack[-1] + 80
+        case Opcode.OP_81:
+            return stack[-1] + 81
+        case Opcode.OP_82:
+            return stack[-1] + 82
+        case Opcode.OP_83:
+            return stack[-1] + 83
+        case Opcode.OP_84:
+            return stack[-1] + 84
+        case Opcode.OP_85:
+            return stack[-1] + 85
+        case Opcode.OP_86:
+            return stack[-1] + 86
+        case Opcode.OP_87:
+            return stack[-1] + 87
+        case Opcode.OP_88:
+            return stack[-1] + 88
+        case Opcode.OP_89:
+            return stack[-1] + 89
+        case Opcode.OP_90:
+            return stack[-1] + 90
+        case Opcode.OP_91:
+            return stack[-1] + 91
+        case Opcode.OP_92:
+            return stack[-1] + 92
+        case Opcode.OP_93:
+            return stack[-1] + 93
+        case Opcode.OP_94:
+            return stack[-1] + 94
+        case Opcode.OP_95:
+            return stack[-1] + 95
+        case _:
+            return len(stack)
+
+
+def execute_6(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_96:
+            return stack[-1] + 96
+        case Opcode.OP_97:
+            return stack[-1] + 97
+        case Opcode.OP_98:
+            return stack[-1] + 98
+        case Opcode.OP_99:
+            return stack[-1] + 99
+        case Opcode.OP_100:
+            return stack[-1] + 100
+        case Opcode.OP_101:
+            return stack[-1] + 101
+        case Opcode.OP_102:
+            return stack[-1] + 102
+        case Opcode.OP_103:
+            return stack[-1] + 103
+        case Opcode.OP_104:
+            return stack[-1] + 104
+        case Opcode.OP_105:
+            return stack[-1] + 105
+        case Opcode.OP_106:
+            return stack[-1] + 106
+        case Opcode.OP_107:
+            return stack[-1] + 107
+        case Opcode.OP_108:
+            return stack[-1] + 108
+        case Opcode.OP_109:
+            return stack[-1] + 109
+        case Opcode.OP_110:
+            return stack[-1] + 110
+        case Opcode.OP_111:
+            return stack[-1] + 111
+        case _:
+            return len(stack)
+
+
+def execute_7(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_112:
+            return stack[-1] + 112
+        case Opcode.OP_113:
+            return stack[-1] + 113
+        case Opcode.OP_114:
+            return stack[-1] + 114
+        case Opcode.OP_115:
+            return stack[-1] + 115
+        case Opcode.OP_116:
+            return stack[-1] + 116
+        case Opcode.OP_117:
+            return stack[-1] + 117
+        case Opcode.OP_118:
+            return stack[-1] + 118
+        case Opcode.OP_119:
+            return stack[-1] + 119
+        case Opcode.OP_120:
+            return stack[-1] + 120
+        case Opcode.OP_121:
+            return stack[-1] + 121
+        case Opcode.OP_122:
+            return stack[-1] + 122
+        case Opcode.OP_123:
+            return stack[-1] + 123
+        case Opcode.OP_124:
+            return stack[-1] + 124
+        case Opcode.OP_125:
+            return stack[-1] + 125
+        case Opcode.OP_126:
+            return stack[-1] + 126
+        case Opcode.OP_127:
+            return stack[-1] + 127
+        case _:
+            return len(stack)
+
+
+def execute_8(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_128:
+            return stack[-1] + 128
+        case Opcode.OP_129:
+            return stack[-1] + 129
+        case Opcode.OP_130:
+            return stack[-1] + 130
+        case Opcode.OP_131:
+            return stack[-1] + 131
+        case Opcode.OP_132:
+            return stack[-1] + 132
+        case Opcode.OP_133:
+            return stack[-1] + 133
+        case Opcode.OP_134:
+            return stack[-1] + 134
+        case Opcode.OP_135:
+            return stack[-1] + 135
+        case Opcode.OP_136:
+            return stack[-1] + 136
+        case Opcode.OP_137:
+            return stack[-1] + 137
+        case Opcode.OP_138:
+            return stack[-1] + 138
+        case Opcode.OP_139:
+            return stack[-1] + 139
+        case Opcode.OP_140:
+            return stack[-1] + 140
+        case Opcode.OP_141:
+            return stack[-1] + 141
+        case Opcode.OP_142:
+            return stack[-1] + 142
+        case Opcode.OP_143:
+            return stack[-1] + 143
+        case _:
+            return len(stack)
+
+
+def execute_9(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_144:
+            return stack[-1] + 144
+        case Opcode.OP_145:
+            return stack[-1] + 145
+        case Opcode.OP_146:
+            return stack[-1] + 146
+        case Opcode.OP_147:
+            return stack[-1] + 147
+        case Opcode.OP_148:
+            return stack[-1] + 148
+        case Opcode.OP_149:
+            return stack[-1] + 149
+        case Opcode.OP_150:
+            return stack[-1] + 150
+        case Opcode.OP_151:
+            return stack[-1] + 151
+        case Opcode.OP_152:
+            return stack[-1] + 152
+        case Opcode.OP_153:
+            return stack[-1] + 153
+        case Opcode.OP_154:
+            return stack[-1] + 154
+        case Opcode.OP_155:
+            return stack[-1] + 155
+        case Opcode.OP_156:
+            return stack[-1] + 156
+        case Opcode.OP_157:
+            return stack[-1] + 157
+        case Opcode.OP_158:
+            return stack[-1] + 158
+        case Opcode.OP_159:
+            return stack[-1] + 159
+        case _:
+            return len(stack)
+
+
+def execute_10(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_160:
+            return stack[-1] + 160
+        case Opcode.OP_161:
+            return stack[-1] + 161
+        case Opcode.OP_162:
+            return stack[-1] + 162
+        case Opcode.OP_163:
+            return stack[-1] + 163
+        case Opcode.OP_164:
+            return stack[-1] + 164
+        case Opcode.OP_165:
+            return stack[-1] + 165
+        case Opcode.OP_166:
+            return stack[-1] + 166
+        case Opcode.OP_167:
+            return stack[-1] + 167
+        case Opcode.OP_168:
+            return stack[-1] + 168
+        case Opcode.OP_169:
+            return stack[-1] + 169
+        case Opcode.OP_170:
+            return stack[-1] + 170
+        case Opcode.OP_171:
+            return stack[-1] + 171
+        case Opcode.OP_172:
+            return stack[-1] + 172
+        case Opcode.OP_173:
+            return stack[-1] + 173
+        case Opcode.OP_174:
+            return stack[-1] + 174
+        case Opcode.OP_175:
+            return stack[-1] + 175
+        case _:
+            return len(stack)
+
+
+def execute_11(op: Opcode, stack: list[int]) -> int:
+    match op:
+        case Opcode.OP_176:
+            return stack[-1] + 176
+        case Opcode.OP_177:
+            return stack[-1] + 177
+        case Opcode.OP_178:
+            return stack[-1] + 178
+        case Opcode.OP_179:
+            return stack[-1] + 179
+        case Opcode.OP_180:
+            return stack[-1] + 180
+        case Opcode.OP_181:
+            return stack[-1] + 181
+        case Opcode.OP_182:
+            return stack[-1] + 182
+        case Opcode.OP_183:
+            return stack[-1] + 183
+        case Opcode.OP_184:
+            return stack[-1] + 184
+        case Opcode.OP_185:
+            return stack[-1] + 185
+        case Opcode.OP_186:
+            return stack[-1] + 186
+        case Opcode.OP_187:
+            return stack[-1] + 187
+        case Opcode.OP_188:
+            return stack[-1] + 188
+        case Opcode.OP_189:
+            return stack[-1] + 189
+        case Opcode.OP_190:
+            return stack[-1] + 190
+        case Opcode.OP_191:
+            return stack[-1] + 191
+        case _:
+            return len(stack)
+
+
+def classify_0(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_0, Token.TOKEN_1, Token.TOKEN_2] = Token.TOKEN_0
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_0, Token.TOKEN_0, Token.TOKEN_0):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_0 in perms:
+        total += int((perms | Permission.PERM_1).value)
+    combined = Permission.PERM_0 | Permission.PERM_2 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_0)
+    total += int(planet.surface_gravity + Planet.PLANET_0.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_1(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_1, Token.TOKEN_2, Token.TOKEN_3] = Token.TOKEN_1
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_1, Token.TOKEN_2, Token.TOKEN_3):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_1 in perms:
+        total += int((perms | Permission.PERM_2).value)
+    combined = Permission.PERM_1 | Permission.PERM_3 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_10)
+    total += int(planet.surface_gravity + Planet.PLANET_1.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_2(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_2, Token.TOKEN_3, Token.TOKEN_4] = Token.TOKEN_2
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_2, Token.TOKEN_4, Token.TOKEN_6):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_2 in perms:
+        total += int((perms | Permission.PERM_3).value)
+    combined = Permission.PERM_2 | Permission.PERM_4 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_20)
+    total += int(planet.surface_gravity + Planet.PLANET_2.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_3(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_3, Token.TOKEN_4, Token.TOKEN_5] = Token.TOKEN_3
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_3, Token.TOKEN_6, Token.TOKEN_9):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_3 in perms:
+        total += int((perms | Permission.PERM_4).value)
+    combined = Permission.PERM_3 | Permission.PERM_5 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_30)
+    total += int(planet.surface_gravity + Planet.PLANET_3.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_4(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_4, Token.TOKEN_5, Token.TOKEN_6] = Token.TOKEN_4
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_4, Token.TOKEN_8, Token.TOKEN_12):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_4 in perms:
+        total += int((perms | Permission.PERM_5).value)
+    combined = Permission.PERM_4 | Permission.PERM_6 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_40)
+    total += int(planet.surface_gravity + Planet.PLANET_4.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_5(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_5, Token.TOKEN_6, Token.TOKEN_7] = Token.TOKEN_5
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_5, Token.TOKEN_10, Token.TOKEN_15):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_5 in perms:
+        total += int((perms | Permission.PERM_6).value)
+    combined = Permission.PERM_5 | Permission.PERM_7 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_50)
+    total += int(planet.surface_gravity + Planet.PLANET_5.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_6(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_6, Token.TOKEN_7, Token.TOKEN_8] = Token.TOKEN_6
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_6, Token.TOKEN_12, Token.TOKEN_18):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_6 in perms:
+        total += int((perms | Permission.PERM_7).value)
+    combined = Permission.PERM_6 | Permission.PERM_8 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_60)
+    total += int(planet.surface_gravity + Planet.PLANET_6.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_7(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_7, Token.TOKEN_8, Token.TOKEN_9] = Token.TOKEN_7
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_7, Token.TOKEN_14, Token.TOKEN_21):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_7 in perms:
+        total += int((perms | Permission.PERM_8).value)
+    combined = Permission.PERM_7 | Permission.PERM_9 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_70)
+    total += int(planet.surface_gravity + Planet.PLANET_7.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_8(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_8, Token.TOKEN_9, Token.TOKEN_10] = Token.TOKEN_8
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_8, Token.TOKEN_16, Token.TOKEN_24):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_8 in perms:
+        total += int((perms | Permission.PERM_9).value)
+    combined = Permission.PERM_8 | Permission.PERM_10 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_80)
+    total += int(planet.surface_gravity + Planet.PLANET_8.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
+
+
+def classify_9(token: Token, perms: Permission, planet: Planet) -> int:
+    lit: Literal[Token.TOKEN_9, Token.TOKEN_10, Token.TOKEN_11] = Token.TOKEN_9
+    total = len(token.value) + Opcode(token.value.count("_")).value
+    if token in (Token.TOKEN_9, Token.TOKEN_18, Token.TOKEN_27):
+        total += 1
+    elif token is lit:
+        total += 2
+    if perms & Permission.READ_ALL and Permission.PERM_9 in perms:
+        total += int((perms | Permission.PERM_10).value)
+    combined = Permission.PERM_9 | Permission.PERM_11 | Permission.WRITE_ALL
+    total += len([p for p in Permission if p in combined])
+    total += sum(op.value for op in Opcode if op > Opcode.OP_90)
+    total += int(planet.surface_gravity + Planet.PLANET_9.mass)
+    total += len(color_name(Color.RED)) + len(Token.__members__) + len(Opcode._member_map_)
+    return total
@@ -0,0 +1,583 @@
+# generic_heavy.py — heavy generics and protocol matching
+# Stresses TypeVar solving and protocol assignability: generic containers
+# nested several levels deep, chained generic method calls, ParamSpec and
+# TypeVarTuple based decorators, and structural matching against protocols.
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, Concatenate, Generic, ParamSpec, Protocol, TypeVar, TypeVarTuple, overload
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+_T_co = TypeVar("_T_co", covariant=True)
+_T_contra = TypeVar("_T_contra", contravariant=True)
+_N = TypeVar("_N", int, float, complex)
+_P = ParamSpec("_P")
+_Ts = TypeVarTuple("_Ts")
+
+
+class SupportsLessThan(Protocol):
+    def __lt__(self, other: Any, /) -> bool: ...
+
+
+_S = TypeVar("_S", bound=SupportsLessThan)
+
+
+class Reader(Protocol[_T_co]):
+    def read(self, size: int = ..., /) -> _T_co: ...
+    def close(self) -> None: ...
+
+
+class Writer(Protocol[_T_contra]):
+    def write(self, data: _T_contra, /) -> int: ...
+    def flush(self) -> None: ...
+
+
+class ReadWriter(Reader[_T], Writer[_T], Protocol[_T]):
+    def seek(self, offset: int, whence: int = ..., /) -> int: ...
+
+
+class Functor(Protocol[_T_co]):
+    def map(self, fn: Callable[[_T_co], _U], /) -> Functor[_U]: ...
+
+
+@dataclass(frozen=True)
+class Box(Generic[_T]):
+    value: _T
+
+    def map(self, fn: Callable[[_T], _U]) -> Box[_U]:
+        return Box(fn(self.value))
+
+    def flat_map(self, fn: Callable[[_T], Box[_U]]) -> Box[_U]:
+        return fn(self.value)
+
+    def zip(self, other: Box[_U]) -> Box[tuple[_T, _U]]:
+        return Box((self.value, other.value))
+
+
+class Stream(Generic[_T]):
+    def __init__(self, items: Iterable[_T]) -> None:
+        self._items = list(items)
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._items)
+
+    def map(self, fn: Callable[[_T], _U]) -> Stream[_U]:
+        return Stream(fn(x) for x in self._items)
+
+    def filter(self, fn: Callable[[_T], bool]) -> Stream[_T]:
+        return Stream(x for x in self._items if fn(x))
+
+    def flat_map(self, fn: Callable[[_T], Iterable[_U]]) -> Stream[_U]:
+        return Stream(y for x in self._items for y in fn(x))
+
+    def group_by(self, key: Callable[[_T], _K]) -> Mapping[_K, list[_T]]:
+        groups: dict[_K, list[_T]] = {}
+        for x in self._items:
+            groups.setdefault(key(x), []).append(x)
+        return groups
+
+    def sorted_by(self, key: Callable[[_T], _S]) -> Stream[_T]:
+        return Stream(sorted(self._items, key=key))
+
+    def zip(self, other: Stream[_U]) -> Stream[tuple[_T, _U]]:
+        return Stream(zip(self._items, other._items))
+
+    def reduce(self, fn: Callable[[_U, _T], _U], initial: _U) -> _U:
+        result = initial
+        for x in self._items:
+            result = fn(result, x)
+        return result
+
+
+class Table(Generic[_K, _V]):
+    def __init__(self, rows: Mapping[_K, _V]) -> None:
+        self._rows = dict(rows)
+
+    def lookup(self, key: _K) -> _V | None:
+        return self._rows.get(key)
+
+    def map_values(self, fn: Callable[[_V], _U]) -> Table[_K, _U]:
+        return Table({k: fn(v) for k, v in self._rows.items()})
+
+    def invert(self) -> Table[_V, _K]:
+        return Table({v: k for k, v in self._rows.items()})
+
+    def join(self, other: Table[_V, _U]) -> Table[_K, _U | None]:
+        return Table({k: other.lookup(v) for k, v in self._rows.items()})
+
+
+def fmap(f: Functor[_T], fn: Callable[[_T], _U]) -> Functor[_U]:
+    return f.map(fn)
+
+
+def copy_stream(src: Reader[_T], dst: Writer[_T]) -> int:
+    return dst.write(src.read())
+
+
+def largest(items: Iterable[_S]) -> _S:
+    return max(items)
+
+
+def scale(value: _N, factor: _N) -> _N:
+    return value * factor
+
+
+def with_retries(fn: Callable[_P, _T]) -> Callable[_P, _T]:
+    return fn
+
+
+def with_context(fn: Callable[Concatenate[str, _P], _T]) -> Callable[_P, _T]:
+    def inner(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        return fn("context", *args, **kwargs)
+
+    return inner
+
+
+def call_all(*fns: *_Ts) -> tuple[*_Ts]:
+    return fns
+
+
+@overload
+def pick(a: Box[_T], b: None = ...) -> Box[_T]: ...
+@overload
+def pick(a: Box[_T], b: Box[_U]) -> Box[_T | _U]: ...
+def pick(a: Box[Any], b: Box[Any] | None = None) -> Box[Any]:
+    return b or a
+
+
+
+@with_retries
+@with_context
+def operation_0(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_0(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 0).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(2)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(5)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(0, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_0(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_0, operation_0, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_1(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_1(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 1).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(3)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(6)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(1, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_1(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_1, operation_1, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_2(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_2(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 2).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(4)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(7)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(2, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_2(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_2, operation_2, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_3(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_3(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 3).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(5)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(8)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(3, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_3(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_3, operation_3, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_4(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_4(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 4).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(6)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(9)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(4, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_4(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_4, operation_4, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_5(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_5(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 5).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(7)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(10)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(5, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_5(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_5, operation_5, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_6(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_6(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 6).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(8)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(11)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(6, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_6(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_6, operation_6, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_7(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_7(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 7).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(9)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(12)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(7, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_7(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_7, operation_7, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_8(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_8(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 8).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(10)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(13)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(8, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_8(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_8, operation_8, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_9(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_9(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 9).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(11)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(14)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(9, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_9(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_9, operation_9, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_10(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_10(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 10).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(12)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(15)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(10, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_10(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_10, operation_10, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_11(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_11(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 11).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(13)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(16)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(11, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_11(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_11, operation_11, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_12(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_12(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 12).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(14)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(17)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(12, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_12(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_12, operation_12, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_13(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_13(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 13).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(15)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(18)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(13, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_13(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_13, operation_13, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_14(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_14(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 14).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(16)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(19)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(14, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_14(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_14, operation_14, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
+
+
+@with_retries
+@with_context
+def operation_15(ctx: str, count: int, names: list[str], *, flag: bool = False) -> Table[str, Box[int]]:
+    return Table({name: Box(len(name) + count) for name in names})
+
+
+def pipeline_15(raw: list[dict[str, list[tuple[int, str]]]], rw: ReadWriter[bytes]) -> None:
+    stream = Stream(raw)
+    pairs = stream.flat_map(lambda d: d.items()).flat_map(lambda kv: ((kv[0], n, s) for n, s in kv[1]))
+    grouped = pairs.filter(lambda t: t[1] > 15).sorted_by(lambda t: t[1]).group_by(lambda t: t[2])
+    totals = Stream(grouped.items()).map(lambda kv: (kv[0], sum(t[1] for t in kv[1])))
+    table = Table(dict(totals)).map_values(lambda n: Box(n).map(str).map(len)).invert()
+    joined = table.join(Table({n: float(n) for n in range(17)}).map_values(lambda f: Box(f)))
+    boxed = Box(raw).map(len).zip(Box("s")).flat_map(lambda t: Box([t] * t[0]))
+    nested: Box[Box[Box[list[tuple[int, str]]]]] = Box(Box(Box([(1, "a")])))
+    inner = nested.map(lambda b: b.map(lambda c: c.map(lambda items: [s for _, s in items])))
+    picked = pick(Box(1), Box("x"))
+    folded = Stream(range(20)).zip(Stream(str(n) for n in range(5))).reduce(lambda acc, t: acc + t[1], "")
+    best = largest(Stream([3, 1, 2]).map(lambda n: (n, str(n))))
+    scaled = scale(15, 2) + scale(1.5, 2.0)
+    copied = copy_stream(rw, rw)
+    mapped = fmap(Box(1.0), lambda f: [f])
+    result = operation_15(1, ["a", "b"], flag=True)
+    funcs = call_all(pipeline_15, operation_15, Box[int])
+    print(joined, boxed, inner, picked, folded, best, scaled, copied, mapped, result, funcs)
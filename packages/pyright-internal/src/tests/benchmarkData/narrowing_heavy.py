@@ -0,0 +1,1091 @@
+# narrowing_heavy.py — deep narrowing chains
+# Stresses code flow analysis: long isinstance/literal/None narrowing chains,
+# narrowing inside loops, match statements and user-defined type guards.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal, TypeGuard, Union
+
+from typing_extensions import TypeIs
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class Circle:
+    center: Point
+    radius: float
+
+
+@dataclass
+class Rect:
+    origin: Point
+    width: float
+    height: float
+
+
+@dataclass
+class Line:
+    start: Point
+    end: Point
+
+
+@dataclass
+class Polygon:
+    points: list[Point]
+
+
+Value = Union[int, str, float, bytes, bool, None, list[int], dict[str, int], tuple[int, ...], set[str]]
+Shape = Union[Circle, Rect, Line, Polygon, Point]
+Mode = Literal["r", "w", "a", "x", "rb", "wb", "ab", "xb", "r+", "w+", "a+", "x+"]
+
+
+def is_str_list(val: list[object]) -> TypeGuard[list[str]]:
+    return all(isinstance(x, str) for x in val)
+
+
+def is_circle(shape: Shape) -> TypeIs[Circle]:
+    return isinstance(shape, Circle)
+
+
+def describe_value_0(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 0)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_1(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 1)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_2(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 2)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_3(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 3)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_4(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 4)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_5(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 5)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_6(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 6)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_7(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 7)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_8(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 8)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_9(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 9)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_10(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 10)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def describe_value_11(v: Value) -> str:
+    if v is None:
+        return "none"
+    elif isinstance(v, bool):
+        return "bool" if v else "false"
+    elif isinstance(v, int):
+        return str(v + 11)
+    elif isinstance(v, float):
+        return f"{v:.2f}"
+    elif isinstance(v, str):
+        return v.upper()
+    elif isinstance(v, bytes):
+        return v.decode()
+    elif isinstance(v, list):
+        return ",".join(str(x) for x in v)
+    elif isinstance(v, dict):
+        return ",".join(v.keys())
+    elif isinstance(v, tuple):
+        return str(len(v))
+    else:
+        return ",".join(sorted(v))
+
+def open_mode_0(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 0
+
+def open_mode_1(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 1
+
+def open_mode_2(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 2
+
+def open_mode_3(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 3
+
+def open_mode_4(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 4
+
+def open_mode_5(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 5
+
+def open_mode_6(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 6
+
+def open_mode_7(mode: Mode) -> int:
+    if mode == "r":
+        return 1
+    elif mode == "w":
+        return 2
+    elif mode == "a":
+        return 3
+    elif mode == "x":
+        return 4
+    elif mode == "rb" or mode == "wb":
+        return 5
+    elif mode in ("ab", "xb"):
+        return 6
+    elif mode == "r+":
+        return 7
+    elif mode == "w+":
+        return 8
+    elif mode == "a+":
+        return 9
+    reveal = mode
+    return len(reveal) + 7
+
+def area_0(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 0
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_1(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 1
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_2(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 2
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_3(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 3
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_4(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 4
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_5(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 5
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_6(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 6
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def area_7(shape: Shape) -> float:
+    match shape:
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return 3.14159 * r * r
+        case Circle(radius=r):
+            return 3.14159 * r * r + 7
+        case Rect(width=w, height=h) if w > 0 and h > 0:
+            return w * h
+        case Rect():
+            return 0.0
+        case Line(start=s, end=e):
+            return abs(e.x - s.x) * abs(e.y - s.y)
+        case Polygon(points=[p0, p1, *rest]):
+            return p0.x * p1.y + len(rest)
+        case Polygon():
+            return 0.0
+        case Point(x=x, y=y):
+            return x * y
+
+def accumulate_0(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 3:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_1(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 4:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_2(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 5:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_3(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 6:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_4(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 7:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_5(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 8:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_6(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 9:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_7(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 10:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_8(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 11:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+def accumulate_9(items: list[Value]) -> str | int | None:
+    result: str | int | None = None
+    count = 0
+    for item in items:
+        if result is None:
+            if isinstance(item, int):
+                result = item
+            elif isinstance(item, str):
+                result = item
+        elif isinstance(result, int):
+            if isinstance(item, int):
+                result = result + item
+            else:
+                result = str(result)
+        else:
+            result = result + str(item)
+        while count < 12:
+            if isinstance(result, str) and len(result) > count:
+                result = result[1:]
+            elif isinstance(result, int):
+                result -= 1
+            count += 1
+    return result
+
+class Node_0:
+    value: int | str | None
+    next: Node_0 | None
+    parent: Node_0 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_0 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_1:
+    value: int | str | None
+    next: Node_1 | None
+    parent: Node_1 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_1 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_2:
+    value: int | str | None
+    next: Node_2 | None
+    parent: Node_2 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_2 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_3:
+    value: int | str | None
+    next: Node_3 | None
+    parent: Node_3 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_3 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_4:
+    value: int | str | None
+    next: Node_4 | None
+    parent: Node_4 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_4 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_5:
+    value: int | str | None
+    next: Node_5 | None
+    parent: Node_5 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_5 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_6:
+    value: int | str | None
+    next: Node_6 | None
+    parent: Node_6 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_6 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+class Node_7:
+    value: int | str | None
+    next: Node_7 | None
+    parent: Node_7 | None
+
+    def __init__(self) -> None:
+        self.value = None
+        self.next = None
+        self.parent = None
+
+    def walk(self) -> int:
+        total = 0
+        node: Node_7 | None = self
+        while node is not None:
+            if node.value is not None:
+                if isinstance(node.value, int):
+                    total += node.value
+                else:
+                    total += len(node.value)
+            if node.parent is not None and node.parent.next is not None and node.parent.next.value is not None:
+                total += 1
+            node = node.next
+        return total
+
+def narrow_guards(values: list[object], shapes: list[Shape]) -> int:
+    total = 0
+    if is_str_list(values):
+        total += sum(len(v) for v in values)
+    for shape in shapes:
+        if is_circle(shape):
+            total += int(shape.radius)
+        elif isinstance(shape, (Rect, Line)):
+            total += 1
+        else:
+            total += 2
+    return total
@@ -0,0 +1,1174 @@
+# overload_heavy.py — large overload sets
+# Stresses overload evaluation: functions and methods with many overloads,
+# calls whose arguments need speculative evaluation against each overload,
+# and overloaded calls nested in other overloaded calls.
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Literal, Mapping, Sequence, TypeVar, overload
+
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+@overload
+def convert_0(value: int, *, strict: bool = ...) -> str: ...
+@overload
+def convert_0(value: str, *, strict: bool = ...) -> int: ...
+@overload
+def convert_0(value: float, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_0(value: bytes, *, strict: bool = ...) -> float: ...
+@overload
+def convert_0(value: bool, *, strict: bool = ...) -> list[str]: ...
+@overload
+def convert_0(value: list[int], *, strict: bool = ...) -> dict[str, str]: ...
+@overload
+def convert_0(value: list[str], *, strict: bool = ...) -> tuple[str, ...]: ...
+@overload
+def convert_0(value: dict[str, int], *, strict: bool = ...) -> set[str]: ...
+@overload
+def convert_0(value: tuple[int, int], *, strict: bool = ...) -> int: ...
+@overload
+def convert_0(value: set[int], *, strict: bool = ...) -> str: ...
+@overload
+def convert_0(value: frozenset[str], *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_0(value: bytearray, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_0(value: complex, *, strict: bool = ...) -> float: ...
+@overload
+def convert_0(value: range, *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_0(value: memoryview, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_0(value: None, *, strict: bool = ...) -> str: ...
+def convert_0(value: Any, *, strict: bool = False) -> Any:
+    return value
+
+
+@overload
+def convert_1(value: int, *, strict: bool = ...) -> str: ...
+@overload
+def convert_1(value: str, *, strict: bool = ...) -> int: ...
+@overload
+def convert_1(value: float, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_1(value: bytes, *, strict: bool = ...) -> float: ...
+@overload
+def convert_1(value: bool, *, strict: bool = ...) -> list[str]: ...
+@overload
+def convert_1(value: list[int], *, strict: bool = ...) -> dict[str, str]: ...
+@overload
+def convert_1(value: list[str], *, strict: bool = ...) -> tuple[str, ...]: ...
+@overload
+def convert_1(value: dict[str, int], *, strict: bool = ...) -> set[str]: ...
+@overload
+def convert_1(value: tuple[int, int], *, strict: bool = ...) -> int: ...
+@overload
+def convert_1(value: set[int], *, strict: bool = ...) -> str: ...
+@overload
+def convert_1(value: frozenset[str], *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_1(value: bytearray, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_1(value: complex, *, strict: bool = ...) -> float: ...
+@overload
+def convert_1(value: range, *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_1(value: memoryview, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_1(value: None, *, strict: bool = ...) -> str: ...
+def convert_1(value: Any, *, strict: bool = False) -> Any:
+    return value
+
+
+@overload
+def convert_2(value: int, *, strict: bool = ...) -> str: ...
+@overload
+def convert_2(value: str, *, strict: bool = ...) -> int: ...
+@overload
+def convert_2(value: float, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_2(value: bytes, *, strict: bool = ...) -> float: ...
+@overload
+def convert_2(value: bool, *, strict: bool = ...) -> list[str]: ...
+@overload
+def convert_2(value: list[int], *, strict: bool = ...) -> dict[str, str]: ...
+@overload
+def convert_2(value: list[str], *, strict: bool = ...) -> tuple[str, ...]: ...
+@overload
+def convert_2(value: dict[str, int], *, strict: bool = ...) -> set[str]: ...
+@overload
+def convert_2(value: tuple[int, int], *, strict: bool = ...) -> int: ...
+@overload
+def convert_2(value: set[int], *, strict: bool = ...) -> str: ...
+@overload
+def convert_2(value: frozenset[str], *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_2(value: bytearray, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_2(value: complex, *, strict: bool = ...) -> float: ...
+@overload
+def convert_2(value: range, *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_2(value: memoryview, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_2(value: None, *, strict: bool = ...) -> str: ...
+def convert_2(value: Any, *, strict: bool = False) -> Any:
+    return value
+
+
+@overload
+def convert_3(value: int, *, strict: bool = ...) -> str: ...
+@overload
+def convert_3(value: str, *, strict: bool = ...) -> int: ...
+@overload
+def convert_3(value: float, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_3(value: bytes, *, strict: bool = ...) -> float: ...
+@overload
+def convert_3(value: bool, *, strict: bool = ...) -> list[str]: ...
+@overload
+def convert_3(value: list[int], *, strict: bool = ...) -> dict[str, str]: ...
+@overload
+def convert_3(value: list[str], *, strict: bool = ...) -> tuple[str, ...]: ...
+@overload
+def convert_3(value: dict[str, int], *, strict: bool = ...) -> set[str]: ...
+@overload
+def convert_3(value: tuple[int, int], *, strict: bool = ...) -> int: ...
+@overload
+def convert_3(value: set[int], *, strict: bool = ...) -> str: ...
+@overload
+def convert_3(value: frozenset[str], *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_3(value: bytearray, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_3(value: complex, *, strict: bool = ...) -> float: ...
+@overload
+def convert_3(value: range, *, strict: bool = ...) -> list[int]: ...
+@overload
+def convert_3(value: memoryview, *, strict: bool = ...) -> bytes: ...
+@overload
+def convert_3(value: None, *, strict: bool = ...) -> str: ...
+def convert_3(value: Any, *, strict: bool = False) -> Any:
+    return value
+
+
+@overload
+def read_0(path: str, mode: Literal["r"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_0(path: str, mode: Literal["w"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_0(path: str, mode: Literal["a"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_0(path: str, mode: Literal["rb"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_0(path: str, mode: Literal["wb"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_0(path: str, mode: Literal["ab"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_0(path: str, mode: Literal["r+"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_0(path: str, mode: Literal["w+"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_0(path: str, mode: str, buffering: int = ..., encoding: str | None = ...) -> str | bytes: ...
+def read_0(path: str, mode: str, buffering: int = -1, encoding: str | None = None) -> str | bytes:
+    return ""
+
+
+@overload
+def read_1(path: str, mode: Literal["r"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_1(path: str, mode: Literal["w"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_1(path: str, mode: Literal["a"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_1(path: str, mode: Literal["rb"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_1(path: str, mode: Literal["wb"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_1(path: str, mode: Literal["ab"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_1(path: str, mode: Literal["r+"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_1(path: str, mode: Literal["w+"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_1(path: str, mode: str, buffering: int = ..., encoding: str | None = ...) -> str | bytes: ...
+def read_1(path: str, mode: str, buffering: int = -1, encoding: str | None = None) -> str | bytes:
+    return ""
+
+
+@overload
+def read_2(path: str, mode: Literal["r"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_2(path: str, mode: Literal["w"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_2(path: str, mode: Literal["a"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_2(path: str, mode: Literal["rb"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_2(path: str, mode: Literal["wb"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_2(path: str, mode: Literal["ab"], buffering: int = ..., encoding: str | None = ...) -> bytes: ...
+@overload
+def read_2(path: str, mode: Literal["r+"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_2(path: str, mode: Literal["w+"], buffering: int = ..., encoding: str | None = ...) -> str: ...
+@overload
+def read_2(path: str, mode: str, buffering: int = ..., encoding: str | None = ...) -> str | bytes: ...
+def read_2(path: str, mode: str, buffering: int = -1, encoding: str | None = None) -> str | bytes:
+    return ""
+
+
+class Registry:
+    @overload
+    def get(self, key: int) -> str: ...
+    @overload
+    def get(self, key: str) -> int: ...
+    @overload
+    def get(self, key: float) -> bytes: ...
+    @overload
+    def get(self, key: bytes) -> float: ...
+    @overload
+    def get(self, key: bool) -> list[str]: ...
+    @overload
+    def get(self, key: list[int]) -> dict[str, str]: ...
+    @overload
+    def get(self, key: list[str]) -> tuple[str, ...]: ...
+    @overload
+    def get(self, key: dict[str, int]) -> set[str]: ...
+    @overload
+    def get(self, key: tuple[int, int]) -> int: ...
+    @overload
+    def get(self, key: set[int]) -> str: ...
+    @overload
+    def get(self, key: frozenset[str]) -> list[int]: ...
+    @overload
+    def get(self, key: bytearray) -> bytes: ...
+    @overload
+    def get(self, key: _T, default: _V) -> _T | _V: ...
+    def get(self, key: Any, default: Any = None) -> Any:
+        return default
+
+    @overload
+    def register(self, key: int, factory: Callable[[], str]) -> Callable[[], str]: ...
+    @overload
+    def register(self, key: str, factory: Callable[[], int]) -> Callable[[], int]: ...
+    @overload
+    def register(self, key: float, factory: Callable[[], bytes]) -> Callable[[], bytes]: ...
+    @overload
+    def register(self, key: bytes, factory: Callable[[], float]) -> Callable[[], float]: ...
+    @overload
+    def register(self, key: bool, factory: Callable[[], list[str]]) -> Callable[[], list[str]]: ...
+    @overload
+    def register(self, key: list[int], factory: Callable[[], dict[str, str]]) -> Callable[[], dict[str, str]]: ...
+    @overload
+    def register(self, key: list[str], factory: Callable[[], tuple[str, ...]]) -> Callable[[], tuple[str, ...]]: ...
+    @overload
+    def register(self, key: dict[str, int], factory: Callable[[], set[str]]) -> Callable[[], set[str]]: ...
+    @overload
+    def register(self, key: tuple[int, int], factory: Callable[[], int]) -> Callable[[], int]: ...
+    @overload
+    def register(self, key: set[int], factory: Callable[[], str]) -> Callable[[], str]: ...
+    def register(self, key: Any, factory: Any) -> Any:
+        return factory
+
+
+@overload
+def first(items: Sequence[_T]) -> _T: ...
+@overload
+def first(items: Iterable[_T], default: _V) -> _T | _V: ...
+@overload
+def first(items: Mapping[_K, _V]) -> _K: ...
+def first(items: Any, default: Any = None) -> Any:
+    return default
+
+
+def use_overloads_0(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_0(1)
+    v1 = convert_1("a")
+    v2 = convert_2(1.5)
+    v3 = convert_3(b"x")
+    v4 = convert_0(True)
+    v5 = convert_1([1, 2])
+    v6 = convert_2(["a", "b"])
+    v7 = convert_3({"a": 1})
+    v8 = convert_0((1, 2))
+    v9 = convert_1({1, 2})
+    v10 = convert_2(frozenset({"a"}))
+    v11 = convert_3(bytearray())
+    v12 = convert_0(1j)
+    v13 = convert_1(range(3))
+    v14 = convert_2(memoryview(b""))
+    v15 = convert_3(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_0(convert_1(convert_2(1)))
+    n1 = [convert_0(x) for x in items]
+    n2 = {k: convert_3(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_0(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_1(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_1(1)
+    v1 = convert_2("a")
+    v2 = convert_3(1.5)
+    v3 = convert_0(b"x")
+    v4 = convert_1(True)
+    v5 = convert_2([1, 2])
+    v6 = convert_3(["a", "b"])
+    v7 = convert_0({"a": 1})
+    v8 = convert_1((1, 2))
+    v9 = convert_2({1, 2})
+    v10 = convert_3(frozenset({"a"}))
+    v11 = convert_0(bytearray())
+    v12 = convert_1(1j)
+    v13 = convert_2(range(3))
+    v14 = convert_3(memoryview(b""))
+    v15 = convert_0(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_1(convert_2(convert_3("a")))
+    n1 = [convert_1(x) for x in items]
+    n2 = {k: convert_0(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_1(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_2(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_2(1)
+    v1 = convert_3("a")
+    v2 = convert_0(1.5)
+    v3 = convert_1(b"x")
+    v4 = convert_2(True)
+    v5 = convert_3([1, 2])
+    v6 = convert_0(["a", "b"])
+    v7 = convert_1({"a": 1})
+    v8 = convert_2((1, 2))
+    v9 = convert_3({1, 2})
+    v10 = convert_0(frozenset({"a"}))
+    v11 = convert_1(bytearray())
+    v12 = convert_2(1j)
+    v13 = convert_3(range(3))
+    v14 = convert_0(memoryview(b""))
+    v15 = convert_1(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_2(convert_3(convert_0(1.5)))
+    n1 = [convert_2(x) for x in items]
+    n2 = {k: convert_1(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_2(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_3(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_3(1)
+    v1 = convert_0("a")
+    v2 = convert_1(1.5)
+    v3 = convert_2(b"x")
+    v4 = convert_3(True)
+    v5 = convert_0([1, 2])
+    v6 = convert_1(["a", "b"])
+    v7 = convert_2({"a": 1})
+    v8 = convert_3((1, 2))
+    v9 = convert_0({1, 2})
+    v10 = convert_1(frozenset({"a"}))
+    v11 = convert_2(bytearray())
+    v12 = convert_3(1j)
+    v13 = convert_0(range(3))
+    v14 = convert_1(memoryview(b""))
+    v15 = convert_2(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_3(convert_0(convert_1(b"x")))
+    n1 = [convert_3(x) for x in items]
+    n2 = {k: convert_2(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_3(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_4(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_0(1)
+    v1 = convert_1("a")
+    v2 = convert_2(1.5)
+    v3 = convert_3(b"x")
+    v4 = convert_0(True)
+    v5 = convert_1([1, 2])
+    v6 = convert_2(["a", "b"])
+    v7 = convert_3({"a": 1})
+    v8 = convert_0((1, 2))
+    v9 = convert_1({1, 2})
+    v10 = convert_2(frozenset({"a"}))
+    v11 = convert_3(bytearray())
+    v12 = convert_0(1j)
+    v13 = convert_1(range(3))
+    v14 = convert_2(memoryview(b""))
+    v15 = convert_3(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_0(convert_1(convert_2(True)))
+    n1 = [convert_0(x) for x in items]
+    n2 = {k: convert_3(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_0(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_5(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_1(1)
+    v1 = convert_2("a")
+    v2 = convert_3(1.5)
+    v3 = convert_0(b"x")
+    v4 = convert_1(True)
+    v5 = convert_2([1, 2])
+    v6 = convert_3(["a", "b"])
+    v7 = convert_0({"a": 1})
+    v8 = convert_1((1, 2))
+    v9 = convert_2({1, 2})
+    v10 = convert_3(frozenset({"a"}))
+    v11 = convert_0(bytearray())
+    v12 = convert_1(1j)
+    v13 = convert_2(range(3))
+    v14 = convert_3(memoryview(b""))
+    v15 = convert_0(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_1(convert_2(convert_3([1, 2])))
+    n1 = [convert_1(x) for x in items]
+    n2 = {k: convert_0(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_1(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_6(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_2(1)
+    v1 = convert_3("a")
+    v2 = convert_0(1.5)
+    v3 = convert_1(b"x")
+    v4 = convert_2(True)
+    v5 = convert_3([1, 2])
+    v6 = convert_0(["a", "b"])
+    v7 = convert_1({"a": 1})
+    v8 = convert_2((1, 2))
+    v9 = convert_3({1, 2})
+    v10 = convert_0(frozenset({"a"}))
+    v11 = convert_1(bytearray())
+    v12 = convert_2(1j)
+    v13 = convert_3(range(3))
+    v14 = convert_0(memoryview(b""))
+    v15 = convert_1(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_2(convert_3(convert_0(["a", "b"])))
+    n1 = [convert_2(x) for x in items]
+    n2 = {k: convert_1(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_2(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_7(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_3(1)
+    v1 = convert_0("a")
+    v2 = convert_1(1.5)
+    v3 = convert_2(b"x")
+    v4 = convert_3(True)
+    v5 = convert_0([1, 2])
+    v6 = convert_1(["a", "b"])
+    v7 = convert_2({"a": 1})
+    v8 = convert_3((1, 2))
+    v9 = convert_0({1, 2})
+    v10 = convert_1(frozenset({"a"}))
+    v11 = convert_2(bytearray())
+    v12 = convert_3(1j)
+    v13 = convert_0(range(3))
+    v14 = convert_1(memoryview(b""))
+    v15 = convert_2(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_3(convert_0(convert_1({"a": 1})))
+    n1 = [convert_3(x) for x in items]
+    n2 = {k: convert_2(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_3(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_8(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_0(1)
+    v1 = convert_1("a")
+    v2 = convert_2(1.5)
+    v3 = convert_3(b"x")
+    v4 = convert_0(True)
+    v5 = convert_1([1, 2])
+    v6 = convert_2(["a", "b"])
+    v7 = convert_3({"a": 1})
+    v8 = convert_0((1, 2))
+    v9 = convert_1({1, 2})
+    v10 = convert_2(frozenset({"a"}))
+    v11 = convert_3(bytearray())
+    v12 = convert_0(1j)
+    v13 = convert_1(range(3))
+    v14 = convert_2(memoryview(b""))
+    v15 = convert_3(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_0(convert_1(convert_2((1, 2))))
+    n1 = [convert_0(x) for x in items]
+    n2 = {k: convert_3(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_0(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_9(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_1(1)
+    v1 = convert_2("a")
+    v2 = convert_3(1.5)
+    v3 = convert_0(b"x")
+    v4 = convert_1(True)
+    v5 = convert_2([1, 2])
+    v6 = convert_3(["a", "b"])
+    v7 = convert_0({"a": 1})
+    v8 = convert_1((1, 2))
+    v9 = convert_2({1, 2})
+    v10 = convert_3(frozenset({"a"}))
+    v11 = convert_0(bytearray())
+    v12 = convert_1(1j)
+    v13 = convert_2(range(3))
+    v14 = convert_3(memoryview(b""))
+    v15 = convert_0(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_1(convert_2(convert_3({1, 2})))
+    n1 = [convert_1(x) for x in items]
+    n2 = {k: convert_0(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_1(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_10(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_2(1)
+    v1 = convert_3("a")
+    v2 = convert_0(1.5)
+    v3 = convert_1(b"x")
+    v4 = convert_2(True)
+    v5 = convert_3([1, 2])
+    v6 = convert_0(["a", "b"])
+    v7 = convert_1({"a": 1})
+    v8 = convert_2((1, 2))
+    v9 = convert_3({1, 2})
+    v10 = convert_0(frozenset({"a"}))
+    v11 = convert_1(bytearray())
+    v12 = convert_2(1j)
+    v13 = convert_3(range(3))
+    v14 = convert_0(memoryview(b""))
+    v15 = convert_1(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_2(convert_3(convert_0(frozenset({"a"}))))
+    n1 = [convert_2(x) for x in items]
+    n2 = {k: convert_1(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_2(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_11(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_3(1)
+    v1 = convert_0("a")
+    v2 = convert_1(1.5)
+    v3 = convert_2(b"x")
+    v4 = convert_3(True)
+    v5 = convert_0([1, 2])
+    v6 = convert_1(["a", "b"])
+    v7 = convert_2({"a": 1})
+    v8 = convert_3((1, 2))
+    v9 = convert_0({1, 2})
+    v10 = convert_1(frozenset({"a"}))
+    v11 = convert_2(bytearray())
+    v12 = convert_3(1j)
+    v13 = convert_0(range(3))
+    v14 = convert_1(memoryview(b""))
+    v15 = convert_2(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_3(convert_0(convert_1(bytearray())))
+    n1 = [convert_3(x) for x in items]
+    n2 = {k: convert_2(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_3(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_12(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_0(1)
+    v1 = convert_1("a")
+    v2 = convert_2(1.5)
+    v3 = convert_3(b"x")
+    v4 = convert_0(True)
+    v5 = convert_1([1, 2])
+    v6 = convert_2(["a", "b"])
+    v7 = convert_3({"a": 1})
+    v8 = convert_0((1, 2))
+    v9 = convert_1({1, 2})
+    v10 = convert_2(frozenset({"a"}))
+    v11 = convert_3(bytearray())
+    v12 = convert_0(1j)
+    v13 = convert_1(range(3))
+    v14 = convert_2(memoryview(b""))
+    v15 = convert_3(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_0(convert_1(convert_2(1j)))
+    n1 = [convert_0(x) for x in items]
+    n2 = {k: convert_3(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_0(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_13(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_1(1)
+    v1 = convert_2("a")
+    v2 = convert_3(1.5)
+    v3 = convert_0(b"x")
+    v4 = convert_1(True)
+    v5 = convert_2([1, 2])
+    v6 = convert_3(["a", "b"])
+    v7 = convert_0({"a": 1})
+    v8 = convert_1((1, 2))
+    v9 = convert_2({1, 2})
+    v10 = convert_3(frozenset({"a"}))
+    v11 = convert_0(bytearray())
+    v12 = convert_1(1j)
+    v13 = convert_2(range(3))
+    v14 = convert_3(memoryview(b""))
+    v15 = convert_0(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_1(convert_2(convert_3(range(3))))
+    n1 = [convert_1(x) for x in items]
+    n2 = {k: convert_0(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_1(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_14(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_2(1)
+    v1 = convert_3("a")
+    v2 = convert_0(1.5)
+    v3 = convert_1(b"x")
+    v4 = convert_2(True)
+    v5 = convert_3([1, 2])
+    v6 = convert_0(["a", "b"])
+    v7 = convert_1({"a": 1})
+    v8 = convert_2((1, 2))
+    v9 = convert_3({1, 2})
+    v10 = convert_0(frozenset({"a"}))
+    v11 = convert_1(bytearray())
+    v12 = convert_2(1j)
+    v13 = convert_3(range(3))
+    v14 = convert_0(memoryview(b""))
+    v15 = convert_1(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_2(convert_3(convert_0(memoryview(b""))))
+    n1 = [convert_2(x) for x in items]
+    n2 = {k: convert_1(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_2(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_15(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_3(1)
+    v1 = convert_0("a")
+    v2 = convert_1(1.5)
+    v3 = convert_2(b"x")
+    v4 = convert_3(True)
+    v5 = convert_0([1, 2])
+    v6 = convert_1(["a", "b"])
+    v7 = convert_2({"a": 1})
+    v8 = convert_3((1, 2))
+    v9 = convert_0({1, 2})
+    v10 = convert_1(frozenset({"a"}))
+    v11 = convert_2(bytearray())
+    v12 = convert_3(1j)
+    v13 = convert_0(range(3))
+    v14 = convert_1(memoryview(b""))
+    v15 = convert_2(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_3(convert_0(convert_1(None)))
+    n1 = [convert_3(x) for x in items]
+    n2 = {k: convert_2(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_3(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_16(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_0(1)
+    v1 = convert_1("a")
+    v2 = convert_2(1.5)
+    v3 = convert_3(b"x")
+    v4 = convert_0(True)
+    v5 = convert_1([1, 2])
+    v6 = convert_2(["a", "b"])
+    v7 = convert_3({"a": 1})
+    v8 = convert_0((1, 2))
+    v9 = convert_1({1, 2})
+    v10 = convert_2(frozenset({"a"}))
+    v11 = convert_3(bytearray())
+    v12 = convert_0(1j)
+    v13 = convert_1(range(3))
+    v14 = convert_2(memoryview(b""))
+    v15 = convert_3(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_0(convert_1(convert_2(1)))
+    n1 = [convert_0(x) for x in items]
+    n2 = {k: convert_3(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_0(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_17(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_1(1)
+    v1 = convert_2("a")
+    v2 = convert_3(1.5)
+    v3 = convert_0(b"x")
+    v4 = convert_1(True)
+    v5 = convert_2([1, 2])
+    v6 = convert_3(["a", "b"])
+    v7 = convert_0({"a": 1})
+    v8 = convert_1((1, 2))
+    v9 = convert_2({1, 2})
+    v10 = convert_3(frozenset({"a"}))
+    v11 = convert_0(bytearray())
+    v12 = convert_1(1j)
+    v13 = convert_2(range(3))
+    v14 = convert_3(memoryview(b""))
+    v15 = convert_0(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_1(convert_2(convert_3("a")))
+    n1 = [convert_1(x) for x in items]
+    n2 = {k: convert_0(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_1(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_18(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_2(1)
+    v1 = convert_3("a")
+    v2 = convert_0(1.5)
+    v3 = convert_1(b"x")
+    v4 = convert_2(True)
+    v5 = convert_3([1, 2])
+    v6 = convert_0(["a", "b"])
+    v7 = convert_1({"a": 1})
+    v8 = convert_2((1, 2))
+    v9 = convert_3({1, 2})
+    v10 = convert_0(frozenset({"a"}))
+    v11 = convert_1(bytearray())
+    v12 = convert_2(1j)
+    v13 = convert_3(range(3))
+    v14 = convert_0(memoryview(b""))
+    v15 = convert_1(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_2(convert_3(convert_0(1.5)))
+    n1 = [convert_2(x) for x in items]
+    n2 = {k: convert_1(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_2(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_19(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_3(1)
+    v1 = convert_0("a")
+    v2 = convert_1(1.5)
+    v3 = convert_2(b"x")
+    v4 = convert_3(True)
+    v5 = convert_0([1, 2])
+    v6 = convert_1(["a", "b"])
+    v7 = convert_2({"a": 1})
+    v8 = convert_3((1, 2))
+    v9 = convert_0({1, 2})
+    v10 = convert_1(frozenset({"a"}))
+    v11 = convert_2(bytearray())
+    v12 = convert_3(1j)
+    v13 = convert_0(range(3))
+    v14 = convert_1(memoryview(b""))
+    v15 = convert_2(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_3(convert_0(convert_1(b"x")))
+    n1 = [convert_3(x) for x in items]
+    n2 = {k: convert_2(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_3(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_20(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_0(1)
+    v1 = convert_1("a")
+    v2 = convert_2(1.5)
+    v3 = convert_3(b"x")
+    v4 = convert_0(True)
+    v5 = convert_1([1, 2])
+    v6 = convert_2(["a", "b"])
+    v7 = convert_3({"a": 1})
+    v8 = convert_0((1, 2))
+    v9 = convert_1({1, 2})
+    v10 = convert_2(frozenset({"a"}))
+    v11 = convert_3(bytearray())
+    v12 = convert_0(1j)
+    v13 = convert_1(range(3))
+    v14 = convert_2(memoryview(b""))
+    v15 = convert_3(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_0(convert_1(convert_2(True)))
+    n1 = [convert_0(x) for x in items]
+    n2 = {k: convert_3(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_0(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_21(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_1(1)
+    v1 = convert_2("a")
+    v2 = convert_3(1.5)
+    v3 = convert_0(b"x")
+    v4 = convert_1(True)
+    v5 = convert_2([1, 2])
+    v6 = convert_3(["a", "b"])
+    v7 = convert_0({"a": 1})
+    v8 = convert_1((1, 2))
+    v9 = convert_2({1, 2})
+    v10 = convert_3(frozenset({"a"}))
+    v11 = convert_0(bytearray())
+    v12 = convert_1(1j)
+    v13 = convert_2(range(3))
+    v14 = convert_3(memoryview(b""))
+    v15 = convert_0(None)
+    r0 = read_0("path", "r")
+    r1 = read_1("path", "w")
+    r2 = read_2("path", "a")
+    r3 = read_0("path", "rb")
+    r4 = read_1("path", "wb")
+    r5 = read_2("path", "ab")
+    r6 = read_0("path", "r+")
+    r7 = read_1("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_1(convert_2(convert_3([1, 2])))
+    n1 = [convert_1(x) for x in items]
+    n2 = {k: convert_0(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_1(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_22(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_2(1)
+    v1 = convert_3("a")
+    v2 = convert_0(1.5)
+    v3 = convert_1(b"x")
+    v4 = convert_2(True)
+    v5 = convert_3([1, 2])
+    v6 = convert_0(["a", "b"])
+    v7 = convert_1({"a": 1})
+    v8 = convert_2((1, 2))
+    v9 = convert_3({1, 2})
+    v10 = convert_0(frozenset({"a"}))
+    v11 = convert_1(bytearray())
+    v12 = convert_2(1j)
+    v13 = convert_3(range(3))
+    v14 = convert_0(memoryview(b""))
+    v15 = convert_1(None)
+    r0 = read_1("path", "r")
+    r1 = read_2("path", "w")
+    r2 = read_0("path", "a")
+    r3 = read_1("path", "rb")
+    r4 = read_2("path", "wb")
+    r5 = read_0("path", "ab")
+    r6 = read_1("path", "r+")
+    r7 = read_2("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_2(convert_3(convert_0(["a", "b"])))
+    n1 = [convert_2(x) for x in items]
+    n2 = {k: convert_1(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_2(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
+
+
+def use_overloads_23(reg: Registry, items: list[int], mapping: dict[str, int]) -> None:
+    v0 = convert_3(1)
+    v1 = convert_0("a")
+    v2 = convert_1(1.5)
+    v3 = convert_2(b"x")
+    v4 = convert_3(True)
+    v5 = convert_0([1, 2])
+    v6 = convert_1(["a", "b"])
+    v7 = convert_2({"a": 1})
+    v8 = convert_3((1, 2))
+    v9 = convert_0({1, 2})
+    v10 = convert_1(frozenset({"a"}))
+    v11 = convert_2(bytearray())
+    v12 = convert_3(1j)
+    v13 = convert_0(range(3))
+    v14 = convert_1(memoryview(b""))
+    v15 = convert_2(None)
+    r0 = read_2("path", "r")
+    r1 = read_0("path", "w")
+    r2 = read_1("path", "a")
+    r3 = read_2("path", "rb")
+    r4 = read_0("path", "wb")
+    r5 = read_1("path", "ab")
+    r6 = read_2("path", "r+")
+    r7 = read_0("path", "w+")
+    g0 = reg.get(1)
+    g1 = reg.get("key")
+    g2 = reg.get(object(), 0)
+    f0 = first(items)
+    f1 = first(iter(items), "default")
+    n0 = convert_3(convert_0(convert_1({"a": 1})))
+    n1 = [convert_3(x) for x in items]
+    n2 = {k: convert_2(v) for k, v in mapping.items()}
+    n3 = reg.register(1, lambda: convert_3(1))
+    print(v0, v5, r0, r3, g0, g1, g2, f0, f1, n0, n1, n2, n3)
@@ -0,0 +1,705 @@
+# typeddict_heavy.py — big TypedDicts
+# Stresses TypedDict synthesis and assignment: classes with many keys,
+# inheritance chains, Required/NotRequired keys, dict literals matched
+# against TypedDict expected types and key-based narrowing of unions.
+
+from __future__ import annotations
+
+from typing import Literal, TypedDict, Union
+
+from typing_extensions import NotRequired, ReadOnly, Required, Unpack
+
+
+class Record(TypedDict):
+    field_0: int
+    field_1: str
+    field_2: float
+    field_3: bool
+    field_4: list[str]
+    field_5: dict[str, int]
+    field_6: str | None
+    field_7: int | None
+    field_8: tuple[int, int]
+    field_9: bytes
+    field_10: int
+    field_11: str
+    field_12: float
+    field_13: bool
+    field_14: list[str]
+    field_15: dict[str, int]
+    field_16: str | None
+    field_17: int | None
+    field_18: tuple[int, int]
+    field_19: bytes
+    field_20: int
+    field_21: str
+    field_22: float
+    field_23: bool
+    field_24: list[str]
+    field_25: dict[str, int]
+    field_26: str | None
+    field_27: int | None
+    field_28: tuple[int, int]
+    field_29: bytes
+    field_30: int
+    field_31: str
+    field_32: float
+    field_33: bool
+    field_34: list[str]
+    field_35: dict[str, int]
+    field_36: str | None
+    field_37: int | None
+    field_38: tuple[int, int]
+    field_39: bytes
+    field_40: int
+    field_41: str
+    field_42: float
+    field_43: bool
+    field_44: list[str]
+    field_45: dict[str, int]
+    field_46: str | None
+    field_47: int | None
+    field_48: tuple[int, int]
+    field_49: bytes
+    field_50: int
+    field_51: str
+    field_52: float
+    field_53: bool
+    field_54: list[str]
+    field_55: dict[str, int]
+    field_56: str | None
+    field_57: int | None
+    field_58: tuple[int, int]
+    field_59: bytes
+
+
+class PartialRecord(TypedDict, total=False):
+    field_0: Required[int]
+    field_1: str
+    field_2: float
+    field_3: bool
+    field_4: list[str]
+    field_5: dict[str, int]
+    field_6: str | None
+    field_7: Required[int | None]
+    field_8: tuple[int, int]
+    field_9: bytes
+    field_10: int
+    field_11: str
+    field_12: float
+    field_13: bool
+    field_14: Required[list[str]]
+    field_15: dict[str, int]
+    field_16: str | None
+    field_17: int | None
+    field_18: tuple[int, int]
+    field_19: bytes
+    field_20: int
+    field_21: Required[str]
+    field_22: float
+    field_23: bool
+    field_24: list[str]
+    field_25: dict[str, int]
+    field_26: str | None
+    field_27: int | None
+    field_28: Required[tuple[int, int]]
+    field_29: bytes
+    field_30: int
+    field_31: str
+    field_32: float
+    field_33: bool
+    field_34: list[str]
+    field_35: Required[dict[str, int]]
+    field_36: str | None
+    field_37: int | None
+    field_38: tuple[int, int]
+    field_39: bytes
+    field_40: int
+    field_41: str
+    field_42: Required[float]
+    field_43: bool
+    field_44: list[str]
+    field_45: dict[str, int]
+    field_46: str | None
+    field_47: int | None
+    field_48: tuple[int, int]
+    field_49: Required[bytes]
+    field_50: int
+    field_51: str
+    field_52: float
+    field_53: bool
+    field_54: list[str]
+    field_55: dict[str, int]
+    field_56: Required[str | None]
+    field_57: int | None
+    field_58: tuple[int, int]
+    field_59: bytes
+
+
+class Level0(TypedDict):
+    level0_key0: NotRequired[int]
+    level0_key1: str
+    level0_key2: float
+    level0_key3: NotRequired[bool]
+    level0_key4: list[str]
+    level0_key5: ReadOnly[dict[str, int]]
+    level0_key6: NotRequired[str | None]
+    level0_key7: int | None
+
+
+class Level1(Level0):
+    level1_key0: NotRequired[str]
+    level1_key1: float
+    level1_key2: bool
+    level1_key3: NotRequired[list[str]]
+    level1_key4: dict[str, int]
+    level1_key5: ReadOnly[str | None]
+    level1_key6: NotRequired[int | None]
+    level1_key7: tuple[int, int]
+
+
+class Level2(Level1):
+    level2_key0: NotRequired[float]
+    level2_key1: bool
+    level2_key2: list[str]
+    level2_key3: NotRequired[dict[str, int]]
+    level2_key4: str | None
+    level2_key5: ReadOnly[int | None]
+    level2_key6: NotRequired[tuple[int, int]]
+    level2_key7: bytes
+
+
+class Level3(Level2):
+    level3_key0: NotRequired[bool]
+    level3_key1: list[str]
+    level3_key2: dict[str, int]
+    level3_key3: NotRequired[str | None]
+    level3_key4: int | None
+    level3_key5: ReadOnly[tuple[int, int]]
+    level3_key6: NotRequired[bytes]
+    level3_key7: int
+
+
+class Level4(Level3):
+    level4_key0: NotRequired[list[str]]
+    level4_key1: dict[str, int]
+    level4_key2: str | None
+    level4_key3: NotRequired[int | None]
+    level4_key4: tuple[int, int]
+    level4_key5: ReadOnly[bytes]
+    level4_key6: NotRequired[int]
+    level4_key7: str
+
+
+class Level5(Level4):
+    level5_key0: NotRequired[dict[str, int]]
+    level5_key1: str | None
+    level5_key2: int | None
+    level5_key3: NotRequired[tuple[int, int]]
+    level5_key4: bytes
+    level5_key5: ReadOnly[int]
+    level5_key6: NotRequired[str]
+    level5_key7: float
+
+
+class Level6(Level5):
+    level6_key0: NotRequired[str | None]
+    level6_key1: int | None
+    level6_key2: tuple[int, int]
+    level6_key3: NotRequired[bytes]
+    level6_key4: int
+    level6_key5: ReadOnly[str]
+    level6_key6: NotRequired[float]
+    level6_key7: bool
+
+
+class Level7(Level6):
+    level7_key0: NotRequired[int | None]
+    level7_key1: tuple[int, int]
+    level7_key2: bytes
+    level7_key3: NotRequired[int]
+    level7_key4: str
+    level7_key5: ReadOnly[float]
+    level7_key6: NotRequired[bool]
+    level7_key7: list[str]
+
+
+class CreateEvent(TypedDict):
+    kind: Literal["create"]
+    path: str
+    create_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class UpdateEvent(TypedDict):
+    kind: Literal["update"]
+    path: str
+    update_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class DeleteEvent(TypedDict):
+    kind: Literal["delete"]
+    path: str
+    delete_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class MoveEvent(TypedDict):
+    kind: Literal["move"]
+    path: str
+    move_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class CopyEvent(TypedDict):
+    kind: Literal["copy"]
+    path: str
+    copy_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class RenameEvent(TypedDict):
+    kind: Literal["rename"]
+    path: str
+    rename_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class LinkEvent(TypedDict):
+    kind: Literal["link"]
+    path: str
+    link_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+class UnlinkEvent(TypedDict):
+    kind: Literal["unlink"]
+    path: str
+    unlink_id: int
+    timestamp: float
+    extra: NotRequired[dict[str, str]]
+
+
+Event = Union[CreateEvent, UpdateEvent, DeleteEvent, MoveEvent, CopyEvent, RenameEvent, LinkEvent, UnlinkEvent]
+
+
+def handle_event(event: Event) -> int:
+    if event["kind"] == "create":
+        return event["create_id"]
+    if event["kind"] == "update":
+        return event["update_id"]
+    if event["kind"] == "delete":
+        return event["delete_id"]
+    if event["kind"] == "move":
+        return event["move_id"]
+    if event["kind"] == "copy":
+        return event["copy_id"]
+    if event["kind"] == "rename":
+        return event["rename_id"]
+    if event["kind"] == "link":
+        return event["link_id"]
+    if event["kind"] == "unlink":
+        return event["unlink_id"]
+    return 0
+
+
+def make_record() -> Record:
+    return {
+        "field_0": 1,
+        "field_1": "s",
+        "field_2": 1.0,
+        "field_3": True,
+        "field_4": ["a"],
+        "field_5": {"a": 1},
+        "field_6": None,
+        "field_7": 0,
+        "field_8": (1, 2),
+        "field_9": b"",
+        "field_10": 1,
+        "field_11": "s",
+        "field_12": 1.0,
+        "field_13": True,
+        "field_14": ["a"],
+        "field_15": {"a": 1},
+        "field_16": None,
+        "field_17": 0,
+        "field_18": (1, 2),
+        "field_19": b"",
+        "field_20": 1,
+        "field_21": "s",
+        "field_22": 1.0,
+        "field_23": True,
+        "field_24": ["a"],
+        "field_25": {"a": 1},
+        "field_26": None,
+        "field_27": 0,
+        "field_28": (1, 2),
+        "field_29": b"",
+        "field_30": 1,
+        "field_31": "s",
+        "field_32": 1.0,
+        "field_33": True,
+        "field_34": ["a"],
+        "field_35": {"a": 1},
+        "field_36": None,
+        "field_37": 0,
+        "field_38": (1, 2),
+        "field_39": b"",
+        "field_40": 1,
+        "field_41": "s",
+        "field_42": 1.0,
+        "field_43": True,
+        "field_44": ["a"],
+        "field_45": {"a": 1},
+        "field_46": None,
+        "field_47": 0,
+        "field_48": (1, 2),
+        "field_49": b"",
+        "field_50": 1,
+        "field_51": "s",
+        "field_52": 1.0,
+        "field_53": True,
+        "field_54": ["a"],
+        "field_55": {"a": 1},
+        "field_56": None,
+        "field_57": 0,
+        "field_58": (1, 2),
+        "field_59": b"",
+    }
+
+
+def make_level() -> Level7:
+    return {
+        "level0_key1": "s",
+        "level0_key2": 1.0,
+        "level0_key4": ["a"],
+        "level0_key5": {"a": 1},
+        "level0_key7": 0,
+        "level1_key1": 1.0,
+        "level1_key2": True,
+        "level1_key4": {"a": 1},
+        "level1_key5": None,
+        "level1_key7": (1, 2),
+        "level2_key1": True,
+        "level2_key2": ["a"],
+        "level2_key4": None,
+        "level2_key5": 0,
+        "level2_key7": b"",
+        "level3_key1": ["a"],
+        "level3_key2": {"a": 1},
+        "level3_key4": 0,
+        "level3_key5": (1, 2),
+        "level3_key7": 1,
+        "level4_key1": {"a": 1},
+        "level4_key2": None,
+        "level4_key4": (1, 2),
+        "level4_key5": b"",
+        "level4_key7": "s",
+        "level5_key1": None,
+        "level5_key2": 0,
+        "level5_key4": b"",
+        "level5_key5": 1,
+        "level5_key7": 1.0,
+        "level6_key1": 0,
+        "level6_key2": (1, 2),
+        "level6_key4": 1,
+        "level6_key5": "s",
+        "level6_key7": True,
+        "level7_key1": (1, 2),
+        "level7_key2": b"",
+        "level7_key4": "s",
+        "level7_key5": 1.0,
+        "level7_key7": ["a"],
+    }
+
+
+def configure(**kwargs: Unpack[PartialRecord]) -> PartialRecord:
+    return kwargs
+
+
+def use_records_0(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_0": record["field_0"]}
+    merged = partial | {"field_0": record["field_0"]}
+    update: PartialRecord = {"field_0": 1, "field_1": "s"}
+    partial.update(update)
+    value = partial.get("field_2")
+    if "field_3" in partial:
+        value = partial["field_3"]
+    nested = level["level0_key1"]
+    configure(field_0=1, field_1="s")
+    events: list[Event] = [{"kind": "create", "path": "p", "create_id": 0, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_1(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_1": record["field_1"]}
+    merged = partial | {"field_3": record["field_3"]}
+    update: PartialRecord = {"field_0": 1, "field_2": 1.0}
+    partial.update(update)
+    value = partial.get("field_3")
+    if "field_4" in partial:
+        value = partial["field_4"]
+    nested = level["level1_key1"]
+    configure(field_0=1, field_2=1.0)
+    events: list[Event] = [{"kind": "update", "path": "p", "update_id": 1, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_2(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_2": record["field_2"]}
+    merged = partial | {"field_6": record["field_6"]}
+    update: PartialRecord = {"field_0": 1, "field_3": True}
+    partial.update(update)
+    value = partial.get("field_4")
+    if "field_5" in partial:
+        value = partial["field_5"]
+    nested = level["level2_key1"]
+    configure(field_0=1, field_3=True)
+    events: list[Event] = [{"kind": "delete", "path": "p", "delete_id": 2, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_3(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_3": record["field_3"]}
+    merged = partial | {"field_9": record["field_9"]}
+    update: PartialRecord = {"field_0": 1, "field_4": ["a"]}
+    partial.update(update)
+    value = partial.get("field_5")
+    if "field_6" in partial:
+        value = partial["field_6"]
+    nested = level["level3_key1"]
+    configure(field_0=1, field_4=["a"])
+    events: list[Event] = [{"kind": "move", "path": "p", "move_id": 3, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_4(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_4": record["field_4"]}
+    merged = partial | {"field_12": record["field_12"]}
+    update: PartialRecord = {"field_0": 1, "field_5": {"a": 1}}
+    partial.update(update)
+    value = partial.get("field_6")
+    if "field_7" in partial:
+        value = partial["field_7"]
+    nested = level["level4_key1"]
+    configure(field_0=1, field_5={"a": 1})
+    events: list[Event] = [{"kind": "copy", "path": "p", "copy_id": 4, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_5(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_5": record["field_5"]}
+    merged = partial | {"field_15": record["field_15"]}
+    update: PartialRecord = {"field_0": 1, "field_6": None}
+    partial.update(update)
+    value = partial.get("field_7")
+    if "field_8" in partial:
+        value = partial["field_8"]
+    nested = level["level5_key1"]
+    configure(field_0=1, field_6=None)
+    events: list[Event] = [{"kind": "rename", "path": "p", "rename_id": 5, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_6(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_6": record["field_6"]}
+    merged = partial | {"field_18": record["field_18"]}
+    update: PartialRecord = {"field_0": 1, "field_7": 0}
+    partial.update(update)
+    value = partial.get("field_8")
+    if "field_9" in partial:
+        value = partial["field_9"]
+    nested = level["level6_key1"]
+    configure(field_0=1, field_7=0)
+    events: list[Event] = [{"kind": "link", "path": "p", "link_id": 6, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_7(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_7": record["field_7"]}
+    merged = partial | {"field_21": record["field_21"]}
+    update: PartialRecord = {"field_0": 1, "field_8": (1, 2)}
+    partial.update(update)
+    value = partial.get("field_9")
+    if "field_10" in partial:
+        value = partial["field_10"]
+    nested = level["level7_key1"]
+    configure(field_0=1, field_8=(1, 2))
+    events: list[Event] = [{"kind": "unlink", "path": "p", "unlink_id": 7, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_8(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_8": record["field_8"]}
+    merged = partial | {"field_24": record["field_24"]}
+    update: PartialRecord = {"field_0": 1, "field_9": b""}
+    partial.update(update)
+    value = partial.get("field_10")
+    if "field_11" in partial:
+        value = partial["field_11"]
+    nested = level["level0_key1"]
+    configure(field_0=1, field_9=b"")
+    events: list[Event] = [{"kind": "create", "path": "p", "create_id": 8, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_9(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_9": record["field_9"]}
+    merged = partial | {"field_27": record["field_27"]}
+    update: PartialRecord = {"field_0": 1, "field_10": 1}
+    partial.update(update)
+    value = partial.get("field_11")
+    if "field_12" in partial:
+        value = partial["field_12"]
+    nested = level["level1_key1"]
+    configure(field_0=1, field_10=1)
+    events: list[Event] = [{"kind": "update", "path": "p", "update_id": 9, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_10(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_10": record["field_10"]}
+    merged = partial | {"field_30": record["field_30"]}
+    update: PartialRecord = {"field_0": 1, "field_11": "s"}
+    partial.update(update)
+    value = partial.get("field_12")
+    if "field_13" in partial:
+        value = partial["field_13"]
+    nested = level["level2_key1"]
+    configure(field_0=1, field_11="s")
+    events: list[Event] = [{"kind": "delete", "path": "p", "delete_id": 10, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_11(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_11": record["field_11"]}
+    merged = partial | {"field_33": record["field_33"]}
+    update: PartialRecord = {"field_0": 1, "field_12": 1.0}
+    partial.update(update)
+    value = partial.get("field_13")
+    if "field_14" in partial:
+        value = partial["field_14"]
+    nested = level["level3_key1"]
+    configure(field_0=1, field_12=1.0)
+    events: list[Event] = [{"kind": "move", "path": "p", "move_id": 11, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_12(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_12": record["field_12"]}
+    merged = partial | {"field_36": record["field_36"]}
+    update: PartialRecord = {"field_0": 1, "field_13": True}
+    partial.update(update)
+    value = partial.get("field_14")
+    if "field_15" in partial:
+        value = partial["field_15"]
+    nested = level["level4_key1"]
+    configure(field_0=1, field_13=True)
+    events: list[Event] = [{"kind": "copy", "path": "p", "copy_id": 12, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_13(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_13": record["field_13"]}
+    merged = partial | {"field_39": record["field_39"]}
+    update: PartialRecord = {"field_0": 1, "field_14": ["a"]}
+    partial.update(update)
+    value = partial.get("field_15")
+    if "field_16" in partial:
+        value = partial["field_16"]
+    nested = level["level5_key1"]
+    configure(field_0=1, field_14=["a"])
+    events: list[Event] = [{"kind": "rename", "path": "p", "rename_id": 13, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_14(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_14": record["field_14"]}
+    merged = partial | {"field_42": record["field_42"]}
+    update: PartialRecord = {"field_0": 1, "field_15": {"a": 1}}
+    partial.update(update)
+    value = partial.get("field_16")
+    if "field_17" in partial:
+        value = partial["field_17"]
+    nested = level["level6_key1"]
+    configure(field_0=1, field_15={"a": 1})
+    events: list[Event] = [{"kind": "link", "path": "p", "link_id": 14, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_15(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_15": record["field_15"]}
+    merged = partial | {"field_45": record["field_45"]}
+    update: PartialRecord = {"field_0": 1, "field_16": None}
+    partial.update(update)
+    value = partial.get("field_17")
+    if "field_18" in partial:
+        value = partial["field_18"]
+    nested = level["level7_key1"]
+    configure(field_0=1, field_16=None)
+    events: list[Event] = [{"kind": "unlink", "path": "p", "unlink_id": 15, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_16(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_16": record["field_16"]}
+    merged = partial | {"field_48": record["field_48"]}
+    update: PartialRecord = {"field_0": 1, "field_17": 0}
+    partial.update(update)
+    value = partial.get("field_18")
+    if "field_19" in partial:
+        value = partial["field_19"]
+    nested = level["level0_key1"]
+    configure(field_0=1, field_17=0)
+    events: list[Event] = [{"kind": "create", "path": "p", "create_id": 16, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_17(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_17": record["field_17"]}
+    merged = partial | {"field_51": record["field_51"]}
+    update: PartialRecord = {"field_0": 1, "field_18": (1, 2)}
+    partial.update(update)
+    value = partial.get("field_19")
+    if "field_20" in partial:
+        value = partial["field_20"]
+    nested = level["level1_key1"]
+    configure(field_0=1, field_18=(1, 2))
+    events: list[Event] = [{"kind": "update", "path": "p", "update_id": 17, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_18(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_18": record["field_18"]}
+    merged = partial | {"field_54": record["field_54"]}
+    update: PartialRecord = {"field_0": 1, "field_19": b""}
+    partial.update(update)
+    value = partial.get("field_20")
+    if "field_21" in partial:
+        value = partial["field_21"]
+    nested = level["level2_key1"]
+    configure(field_0=1, field_19=b"")
+    events: list[Event] = [{"kind": "delete", "path": "p", "delete_id": 18, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
+
+
+def use_records_19(record: Record, partial: PartialRecord, level: Level7) -> None:
+    copy: Record = {**record, "field_19": record["field_19"]}
+    merged = partial | {"field_57": record["field_57"]}
+    update: PartialRecord = {"field_0": 1, "field_20": 1}
+    partial.update(update)
+    value = partial.get("field_21")
+    if "field_22" in partial:
+        value = partial["field_22"]
+    nested = level["level3_key1"]
+    configure(field_0=1, field_20=1)
+    events: list[Event] = [{"kind": "move", "path": "p", "move_id": 19, "timestamp": 0.0}]
+    print(copy, merged, value, nested, handle_event(events[0]))
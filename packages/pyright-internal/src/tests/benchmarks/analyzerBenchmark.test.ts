@@ -0,0 +1,379 @@
+/*
+ * analyzerBenchmark.test.ts
+ *
+ * Microbenchmark for the binder, checker and type evaluator.
+ * Measures the time per parse node spent in each stage of analyzing a file
+ * and the hit rates of the evaluator's caches, using corpora that target
+ * expensive parts of the evaluator (narrowing, overloads, TypedDicts,
+ * generics and enums).
+ *
+ * Each iteration discards the file's parse tree and the type evaluator, so
+ * every stage starts cold. Builtins and other imported stubs stay parsed and
+ * bound, but their types are evaluated again by the new evaluator.
+ *
+ * Stages:
+ *   parse    - tokenizing and parsing the file and resolving its imports
+ *   bind     - binding the file
+ *   check    - checking the file, including the evaluation it triggers
+ *   evaluate - evaluating the type of every name in the file with a new
+ *              evaluator, without running the checker
+ *
+ * Run with:
+ *   cd packages/pyright-internal
+ *   PYRIGHT_RUN_BENCHMARKS=1 node node_modules\jest\bin\jest analyzerBenchmark.test --runInBand --detectOpenHandles --forceExit --testTimeout=300000
+ *
+ * Results are written as JSON to:
+ *   src/tests/benchmarks/.generated/benchmark-results/analyzer/
+ */
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { CancellationToken } from 'vscode-languageserver';
+
+import { ImportResolver } from '../../analyzer/importResolver';
+import { ParseTreeWalker } from '../../analyzer/parseTreeWalker';
+import { Program } from '../../analyzer/program';
+import { NameTypeWalker } from '../../analyzer/testWalker';
+import { ConfigOptions } from '../../common/configOptions';
+import { NullConsole } from '../../common/console';
+import { FullAccessHost } from '../../common/fullAccessHost';
+import { createFromRealFileSystem, RealTempFile } from '../../common/realFileSystem';
+import { createServiceProvider } from '../../common/serviceProviderExtensions';
+import { cacheStats } from '../../common/timing';
+import { Uri } from '../../common/uri/uri';
+import { UriEx } from '../../common/uri/uriUtils';
+import { ParseNode, ParseNodeArray } from '../../parser/parseNodes';
+
+// This allows the fallback typeshed directory to be located when running
+// within jest. It assumes that the working directory is pyright-internal.
+(global as any).__rootDirectory = path.resolve();
+
+// --- Configuration ---
+
+const WARMUP_ITERATIONS = 2;
+const BENCHMARK_ITERATIONS = 10;
+
+const BENCHMARK_OUTPUT_DIR = path.join(__dirname, '.generated', 'benchmark-results', 'analyzer');
+const RUN_BENCHMARKS_ENV = 'PYRIGHT_RUN_BENCHMARKS';
+
+// --- Types ---
+
+type Stage = 'parse' | 'bind' | 'check' | 'evaluate';
+type CacheName = 'typeCache' | 'speculativeTypeCache' | 'codeFlowTypeCache';
+
+const stages: Stage[] = ['parse', 'bind', 'check', 'evaluate'];
+const cacheNames: CacheName[] = ['typeCache', 'speculativeTypeCache', 'codeFlowTypeCache'];
+
+interface StageResult {
+    timesMs: number[];
+    medianMs: number;
+    p95Ms: number;
+    minMs: number;
+    maxMs: number;
+    avgMs: number;
+    nsPerNode: number;
+}
+
+interface CacheResult {
+    hitCount: number;
+    missCount: number;
+    hitRate: number;
+}
+
+type CacheResults = Record<CacheName, CacheResult>;
+
+interface BenchmarkResult {
+    corpus: string;
+    fileSizeBytes: number;
+    iterations: number;
+    nodeCount: number;
+    stages: Record<Stage, StageResult>;
+
+    // The cache lookups made while checking the file and while evaluating
+    // its names. They're the same in every iteration because every
+    // iteration starts with a new evaluator.
+    caches: { check: CacheResults; evaluate: CacheResults };
+}
+
+interface BenchmarkReport {
+    timestamp: string;
+    system: {
+        platform: string;
+        arch: string;
+        cpus: string;
+        cpuCount: number;
+        totalMemoryMB: number;
+        nodeVersion: string;
+    };
+    config: {
+        warmupIterations: number;
+        benchmarkIterations: number;
+    };
+    results: BenchmarkResult[];
+}
+
+interface IterationResult {
+    timesMs: Record<Stage, number>;
+    caches: { check: CacheResults; evaluate: CacheResults };
+}
+
+// --- Helpers ---
+
+function calculateStats(times: ReadonlyArray<number>): {
+    median: number;
+    p95: number;
+    min: number;
+    max: number;
+    avg: number;
+} {
+    const sorted = [...times].sort((a, b) => a - b);
+    const len = sorted.length;
+
+    const median = len % 2 === 0 ? (sorted[len / 2 - 1] + sorted[len / 2]) / 2 : sorted[Math.floor(len / 2)];
+    const p95Index = Math.ceil(len * 0.95) - 1;
+    const p95 = sorted[Math.min(p95Index, len - 1)];
+    const min = sorted[0];
+    const max = sorted[len - 1];
+    const avg = times.reduce((a, b) => a + b, 0) / len;
+
+    return { median, p95, min, max, avg };
+}
+
+function getCorpusPath(filename: string): string {
+    return path.resolve(__dirname, '..', 'benchmarkData', filename);
+}
+
+function getSystemInfo(): BenchmarkReport['system'] {
+    const cpus = os.cpus();
+    return {
+        platform: os.platform(),
+        arch: os.arch(),
+        cpus: cpus[0]?.model ?? 'unknown',
+        cpuCount: cpus.length,
+        totalMemoryMB: Math.round(os.totalmem() / (1024 * 1024)),
+        nodeVersion: process.version,
+    };
+}
+
+function writeReport(report: BenchmarkReport): void {
+    fs.mkdirSync(BENCHMARK_OUTPUT_DIR, { recursive: true });
+    const filename = `analyzer-benchmark-${new Date().toISOString().replace(/[:.]/g, '-')}.json`;
+    const outputPath = path.join(BENCHMARK_OUTPUT_DIR, filename);
+    fs.writeFileSync(outputPath, JSON.stringify(report, undefined, 2), 'utf-8');
+    console.log(`\nBenchmark results written to: ${outputPath}`);
+}
+
+function formatHitRate(cache: CacheResult): string {
+    return `${(cache.hitRate * 100).toFixed(1)}%`;
+}
+
+function printResultTable(results: ReadonlyArray<BenchmarkResult>): void {
+    console.log('\n=== Analyzer Benchmark Results (ns/node, cache hit rates while checking) ===\n');
+    console.log(
+        `${'Corpus'.padEnd(20)} ${'Nodes'.padStart(8)} ${'Parse'.padStart(9)} ${'Bind'.padStart(9)} ${'Check'.padStart(
+            9
+        )} ${'Evaluate'.padStart(9)} ${'Type'.padStart(7)} ${'Spec'.padStart(7)} ${'Flow'.padStart(7)}`
+    );
+    console.log('-'.repeat(94));
+
+    for (const r of results) {
+        const caches = r.caches.check;
+        console.log(
+            `${r.corpus.padEnd(20)} ${String(r.nodeCount).padStart(8)} ${stages
+                .map((stage) => Math.round(r.stages[stage].nsPerNode).toLocaleString().padStart(9))
+                .join(' ')} ${formatHitRate(caches.typeCache).padStart(7)} ${formatHitRate(
+                caches.speculativeTypeCache
+            ).padStart(7)} ${formatHitRate(caches.codeFlowTypeCache).padStart(7)}`
+        );
+    }
+    console.log('');
+}
+
+class NodeCounter extends ParseTreeWalker {
+    nodeCount = 0;
+
+    override visitNode(node: ParseNode): ParseNodeArray {
+        this.nodeCount++;
+        return super.visitNode(node);
+    }
+}
+
+function createProgram(): Program {
+    const tempFile = new RealTempFile();
+    const fs = createFromRealFileSystem(tempFile);
+    const serviceProvider = createServiceProvider(fs, new NullConsole(), tempFile);
+    const configOptions = new ConfigOptions(Uri.empty());
+    const importResolver = new ImportResolver(serviceProvider, configOptions, new FullAccessHost(serviceProvider));
+
+    return new Program(importResolver, configOptions, serviceProvider);
+}
+
+// Runs the callback and returns the number of cache lookups it made.
+function countCacheLookups(callback: () => void): CacheResults {
+    const before = cacheNames.map((name) => ({ ...cacheStats[name] }));
+    cacheStats.isEnabled = true;
+    try {
+        callback();
+    } finally {
+        cacheStats.isEnabled = false;
+    }
+
+    const results = {} as CacheResults;
+    cacheNames.forEach((name, i) => {
+        const hitCount = cacheStats[name].hitCount - before[i].hitCount;
+        const missCount = cacheStats[name].missCount - before[i].missCount;
+        const lookupCount = hitCount + missCount;
+        results[name] = { hitCount, missCount, hitRate: lookupCount > 0 ? hitCount / lookupCount : 0 };
+    });
+
+    return results;
+}
+
+function timeOperation(callback: () => void): number {
+    const start = performance.now();
+    callback();
+    return performance.now() - start;
+}
+
+function analyzeOnce(program: Program, fileUri: Uri): IterationResult {
+    // Discard the file's parse tree and create a new evaluator.
+    program.markFilesDirty([fileUri], /* evenIfContentsAreSame */ true);
+    const sourceFile = program.getSourceFile(fileUri)!;
+
+    // The source file is normally parsed only by the program, which also
+    // updates its import graph. The file's imports are the same in every
+    // iteration, so the graph built by the first iteration stays valid.
+    const parse = timeOperation(() => sourceFile.parse(program.configOptions, program.importResolver));
+    const bind = timeOperation(() => program.getBoundSourceFile(fileUri));
+
+    let check = 0;
+    const checkCaches = countCacheLookups(() => {
+        check = timeOperation(() => program.analyzeFile(fileUri));
+    });
+
+    // Evaluate the types of the names with a new evaluator. Names are the
+    // leaves of most expressions, so this evaluates most of the file in the
+    // same order as hovering over each name would.
+    program.markFilesDirty([fileUri], /* evenIfContentsAreSame */ true);
+    const parseTree = program.getParseResults(fileUri)!.parserOutput.parseTree;
+
+    let evaluate = 0;
+    const evaluateCaches = countCacheLookups(() => {
+        evaluate = timeOperation(() =>
+            program.run(() => new NameTypeWalker(program.evaluator!).walk(parseTree), CancellationToken.None)
+        );
+    });
+
+    return {
+        timesMs: { parse, bind, check, evaluate },
+        caches: { check: checkCaches, evaluate: evaluateCaches },
+    };
+}
+
+function benchmarkAnalysis(corpusName: string, file: string): BenchmarkResult {
+    const fileUri = UriEx.file(getCorpusPath(file));
+    const program = createProgram();
+    program.setTrackedFiles([fileUri]);
+
+    try {
+        // Warmup. The first iteration also parses and binds the builtins.
+        for (let i = 0; i < WARMUP_ITERATIONS; i++) {
+            analyzeOnce(program, fileUri);
+        }
+
+        const iterations: IterationResult[] = [];
+        for (let i = 0; i < BENCHMARK_ITERATIONS; i++) {
+            iterations.push(analyzeOnce(program, fileUri));
+        }
+
+        const nodeCounter = new NodeCounter();
+        nodeCounter.walk(program.getParseResults(fileUri)!.parserOutput.parseTree);
+        const nodeCount = nodeCounter.nodeCount;
+
+        const stageResults = {} as Record<Stage, StageResult>;
+        for (const stage of stages) {
+            const times = iterations.map((iteration) => iteration.timesMs[stage]);
+            const stats = calculateStats(times);
+            stageResults[stage] = {
+                timesMs: times,
+                medianMs: stats.median,
+                p95Ms: stats.p95,
+                minMs: stats.min,
+                maxMs: stats.max,
+                avgMs: stats.avg,
+                nsPerNode: (stats.median * 1e6) / nodeCount,
+            };
+        }
+
+        return {
+            corpus: corpusName,
+            fileSizeBytes: fs.statSync(getCorpusPath(file)).size,
+            iterations: BENCHMARK_ITERATIONS,
+            nodeCount,
+            stages: stageResults,
+            caches: iterations[iterations.length - 1].caches,
+        };
+    } finally {
+        program.dispose();
+        program.serviceProvider.dispose();
+    }
+}
+
+// --- Corpus definitions ---
+
+const corpora: { name: string; file: string }[] = [
+    { name: 'narrowing_heavy', file: 'narrowing_heavy.py' },
+    { name: 'overload_heavy', file: 'overload_heavy.py' },
+    { name: 'typeddict_heavy', file: 'typeddict_heavy.py' },
+    { name: 'generic_heavy', file: 'generic_heavy.py' },
+    { name: 'enum_heavy', file: 'enum_heavy.py' },
+    { name: 'union_heavy', file: 'union_heavy.py' },
+    { name: 'large_class', file: 'large_class.py' },
+];
+
+// --- Tests ---
+
+const benchmarkSuite = process.env[RUN_BENCHMARKS_ENV] === '1' ? describe : describe.skip;
+
+benchmarkSuite('Analyzer Benchmark', () => {
+    const allResults: BenchmarkResult[] = [];
+
+    for (const { name, file } of corpora) {
+        test(`analyze ${name}`, () => {
+            const result = benchmarkAnalysis(name, file);
+            allResults.push(result);
+
+            console.log(
+                `  ${name}: nodes=${result.nodeCount}, ${stages
+                    .map((stage) => `${stage}=${result.stages[stage].medianMs.toFixed(2)}ms`)
+                    .join(', ')}, type cache hits=${formatHitRate(result.caches.check.typeCache)}`
+            );
+
+            expect(result.nodeCount).toBeGreaterThan(0);
+            expect(result.caches.check.typeCache.hitCount + result.caches.check.typeCache.missCount).toBeGreaterThan(
+                0
+            );
+        });
+    }
+
+    afterAll(() => {
+        if (allResults.length === 0) {
+            return;
+        }
+
+        printResultTable(allResults);
+
+        const report: BenchmarkReport = {
+            timestamp: new Date().toISOString(),
+            system: getSystemInfo(),
+            config: {
+                warmupIterations: WARMUP_ITERATIONS,
+                benchmarkIterations: BENCHMARK_ITERATIONS,
+            },
+            results: allResults,
+        };
+
+        writeReport(report);
+    });
+});
@@ -0,0 +1,418 @@
+/*
+ * languageServerBenchmark.test.ts
+ *
+ * Latency benchmark for the language server.
+ * Starts basedpyright-langserver over stdio against the benchmark corpus,
+ * replays a recorded editing session (edits, hovers, completions, semantic
+ * tokens and pull diagnostics) and measures how long the server takes to
+ * respond to each request.
+ *
+ * The language server bundle must be built first:
+ *   cd packages/pyright
+ *   npm run build
+ *
+ * Run with:
+ *   cd packages/pyright-internal
+ *   PYRIGHT_RUN_BENCHMARKS=1 node node_modules\jest\bin\jest languageServerBenchmark.test --runInBand --detectOpenHandles --forceExit --testTimeout=300000
+ *
+ * Set PYRIGHT_LANGSERVER_PATH to benchmark another build of the server, and
+ * PYRIGHT_LSP_BENCHMARK_SESSION to replay another session file (the files it
+ * names are resolved relative to the session file).
+ *
+ * Results are written as JSON to:
+ *   src/tests/benchmarks/.generated/benchmark-results/languageServer/
+ */
+
+import { ChildProcess, spawn } from 'child_process';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import {
+    createMessageConnection,
+    MessageConnection,
+    StreamMessageReader,
+    StreamMessageWriter,
+} from 'vscode-jsonrpc/node';
+import {
+    CompletionRequest,
+    ConfigurationParams,
+    DidChangeTextDocumentNotification,
+    DidOpenTextDocumentNotification,
+    DocumentDiagnosticReportKind,
+    DocumentDiagnosticRequest,
+    ExitNotification,
+    HoverRequest,
+    InitializedNotification,
+    InitializeRequest,
+    LSPErrorCodes,
+    Position,
+    ResponseError,
+    SemanticTokensRequest,
+    ShutdownRequest,
+} from 'vscode-languageserver-protocol';
+
+import { convertOffsetToPosition } from '../../common/positionUtils';
+import { UriEx } from '../../common/uri/uriUtils';
+import { Tokenizer } from '../../parser/tokenizer';
+import { getInitializeParams } from '../lsp/languageServerTestUtils';
+
+// --- Configuration ---
+
+const BENCHMARK_OUTPUT_DIR = path.join(__dirname, '.generated', 'benchmark-results', 'languageServer');
+const LANGSERVER_PATH_ENV = 'PYRIGHT_LANGSERVER_PATH';
+const SESSION_PATH_ENV = 'PYRIGHT_LSP_BENCHMARK_SESSION';
+const RUN_BENCHMARKS_ENV = 'PYRIGHT_RUN_BENCHMARKS';
+
+const DEFAULT_LANGSERVER_PATH = path.resolve(__dirname, '..', '..', '..', '..', 'pyright', 'langserver.index.js');
+const DEFAULT_SESSION_PATH = path.resolve(__dirname, '..', 'benchmarkData', 'lspSession.json');
+
+// The first iteration of the session is a warmup and isn't measured.
+const WARMUP_ITERATIONS = 1;
+
+// Bounds of the delay before a diagnostics pull is retried.
+const PULL_RETRY_INITIAL_DELAY_MS = 5;
+const PULL_RETRY_MAX_DELAY_MS = 200;
+
+// --- Types ---
+
+type SessionStep =
+    | { kind: 'insert' | 'delete'; file: string; after: string; text: string }
+    | { kind: 'hover'; file: string; at: string; offset?: number }
+    | { kind: 'completion'; file: string; after: string }
+    | { kind: 'semanticTokens' | 'diagnostics'; file: string };
+
+type RequestKind = 'didChange' | 'hover' | 'completion' | 'semanticTokens' | 'diagnostics';
+
+interface Session {
+    files: string[];
+    iterations: number;
+    steps: SessionStep[];
+}
+
+interface LatencyResult {
+    kind: RequestKind;
+    count: number;
+    p50Ms: number;
+    p95Ms: number;
+    p99Ms: number;
+    maxMs: number;
+    avgMs: number;
+}
+
+interface BenchmarkReport {
+    timestamp: string;
+    system: {
+        platform: string;
+        arch: string;
+        cpus: string;
+        cpuCount: number;
+        totalMemoryMB: number;
+        nodeVersion: string;
+    };
+    config: {
+        langServerPath: string;
+        sessionPath: string;
+        warmupIterations: number;
+        benchmarkIterations: number;
+    };
+    initializeMs: number;
+    timeToFirstDiagnosticMs: number;
+    results: LatencyResult[];
+}
+
+interface OpenDocument {
+    uri: string;
+    text: string;
+    version: number;
+}
+
+// --- Helpers ---
+
+function percentile(sorted: ReadonlyArray<number>, fraction: number): number {
+    const index = Math.ceil(sorted.length * fraction) - 1;
+    return sorted[Math.min(Math.max(index, 0), sorted.length - 1)];
+}
+
+function calculateLatency(kind: RequestKind, times: ReadonlyArray<number>): LatencyResult {
+    const sorted = [...times].sort((a, b) => a - b);
+    return {
+        kind,
+        count: sorted.length,
+        p50Ms: percentile(sorted, 0.5),
+        p95Ms: percentile(sorted, 0.95),
+        p99Ms: percentile(sorted, 0.99),
+        maxMs: sorted[sorted.length - 1],
+        avgMs: sorted.reduce((a, b) => a + b, 0) / sorted.length,
+    };
+}
+
+function getSystemInfo(): BenchmarkReport['system'] {
+    const cpus = os.cpus();
+    return {
+        platform: os.platform(),
+        arch: os.arch(),
+        cpus: cpus[0]?.model ?? 'unknown',
+        cpuCount: cpus.length,
+        totalMemoryMB: Math.round(os.totalmem() / (1024 * 1024)),
+        nodeVersion: process.version,
+    };
+}
+
+function writeReport(report: BenchmarkReport): void {
+    fs.mkdirSync(BENCHMARK_OUTPUT_DIR, { recursive: true });
+    const filename = `languageServer-benchmark-${new Date().toISOString().replace(/[:.]/g, '-')}.json`;
+    const outputPath = path.join(BENCHMARK_OUTPUT_DIR, filename);
+    fs.writeFileSync(outputPath, JSON.stringify(report, undefined, 2), 'utf-8');
+    console.log(`\nBenchmark results written to: ${outputPath}`);
+}
+
+function printResultTable(report: BenchmarkReport): void {
+    console.log('\n=== Language Server Latency Results ===\n');
+    console.log(`Initialize:              ${report.initializeMs.toFixed(1)}ms`);
+    console.log(`Time to first diagnostic: ${report.timeToFirstDiagnosticMs.toFixed(1)}ms\n`);
+    console.log(
+        `${'Request'.padEnd(16)} ${'Count'.padStart(7)} ${'p50'.padStart(10)} ${'p95'.padStart(10)} ${'p99'.padStart(
+            10
+        )} ${'Max'.padStart(10)} ${'Avg'.padStart(10)}`
+    );
+    console.log('-'.repeat(78));
+
+    for (const r of report.results) {
+        console.log(
+            `${r.kind.padEnd(16)} ${String(r.count).padStart(7)} ${r.p50Ms.toFixed(2).padStart(10)} ${r.p95Ms
+                .toFixed(2)
+                .padStart(10)} ${r.p99Ms.toFixed(2).padStart(10)} ${r.maxMs.toFixed(2).padStart(10)} ${r.avgMs
+                .toFixed(2)
+                .padStart(10)}`
+        );
+    }
+    console.log('');
+}
+
+function getOffset(doc: OpenDocument, anchor: string): number {
+    const offset = doc.text.indexOf(anchor);
+    if (offset < 0) {
+        throw new Error(`Anchor ${JSON.stringify(anchor)} not found in ${doc.uri}`);
+    }
+
+    return offset;
+}
+
+function getPosition(doc: OpenDocument, offset: number): Position {
+    return convertOffsetToPosition(offset, new Tokenizer().tokenize(doc.text).lines);
+}
+
+// Copies the session's files to a fresh workspace so the server can't pick up
+// a config file or other files from the repo.
+function createWorkspace(session: Session, sessionDir: string): string {
+    const workspaceDir = fs.mkdtempSync(path.join(os.tmpdir(), 'lsp-benchmark-'));
+    for (const file of session.files) {
+        fs.copyFileSync(path.join(sessionDir, file), path.join(workspaceDir, path.basename(file)));
+    }
+
+    return workspaceDir;
+}
+
+function startServer(langServerPath: string): { process: ChildProcess; connection: MessageConnection } {
+    const serverProcess = spawn(process.execPath, [langServerPath, '--stdio'], {
+        stdio: ['pipe', 'pipe', 'inherit'],
+    });
+    const connection = createMessageConnection(
+        new StreamMessageReader(serverProcess.stdout!),
+        new StreamMessageWriter(serverProcess.stdin!)
+    );
+
+    // Answer the requests the server sends to the client. Only the settings
+    // matter; analyze only the open files, like most editors do by default.
+    connection.onRequest('workspace/configuration', (params: ConfigurationParams) =>
+        params.items.map((item) =>
+            item.section === 'basedpyright' ? { analysis: { diagnosticMode: 'openFilesOnly' } } : null
+        )
+    );
+    connection.onRequest(() => null);
+    connection.onNotification(() => {
+        /* ignore log messages, progress, etc. */
+    });
+    connection.listen();
+
+    return { process: serverProcess, connection };
+}
+
+// Pulls the diagnostics for the file, retrying while the server asks for the
+// request to be retriggered (e.g. while the workspace is being initialized).
+// The delay between retries doubles up to a limit so the server isn't flooded.
+async function pullDiagnostics(connection: MessageConnection, doc: OpenDocument) {
+    let retryDelayMs = PULL_RETRY_INITIAL_DELAY_MS;
+    for (;;) {
+        try {
+            const report = await connection.sendRequest(DocumentDiagnosticRequest.type, {
+                textDocument: { uri: doc.uri },
+            });
+            if (report.kind === DocumentDiagnosticReportKind.Full) {
+                return report;
+            }
+        } catch (e) {
+            if (!(e instanceof ResponseError) || e.code !== LSPErrorCodes.ServerCancelled) {
+                throw e;
+            }
+        }
+
+        await new Promise((resolve) => setTimeout(resolve, retryDelayMs));
+        retryDelayMs = Math.min(retryDelayMs * 2, PULL_RETRY_MAX_DELAY_MS);
+    }
+}
+
+async function runSession(langServerPath: string, sessionPath: string): Promise<BenchmarkReport> {
+    const session: Session = JSON.parse(fs.readFileSync(sessionPath, 'utf-8'));
+    const workspaceDir = createWorkspace(session, path.dirname(sessionPath));
+    const workspaceUri = UriEx.file(workspaceDir);
+    const docs = new Map<string, OpenDocument>();
+    const times = new Map<RequestKind, number[]>();
+
+    const { process: serverProcess, connection } = startServer(langServerPath);
+
+    try {
+        let start = performance.now();
+        await connection.sendRequest(InitializeRequest.type, getInitializeParams([workspaceUri], true));
+        connection.sendNotification(InitializedNotification.type, {});
+        const initializeMs = performance.now() - start;
+
+        // Open all of the files, then wait until the diagnostics for the first
+        // one are available.
+        start = performance.now();
+        for (const file of session.files) {
+            const fileName = path.basename(file);
+            const uri = workspaceUri.combinePaths(fileName).toString();
+            const text = fs.readFileSync(path.join(workspaceDir, fileName), 'utf-8');
+            const doc: OpenDocument = { uri, text, version: 1 };
+            docs.set(file, doc);
+            connection.sendNotification(DidOpenTextDocumentNotification.type, {
+                textDocument: { uri, languageId: 'python', version: doc.version, text: doc.text },
+            });
+        }
+        await pullDiagnostics(connection, docs.get(session.files[0])!);
+        const timeToFirstDiagnosticMs = performance.now() - start;
+
+        for (let i = 0; i < WARMUP_ITERATIONS + session.iterations; i++) {
+            for (const step of session.steps) {
+                const doc = docs.get(step.file);
+                if (!doc) {
+                    throw new Error(`Session step refers to a file that isn't in the session: ${step.file}`);
+                }
+
+                const [kind, elapsed] = await runStep(connection, doc, step);
+                if (i >= WARMUP_ITERATIONS) {
+                    times.set(kind, [...(times.get(kind) ?? []), elapsed]);
+                }
+            }
+        }
+
+        await connection.sendRequest(ShutdownRequest.type);
+        connection.sendNotification(ExitNotification.type);
+
+        return {
+            timestamp: new Date().toISOString(),
+            system: getSystemInfo(),
+            config: {
+                langServerPath,
+                sessionPath,
+                warmupIterations: WARMUP_ITERATIONS,
+                benchmarkIterations: session.iterations,
+            },
+            initializeMs,
+            timeToFirstDiagnosticMs,
+            results: [...times.entries()].map(([kind, kindTimes]) => calculateLatency(kind, kindTimes)),
+        };
+    } finally {
+        connection.dispose();
+        serverProcess.kill();
+        fs.rmSync(workspaceDir, { recursive: true, force: true });
+    }
+}
+
+// Runs one step of the session and returns how long the server took to
+// respond. Edits are notifications, so for them the time until the server
+// returns the diagnostics for the edited contents is measured.
+async function runStep(
+    connection: MessageConnection,
+    doc: OpenDocument,
+    step: SessionStep
+): Promise<[RequestKind, number]> {
+    const textDocument = { uri: doc.uri };
+
+    switch (step.kind) {
+        case 'insert':
+        case 'delete': {
+            const offset = getOffset(doc, step.after) + step.after.length;
+            const range =
+                step.kind === 'insert'
+                    ? { start: getPosition(doc, offset), end: getPosition(doc, offset) }
+                    : { start: getPosition(doc, offset), end: getPosition(doc, offset + step.text.length) };
+            if (step.kind === 'delete' && doc.text.substr(offset, step.text.length) !== step.text) {
+                throw new Error(`Text to delete ${JSON.stringify(step.text)} not found in ${doc.uri}`);
+            }
+
+            doc.text =
+                doc.text.slice(0, offset) +
+                (step.kind === 'insert' ? step.text : '') +
+                doc.text.slice(step.kind === 'insert' ? offset : offset + step.text.length);
+            doc.version++;
+
+            const start = performance.now();
+            await connection.sendNotification(DidChangeTextDocumentNotification.type, {
+                textDocument: { uri: doc.uri, version: doc.version },
+                contentChanges: [{ range, text: step.kind === 'insert' ? step.text : '' }],
+            });
+            await pullDiagnostics(connection, doc);
+            return ['didChange', performance.now() - start];
+        }
+
+        case 'hover': {
+            const position = getPosition(doc, getOffset(doc, step.at) + (step.offset ?? 0));
+            const start = performance.now();
+            await connection.sendRequest(HoverRequest.type, { textDocument, position });
+            return ['hover', performance.now() - start];
+        }
+
+        case 'completion': {
+            const position = getPosition(doc, getOffset(doc, step.after) + step.after.length);
+            const start = performance.now();
+            await connection.sendRequest(CompletionRequest.type, { textDocument, position });
+            return ['completion', performance.now() - start];
+        }
+
+        case 'semanticTokens': {
+            const start = performance.now();
+            await connection.sendRequest(SemanticTokensRequest.type, { textDocument });
+            return ['semanticTokens', performance.now() - start];
+        }
+
+        case 'diagnostics': {
+            const start = performance.now();
+            await pullDiagnostics(connection, doc);
+            return ['diagnostics', performance.now() - start];
+        }
+    }
+}
+
+// --- Tests ---
+
+const benchmarkSuite = process.env[RUN_BENCHMARKS_ENV] === '1' ? describe : describe.skip;
+
+benchmarkSuite('Language Server Benchmark', () => {
+    test('replay editing session', async () => {
+        const langServerPath = process.env[LANGSERVER_PATH_ENV] ?? DEFAULT_LANGSERVER_PATH;
+        const sessionPath = process.env[SESSION_PATH_ENV] ?? DEFAULT_SESSION_PATH;
+        if (!fs.existsSync(langServerPath)) {
+            throw new Error(`Language server not found at ${langServerPath}. Build it with "npm run build" first.`);
+        }
+
+        const report = await runSession(langServerPath, sessionPath);
+
+        printResultTable(report);
+        writeReport(report);
+
+        expect(report.results.length).toBeGreaterThan(0);
+        expect(report.timeToFirstDiagnosticMs).toBeGreaterThan(0);
+    });
+});
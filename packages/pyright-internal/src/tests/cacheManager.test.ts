@@ -70,6 +70,23 @@ test('multiple owners', () => {
     assert.strictEqual(manager.getCacheUsage(), 0);
 });
 
+test('emptyCache', () => {
+    const manager = new CacheManager();
+    const mock1 = new MockCacheOwner(10);
+    const mock2 = new MockCacheOwner(20);
+
+    manager.registerCacheOwner(mock1);
+    manager.registerCacheOwner(mock2);
+    assert.strictEqual(manager.emptyCacheCount, 0);
+
+    manager.emptyCache();
+    assert.strictEqual(manager.getCacheUsage(), 0);
+    assert.strictEqual(manager.emptyCacheCount, 1);
+
+    manager.unregisterCacheOwner(mock1);
+    manager.unregisterCacheOwner(mock2);
+});
+
 test('Shared memory', async () => {
     const manager = new CacheManager(/* maxWorkers */ 1);
 
@@ -0,0 +1,56 @@
+/*
+ * compactDiagnostics.test.ts
+ *
+ * Tests for the compact diagnostic encoding used to send results from
+ * worker processes to the main process.
+ */
+
+import assert from 'assert';
+
+import { decodeFileDiagnostics, encodeFileDiagnostics } from '../common/compactDiagnostics';
+import { Diagnostic, DiagnosticCategory, TaskListPriority } from '../common/diagnostic';
+import { FileDiagnostics } from '../common/diagnosticSink';
+import { UriEx } from '../common/uri/uriUtils';
+
+function range(line: number, start: number, end: number) {
+    return { start: { line, character: start }, end: { line, character: end } };
+}
+
+test('round trip preserves all diagnostic fields', () => {
+    const fileUri = UriEx.file('/a.py');
+    const otherUri = UriEx.file('/b.py');
+
+    const error = new Diagnostic(DiagnosticCategory.Error, 'Bad thing', range(1, 2, 3));
+    error.setRule('reportGeneralTypeIssues');
+    error.addRelatedInfo('Declared here', otherUri, range(4, 0, 5), TaskListPriority.Low);
+
+    const hint = new Diagnostic(DiagnosticCategory.Hint, 'Unused', range(7, 0, 1), TaskListPriority.Normal, true);
+    hint.addAction({ action: 'pyright.ignore' });
+    hint.setData({ value: 1 });
+
+    const fileDiagnostics: FileDiagnostics[] = [
+        { fileUri, cell: undefined, version: 3, diagnostics: [error, hint], reason: 'analysis' },
+        { fileUri: otherUri, cell: 2, version: undefined, diagnostics: [], reason: 'tracking' },
+    ];
+
+    const decoded = decodeFileDiagnostics(encodeFileDiagnostics(fileDiagnostics));
+    assert.deepStrictEqual(
+        decoded.map((fileDiag) => FileDiagnostics.toJsonObj(fileDiag)),
+        fileDiagnostics.map((fileDiag) => FileDiagnostics.toJsonObj(fileDiag))
+    );
+});
+
+test('repeated strings and uris are stored once', () => {
+    const fileUri = UriEx.file('/a.py');
+    const diagnostics = [0, 1, 2].map(
+        (line) => new Diagnostic(DiagnosticCategory.Error, 'Same message', range(line, 0, 1))
+    );
+
+    const encoded = encodeFileDiagnostics([
+        { fileUri, cell: undefined, version: undefined, diagnostics, reason: 'analysis' },
+    ]);
+
+    assert.strictEqual(encoded.uris.length, 1);
+    assert.strictEqual(encoded.strings.filter((value) => value === 'Same message').length, 1);
+    assert.strictEqual(encoded.extras.length, 0);
+});
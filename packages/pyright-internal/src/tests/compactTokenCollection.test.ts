@@ -0,0 +1,88 @@
+/*
+ * compactTokenCollection.test.ts
+ *
+ * Unit tests for the array-backed token collection used for large files.
+ */
+
+import assert from 'assert';
+import * as fs from 'fs';
+import * as path from 'path';
+
+import { TextRangeCollection } from '../common/textRangeCollection';
+import { CompactTokenCollection } from '../parser/compactTokenCollection';
+import { Tokenizer } from '../parser/tokenizer';
+import { Token } from '../parser/tokenizerTypes';
+
+function tokenize(text: string): TextRangeCollection<Token> {
+    return new Tokenizer().tokenize(text).tokens;
+}
+
+function getTokens(collection: TextRangeCollection<Token>): Token[] {
+    const tokens: Token[] = [];
+    for (let i = 0; i < collection.count; i++) {
+        tokens.push(collection.getItemAt(i));
+    }
+    return tokens;
+}
+
+function verifySameTokens(text: string) {
+    const expected = tokenize(text);
+    const compact = new CompactTokenCollection(getTokens(expected));
+
+    assert.strictEqual(compact.count, expected.count);
+    assert.strictEqual(compact.start, expected.start);
+    assert.strictEqual(compact.end, expected.end);
+    assert.deepStrictEqual(getTokens(compact), getTokens(expected));
+
+    for (let position = -1; position <= text.length + 1; position++) {
+        assert.strictEqual(compact.getItemAtPosition(position), expected.getItemAtPosition(position), `${position}`);
+        assert.strictEqual(compact.getItemContaining(position), expected.getItemContaining(position), `${position}`);
+    }
+}
+
+test('matches the tokens of a simple module', () => {
+    verifySameTokens(
+        [
+            'import os  # comment',
+            '',
+            'class A:',
+            '    def f(self, x: int = 1) -> "A":',
+            '        if x >= 2 and not self:  # type: ignore',
+            '            return self',
+            '        y = [i ** 2 for i in range(10)]; y += [...]',
+            '        return A()',
+            '',
+        ].join('\n')
+    );
+});
+
+test('matches the tokens of strings, numbers and f-strings', () => {
+    verifySameTokens(
+        [
+            'a = f"x{1 + 2!r:>{width}}y" rb"\\x00" 0x1f 1_000j 3.5e-2',
+            'b = """multi',
+            'line""" \'unterminated',
+            '\tc = `d`',
+            '',
+        ].join('\r\n')
+    );
+});
+
+test('matches the tokens of a corpus', () => {
+    verifySameTokens(fs.readFileSync(path.resolve(__dirname, 'benchmarkData', 'fstring_heavy.py'), 'utf8'));
+});
+
+test('is used for large files', () => {
+    const text = 'x = (1, 2)\n'.repeat(2000);
+    const tokens = tokenize(text);
+
+    assert(tokens instanceof CompactTokenCollection);
+    assert.strictEqual(tokens.getItemAt(tokens.getItemContaining(text.length - 3)).start, text.length - 3);
+});
+
+test('returns the same object for a token accessed repeatedly', () => {
+    const tokens = new CompactTokenCollection(getTokens(tokenize('x = (1, 2)\n')));
+
+    assert.strictEqual(tokens.getItemAt(2), tokens.getItemAt(2));
+    assert.throws(() => tokens.getItemAt(tokens.count));
+});
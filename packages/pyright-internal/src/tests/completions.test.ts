@@ -9,7 +9,12 @@ import { CancellationToken } from 'vscode-languageserver';
 import { ApplyKind, CompletionItemKind, CompletionItemTag, MarkupKind } from 'vscode-languageserver-types';
 
 import { Uri } from '../common/uri/uri';
-import { CompletionItemData, CompletionOptions, CompletionProvider } from '../languageService/completionProvider';
+import {
+    CompletionCache,
+    CompletionItemData,
+    CompletionOptions,
+    CompletionProvider,
+} from '../languageService/completionProvider';
 import { parseAndGetTestState } from './harness/fourslash/testState';
 
 const configEnableExplicitOverride = `
@@ -1067,6 +1072,87 @@ test('passive resolve does not change MRU sort order', async () => {
     completionProviderTestAccess._mostRecentCompletions = [];
 });
 
+test('reuses completions while typing an identifier', () => {
+    const code = `
+// @filename: test.py
+//// true_divide = 0
+//// truly = 0
+//// t/*marker*/
+    `;
+
+    const state = parseAndGetTestState(code).state;
+    const marker = state.getMarkerByName('marker');
+    state.openFiles(state.testData.files.map((f) => f.fileName));
+
+    while (state.workspace.service.test_program.analyze());
+
+    const filePath = marker.fileName;
+    const uri = Uri.file(filePath, state.serviceProvider);
+    const position = state.convertOffsetToPosition(filePath, marker.position);
+
+    const options: CompletionOptions = {
+        format: 'markdown',
+        snippet: false,
+        lazyEdit: false,
+        checkDeprecatedWhenResolving: false,
+        useTypingExtensions: false,
+    };
+
+    const cache = new CompletionCache();
+    let version = 1;
+    const getCompletions = (text: string, character: number, completionCache?: CompletionCache) => {
+        state.program.setFileOpened(uri, version++, text);
+        state.program.markFilesDirty([uri], /* evenIfContentsAreSame */ true);
+
+        let isComputed = false;
+        const provider = new CompletionProvider(
+            state.program,
+            uri,
+            { line: position.line, character },
+            options,
+            CancellationToken.None,
+            false,
+            completionCache
+        );
+        const providerTestAccess = provider as unknown as { _getCompletions: () => unknown };
+        const getUncachedCompletions = providerTestAccess._getCompletions.bind(provider);
+        providerTestAccess._getCompletions = () => {
+            isComputed = true;
+            return getUncachedCompletions();
+        };
+
+        const result = provider.getCompletions();
+        assert(result);
+        result.items.sort((a, b) => (a.sortText ?? a.label).localeCompare(b.sortText ?? b.label));
+        return { result, isComputed };
+    };
+
+    const first = getCompletions('true_divide = 0\ntruly = 0\nt', position.character, cache);
+    assert(first.isComputed);
+    assert(first.result.isIncomplete);
+
+    const second = getCompletions('true_divide = 0\ntruly = 0\ntrl', position.character + 2, cache);
+    assert(!second.isComputed);
+    assert.deepStrictEqual(
+        second.result,
+        getCompletions('true_divide = 0\ntruly = 0\ntrl', position.character + 2).result
+    );
+    assert(second.result.items.some((i) => i.label === 'truly'));
+    assert(!second.result.items.some((i) => i.label === 'true_divide'));
+
+    // Completions aren't reused if the text around the identifier changed.
+    const third = getCompletions('true_divide = 0\ntruly = 1\ntrl', position.character + 2, cache);
+    assert(third.isComputed);
+
+    // Nor if the longer word allows the matcher more skips.
+    const fourth = getCompletions('true_divide = 0\ntruly = 1\ntrly', position.character + 3, cache);
+    assert(fourth.isComputed);
+    assert(fourth.result.isIncomplete);
+
+    const empty = getCompletions('true_divide = 0\ntruly = 0\n', 0, cache);
+    assert(empty.result.isIncomplete);
+});
+
 test('override generic', async () => {
     const code = `
 // @filename: test.py
@@ -0,0 +1,83 @@
+/*
+ * fileScheduler.test.ts
+ *
+ * Unit tests for the scheduler that distributes files across worker processes.
+ */
+
+import assert from 'assert';
+
+import { FileScheduler, ScheduledFile } from '../analyzer/fileScheduler';
+
+function file(key: string, cost: number, clusterKey: string, dependencies?: string[]): ScheduledFile<string> {
+    return { key, item: key, cost, clusterKey, dependencies };
+}
+
+function drain(scheduler: FileScheduler<string>, workerIndex: number) {
+    const result: string[] = [];
+    let next = scheduler.next(workerIndex);
+    while (next !== undefined) {
+        result.push(next);
+        next = scheduler.next(workerIndex);
+    }
+    return result;
+}
+
+test('files in the same cluster go to the same worker', () => {
+    const scheduler = new FileScheduler(
+        [file('a1', 10, 'a'), file('b1', 10, 'b'), file('a2', 10, 'a'), file('b2', 10, 'b')],
+        /* workerCount */ 2
+    );
+
+    const first = [scheduler.next(0)!, scheduler.next(0)!].sort();
+    const second = [scheduler.next(1)!, scheduler.next(1)!].sort();
+    assert.deepStrictEqual([first, second].sort(), [
+        ['a1', 'a2'],
+        ['b1', 'b2'],
+    ]);
+    assert.strictEqual(scheduler.stealCount, 0);
+});
+
+test('expensive clusters are balanced across workers', () => {
+    const scheduler = new FileScheduler(
+        [file('big', 100, 'a'), file('small1', 10, 'b'), file('small2', 10, 'c'), file('medium', 90, 'd')],
+        /* workerCount */ 2
+    );
+
+    const costs = new Map([
+        ['big', 100],
+        ['small1', 10],
+        ['small2', 10],
+        ['medium', 90],
+    ]);
+
+    const totalFor = (workerIndex: number) => {
+        let total = 0;
+        for (let i = 0; i < 2; i++) {
+            total += costs.get(scheduler.next(workerIndex)!)!;
+        }
+        return total;
+    };
+
+    assert.deepStrictEqual([totalFor(0), totalFor(1)].sort(), [100, 110]);
+});
+
+test('idle workers steal from the most loaded worker', () => {
+    const scheduler = new FileScheduler([file('a1', 10, 'a'), file('a2', 10, 'a'), file('a3', 10, 'a')], 2);
+
+    const stolen = drain(scheduler, 1);
+    assert.strictEqual(stolen.length, 3);
+    assert.strictEqual(scheduler.stealCount, 3);
+    assert.strictEqual(scheduler.remainingFileCount, 0);
+});
+
+test('files that import each other are merged into one cluster', () => {
+    const scheduler = new FileScheduler(
+        [file('a', 10, 'dirA', ['b']), file('b', 10, 'dirB'), file('c', 10, 'dirC'), file('d', 10, 'dirD')],
+        /* workerCount */ 2,
+        /* maxClusterFraction */ 1
+    );
+
+    const worker0 = [scheduler.next(0)!, scheduler.next(0)!].sort();
+    const worker1 = [scheduler.next(1)!, scheduler.next(1)!].sort();
+    assert([worker0, worker1].some((files) => files[0] === 'a' && files[1] === 'b'));
+});
@@ -0,0 +1,34 @@
+/// <reference path="typings/fourslash.d.ts" />
+
+// @filename: test.py
+//// import testLib
+////
+//// [|/*marker1*/w|] = testLib.make()
+//// [|/*marker2*/s|] = w.size
+//// [|/*marker3*/g|] = testLib.count_up()
+//// [|/*marker4*/c|] = testLib.counter
+
+// @filename: testLib/__init__.py
+// @library: true
+//// counter = None
+////
+//// class Widget:
+////     def __init__(self):
+////         self.size = 1
+////
+//// def make():
+////     return Widget()
+////
+//// def count_up():
+////     yield 1
+////
+//// def increment():
+////     global counter
+////     counter = 1
+
+helper.verifyHover('markdown', {
+    marker1: '```python\n(variable) w: Widget\n```',
+    marker2: '```python\n(variable) s: int\n```',
+    marker3: '```python\n(variable) g: Generator[int, Any, None]\n```',
+    marker4: '```python\n(variable) c: int | None\n```',
+});
@@ -0,0 +1,169 @@
+/*
+ * functionBodyEdit.test.ts
+ *
+ * Tests that edits confined to the body of a function or that leave a
+ * module's interface unchanged don't cause the files that import it to be
+ * checked again.
+ */
+
+import assert from 'assert';
+
+import { ImportResolver } from '../analyzer/importResolver';
+import { Program } from '../analyzer/program';
+import { ConfigOptions } from '../common/configOptions';
+import { normalizeSlashes } from '../common/pathUtils';
+import { createServiceProvider } from '../common/serviceProviderExtensions';
+import { UriEx } from '../common/uri/uriUtils';
+import { PyrightFileSystem } from '../pyrightFileSystem';
+import { TestAccessHost } from './harness/testAccessHost';
+import { TestFileSystem } from './harness/vfs/filesystem';
+
+const libUri = UriEx.file('/lib.py');
+const mainUri = UriEx.file('/main.py');
+
+const libContents = 'def f() -> int:\n    x = 1\n    return x\n';
+
+function createProgram(openLib = true) {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    testFS.writeFileSync(libUri, libContents);
+    testFS.writeFileSync(mainUri, 'from lib import f\ny: str = f()\n');
+
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+
+    program.setTrackedFiles([libUri, mainUri]);
+    if (openLib) {
+        program.setFileOpened(libUri, /* version */ 1, libContents);
+    } else {
+        program.setFileOpened(mainUri, /* version */ 1, testFS.readFileSync(mainUri, 'utf8'));
+    }
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+    return { program, testFS, configOptions };
+}
+
+function editLib(program: Program, version: number, contents: string) {
+    program.setFileOpened(libUri, version, contents);
+    program.markFilesDirty([libUri], /* evenIfContentsAreSame */ true);
+}
+
+test('body edit does not invalidate importers', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, libContents.replace('x = 1', 'x = 2'));
+    assert(program.getBoundSourceFile(libUri));
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+    assert(program.getSourceFile(libUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('signature edit invalidates importers after parsing', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, libContents.replace('-> int', '-> str'));
+    assert(program.getBoundSourceFile(libUri));
+    assert(program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('edit that escapes the body invalidates importers after parsing', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, libContents.replace('x = 1\n', 'x = 1\ng = 1\n'));
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    assert(program.getBoundSourceFile(libUri));
+    assert(program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('comment edit does not invalidate importers', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, libContents.replace('-> int:', '-> int:  # A comment'));
+    assert(program.getBoundSourceFile(libUri));
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('edit that adds lines invalidates importers after parsing', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, libContents.replace('x = 1\n', 'x = 1\n    x += 1\n'));
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+    assert(program.getBoundSourceFile(libUri));
+    assert(program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('type comment edit invalidates importers', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, libContents + 'g = []  # type: list[int]\n');
+    while (program.analyze()) {
+        // Continue until complete
+    }
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    editLib(program, 3, libContents + 'g = []  # type: list[str]\n');
+    assert(program.getBoundSourceFile(libUri));
+    assert(program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('pyright directive edit invalidates importers', () => {
+    const { program } = createProgram();
+
+    editLib(program, 2, '# pyright: strict\n' + libContents);
+    assert(program.getBoundSourceFile(libUri));
+    assert(program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('on-disk change to a private helper does not invalidate importers', () => {
+    const { program, testFS } = createProgram(/* openLib */ false);
+
+    testFS.writeFileSync(libUri, libContents + 'def _helper() -> int:\n    return 1\n');
+    program.markFilesDirty([libUri], /* evenIfContentsAreSame */ false);
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    testFS.writeFileSync(libUri, libContents + 'def _helper() -> int:\n    return 2\n');
+    program.markFilesDirty([libUri], /* evenIfContentsAreSame */ false);
+    assert(program.getBoundSourceFile(libUri));
+    assert(!program.getSourceFile(mainUri)!.isCheckingRequired());
+
+    program.dispose();
+});
+
+test('analysis checks importers of a closed file whose interface changed', () => {
+    const { program, testFS, configOptions } = createProgram(/* openLib */ false);
+    const mainFile = program.getSourceFile(mainUri)!;
+    assert.strictEqual(mainFile.getDiagnostics(configOptions).length, 1);
+
+    testFS.writeFileSync(libUri, libContents.replace('-> int', '-> str').replace('1', "'1'"));
+    program.markFilesDirty([libUri], /* evenIfContentsAreSame */ false);
+    assert(!mainFile.isCheckingRequired());
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    assert.strictEqual(mainFile.getDiagnostics(configOptions).length, 0);
+
+    program.dispose();
+});
@@ -0,0 +1,133 @@
+/*
+ * incrementalParse.test.ts
+ *
+ * Unit tests for reparsing a file incrementally after an edit.
+ */
+
+import assert from 'assert';
+import * as fs from 'fs';
+import * as path from 'path';
+
+import { ParseTreeWalker } from '../analyzer/parseTreeWalker';
+import { DiagnosticSink } from '../common/diagnosticSink';
+import { ParseNode } from '../parser/parseNodes';
+import { ParseFileResults, ParseOptions, Parser } from '../parser/parser';
+
+class NodeRangeCollector extends ParseTreeWalker {
+    readonly ranges: string[] = [];
+
+    override visitNode(node: ParseNode) {
+        assert(node.parent || this.ranges.length === 0);
+        this.ranges.push(`${node.nodeType}@${node.start}+${node.length}`);
+        return super.visitNode(node);
+    }
+}
+
+function parse(text: string, previous?: { text: string; results: ParseFileResults }) {
+    const parseOptions = new ParseOptions();
+    parseOptions.enableIncrementalParse = true;
+    const diagSink = new DiagnosticSink();
+
+    const results = new Parser().parseSourceFile(
+        text,
+        parseOptions,
+        diagSink,
+        previous
+            ? {
+                  text: previous.text,
+                  parserOutput: previous.results.parserOutput,
+                  tokenizerOutput: previous.results.tokenizerOutput,
+                  incrementalParseInfo: previous.results.incrementalParseInfo!,
+              }
+            : undefined
+    );
+
+    return { text, results, diagnostics: diagSink.fetchAndClear() };
+}
+
+function describe(parse: { results: ParseFileResults; diagnostics: ReturnType<DiagnosticSink['fetchAndClear']> }) {
+    const collector = new NodeRangeCollector();
+    collector.walk(parse.results.parserOutput.parseTree);
+
+    return {
+        ranges: collector.ranges,
+        imports: parse.results.parserOutput.importedModules.map((i) => [i.nameNode.start, i.nameParts, i.importedSymbols]),
+        futureImports: [...parse.results.parserOutput.futureImports],
+        hasTypeAnnotations: parse.results.parserOutput.hasTypeAnnotations,
+        diagnostics: parse.diagnostics.map((d) => [d.message, d.range]),
+    };
+}
+
+// Parses the text, applies the edit and verifies that reparsing the result
+// incrementally produces the same results as parsing it from scratch.
+// Returns the number of top-level statements that were reused.
+function verifyEdit(text: string, start: number, length: number, newText: string) {
+    const editedText = text.slice(0, start) + newText + text.slice(start + length);
+    const previous = parse(text);
+    const previousStatements = new Set(previous.results.parserOutput.parseTree.d.statements);
+
+    const incremental = parse(editedText, previous);
+    assert.deepStrictEqual(describe(incremental), describe(parse(editedText)));
+
+    return incremental.results.parserOutput.parseTree.d.statements.filter((s) => previousStatements.has(s)).length;
+}
+
+const sampleText = [
+    'from __future__ import annotations',
+    'import os',
+    '',
+    'def f(x: int) -> int:',
+    '    return x + 1',
+    '',
+    'if os.name:',
+    '    y = 1',
+    'else:',
+    '    y = 2',
+    '',
+    '# comment',
+    'class A:',
+    '    z: list[int] = []',
+    '',
+    'print(f(1), A.z)',
+    'w = (',
+    '',
+].join('\n');
+
+test('reuses the statements before and after an edit', () => {
+    const start = sampleText.indexOf('x + 1') + 4;
+
+    assert.strictEqual(verifyEdit(sampleText, start, 1, '100'), 5);
+});
+
+test('reuses the statements after an edit that adds lines', () => {
+    const start = sampleText.indexOf('# comment');
+
+    assert.strictEqual(verifyEdit(sampleText, start, 0, 'def g():\n    pass\n\n'), 5);
+});
+
+test('reparses the statements that follow an edit that changes their meaning', () => {
+    verifyEdit(sampleText, sampleText.indexOf('else:'), 0, '    ');
+    verifyEdit(sampleText, sampleText.indexOf('# comment'), 0, '"""');
+    verifyEdit(sampleText, sampleText.indexOf('class A'), 0, 'def g():\n');
+    verifyEdit(sampleText, sampleText.indexOf('import os'), 0, 'from typing import List\n');
+    verifyEdit(sampleText, sampleText.indexOf('w = ('), 0, ')');
+});
+
+test('matches a full parse after random edits', () => {
+    const fileNames = fs.readdirSync(path.resolve(__dirname, 'benchmarkData')).filter((f) => f.endsWith('.py'));
+    const snippets = ['', 'x', ' ', '\n', '    ', ':', '(', ')', '"', '"""', '#', 'else:\n', 'def f():\n', 'import a\n'];
+
+    let seed = 1;
+    const random = (max: number) => {
+        seed = (seed * 1103515245 + 12345) % 2147483648;
+        return seed % max;
+    };
+
+    fileNames.forEach((fileName) => {
+        const text = fs.readFileSync(path.resolve(__dirname, 'benchmarkData', fileName), 'utf8');
+
+        for (let i = 0; i < 10; i++) {
+            verifyEdit(text, random(text.length), random(3), snippets[random(snippets.length)]);
+        }
+    });
+});
@@ -9,6 +9,7 @@
 import assert from 'assert';
 import {
     CancellationToken,
+    CancellationTokenSource,
     CompletionItem,
     CompletionRequest,
     ConfigurationItem,
@@ -21,13 +22,17 @@ import {
     InitializedNotification,
     InitializeRequest,
     MarkupContent,
+    PreviousResultId,
     WillRenameFilesRequest,
+    WorkspaceDiagnosticRequest,
+    WorkspaceDocumentDiagnosticReport,
 } from 'vscode-languageserver';
 
 import { convertOffsetToPosition } from '../common/positionUtils';
 import { PythonVersion, pythonVersion3_10 } from '../common/pythonVersion';
 
 import { isArray } from '../common/core';
+import { createDeferred } from '../common/deferred';
 import { normalizeSlashes } from '../common/pathUtils';
 import { distlibFolder } from './harness/vfs/factory';
 import {
@@ -40,6 +45,7 @@ import {
     runPyrightServer,
     sleep,
     waitForDiagnostics,
+    waitForPromise,
 } from './lsp/languageServerTestUtils';
 import { tExpect } from 'typed-jest-expect';
 
@@ -587,6 +593,176 @@ describe(`Basic language server tests`, () => {
             }
         });
     });
+    describe('Workspace diagnostics pull', () => {
+        jest.setTimeout(200000);
+
+        const settings = [
+            {
+                item: {
+                    scopeUri: `file://${normalizeSlashes(DEFAULT_WORKSPACE_ROOT, '/')}`,
+                    section: 'python.analysis',
+                },
+                value: {
+                    diagnosticMode: 'workspace',
+                },
+            },
+        ];
+
+        let requestCount = 0;
+
+        // Sends a workspace diagnostics request and collects its partial results until
+        // isDone returns true for the reports received so far. The request is then cancelled.
+        async function pullWorkspaceDiagnostics(
+            info: PyrightServerInfo,
+            previousResultIds: PreviousResultId[],
+            isDone: (reports: WorkspaceDocumentDiagnosticReport[]) => boolean
+        ) {
+            const partialResultToken = `workspaceDiagnosticsTest-${++requestCount}`;
+            const reports: WorkspaceDocumentDiagnosticReport[] = [];
+            const chunkSizes: number[] = [];
+            const received = createDeferred<void>();
+
+            const progressDisposable = info.connection.onProgress(
+                WorkspaceDiagnosticRequest.partialResult,
+                partialResultToken,
+                (progress) => {
+                    chunkSizes.push(progress.items.length);
+                    reports.push(...progress.items);
+                    if (isDone(reports)) {
+                        received.resolve();
+                    }
+                }
+            );
+
+            const cancellationSource = new CancellationTokenSource();
+            const request = info.connection.sendRequest(
+                WorkspaceDiagnosticRequest.type,
+                { identifier: 'Pylance', previousResultIds, partialResultToken },
+                cancellationSource.token
+            );
+
+            try {
+                await waitForPromise(received.promise, 20000, 'Timed out waiting for workspace diagnostics');
+            } finally {
+                cancellationSource.cancel();
+                await waitForPromise(request, 5000).catch(() => {
+                    // The request may be rejected because it was cancelled.
+                });
+                progressDisposable.dispose();
+            }
+
+            return { reports, chunkSizes };
+        }
+
+        const isTestFile = (report: WorkspaceDocumentDiagnosticReport) => report.uri.endsWith('/test.py');
+        const hasTestFileErrors = (reports: WorkspaceDocumentDiagnosticReport[]) =>
+            reports.some((report) => isTestFile(report) && report.kind === 'full' && report.items.length > 0);
+
+        function getLastFullReport(reports: WorkspaceDocumentDiagnosticReport[]) {
+            const report = reports.filter((report) => isTestFile(report) && report.kind === 'full').pop();
+            assert(report?.kind === 'full' && report.resultId);
+            return report;
+        }
+
+        test('files the client already has are reported as unchanged', async () => {
+            const code = `
+// @filename: root/test.py
+//// x: int = [|/*marker*/"not an int"|]
+        `;
+            const info = await runLanguageServer(
+                DEFAULT_WORKSPACE_ROOT,
+                code,
+                /* callInitialize */ true,
+                settings,
+                undefined,
+                /* supportsBackgroundThread */ true,
+                /* supportsPullDiagnostics */ true
+            );
+
+            const firstPull = await pullWorkspaceDiagnostics(info, [], hasTestFileErrors);
+            const fullReport = getLastFullReport(firstPull.reports);
+
+            const secondPull = await pullWorkspaceDiagnostics(
+                info,
+                [{ uri: fullReport.uri, value: fullReport.resultId! }],
+                (reports) => reports.some(isTestFile)
+            );
+            const report = secondPull.reports.find(isTestFile);
+            assert(report?.kind === 'unchanged');
+            assert.strictEqual(report.resultId, fullReport.resultId);
+        });
+
+        test('files edited while no request is pending are reported in full', async () => {
+            const code = `
+// @filename: root/test.py
+//// x: int = [|/*marker*/"not an int"|]
+        `;
+            const info = await runLanguageServer(
+                DEFAULT_WORKSPACE_ROOT,
+                code,
+                /* callInitialize */ true,
+                settings,
+                undefined,
+                /* supportsBackgroundThread */ true,
+                /* supportsPullDiagnostics */ true
+            );
+
+            // The first request is cancelled once the file's errors have been reported.
+            const firstPull = await pullWorkspaceDiagnostics(info, [], hasTestFileErrors);
+            const fullReport = getLastFullReport(firstPull.reports);
+
+            // Fix the error and wait for the file to be checked again.
+            await openFile(info, 'marker', 'x: int = 1');
+            const documentReport: any = await info.connection.sendRequest(DocumentDiagnosticRequest.type, {
+                textDocument: { uri: info.testData.markerPositions.get('marker')!.fileUri.toString() },
+            });
+            assert.strictEqual(documentReport?.items?.length, 0);
+
+            const secondPull = await pullWorkspaceDiagnostics(
+                info,
+                [{ uri: fullReport.uri, value: fullReport.resultId! }],
+                (reports) => reports.some(isTestFile)
+            );
+            const report = secondPull.reports.find(isTestFile);
+            assert(report?.kind === 'full');
+            assert.notStrictEqual(report.resultId, fullReport.resultId);
+            assert.strictEqual(report.items.length, 0);
+        });
+
+        test('diagnostics for many files are reported in chunks', async () => {
+            const fileCount = 150;
+            const code = Array.from(
+                { length: fileCount },
+                (_, index) => `
+// @filename: root/test${index}.py
+//// x: int = "not an int"
+`
+            ).join('');
+            const info = await runLanguageServer(
+                DEFAULT_WORKSPACE_ROOT,
+                code,
+                /* callInitialize */ true,
+                settings,
+                undefined,
+                /* supportsBackgroundThread */ true,
+                /* supportsPullDiagnostics */ true
+            );
+
+            const getReportedFiles = (reports: WorkspaceDocumentDiagnosticReport[]) =>
+                new Set(reports.filter((report) => report.kind === 'full').map((report) => report.uri));
+            const { reports, chunkSizes } = await pullWorkspaceDiagnostics(
+                info,
+                [],
+                (reports) => getReportedFiles(reports).size >= fileCount
+            );
+
+            // Partial results are sent in chunks of at most 100 files.
+            assert.strictEqual(getReportedFiles(reports).size, fileCount);
+            assert(chunkSizes.length > 1);
+            assert(chunkSizes.every((size) => size > 0 && size <= 100), `unexpected chunk sizes: ${chunkSizes}`);
+        });
+    });
+
     describe('module/package renaming', () => {
         describe('import statement', () => {
             test('rename module', async () => {
@@ -0,0 +1,85 @@
+/*
+ * performanceTrace.test.ts
+ *
+ * Unit tests for the performance trace recorder.
+ */
+
+import assert from 'assert';
+
+import { PerformanceTrace } from '../common/performanceTrace';
+
+test('records nothing until started', () => {
+    const trace = new PerformanceTrace();
+
+    assert.strictEqual(trace.span('parseFile', 'file', { file: 'a.py' }, () => 1), 1);
+    assert(!trace.isEnabled);
+    assert.deepStrictEqual(trace.takeEvents().events, []);
+});
+
+test('records nested spans', () => {
+    const trace = new PerformanceTrace();
+    trace.start('test');
+
+    const result = trace.span('parseFile', 'file', { file: 'a.py' }, () =>
+        trace.span('tokenize', 'analysis', undefined, () => 'done')
+    );
+    assert.strictEqual(result, 'done');
+
+    const events = JSON.parse(trace.serialize()).traceEvents;
+    assert.deepStrictEqual(
+        events.map((e: any) => [e.ph, e.name]),
+        [
+            ['M', 'process_name'],
+            ['X', 'tokenize'],
+            ['X', 'parseFile'],
+        ]
+    );
+
+    const [, inner, outer] = events;
+    assert.deepStrictEqual(outer.args, { file: 'a.py' });
+    assert(outer.ts <= inner.ts);
+    assert(inner.ts + inner.dur <= outer.ts + outer.dur + 1);
+});
+
+test('omits short spans and computes their arguments lazily', () => {
+    const trace = new PerformanceTrace();
+    trace.start('test');
+    trace.takeEvents();
+
+    let argsComputed = false;
+    const getArgs = () => {
+        argsComputed = true;
+        return {};
+    };
+
+    trace.span('getTypeOfExpression', 'evaluator', getArgs, () => undefined, /* minDurationInMs */ 1000);
+    assert(!argsComputed);
+    assert.deepStrictEqual(trace.takeEvents().events, []);
+});
+
+test('records spans for callbacks that throw', () => {
+    const trace = new PerformanceTrace();
+    trace.start('test');
+    trace.takeEvents();
+
+    assert.throws(() =>
+        trace.span('checkFile', 'file', undefined, () => {
+            throw new Error('cancelled');
+        })
+    );
+    assert.deepStrictEqual(trace.takeEvents().events.map((e) => e.name), ['checkFile']);
+});
+
+test('merges events from other processes', () => {
+    const worker = new PerformanceTrace();
+    worker.start('worker 0');
+    worker.span('bindFile', 'file', undefined, () => undefined);
+
+    const main = new PerformanceTrace();
+    main.start('main');
+    main.addEvents(worker.takeEvents());
+
+    const names = JSON.parse(main.serialize()).traceEvents.map((e: any) => e.args?.name ?? e.name);
+    assert.deepStrictEqual(names, ['main', 'worker 0', 'bindFile']);
+    assert.deepStrictEqual(worker.takeEvents().events, []);
+});
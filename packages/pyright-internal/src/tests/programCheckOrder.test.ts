@@ -0,0 +1,64 @@
+/*
+ * programCheckOrder.test.ts
+ *
+ * Tests the order in which the program checks the files that need to be checked.
+ */
+
+import assert from 'assert';
+
+import { getFileInfo } from '../analyzer/analyzerNodeInfo';
+import { ImportResolver } from '../analyzer/importResolver';
+import { Program } from '../analyzer/program';
+import { ConfigOptions } from '../common/configOptions';
+import { normalizeSlashes } from '../common/pathUtils';
+import { createServiceProvider } from '../common/serviceProviderExtensions';
+import { UriEx } from '../common/uri/uriUtils';
+import { PyrightFileSystem } from '../pyrightFileSystem';
+import { TestAccessHost } from './harness/testAccessHost';
+import { TestFileSystem } from './harness/vfs/filesystem';
+
+const files: { [fileName: string]: string } = {
+    'a.py': 'a = 1\n',
+    'b.py': 'b = 1\n',
+    'c.py': 'c = 1\n',
+    'lib.py': 'def f() -> int: ...\n',
+    'main.py': 'from lib import f\nx = f()\n',
+};
+
+test('recently changed files and their importers are checked first', () => {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    for (const [fileName, contents] of Object.entries(files)) {
+        testFS.writeFileSync(UriEx.file(`/${fileName}`), contents);
+    }
+
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+    program.setTrackedFiles(Object.keys(files).map((fileName) => UriEx.file(`/${fileName}`)));
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    // Change the files in a different order than the one they're tracked in.
+    // The library is changed last, so it and the file that imports it come first.
+    for (const fileName of ['a.py', 'b.py', 'c.py', 'lib.py']) {
+        const fileUri = UriEx.file(`/${fileName}`);
+        testFS.writeFileSync(fileUri, files[fileName].replace('1', '2').replace('int', 'str'));
+        program.markFilesDirty([fileUri], /* evenIfContentsAreSame */ false);
+    }
+
+    const checkedFiles: string[] = [];
+    program.setPreCheckCallback((parserOutput) => {
+        checkedFiles.push(getFileInfo(parserOutput.parseTree).fileUri.fileName);
+    });
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    assert.deepStrictEqual(checkedFiles, ['lib.py', 'main.py', 'c.py', 'b.py', 'a.py']);
+
+    program.dispose();
+});
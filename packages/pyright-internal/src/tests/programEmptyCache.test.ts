@@ -0,0 +1,121 @@
+/*
+ * programEmptyCache.test.ts
+ *
+ * Tests for the handling of low-memory conditions by the program, which
+ * discards cached information for the least recently used files first.
+ */
+
+import assert from 'assert';
+
+import { ImportResolver } from '../analyzer/importResolver';
+import { Program } from '../analyzer/program';
+import { ConfigOptions } from '../common/configOptions';
+import { DiagnosticCategory } from '../common/diagnostic';
+import { getDirectoryPath, normalizeSlashes } from '../common/pathUtils';
+import { createServiceProvider } from '../common/serviceProviderExtensions';
+import { UriEx } from '../common/uri/uriUtils';
+import { PyrightFileSystem } from '../pyrightFileSystem';
+import { TestAccessHost } from './harness/testAccessHost';
+import { TestFileSystem } from './harness/vfs/filesystem';
+
+// Enough files that the stdlib stubs make up only a small fraction of the program.
+const fileNames = Array.from({ length: 40 }, (_, index) => `file${index}`);
+
+test('emptyCache retains open and recently used files', () => {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    for (const name of fileNames) {
+        const path = normalizeSlashes(`/${name}.py`);
+        testFS.mkdirpSync(getDirectoryPath(path));
+        testFS.writeFileSync(UriEx.file(path), `def ${name}() -> int: ...`);
+    }
+
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+
+    const uris = fileNames.map((name) => UriEx.file(`/${name}.py`));
+    program.setTrackedFiles(uris);
+    const openIndex = fileNames.length - 1;
+    program.setFileOpened(uris[openIndex], /* version */ 1, `def ${fileNames[openIndex]}() -> int: ...`);
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    // Use a file that was checked early on again so it's the most recently used.
+    assert(program.getBoundSourceFile(uris[1]));
+
+    program.emptyCache();
+
+    const isParsed = (index: number) => !program.getSourceFile(uris[index])!.isParseRequired();
+    assert(!isParsed(0), 'least recently used file should be discarded');
+    assert(isParsed(openIndex), 'open file should be retained');
+    assert(isParsed(1), 'most recently used file should be retained');
+
+    program.dispose();
+    sp.dispose();
+});
+
+// Creates a program with files that are large enough that they don't all fit in the
+// memory budget, along with the builtins stubs, which take up about 5MB. The first
+// file is open.
+function createProgramWithMemoryBudget(memoryBudgetMB: number) {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    const getContents = (name: string) => `def ${name}() -> int:\n    return ""\n# ${'x'.repeat(5000)}\n`;
+    for (const name of fileNames) {
+        const path = normalizeSlashes(`/${name}.py`);
+        testFS.mkdirpSync(getDirectoryPath(path));
+        testFS.writeFileSync(UriEx.file(path), getContents(name));
+    }
+
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    configOptions.memoryBudgetMB = memoryBudgetMB;
+
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+
+    const uris = fileNames.map((name) => UriEx.file(`/${name}.py`));
+    program.setTrackedFiles(uris);
+    program.setFileOpened(uris[0], /* version */ 1, getContents(fileNames[0]));
+
+    while (program.analyze()) {
+        // Continue until complete
+    }
+
+    return { sp, configOptions, program, uris };
+}
+
+test('memory budget evicts least recently used closed files', () => {
+    // Enough for the open file and the builtins stubs, but not for all of the files.
+    const { sp, configOptions, program, uris } = createProgramWithMemoryBudget(8);
+
+    const isParsed = (index: number) => !program.getSourceFile(uris[index])!.isParseRequired();
+    assert(!isParsed(1), 'least recently used file should be discarded');
+    assert(isParsed(0), 'open file should be retained');
+
+    // The diagnostics of the evicted files are kept.
+    for (const uri of uris) {
+        const sourceFile = program.getSourceFile(uri)!;
+        assert(!sourceFile.isCheckingRequired());
+        const errors = sourceFile.getDiagnostics(configOptions).filter((d) => d.category === DiagnosticCategory.Error);
+        assert.strictEqual(errors.length, 1);
+    }
+
+    program.dispose();
+    sp.dispose();
+});
+
+test('memory budget is not enforced while the open files alone exceed it', () => {
+    // Less than the builtins stubs alone, which the open file needs.
+    const { sp, program, uris } = createProgramWithMemoryBudget(1);
+
+    // Evicting the closed files wouldn't get below the budget, so they're kept.
+    for (const uri of uris) {
+        assert(!program.getSourceFile(uri)!.isParseRequired());
+    }
+
+    program.dispose();
+    sp.dispose();
+});
@@ -1,4 +1,6 @@
-import { semanticTokenizeSampleFile } from './testUtils';
+import { SemanticTokensDelta } from 'vscode-languageserver';
+import { TextRange } from '../common/textRange';
+import { semanticTokenizeSampleFile, withSemanticTokensSampleFile } from './testUtils';
 
 //TODO: these tests have different start positions in ci on windows, i assume because of crlf moment
 if (process.platform !== 'win32' || !process.env['CI']) {
@@ -939,6 +941,40 @@ if (process.platform !== 'win32' || !process.env['CI']) {
             ]);
         });
     });
+
+    test('range', () => {
+        const range: TextRange = { start: 90, length: 60 };
+        const overlapsRange = (item: TextRange) => TextRange.overlapsRange(range, item);
+        const all = semanticTokenizeSampleFile('class_members.py');
+        const result = semanticTokenizeSampleFile('class_members.py', range);
+        expect(result.filter(overlapsRange)).toStrictEqual(all.filter(overlapsRange));
+        expect(result.length).toBeLessThan(all.length);
+    });
+
+    test('delta', () => {
+        withSemanticTokensSampleFile('variable.py', (createProvider, program, fileUri) => {
+            const full = createProvider().onSemanticTokens();
+            expect(createProvider().onSemanticTokens()).toStrictEqual(full);
+            expect(createProvider().onSemanticTokensDelta(full.resultId!)).toStrictEqual({
+                resultId: full.resultId,
+                edits: [],
+            });
+            expect(createProvider().onSemanticTokensDelta('unknown')).toStrictEqual(full);
+
+            program.setFileOpened(fileUri, 1, 'baz = 1\nfoo = 1\nbar = (\n    foo\n)');
+            const delta = createProvider().onSemanticTokensDelta(full.resultId!) as SemanticTokensDelta;
+            const edited = createProvider().onSemanticTokens();
+            expect(delta.resultId).toBe(edited.resultId);
+            expect(delta.resultId).not.toBe(full.resultId);
+
+            const data = [...full.data];
+            for (const edit of delta.edits) {
+                data.splice(edit.start, edit.deleteCount, ...(edit.data ?? []));
+            }
+            expect(data).toStrictEqual(edited.data);
+            expect(delta.edits[0].data!.length).toBeLessThan(edited.data.length);
+        });
+    });
 } else {
     // prevent jest from failing because no tests were found
     test('windows placeholder', () => {});
@@ -67,6 +67,61 @@ test('source enumeration reports symlinked include roots', () => {
     );
 });
 
+test('source enumeration reports the files found by each call', () => {
+    const fs = new TestFileSystem(/* ignoreCase */ false, { cwd: '/' });
+    fs.mkdirpSync('/root/a');
+    fs.mkdirpSync('/root/b');
+    fs.writeFileSync(Uri.file('/root/a/module1.py', fs), 'x = 1');
+    fs.writeFileSync(Uri.file('/root/b/module2.py', fs), 'x = 1');
+
+    const enumerator = new SourceEnumerator(
+        [getFileSpec(Uri.file('/', fs), 'root')],
+        [],
+        /* autoExcludeVenv */ false,
+        fs,
+        new NullConsole(),
+        10
+    );
+
+    const result = enumerator.enumerate(/* timeLimitInMs */ 1000);
+
+    assert.strictEqual(result.isComplete, true);
+    assert.deepStrictEqual(
+        result.newMatches.map((uri) => uri.key),
+        [Uri.file('/root/a/module1.py', fs).key, Uri.file('/root/b/module2.py', fs).key]
+    );
+    assert.deepStrictEqual(enumerator.enumerate(/* timeLimitInMs */ 1000).newMatches, []);
+});
+
+test('source enumeration auto-excludes environments', () => {
+    const fs = new TestFileSystem(/* ignoreCase */ false, { cwd: '/' });
+    fs.mkdirpSync('/root/venv/bin');
+    fs.mkdirpSync('/root/conda/conda-meta');
+    fs.mkdirpSync('/root/notVenv/bin');
+    fs.writeFileSync(Uri.file('/root/venv/bin/activate', fs), '');
+    fs.writeFileSync(Uri.file('/root/venv/module1.py', fs), 'x = 1');
+    fs.writeFileSync(Uri.file('/root/conda/module2.py', fs), 'x = 1');
+    fs.writeFileSync(Uri.file('/root/notVenv/module3.py', fs), 'x = 1');
+
+    const enumerator = new SourceEnumerator(
+        [getFileSpec(Uri.file('/', fs), 'root')],
+        [],
+        /* autoExcludeVenv */ true,
+        fs,
+        new NullConsole(),
+        10
+    );
+
+    const result = enumerator.enumerate(/* timeLimitInMs */ 1000);
+
+    assert.strictEqual(result.isComplete, true);
+    assert.deepStrictEqual(
+        result.autoExcludedDirs.map((uri) => uri.key),
+        [Uri.file('/root/conda', fs).key, Uri.file('/root/venv', fs).key]
+    );
+    assert.deepStrictEqual(Array.from(result.matches.keys()), [Uri.file('/root/notVenv/module3.py', fs).key]);
+});
+
 test('random library file changed, nested search paths', () => {
     const state = parseAndGetTestState('', '/projectRoot').state;
 
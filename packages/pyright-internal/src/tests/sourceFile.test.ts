@@ -12,11 +12,13 @@ import { ImportResolver } from '../analyzer/importResolver';
 import { SourceFile } from '../analyzer/sourceFile';
 import { ConfigOptions, getBasicDiagnosticRuleSet, getOffDiagnosticRuleSet } from '../common/configOptions';
 import { FullAccessHost } from '../common/fullAccessHost';
-import { combinePaths } from '../common/pathUtils';
+import { combinePaths, normalizeSlashes } from '../common/pathUtils';
 import { RealTempFile, createFromRealFileSystem } from '../common/realFileSystem';
 import { createServiceProvider } from '../common/serviceProviderExtensions';
 import { Uri } from '../common/uri/uri';
+import { UriEx } from '../common/uri/uriUtils';
 import { parseAndGetTestState } from './harness/fourslash/testState';
+import { TestFileSystem } from './harness/vfs/filesystem';
 import { BaselineHandler } from '../baseline';
 import { tExpect } from 'typed-jest-expect';
 
@@ -79,6 +81,43 @@ test('SourceFile setInitialDiagnosticRuleSet overrides default', () => {
     serviceProvider.dispose();
 });
 
+test('Opening a library file bound on demand rebinds it in full', () => {
+    const filePath = combinePaths(process.cwd(), 'tests/samples/test_file1.py');
+    const tempFile = new RealTempFile();
+    const fs = createFromRealFileSystem(tempFile);
+    const serviceProvider = createServiceProvider(tempFile, fs);
+    const configOptions = new ConfigOptions(Uri.file(process.cwd(), serviceProvider));
+    const sourceFile = new SourceFile(
+        serviceProvider,
+        Uri.file(filePath, serviceProvider),
+        () => '',
+        /* isThirdPartyImport */ true,
+        false,
+        {
+            isEditMode: false,
+        },
+        new BaselineHandler(fs, configOptions, undefined),
+        () => undefined
+    );
+    const importResolver = new ImportResolver(serviceProvider, configOptions, new FullAccessHost(serviceProvider));
+    const bind = () => sourceFile.bind(configOptions, () => undefined, undefined, new Set<string>(), undefined);
+
+    sourceFile.parse(configOptions, importResolver);
+    bind();
+    assert.ok(!sourceFile.isBindingRequired());
+
+    // The contents are unchanged, but the function bodies need to be bound now.
+    const contents = sourceFile.getFileContent()!;
+    sourceFile.setClientVersion(1, contents);
+    assert.ok(!sourceFile.isParseRequired());
+    assert.ok(sourceFile.isBindingRequired());
+
+    bind();
+    sourceFile.setClientVersion(2, contents);
+    assert.ok(!sourceFile.isBindingRequired());
+    serviceProvider.dispose();
+});
+
 test('Empty Open file', () => {
     const code = `
 // @filename: test.py
@@ -97,6 +136,43 @@ test('Empty Open file', () => {
     assert.strictEqual(state.workspace.service.test_program.getSourceFile(marker.fileUri)?.getFileContent(), '');
 });
 
+test('Memory stats', () => {
+    const code = `
+// @filename: test.py
+//// [|/*marker*/class A:
+////     def f(self, x: int) -> int:
+////         return x + 1
+////
+//// a = A().f(1)|]
+    `;
+
+    const state = parseAndGetTestState(code).state;
+    const marker = state.getMarkerByName('marker');
+    state.program.analyze();
+
+    const sourceFile = state.program.getSourceFile(marker.fileUri)!;
+    const stats = sourceFile.getMemoryStats(state.program.evaluator)!;
+    assert.strictEqual(stats.textLength, sourceFile.getFileContent()!.length);
+    assert.ok(stats.parseNodeCount > 10);
+    assert.ok(stats.symbolCount >= 5);
+    assert.ok(stats.typeCacheEntryCount > 0);
+    assert.strictEqual(sourceFile.getMemoryStats(/* evaluator */ undefined)!.typeCacheEntryCount, 0);
+
+    const programStats = state.program.getMemoryStats(/* maxFileCount */ 2);
+    assert.strictEqual(programStats.heaviestFiles.length, 2);
+    assert.ok(programStats.parsedFileCount > 2);
+    assert.ok(programStats.heaviestFiles[0].approximateBytes >= programStats.heaviestFiles[1].approximateBytes);
+
+    const cacheNames = programStats.caches.flatMap((owner) => owner.caches.map((cache) => cache.name));
+    assert.ok(cacheNames.includes('parse results'));
+    assert.ok(cacheNames.includes('type cache'));
+    assert.ok(cacheNames.includes('import results'));
+
+    // The program's own stats are computed from the same walk, without the per-file type cache entries.
+    const ownStats = programStats.caches.find((owner) => owner.name === state.program.getCacheStats().name);
+    assert.deepStrictEqual(ownStats, state.program.getCacheStats());
+});
+
 describe('no builtin libraries should be treated as user code', () => {
     const code = `
 // @filename: pyrightconfig.json
@@ -128,3 +204,43 @@ describe('no builtin libraries should be treated as user code', () => {
         tExpect(fileDiagnostics[0].fileUri.toString()).toBe(marker.fileUri.toString());
     });
 });
+
+test('containsIdentifier', () => {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    const fileUri = UriEx.file('/test.py');
+    testFS.writeFileSync(
+        fileUri,
+        'import os\n\nclass Foo:\n    """Docs for helper."""\n\n__all__ = ["Foo"]\nx = {"my-key": 1}  # see bar\n'
+    );
+
+    const serviceProvider = createServiceProvider(testFS);
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    const sourceFile = new SourceFile(
+        serviceProvider,
+        fileUri,
+        () => '',
+        false,
+        false,
+        {
+            isEditMode: false,
+        },
+        new BaselineHandler(testFS, configOptions, undefined),
+        () => undefined
+    );
+    const importResolver = new ImportResolver(serviceProvider, configOptions, new FullAccessHost(serviceProvider));
+
+    assert.strictEqual(sourceFile.containsIdentifier(['Foo']), undefined);
+    sourceFile.parse(configOptions, importResolver);
+
+    assert.strictEqual(sourceFile.containsIdentifier(['os']), true);
+    assert.strictEqual(sourceFile.containsIdentifier(['Foo']), true);
+    assert.strictEqual(sourceFile.containsIdentifier(['class']), true);
+    assert.strictEqual(sourceFile.containsIdentifier(['helper']), true);
+    assert.strictEqual(sourceFile.containsIdentifier(['my-key']), true);
+    assert.strictEqual(sourceFile.containsIdentifier(['bar']), true);
+    assert.strictEqual(sourceFile.containsIdentifier(['Fo', 'oo', 'baz']), false);
+
+    sourceFile.markDirty();
+    assert.strictEqual(sourceFile.containsIdentifier(['Foo']), undefined);
+    serviceProvider.dispose();
+});
@@ -29,10 +29,13 @@ import { ParseFileResults, ParseOptions, Parser, ParserOutput } from '../parser/
 import { entries } from '@detachhead/ts-helpers/dist/functions/misc';
 import { DiagnosticRule } from '../common/diagnosticRules';
 import { SemanticTokenItem, SemanticTokensWalker } from '../analyzer/semanticTokensWalker';
-import { TypeInlayHintsItemType, TypeInlayHintsWalker } from '../analyzer/typeInlayHintsWalker';
+import { TypeInlayHintsCache, TypeInlayHintsItemType, TypeInlayHintsWalker } from '../analyzer/typeInlayHintsWalker';
 import { Range } from 'vscode-languageserver-types';
 import { ServiceProvider } from '../common/serviceProvider';
 import { InlayHintSettings } from '../workspaceFactory';
+import { TextRange } from '../common/textRange';
+import { CancellationToken } from 'vscode-languageserver';
+import { SemanticTokensCache, SemanticTokensProvider } from '../languageService/semanticTokensProvider';
 
 // This is a bit gross, but it's necessary to allow the fallback typeshed
 // directory to be located when running within the jest environment. This
@@ -148,41 +151,75 @@ export function typeAnalyzeSampleFiles(
     return results;
 }
 
-export const semanticTokenizeSampleFile = (fileName: string): SemanticTokenItem[] => {
+export const semanticTokenizeSampleFile = (fileName: string, range?: TextRange): SemanticTokenItem[] => {
     const program = createProgram();
     const fileUri = UriEx.file(resolveSampleFilePath(path.join('semantic_highlighting', fileName)));
     program.setTrackedFiles([fileUri]);
-    const walker = new SemanticTokensWalker(program.evaluator!);
+    const walker = new SemanticTokensWalker(program.evaluator!, range);
     walker.walk(program.getParseResults(fileUri)!.parserOutput.parseTree);
     program.dispose();
     return walker.items;
 };
 
+// Calls the callback with a function that creates semantic tokens providers for the
+// sample file. The providers share a cache, as they do in the language server.
+export const withSemanticTokensSampleFile = <T>(
+    fileName: string,
+    callback: (createProvider: () => SemanticTokensProvider, program: Program, fileUri: Uri) => T
+): T => {
+    const program = createProgram();
+    const fileUri = UriEx.file(resolveSampleFilePath(path.join('semantic_highlighting', fileName)));
+    program.setTrackedFiles([fileUri]);
+    const cache = new SemanticTokensCache();
+    try {
+        return callback(
+            () => new SemanticTokensProvider(program, fileUri, CancellationToken.None, cache),
+            program,
+            fileUri
+        );
+    } finally {
+        program.dispose();
+    }
+};
+
 export const inlayHintSampleFile = (
     fileName: string,
     range?: Range,
     settings: Partial<InlayHintSettings> = {}
-): TypeInlayHintsItemType[] => {
+): TypeInlayHintsItemType[] => inlayHintSampleFileRanges(fileName, [range], settings)[0];
+
+// Walks the sample file once for each range. The walks share a cache, so the
+// hints of a node that was visited by an earlier walk are reused.
+export const inlayHintSampleFileRanges = (
+    fileName: string,
+    ranges: (Range | undefined)[],
+    settings: Partial<InlayHintSettings> = {}
+): TypeInlayHintsItemType[][] => {
     const projectRoot = UriEx.file(resolveSampleFilePath(path.join('inlay_hints')));
     const program = createProgram(new ConfigOptions(projectRoot));
     const fileUri = projectRoot.combinePaths(fileName);
     program.setTrackedFiles([fileUri]);
-    const walker = new TypeInlayHintsWalker(
-        program,
-        {
-            callArgumentNames: true,
-            callArgumentNamesMatching: false,
-            functionReturnTypes: true,
-            variableTypes: true,
-            genericTypes: false,
-            ...settings,
-        },
-        fileUri,
-        range
-    );
-    walker.walk(program.getParseResults(fileUri)!.parserOutput.parseTree);
+    const cache: TypeInlayHintsCache = new WeakMap();
+    const results = ranges.map((range) => {
+        const walker = new TypeInlayHintsWalker(
+            program,
+            {
+                callArgumentNames: true,
+                callArgumentNamesMatching: false,
+                functionReturnTypes: true,
+                variableTypes: true,
+                genericTypes: false,
+                ...settings,
+            },
+            fileUri,
+            range,
+            cache
+        );
+        walker.walk(program.getParseResults(fileUri)!.parserOutput.parseTree);
+        return walker.featureItems;
+    });
     program.dispose();
-    return walker.featureItems;
+    return results;
 };
 
 export function getAnalysisResults(
@@ -1,6 +1,6 @@
 import { tExpect } from 'typed-jest-expect';
 import { ImportTrackerResults } from '../analyzer/typePrinter';
-import { inlayHintSampleFile } from './testUtils';
+import { inlayHintSampleFile, inlayHintSampleFileRanges } from './testUtils';
 
 const noImports: ImportTrackerResults = { imports: new Set(), importFroms: new Map() };
 
@@ -158,6 +158,23 @@ if (process.platform !== 'win32' || !process.env['CI']) {
             },
         ]);
     });
+
+    test('cache', () => {
+        const range = { start: { line: 4, character: 0 }, end: { line: 9, character: 0 } };
+        const [inRange, all, inRangeAgain] = inlayHintSampleFileRanges('function_calls.py', [
+            range,
+            undefined,
+            range,
+        ]);
+        tExpect(all).toStrictEqual(inlayHintSampleFile('function_calls.py'));
+        tExpect(inRange.length).toBeLessThan(all.length);
+
+        // The hints computed by the earlier walks are reused.
+        inRange.forEach((item) => tExpect(all).toContain(item));
+        tExpect(inRangeAgain.length).toBe(inRange.length);
+        inRangeAgain.forEach((item, index) => tExpect(item).toBe(inRange[index]));
+    });
+
     test('generics', () => {
         const result = inlayHintSampleFile('generics.py', undefined, { genericTypes: true });
         tExpect(result).toStrictEqual([
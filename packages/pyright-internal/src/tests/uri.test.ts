@@ -17,8 +17,10 @@ import { isRootedDiskPath, normalizeSlashes } from '../common/pathUtils';
 import { RealTempFile, createFromRealFileSystem } from '../common/realFileSystem';
 import { Uri } from '../common/uri/uri';
 import {
+    FileSpec,
     UriEx,
     deduplicateFolders,
+    getFileSpec,
     getWildcardRegexPattern,
     getWildcardRoot,
     makeDirectories,
@@ -688,6 +690,35 @@ test('getWildcardRegexPattern4', () => {
     assert.ok(!regex.test('//server/share/dix++/.bar*/bidfoo.py'));
 });
 
+test('FileSpec.isInPath', () => {
+    const root = Uri.parse('foo:///users/me', caseDetector);
+    const fileSpecs = ['./blah', './**/node_modules', './src/*.py', './a?c'].map((spec) => getFileSpec(root, spec));
+    const paths = [
+        'foo:///users/me/blah',
+        'foo:///users/me/blah/d.py',
+        'foo:///users/me/blahd.py',
+        'foo:///users/me/x/y/node_modules/z.py',
+        'foo:///users/me/src/z.py',
+        'foo:///users/me/src/z/z.py',
+        'foo:///users/me/abc/z.py',
+        'foo:///users/me/ac/z.py',
+    ].map((path) => Uri.parse(path, caseDetector));
+
+    paths.forEach((path) => {
+        const expected = fileSpecs.some((fileSpec) => path.matchesRegex(fileSpec.regExp));
+        assert.equal(FileSpec.isInPath(path, fileSpecs), expected, path.toString());
+    });
+
+    // The file specs can be modified after they've been matched against.
+    const path = Uri.parse('foo:///users/me/added/z.py', caseDetector);
+    assert.ok(!FileSpec.isInPath(path, fileSpecs));
+    fileSpecs.push(getFileSpec(root, './added'));
+    assert.ok(FileSpec.isInPath(path, fileSpecs));
+    fileSpecs.shift();
+    assert.ok(!FileSpec.isInPath(paths[0], fileSpecs));
+    assert.ok(!FileSpec.isInPath(path, []));
+});
+
 test('getWildcardRoot1', () => {
     const p = getWildcardRoot(Uri.parse('foo:/users/me', caseDetector), './blah/');
     assert.equal(p.toString(), 'foo:/users/me/blah');
@@ -0,0 +1,93 @@
+/*
+ * workspaceSymbolIndex.test.ts
+ *
+ * Unit tests for the persistent index used to answer workspace symbol queries.
+ */
+
+import assert from 'assert';
+import { CancellationToken } from 'vscode-languageserver';
+
+import { ImportResolver } from '../analyzer/importResolver';
+import { Program } from '../analyzer/program';
+import { ConfigOptions } from '../common/configOptions';
+import { normalizeSlashes } from '../common/pathUtils';
+import { createServiceProvider } from '../common/serviceProviderExtensions';
+import { UriEx } from '../common/uri/uriUtils';
+import { WorkspaceSymbolIndex } from '../languageService/workspaceSymbolIndex';
+import { PyrightFileSystem } from '../pyrightFileSystem';
+import { TestAccessHost } from './harness/testAccessHost';
+import { TestFileSystem } from './harness/vfs/filesystem';
+
+const fileUri = UriEx.file('/src/shapes.py');
+const cacheDir = UriEx.file('/cache');
+
+function createProgram(testFS: TestFileSystem) {
+    const sp = createServiceProvider(testFS, new PyrightFileSystem(testFS));
+    const configOptions = new ConfigOptions(UriEx.file('/'));
+    configOptions.analysisCacheDir = cacheDir;
+    const importResolver = new ImportResolver(sp, configOptions, new TestAccessHost(sp.fs().getModulePath(), []));
+    const program = new Program(importResolver, configOptions, sp);
+    program.setTrackedFiles([fileUri]);
+    return program;
+}
+
+function findSymbols(program: Program, query: string) {
+    const index = WorkspaceSymbolIndex.get(program);
+    const symbols = index.findSymbols(program.getSourceFileInfo(fileUri)!, query, CancellationToken.None);
+    index.update(new Set([fileUri.key]));
+    return symbols.map((symbol) => (symbol.containerName ? `${symbol.containerName}.${symbol.name}` : symbol.name));
+}
+
+function createFileSystem() {
+    const testFS = new TestFileSystem(/* ignoreCase */ false, { cwd: normalizeSlashes('/') });
+    testFS.mkdirpSync(fileUri.getDirectory().getFilePath());
+    testFS.writeFileSync(fileUri, 'class Circle:\n    def area(self) -> float: ...\n\ndef make_circle(): ...\n');
+    return testFS;
+}
+
+test('finds symbols with fuzzy matching', () => {
+    const program = createProgram(createFileSystem());
+
+    assert.deepStrictEqual(findSymbols(program, 'circle'), ['Circle', 'make_circle']);
+    assert.deepStrictEqual(findSymbols(program, 'area'), ['Circle.area']);
+    assert.deepStrictEqual(findSymbols(program, 'mkecircle'), ['make_circle']);
+    assert.deepStrictEqual(findSymbols(program, 'square'), []);
+
+    program.dispose();
+});
+
+test('reindexes files that changed', () => {
+    const program = createProgram(createFileSystem());
+    const index = WorkspaceSymbolIndex.get(program);
+
+    findSymbols(program, 'circle');
+    assert(index.isUpToDate(program.getSourceFileInfo(fileUri)!));
+
+    program.setFileOpened(fileUri, /* version */ 1, 'class Square: ...\n');
+    program.markFilesDirty([fileUri], /* evenIfContentsAreSame */ true);
+    assert(!index.isUpToDate(program.getSourceFileInfo(fileUri)!));
+
+    assert.deepStrictEqual(findSymbols(program, 'circle'), []);
+    assert.deepStrictEqual(findSymbols(program, 'square'), ['Square']);
+
+    program.dispose();
+});
+
+test('reuses the saved index after a restart', () => {
+    const testFS = createFileSystem();
+    const program1 = createProgram(testFS);
+    findSymbols(program1, 'circle');
+    program1.dispose();
+
+    const program2 = createProgram(testFS);
+    assert(WorkspaceSymbolIndex.get(program2).isUpToDate(program2.getSourceFileInfo(fileUri)!));
+    assert.deepStrictEqual(findSymbols(program2, 'circle'), ['Circle', 'make_circle']);
+    assert(!program2.getSourceFile(fileUri)!.getParseResults());
+    program2.dispose();
+
+    testFS.writeFileSync(fileUri, 'class Square: ...\n');
+    const program3 = createProgram(testFS);
+    assert(!WorkspaceSymbolIndex.get(program3).isUpToDate(program3.getSourceFileInfo(fileUri)!));
+    assert.deepStrictEqual(findSymbols(program3, 'square'), ['Square']);
+    program3.dispose();
+});